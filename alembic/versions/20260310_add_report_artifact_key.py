@@ -0,0 +1,37 @@
+"""add artifact_key column to reports
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-03-10 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Idempotent: check if column already exists
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name='reports' AND column_name='artifact_key'"
+        )
+    )
+    if result.fetchone() is None:
+        op.add_column(
+            "reports",
+            sa.Column("artifact_key", sa.Text(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("reports", "artifact_key")
@@ -0,0 +1,53 @@
+"""add content hash columns for change detection
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-03-11 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("sources", "content_hash"),
+    ("sources", "extraction_content_hash"),
+    ("sources", "extraction_schema_hash"),
+    ("extractions", "source_content_hash"),
+    ("domain_boilerplate", "content_digest"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    # Idempotent: skip columns that already exist
+    for table, column in _COLUMNS:
+        result = conn.execute(
+            sa.text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name=:table AND column_name=:column"
+            ),
+            {"table": table, "column": column},
+        )
+        if not result.fetchone():
+            op.add_column(table, sa.Column(column, sa.Text(), nullable=True))
+
+    # Idempotent: skip if index already exists
+    result = conn.execute(
+        sa.text("SELECT 1 FROM pg_indexes WHERE indexname='ix_sources_content_hash'")
+    )
+    if not result.fetchone():
+        op.create_index("ix_sources_content_hash", "sources", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sources_content_hash", table_name="sources")
+    for table, column in reversed(_COLUMNS):
+        op.drop_column(table, column)
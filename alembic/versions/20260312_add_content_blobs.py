@@ -0,0 +1,68 @@
+"""add content_blobs table and blob references on sources
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-03-12 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+_SOURCE_COLUMNS = [
+    ("content_blob_hash", sa.Text()),
+    ("raw_content_blob_hash", sa.Text()),
+    ("cleaned_content_delta", postgresql.JSONB(astext_type=sa.Text())),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Idempotent: skip if table already exists
+    result = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.tables WHERE table_name='content_blobs'"
+        )
+    )
+    if not result.fetchone():
+        op.create_table(
+            "content_blobs",
+            sa.Column("hash", sa.Text(), primary_key=True, nullable=False),
+            sa.Column("codec", sa.Text(), nullable=False, server_default="zstd"),
+            sa.Column("size", sa.Integer(), nullable=False),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+        )
+        # Already compressed: skip TOAST's own pglz pass
+        op.execute("ALTER TABLE content_blobs ALTER COLUMN data SET STORAGE EXTERNAL")
+
+    for column, column_type in _SOURCE_COLUMNS:
+        result = conn.execute(
+            sa.text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name='sources' AND column_name=:column"
+            ),
+            {"column": column},
+        )
+        if not result.fetchone():
+            op.add_column("sources", sa.Column(column, column_type, nullable=True))
+
+
+def downgrade() -> None:
+    for column, _ in reversed(_SOURCE_COLUMNS):
+        op.drop_column("sources", column)
+    op.drop_table("content_blobs")
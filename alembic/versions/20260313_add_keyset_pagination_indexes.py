@@ -0,0 +1,58 @@
+"""add sort-key indexes for keyset pagination of list endpoints
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-03-13 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c9d0e1f2a3b4"
+down_revision = "b8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+# (index, table, columns): filter column, list sort key, id tie-breaker
+_INDEXES = [
+    (
+        "ix_extractions_project_created",
+        "extractions",
+        ["project_id", "created_at", "id"],
+    ),
+    ("ix_entities_project_value", "entities", ["project_id", "value", "id"]),
+    ("ix_sources_project_created", "sources", ["project_id", "created_at", "id"]),
+    ("ix_reports_project_created", "reports", ["project_id", "created_at", "id"]),
+    ("ix_jobs_created_id", "jobs", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it
+    # cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        for name, table, columns in _INDEXES:
+            valid = conn.execute(
+                sa.text(
+                    "SELECT i.indisvalid FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+                ),
+                {"name": name},
+            ).scalar()
+            # Idempotent: skip if index already exists; rebuild one left
+            # invalid by an interrupted concurrent build
+            if valid:
+                continue
+            if valid is not None:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark Camoufox request blocking decisions without a browser.
+
+Compares the previous per-request linear substring scan over the ad domain
+list with the host-suffix trie used by RequestBlocker, on a synthetic
+sub-request mix resembling a heavy product page. Times cover only the
+Python-side decision; the larger saving is not routing non-ad requests
+through Python at all (see services.camoufox.blocking).
+
+--extra-domains pads the ad list with synthetic domains to show how each
+approach scales with list size (e.g. an EasyList-sized list).
+
+Usage:
+    PYTHONPATH=src python scripts/bench_camoufox_blocking.py [--requests N]
+        [--extra-domains N]
+"""
+
+import argparse
+import random
+import timeit
+
+from services.camoufox.blocking import (
+    AD_SERVING_DOMAINS,
+    HostSuffixMatcher,
+    RequestBlocker,
+)
+
+FIRST_PARTY = [
+    ("https://www.example-industries.com/assets/img/product-{i}.webp", "image"),
+    ("https://www.example-industries.com/static/fonts/inter-{i}.woff2", "font"),
+    ("https://www.example-industries.com/static/css/site.{i}.css", "stylesheet"),
+    ("https://cdn.example-industries.com/js/chunk.{i}.js", "script"),
+    ("https://www.example-industries.com/api/products/{i}?lang=en", "fetch"),
+]
+THIRD_PARTY = [
+    ("https://securepubads.g.doubleclick.net/tag/js/gpt-{i}.js", "script"),
+    ("https://www.googletagmanager.com/gtm.js?id=GTM-{i}", "script"),
+    ("https://connect.facebook.net/en_US/fbevents-{i}.js", "script"),
+    ("https://cdn.cookielaw.org/consent/{i}/otSDKStub.js", "script"),
+]
+
+
+def build_requests(n: int) -> list[tuple[str, str]]:
+    rng = random.Random(42)
+    templates = FIRST_PARTY * 4 + THIRD_PARTY
+    return [
+        (url.format(i=i), resource_type)
+        for i, (url, resource_type) in enumerate(
+            rng.choice(templates) for _ in range(n)
+        )
+    ]
+
+
+def linear_scan(requests: list[tuple[str, str]], domains: list[str], _matcher) -> int:
+    return sum(1 for url, _ in requests if any(domain in url for domain in domains))
+
+
+def trie_only(requests: list[tuple[str, str]], _domains, matcher) -> int:
+    blocker = RequestBlocker(matcher=matcher)
+    return sum(1 for url, rt in requests if blocker.should_block(url, rt))
+
+
+def trie_with_resource_types(requests: list[tuple[str, str]], _domains, matcher) -> int:
+    blocker = RequestBlocker(["image", "media", "font"], matcher=matcher)
+    return sum(1 for url, rt in requests if blocker.should_block(url, rt))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--extra-domains", type=int, default=0)
+    args = parser.parse_args()
+
+    requests = build_requests(args.requests)
+    domains = AD_SERVING_DOMAINS + [
+        f"tracker{i}.adnetwork{i % 97}.com" for i in range(args.extra_domains)
+    ]
+    matcher = HostSuffixMatcher(domains)
+    print(f"{len(domains)} ad domains, {len(requests)} requests")
+    for name, fn in [
+        ("linear substring scan", linear_scan),
+        ("host-suffix trie", trie_only),
+        ("trie + resource types", trie_with_resource_types),
+    ]:
+        seconds = min(
+            timeit.repeat(
+                lambda fn=fn: fn(requests, domains, matcher),
+                number=args.repeat,
+                repeat=3,
+            )
+        )
+        per_request_us = seconds / args.repeat / len(requests) * 1e6
+        print(
+            f"{name:24s} {per_request_us:6.2f} us/request  "
+            f"blocked={fn(requests, domains, matcher)}/{len(requests)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Benchmark the extraction pipeline end to end without network access.
+
+Replays synthetic pages (or a recorded JSONL corpus) through the real
+extraction pipeline and consolidation, against a deterministic mock
+OpenAI-compatible LLM/embedding server with configurable latency (see
+src/benchmarks). Reports throughput, p50/p99 latency per stage, LLM calls
+per source and peak RSS.
+
+With --baseline, the run is compared to a stored report and the script
+exits with status 1 if any metric is worse by more than --threshold
+percent. Store a baseline with --output from a reference run.
+
+--stream-entities streams entity-list completions (v2 extraction); the
+first_grounded_entity stage then shows time to the first grounded entity.
+--stream-stall-at FRACTION makes the mock hang streamed answers part-way,
+so with a short --llm-timeout the report's "streaming" section shows how
+many entities were salvaged from cut-off streams.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_pipeline.py [--pages N]
+        [--corpus pages.jsonl] [--llm-latency-ms MS] [--output report.json]
+        [--baseline baseline.json --threshold PCT]
+        [--data-version 2 --stream-entities [--stream-stall-at 0.7
+         --llm-timeout 5]]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Settings require an API key; the benchmark never serves requests
+os.environ.setdefault("API_KEY", "benchmark-api-key-not-used-for-serving")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    corpus = parser.add_argument_group("corpus")
+    corpus.add_argument("--corpus", help="recorded pages (JSONL); default synthetic")
+    corpus.add_argument("--pages", type=int, default=100)
+    corpus.add_argument("--companies", type=int, default=5)
+    corpus.add_argument("--page-chars", type=int, default=6000)
+    corpus.add_argument("--seed", type=int, default=42)
+
+    mock = parser.add_argument_group("mock servers")
+    mock.add_argument("--llm-latency-ms", type=float, default=50.0)
+    mock.add_argument("--llm-jitter-ms", type=float, default=20.0)
+    mock.add_argument("--embedding-latency-ms", type=float, default=5.0)
+    mock.add_argument("--embedding-jitter-ms", type=float, default=2.0)
+    mock.add_argument(
+        "--stream-stall-at",
+        type=float,
+        help="hang streamed answers after this fraction (0-1) of their content",
+    )
+
+    run = parser.add_argument_group("pipeline")
+    run.add_argument("--template", default="drivetrain_company_analysis")
+    run.add_argument("--data-version", type=int)
+    run.add_argument("--max-concurrent-sources", type=int)
+    run.add_argument("--batch-size", type=int)
+    run.add_argument("--no-smart-classification", action="store_true")
+    run.add_argument("--skip-gate", action="store_true")
+    run.add_argument("--no-grounding-verifier", action="store_true")
+    run.add_argument("--no-consolidation", action="store_true")
+    run.add_argument("--stream-entities", action="store_true")
+    run.add_argument("--llm-timeout", type=int, help="LLM HTTP timeout (seconds)")
+
+    out = parser.add_argument_group("output")
+    out.add_argument("--name", default="pipeline")
+    out.add_argument("--output", help="write the JSON report here")
+    out.add_argument("--baseline", help="stored report to compare against")
+    out.add_argument("--threshold", type=float, default=10.0)
+    out.add_argument("--min-latency-ms", type=float, default=1.0)
+    out.add_argument("--verbose", action="store_true", help="keep pipeline logs")
+    return parser.parse_args()
+
+
+def print_report(report: dict) -> None:
+    result = report["result"]
+    print(
+        f"{report['sources']} sources in {report['wall_seconds']:.2f}s "
+        f"({report['throughput_sources_per_s']:.2f} sources/s), "
+        f"{result['total_extractions']} extractions, "
+        f"{result['consolidated_records']} consolidated records, "
+        f"{result['sources_failed']} failed"
+    )
+    print(
+        f"LLM calls: {report['llm_calls']} "
+        f"({report['llm_calls_per_source']:.2f}/source)  "
+        f"peak RSS: {report['peak_rss_mb']:.1f} MB"
+    )
+    print(f"calls by kind: {json.dumps(report['calls'], sort_keys=True)}")
+    if any(report["streaming"].values()):
+        print(f"streaming: {json.dumps(report['streaming'], sort_keys=True)}")
+    print(f"{'stage':22s} {'count':>7s} {'total s':>9s} {'p50 ms':>9s} {'p99 ms':>9s}")
+    for stage, stats in report["stages"].items():
+        print(
+            f"{stage:22s} {stats['count']:7d} {stats['total_s']:9.3f} "
+            f"{stats['p50_ms']:9.2f} {stats['p99_ms']:9.2f}"
+        )
+
+
+def main() -> int:
+    args = parse_args()
+
+    from benchmarks.corpus import load_pages, synthetic_pages
+    from benchmarks.harness import BenchmarkOptions, compare_reports, run_benchmark
+    from benchmarks.mock_openai import Latency, MockOpenAIServer, MockSettings
+
+    if not args.verbose:
+        import structlog
+
+        structlog.configure(
+            wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+        )
+
+    if args.corpus:
+        pages = load_pages(args.corpus)
+    else:
+        pages = synthetic_pages(
+            args.pages,
+            companies=args.companies,
+            page_chars=args.page_chars,
+            seed=args.seed,
+        )
+    options = BenchmarkOptions(
+        template=args.template,
+        data_version=args.data_version,
+        max_concurrent_sources=args.max_concurrent_sources,
+        extraction_batch_size=args.batch_size,
+        smart_classification=not args.no_smart_classification,
+        skip_gate=args.skip_gate,
+        grounding_verifier=not args.no_grounding_verifier,
+        consolidate=not args.no_consolidation,
+        stream_entities=args.stream_entities,
+        llm_timeout=args.llm_timeout,
+    )
+    mock_settings = MockSettings(
+        chat_latency=Latency(args.llm_latency_ms, args.llm_jitter_ms),
+        embedding_latency=Latency(args.embedding_latency_ms, args.embedding_jitter_ms),
+        seed=args.seed,
+        stream_stall_at=args.stream_stall_at,
+    )
+
+    with MockOpenAIServer(mock_settings) as server:
+        report = asyncio.run(run_benchmark(pages, server, options, name=args.name))
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(
+            report,
+            baseline,
+            threshold_pct=args.threshold,
+            min_latency_ms=args.min_latency_ms,
+        )
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.baseline} (threshold {args.threshold}%):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nno regressions vs {args.baseline} (threshold {args.threshold}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
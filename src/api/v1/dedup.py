@@ -3,11 +3,14 @@
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from constants import JobStatus, JobType
 from database import get_db
+from orm_models import Job
 from services.extraction.domain_dedup import DomainDedupService
+from services.projects.repository import ProjectRepository
 
 logger = structlog.get_logger(__name__)
 
@@ -20,6 +23,7 @@ router = APIRouter(prefix="/api/v1/projects", tags=["dedup"])
 )
 async def analyze_boilerplate(
     project_id: UUID,
+    response: Response,
     source_groups: list[str] | None = Query(
         default=None, description="Filter by source groups"
     ),
@@ -35,54 +39,80 @@ async def analyze_boilerplate(
         le=500,
         description="Min block chars (default 50)",
     ),
+    run_async: bool = Query(
+        default=False,
+        alias="async",
+        description="Queue a background job and return 202 with its job_id",
+    ),
     db: Session = Depends(get_db),
 ) -> dict:
     """Analyze domains for boilerplate content and clean sources.
 
     Scans all pages per domain, identifies repeating blocks (cookie banners,
     navs, footers), and stores cleaned versions in sources.cleaned_content.
+    Returns the per-domain statistics. With ``async=true`` the analysis runs
+    as a background job instead: the response is 202 with a job_id, poll
+    GET /jobs/{job_id} for progress, and the finished job's result holds
+    the same statistics.
     """
     from config import settings
 
-    service = DomainDedupService(db, settings.extraction)
-
-    try:
-        result = service.analyze_project(
-            project_id=project_id,
-            source_groups=source_groups,
-            threshold_pct=threshold_pct,
-            min_pages=min_pages,
-            min_block_chars=min_block_chars,
-        )
-        db.commit()
-    except Exception as e:
-        logger.error(
-            "boilerplate_analysis_failed",
-            project_id=str(project_id),
-            error=str(e),
-        )
+    project = ProjectRepository(db).get(project_id)
+    if not project:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Boilerplate analysis failed",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    if not run_async:
+        service = DomainDedupService.from_config(db, settings.extraction)
+        try:
+            result = await service.analyze_project_parallel(
+                project_id,
+                source_groups=source_groups,
+                threshold_pct=threshold_pct,
+                min_pages=min_pages,
+                min_block_chars=min_block_chars,
+            )
+            db.commit()
+        except Exception as e:
+            logger.error(
+                "boilerplate_analysis_failed",
+                project_id=str(project_id),
+                error=str(e),
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Boilerplate analysis failed",
+            ) from e
+        return result.to_dict()
+
+    job = Job(
+        type=JobType.DEDUP,
+        status=JobStatus.QUEUED,
+        project_id=project_id,
+        payload={
+            "project_id": str(project_id),
+            "source_groups": source_groups,
+            "threshold_pct": threshold_pct,
+            "min_pages": min_pages,
+            "min_block_chars": min_block_chars,
+        },
+    )
+    db.add(job)
+    db.commit()
+    response.status_code = status.HTTP_202_ACCEPTED
+
+    logger.info(
+        "boilerplate_analysis_queued",
+        project_id=str(project_id),
+        job_id=str(job.id),
+    )
 
     return {
-        "domains_analyzed": result.domains_analyzed,
-        "domains_with_boilerplate": result.domains_with_boilerplate,
-        "total_pages_cleaned": result.total_pages_cleaned,
-        "total_bytes_removed": result.total_bytes_removed,
-        "domains": [
-            {
-                "domain": d.domain,
-                "pages_analyzed": d.pages_analyzed,
-                "pages_cleaned": d.pages_cleaned,
-                "blocks_boilerplate": d.blocks_boilerplate,
-                "bytes_removed_total": d.bytes_removed_total,
-                "sections_analyzed": d.sections_analyzed,
-                "sections_with_boilerplate": d.sections_with_boilerplate,
-            }
-            for d in result.domain_results
-        ],
+        "job_id": str(job.id),
+        "status": "queued",
+        "project_id": str(project_id),
     }
 
 
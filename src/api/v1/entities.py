@@ -13,6 +13,7 @@ from models import (
     EntityTypesResponse,
 )
 from services.projects.repository import ProjectRepository
+from services.storage.pagination import CountMode
 from services.storage.repositories.entity import EntityFilters, EntityRepository
 
 router = APIRouter(prefix="/api/v1", tags=["entities"])
@@ -29,6 +30,12 @@ async def list_entities(
     source_group: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces offset)"
+    ),
+    count: CountMode = Query(
+        default="exact", description="Total: exact count or fast estimate"
+    ),
     db: Session = Depends(get_db),
 ) -> EntityListResponse:
     """List entities for a project with optional filtering and pagination."""
@@ -50,8 +57,10 @@ async def list_entities(
 
     # Get entities with DB-level pagination
     entity_repo = EntityRepository(db)
-    total = entity_repo.count(filters)
-    paginated_entities = entity_repo.list(filters, limit=limit, offset=offset)
+    total, total_estimated = entity_repo.count_total(filters, count)
+    paginated_entities, next_cursor = entity_repo.list_page(
+        filters, limit, offset=offset, cursor=cursor
+    )
 
     # Convert to response models
     entity_responses = [
@@ -72,6 +81,8 @@ async def list_entities(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -1,15 +1,24 @@
-"""Export API endpoints for entities and extractions."""
+"""Export API endpoints for entities and extractions.
+
+Exports are streamed: rows are read through a server-side cursor
+(``yield_per``) and encoded incrementally as a JSON document, NDJSON or CSV,
+optionally gzip-compressed on the fly, so memory stays constant regardless
+of export size.
+"""
 
 import csv
 import io
 import json
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from datetime import UTC, datetime
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Query as ORMQuery
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_project_or_404
@@ -21,13 +30,27 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/projects/{project_id}/export", tags=["export"])
 
+# Rows fetched per server-side cursor round trip
+EXPORT_BATCH_SIZE = 1000
+# Encoded output is flushed to the client in chunks of about this many chars
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+ExportFormat = Literal["csv", "json", "ndjson"]
+
+_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
 
 @router.get("/entities")
 async def export_entities(
     project_id: UUID,
-    format: Literal["csv", "json"] = Query(default="csv"),
+    format: ExportFormat = Query(default="csv"),
     entity_type: str | None = Query(default=None),
     source_group: str | None = Query(default=None),
+    compress: bool = Query(default=False, description="Gzip-compress the export"),
     db: Session = Depends(get_db),
     project: Project = Depends(get_project_or_404),
 ) -> StreamingResponse:
@@ -36,9 +59,10 @@ async def export_entities(
 
     Args:
         project_id: Project UUID
-        format: Export format (csv or json)
+        format: Export format (csv, json or ndjson)
         entity_type: Filter by entity type
         source_group: Filter by source group
+        compress: Gzip-compress the export on the fly
     """
     # Build query
     query = db.query(Entity).filter(Entity.project_id == project_id)
@@ -48,28 +72,41 @@ async def export_entities(
     if source_group:
         query = query.filter(Entity.source_group == source_group)
 
-    entities = query.all()
-
     logger.info(
         "export_entities",
         project_id=str(project_id),
         format=format,
-        count=len(entities),
     )
 
-    if format == "json":
-        return _export_entities_json(entities, project_id)
-    else:
-        return _export_entities_csv(entities, project_id)
+    return _export_response(
+        db,
+        query,
+        name="entities",
+        project_id=project_id,
+        format=format,
+        compress=compress,
+        to_record=_entity_record,
+        csv_header=[
+            "id",
+            "entity_type",
+            "value",
+            "normalized_value",
+            "source_group",
+            "attributes",
+            "created_at",
+        ],
+        to_csv_row=_entity_csv_row,
+    )
 
 
 @router.get("/extractions")
 async def export_extractions(
     project_id: UUID,
-    format: Literal["csv", "json"] = Query(default="csv"),
+    format: ExportFormat = Query(default="csv"),
     extraction_type: str | None = Query(default=None),
     source_group: str | None = Query(default=None),
     min_confidence: float | None = Query(default=None, ge=0.0, le=1.0),
+    compress: bool = Query(default=False, description="Gzip-compress the export"),
     db: Session = Depends(get_db),
     project: Project = Depends(get_project_or_404),
 ) -> StreamingResponse:
@@ -78,10 +115,11 @@ async def export_extractions(
 
     Args:
         project_id: Project UUID
-        format: Export format (csv or json)
+        format: Export format (csv, json or ndjson)
         extraction_type: Filter by extraction type
         source_group: Filter by source group
         min_confidence: Minimum confidence threshold
+        compress: Gzip-compress the export on the fly
     """
     # Build query
     query = db.query(Extraction).filter(Extraction.project_id == project_id)
@@ -93,28 +131,42 @@ async def export_extractions(
     if min_confidence is not None:
         query = query.filter(Extraction.confidence >= min_confidence)
 
-    extractions = query.all()
-
     logger.info(
         "export_extractions",
         project_id=str(project_id),
         format=format,
-        count=len(extractions),
     )
 
-    if format == "json":
-        return _export_extractions_json(extractions, project_id)
-    else:
-        return _export_extractions_csv(extractions, project_id)
+    return _export_response(
+        db,
+        query,
+        name="extractions",
+        project_id=project_id,
+        format=format,
+        compress=compress,
+        to_record=_extraction_record,
+        csv_header=[
+            "id",
+            "source_id",
+            "extraction_type",
+            "data",
+            "source_group",
+            "confidence",
+            "profile_used",
+            "created_at",
+        ],
+        to_csv_row=_extraction_csv_row,
+    )
 
 
 @router.get("/sources")
 async def export_sources(
     project_id: UUID,
-    format: Literal["csv", "json"] = Query(default="csv"),
+    format: ExportFormat = Query(default="csv"),
     source_group: str | None = Query(default=None),
     status: str | None = Query(default=None),
     source_type: str | None = Query(default=None),
+    compress: bool = Query(default=False, description="Gzip-compress the export"),
     db: Session = Depends(get_db),
     project: Project = Depends(get_project_or_404),
 ) -> StreamingResponse:
@@ -123,13 +175,23 @@ async def export_sources(
 
     Args:
         project_id: Project UUID
-        format: Export format (csv or json)
+        format: Export format (csv, json or ndjson)
         source_group: Filter by source group
         status: Filter by status (pending/completed/failed)
         source_type: Filter by source type (web/pdf)
+        compress: Gzip-compress the export on the fly
     """
-    # Build query
-    query = db.query(Source).filter(Source.project_id == project_id)
+    # Select only exported columns so page content is never loaded
+    query = db.query(
+        Source.id,
+        Source.uri,
+        Source.source_group,
+        Source.source_type,
+        Source.title,
+        Source.status,
+        Source.created_at,
+        Source.fetched_at,
+    ).filter(Source.project_id == project_id)
 
     if source_group:
         query = query.filter(Source.source_group == source_group)
@@ -138,61 +200,21 @@ async def export_sources(
     if source_type:
         query = query.filter(Source.source_type == source_type)
 
-    sources = query.all()
-
     logger.info(
         "export_sources",
         project_id=str(project_id),
         format=format,
-        count=len(sources),
     )
 
-    if format == "json":
-        return _export_sources_json(sources, project_id)
-    else:
-        return _export_sources_csv(sources, project_id)
-
-
-def _export_sources_json(sources: list[Source], project_id: UUID) -> StreamingResponse:
-    """Generate JSON export for sources."""
-    data = {
-        "project_id": str(project_id),
-        "exported_at": datetime.now(UTC).isoformat(),
-        "count": len(sources),
-        "sources": [
-            {
-                "id": str(s.id),
-                "uri": s.uri,
-                "source_group": s.source_group,
-                "source_type": s.source_type,
-                "title": s.title,
-                "status": s.status,
-                "created_at": s.created_at.isoformat() if s.created_at else None,
-                "fetched_at": s.fetched_at.isoformat() if s.fetched_at else None,
-            }
-            for s in sources
-        ],
-    }
-
-    content = json.dumps(data, indent=2)
-
-    return StreamingResponse(
-        iter([content]),
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f'attachment; filename="sources_{project_id}.json"'
-        },
-    )
-
-
-def _export_sources_csv(sources: list[Source], project_id: UUID) -> StreamingResponse:
-    """Generate CSV export for sources."""
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow(
-        [
+    return _export_response(
+        db,
+        query,
+        name="sources",
+        project_id=project_id,
+        format=format,
+        compress=compress,
+        to_record=_source_record,
+        csv_header=[
             "id",
             "uri",
             "source_group",
@@ -201,192 +223,217 @@ def _export_sources_csv(sources: list[Source], project_id: UUID) -> StreamingRes
             "status",
             "created_at",
             "fetched_at",
-        ]
+        ],
+        to_csv_row=_source_csv_row,
     )
 
-    # Data rows
-    for s in sources:
-        writer.writerow(
-            [
-                str(s.id),
-                s.uri,
-                s.source_group,
-                s.source_type,
-                s.title or "",
-                s.status,
-                s.created_at.isoformat() if s.created_at else "",
-                s.fetched_at.isoformat() if s.fetched_at else "",
-            ]
-        )
-
-    output.seek(0)
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="sources_{project_id}.csv"'
-        },
-    )
+# ── Record encoders ──
 
 
-def _export_entities_json(
-    entities: list[Entity], project_id: UUID
-) -> StreamingResponse:
-    """Generate JSON export for entities."""
-    data = {
-        "project_id": str(project_id),
-        "exported_at": datetime.now(UTC).isoformat(),
-        "count": len(entities),
-        "entities": [
-            {
-                "id": str(e.id),
-                "entity_type": e.entity_type,
-                "value": e.value,
-                "normalized_value": e.normalized_value,
-                "source_group": e.source_group,
-                "attributes": e.attributes,
-                "created_at": e.created_at.isoformat() if e.created_at else None,
-            }
-            for e in entities
-        ],
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _source_record(s: Any) -> dict:
+    return {
+        "id": str(s.id),
+        "uri": s.uri,
+        "source_group": s.source_group,
+        "source_type": s.source_type,
+        "title": s.title,
+        "status": s.status,
+        "created_at": _isoformat(s.created_at),
+        "fetched_at": _isoformat(s.fetched_at),
     }
 
-    content = json.dumps(data, indent=2)
 
-    return StreamingResponse(
-        iter([content]),
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f'attachment; filename="entities_{project_id}.json"'
-        },
-    )
+def _source_csv_row(s: Any) -> list:
+    return [
+        str(s.id),
+        s.uri,
+        s.source_group,
+        s.source_type,
+        s.title or "",
+        s.status,
+        _isoformat(s.created_at) or "",
+        _isoformat(s.fetched_at) or "",
+    ]
+
+
+def _entity_record(e: Entity) -> dict:
+    return {
+        "id": str(e.id),
+        "entity_type": e.entity_type,
+        "value": e.value,
+        "normalized_value": e.normalized_value,
+        "source_group": e.source_group,
+        "attributes": e.attributes,
+        "created_at": _isoformat(e.created_at),
+    }
 
 
-def _export_entities_csv(entities: list[Entity], project_id: UUID) -> StreamingResponse:
-    """Generate CSV export for entities."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def _entity_csv_row(e: Entity) -> list:
+    return [
+        str(e.id),
+        e.entity_type,
+        e.value,
+        e.normalized_value,
+        e.source_group,
+        json.dumps(e.attributes) if e.attributes else "",
+        _isoformat(e.created_at) or "",
+    ]
+
+
+def _extraction_record(e: Extraction) -> dict:
+    return {
+        "id": str(e.id),
+        "source_id": str(e.source_id) if e.source_id else None,
+        "extraction_type": e.extraction_type,
+        "data": e.data,
+        "data_version": safe_data_version(e),
+        "source_group": e.source_group,
+        "confidence": e.confidence,
+        "profile_used": e.profile_used,
+        "created_at": _isoformat(e.created_at),
+    }
 
-    # Header
-    writer.writerow(
-        [
-            "id",
-            "entity_type",
-            "value",
-            "normalized_value",
-            "source_group",
-            "attributes",
-            "created_at",
-        ]
-    )
 
-    # Data rows
-    for e in entities:
-        writer.writerow(
-            [
-                str(e.id),
-                e.entity_type,
-                e.value,
-                e.normalized_value,
-                e.source_group,
-                json.dumps(e.attributes) if e.attributes else "",
-                e.created_at.isoformat() if e.created_at else "",
-            ]
-        )
-
-    output.seek(0)
+def _extraction_csv_row(e: Extraction) -> list:
+    # Flatten v2 data for tabular export
+    export_data = e.data
+    if safe_data_version(e) >= 2 and e.data:
+        from services.extraction.extraction_items import v2_to_flat
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="entities_{project_id}.csv"'
-        },
-    )
+        export_data = v2_to_flat(e.data)
+    return [
+        str(e.id),
+        str(e.source_id) if e.source_id else "",
+        e.extraction_type,
+        json.dumps(export_data) if export_data else "",
+        e.source_group,
+        e.confidence,
+        e.profile_used,
+        _isoformat(e.created_at) or "",
+    ]
 
 
-def _export_extractions_json(
-    extractions: list[Extraction], project_id: UUID
-) -> StreamingResponse:
-    """Generate JSON export for extractions."""
-    data = {
-        "project_id": str(project_id),
-        "exported_at": datetime.now(UTC).isoformat(),
-        "count": len(extractions),
-        "extractions": [
-            {
-                "id": str(e.id),
-                "source_id": str(e.source_id) if e.source_id else None,
-                "extraction_type": e.extraction_type,
-                "data": e.data,
-                "data_version": safe_data_version(e),
-                "source_group": e.source_group,
-                "confidence": e.confidence,
-                "profile_used": e.profile_used,
-                "created_at": e.created_at.isoformat() if e.created_at else None,
-            }
-            for e in extractions
-        ],
-    }
+# ── Streaming helpers ──
 
-    content = json.dumps(data, indent=2)
 
-    filename = f"extractions_{project_id}.json"
-    return StreamingResponse(
-        iter([content]),
-        media_type="application/json",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def _iter_rows(db: Session, query: ORMQuery) -> Iterator[Any]:
+    """Iterate query results through a server-side cursor.
 
+    The request-scoped session is closed by get_db before the response body
+    is streamed, so the generator reopens it on first use and closes it again
+    once the export is finished or the client disconnects.
+    """
+    try:
+        yield from query.yield_per(EXPORT_BATCH_SIZE)
+    finally:
+        db.close()
 
-def _export_extractions_csv(
-    extractions: list[Extraction], project_id: UUID
-) -> StreamingResponse:
-    """Generate CSV export for extractions."""
-    output = io.StringIO()
-    writer = csv.writer(output)
 
-    # Header
-    writer.writerow(
-        [
-            "id",
-            "source_id",
-            "extraction_type",
-            "data",
-            "source_group",
-            "confidence",
-            "profile_used",
-            "created_at",
-        ]
+def _json_document(
+    name: str, project_id: UUID, records: Iterable[dict]
+) -> Iterator[str]:
+    """Encode records as one JSON document with export metadata.
+
+    ``count`` is written after the records, as counted while streaming, so
+    the export needs no separate COUNT query.
+    """
+    header = json.dumps(
+        {
+            "project_id": str(project_id),
+            "exported_at": datetime.now(UTC).isoformat(),
+        }
     )
+    yield f"{header[:-1]}, {json.dumps(name)}: ["
+    separator = "\n"
+    count = 0
+    for record in records:
+        yield separator + json.dumps(record)
+        separator = ",\n"
+        count += 1
+    yield f'\n], "count": {count}}}\n'
+
+
+def _ndjson_lines(records: Iterable[dict]) -> Iterator[str]:
+    """Encode records as newline-delimited JSON."""
+    for record in records:
+        yield json.dumps(record) + "\n"
+
+
+def _csv_lines(header: list[str], rows: Iterable[list]) -> Iterator[str]:
+    """Encode rows as CSV, reusing one small buffer."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _chunked(parts: Iterable[str]) -> Iterator[bytes]:
+    """Coalesce small encoded parts into chunks of about EXPORT_CHUNK_SIZE."""
+    pending: list[str] = []
+    size = 0
+    for part in parts:
+        pending.append(part)
+        size += len(part)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(pending).encode()
+            pending.clear()
+            size = 0
+    if pending:
+        yield "".join(pending).encode()
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip-compress a byte stream on the fly."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _export_response(
+    db: Session,
+    query: ORMQuery,
+    *,
+    name: str,
+    project_id: UUID,
+    format: str,
+    compress: bool,
+    to_record: Callable[[Any], dict],
+    csv_header: list[str],
+    to_csv_row: Callable[[Any], list],
+) -> StreamingResponse:
+    """Build a streaming export response for a query."""
+    rows = _iter_rows(db, query)
+    if format == "csv":
+        parts = _csv_lines(csv_header, (to_csv_row(r) for r in rows))
+    elif format == "ndjson":
+        parts = _ndjson_lines(to_record(r) for r in rows)
+    else:
+        parts = _json_document(name, project_id, (to_record(r) for r in rows))
+
+    body: Iterator[bytes] = _chunked(parts)
+    filename = f"{name}_{project_id}.{format}"
+    media_type = _MEDIA_TYPES[format]
+    if compress:
+        body = _gzipped(body)
+        filename += ".gz"
+        media_type = "application/gzip"
 
-    # Data rows
-    for e in extractions:
-        # Flatten v2 data for tabular export
-        export_data = e.data
-        if safe_data_version(e) >= 2 and e.data:
-            from services.extraction.extraction_items import v2_to_flat
-
-            export_data = v2_to_flat(e.data)
-        writer.writerow(
-            [
-                str(e.id),
-                str(e.source_id) if e.source_id else "",
-                e.extraction_type,
-                json.dumps(export_data) if export_data else "",
-                e.source_group,
-                e.confidence,
-                e.profile_used,
-                e.created_at.isoformat() if e.created_at else "",
-            ]
-        )
-
-    output.seek(0)
-
-    filename = f"extractions_{project_id}.csv"
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        body,
+        media_type=media_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -21,6 +21,7 @@ from models import (
 from orm_models import Job
 from services.extraction.extraction_items import safe_data_version
 from services.projects.repository import ProjectRepository
+from services.storage.pagination import CountMode
 from services.storage.repositories.extraction import (
     ExtractionFilters,
     ExtractionRepository,
@@ -107,6 +108,7 @@ async def create_extraction_job(
         # Count sources that will be processed based on force flag
         # Worker processes: "ready" + "pending", and "extracted" if force=True
         from orm_models import Source
+        from services.storage.repositories.source import source_has_content
 
         allowed_statuses = [SourceStatus.READY, SourceStatus.PENDING]
         if request.force:
@@ -117,7 +119,7 @@ async def create_extraction_job(
             .filter(
                 Source.project_id == project_uuid,
                 Source.status.in_(allowed_statuses),
-                Source.content.isnot(None),
+                source_has_content(),
             )
             .count()
         )
@@ -177,6 +179,12 @@ async def list_extractions(
     ),
     limit: int = Query(default=50, ge=1, le=100, description="Page size"),
     offset: int = Query(default=0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces offset)"
+    ),
+    count: CountMode = Query(
+        default="exact", description="Total: exact count or fast estimate"
+    ),
     db: Session = Depends(get_db),
 ) -> ExtractionListResponse:
     """
@@ -190,6 +198,9 @@ async def list_extractions(
         min_confidence: Optional minimum confidence threshold
         limit: Page size (default 50, max 100)
         offset: Pagination offset (default 0)
+        cursor: Keyset cursor from the previous page's next_cursor; when
+            given, offset is ignored and deep pages stay fast
+        count: "exact" total or "estimate" (planner estimate on large lists)
         db: Database session
 
     Returns:
@@ -238,8 +249,10 @@ async def list_extractions(
 
     # Query extractions with DB-level pagination
     extraction_repo = ExtractionRepository(db)
-    total = extraction_repo.count(filters)
-    paginated_extractions = extraction_repo.list(filters, limit=limit, offset=offset)
+    total, total_estimated = extraction_repo.count_total(filters, count)
+    paginated_extractions, next_cursor = extraction_repo.list_page(
+        filters, limit, offset=offset, cursor=cursor
+    )
 
     # Convert to response format
     extractions_data = []
@@ -263,6 +276,8 @@ async def list_extractions(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, func, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_dlq_service, get_qdrant_repository
@@ -22,11 +22,15 @@ from models import (
 from orm_models import Job, Source
 from services.dlq.service import DLQService
 from services.job.cleanup_service import JobCleanupService
+from services.storage.pagination import CountMode, Keyset, count_rows, paginate
 from services.storage.qdrant.repository import QdrantRepository
 from services.storage.repositories.job import JobRepository
 
 router = APIRouter(prefix="/api/v1", tags=["jobs"])
 
+# Newest first; id breaks ties for keyset cursors
+_JOB_ORDER = Keyset(Job.created_at, Job.id)
+
 
 @router.get("/jobs", status_code=status.HTTP_200_OK)
 def list_jobs(
@@ -44,9 +48,15 @@ def list_jobs(
     ),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces offset)"
+    ),
+    count: CountMode = Query(
+        default="exact", description="Total: exact count or fast estimate"
+    ),
     db: Session = Depends(get_db),
 ) -> JobListResponse:
-    """List all jobs with optional filtering."""
+    """List all jobs with optional filtering, newest first."""
     # Build query with filters
     query = select(Job)
 
@@ -62,27 +72,10 @@ def list_jobs(
     if created_before:
         query = query.where(Job.created_at <= created_before)
 
-    # Sort by created_at descending (newest first)
-    query = query.order_by(desc(Job.created_at))
-
-    # Get total count
-    count_query = select(Job.id)
-    if type:
-        count_query = count_query.where(Job.type == type)
-    if status_filter:
-        count_query = count_query.where(Job.status == status_filter)
-    if created_after:
-        count_query = count_query.where(Job.created_at >= created_after)
-    if created_before:
-        count_query = count_query.where(Job.created_at <= created_before)
-
-    total = len(db.execute(count_query).all())
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    # Execute query
-    jobs = db.execute(query).scalars().all()
+    total, total_estimated = count_rows(db, query, count)
+    jobs, next_cursor = paginate(
+        db, query, _JOB_ORDER, limit, offset=offset, cursor=cursor
+    )
 
     # Convert to response models
     job_summaries = [
@@ -103,6 +96,8 @@ def list_jobs(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
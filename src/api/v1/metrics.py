@@ -5,8 +5,9 @@ from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 
 from database import get_db
-from services.metrics.collector import MetricsCollector
+from services.metrics.instruments import REGISTRY
 from services.metrics.prometheus import format_prometheus
+from services.metrics.snapshot import get_metrics_snapshot
 
 router = APIRouter(tags=["metrics"])
 
@@ -15,12 +16,14 @@ router = APIRouter(tags=["metrics"])
 def get_metrics(db: Session = Depends(get_db)) -> str:
     """Get Prometheus-format metrics.
 
-    Returns system metrics in Prometheus text exposition format.
+    Returns system metrics in Prometheus text exposition format, followed
+    by the in-process hot-path histograms and counters. Database metrics
+    come from a background-refreshed snapshot at most
+    ``metrics_max_staleness`` seconds old.
     This endpoint is unauthenticated to allow Prometheus scraping.
 
     Returns:
         Metrics in Prometheus text exposition format.
     """
-    collector = MetricsCollector(db)
-    metrics = collector.collect()
-    return format_prometheus(metrics)
+    metrics = get_metrics_snapshot().get(db)
+    return format_prometheus(metrics) + REGISTRY.render()
@@ -18,7 +18,6 @@ from models import (
     TemplateResponse,
 )
 from orm_models import Extraction
-from services.extraction.extraction_items import safe_data_version
 from services.projects.repository import ProjectRepository
 from services.projects.template_loader import (
     get_all_templates,
@@ -302,35 +301,14 @@ async def create_from_template(
     return ProjectResponse.model_validate(db_project)
 
 
-@router.post("/{project_id}/backfill-grounding")
-async def backfill_grounding(
-    project_id: UUID,
-    dry_run: bool = Query(
-        default=False, description="Compute scores without writing to DB"
-    ),
-    batch_size: int = Query(default=500, ge=1, le=5000, description="Batch size"),
-    db: Session = Depends(get_db),
+def _queue_backfill(
+    db: Session, project_id: UUID, mode: str, dry_run: bool, batch_size: int
 ) -> dict:
-    """Backfill string-match grounding scores for all extractions in a project.
-
-    Computes grounding scores by matching extracted values against source quotes.
-    This is a CPU-only operation (no LLM calls) and runs synchronously.
-    """
-    from collections import defaultdict
-
-    from services.extraction.grounding import (
-        compute_entity_list_grounding_scores,
-        compute_grounding_scores,
-        extract_entity_list_groups,
-        extract_field_types_from_schema,
-    )
-    from services.storage.repositories.extraction import (
-        ExtractionFilters,
-        ExtractionRepository,
-    )
+    """Validate the project schema and queue a grounding backfill job."""
+    from constants import JobStatus, JobType
+    from orm_models import Job
 
-    repo = ProjectRepository(db)
-    project = repo.get(project_id)
+    project = ProjectRepository(db).get(project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -344,68 +322,62 @@ async def backfill_grounding(
             detail="Project has no extraction schema with field_groups",
         )
 
-    field_types_by_group = extract_field_types_from_schema(schema)
-    entity_list_groups = extract_entity_list_groups(schema)
-    _ctx = schema.get("extraction_context") or {}
-    _id_fields = tuple(_ctx.get("entity_id_fields") or ("entity_id", "name", "id"))
-    ext_repo = ExtractionRepository(db)
-    filters = ExtractionFilters(project_id=project_id)
-    total_count = ext_repo.count(filters)
-
-    stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    processed = 0
-    updated = 0
-    skipped = 0
-    offset = 0
-
-    while offset < total_count:
-        extractions = ext_repo.list(filters, limit=batch_size, offset=offset)
-        if not extractions:
-            break
-
-        updates: list[tuple[UUID, dict[str, float]]] = []
-        for ext in extractions:
-            # v2 extractions have inline grounding — skip backfill
-            if safe_data_version(ext) >= 2:
-                skipped += 1
-                continue
-
-            field_types = field_types_by_group.get(ext.extraction_type, {})
-            if not field_types:
-                skipped += 1
-                continue
-
-            if ext.extraction_type in entity_list_groups:
-                scores = compute_entity_list_grounding_scores(
-                    ext.data, ext.extraction_type, field_types, _id_fields
-                )
-            else:
-                scores = compute_grounding_scores(ext.data, field_types)
-            if scores:
-                updates.append((ext.id, scores))
-                for field_name, score in scores.items():
-                    bucket = "grounded" if score >= 0.5 else "ungrounded"
-                    stats[field_name][bucket] += 1
-
-            processed += 1
-
-        if updates and not dry_run:
-            updated += ext_repo.update_grounding_scores_batch(updates)
-            db.commit()
+    job = Job(
+        type=JobType.BACKFILL,
+        status=JobStatus.QUEUED,
+        project_id=project_id,
+        payload={
+            "project_id": str(project_id),
+            "mode": mode,
+            "dry_run": dry_run,
+            "batch_size": batch_size,
+        },
+    )
+    db.add(job)
+    db.commit()
 
-        offset += batch_size
+    logger.info(
+        "grounding_backfill_queued",
+        project_id=str(project_id),
+        job_id=str(job.id),
+        mode=mode,
+        dry_run=dry_run,
+    )
 
     return {
-        "total_extractions": total_count,
-        "processed": processed,
-        "updated": updated,
-        "skipped_no_field_types": skipped,
-        "dry_run": dry_run,
-        "field_stats": {field: dict(counts) for field, counts in sorted(stats.items())},
+        "job_id": str(job.id),
+        "status": "queued",
+        "project_id": str(project_id),
     }
 
 
-@router.post("/{project_id}/backfill-grounding-v2")
+@router.post(
+    "/{project_id}/backfill-grounding",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def backfill_grounding(
+    project_id: UUID,
+    dry_run: bool = Query(
+        default=False, description="Compute scores without writing to DB"
+    ),
+    batch_size: int = Query(default=500, ge=1, le=5000, description="Batch size"),
+    db: Session = Depends(get_db),
+) -> dict:
+    """Queue a backfill of string-match grounding scores for a project.
+
+    Computes grounding scores of v1 extractions by matching extracted values
+    against source quotes. Runs as a background job that scores batches in
+    parallel and resumes after a restart; poll GET /jobs/{job_id} for
+    progress. The finished job's result holds the totals, per-field stats
+    and throughput (extractions_per_second).
+    """
+    return _queue_backfill(db, project_id, "v1", dry_run, batch_size)
+
+
+@router.post(
+    "/{project_id}/backfill-grounding-v2",
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def backfill_grounding_v2(
     project_id: UUID,
     dry_run: bool = Query(
@@ -414,151 +386,15 @@ async def backfill_grounding_v2(
     batch_size: int = Query(default=100, ge=1, le=5000, description="Batch size"),
     db: Session = Depends(get_db),
 ) -> dict:
-    """Backfill grounding scores for v2 extractions.
+    """Queue a backfill of grounding scores for v2 extractions.
 
     V2 extractions store per-field grounding inline in the data JSONB column.
-    This re-computes grounding using ground_field_item() with current defaults
-    (text fields now use semantic grounding instead of none).
+    The background job re-computes grounding using ground_field_item() with
+    current defaults (text fields now use semantic grounding instead of none).
+    Poll GET /jobs/{job_id} for progress; in dry runs, the result's updated
+    count is the number of extractions that would change.
     """
-    from collections import defaultdict
-
-    from services.extraction.extraction_items import safe_data_version
-    from services.extraction.grounding import (
-        GROUNDING_DEFAULTS,
-        ground_field_item,
-    )
-    from services.storage.repositories.extraction import (
-        ExtractionFilters,
-        ExtractionRepository,
-    )
-
-    repo = ProjectRepository(db)
-    project = repo.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found",
-        )
-
-    schema = project.extraction_schema
-    if not schema or not schema.get("field_groups"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Project has no extraction schema with field_groups",
-        )
-
-    # Build field_type and grounding_mode maps per (group, field)
-    field_info_by_group: dict[str, dict[str, tuple[str, str | None]]] = {}
-    for fg in schema.get("field_groups", []):
-        group_name = fg.get("name", "")
-        if not group_name:
-            continue
-        fields: dict[str, tuple[str, str | None]] = {}
-        for f in fg.get("fields", []):
-            name = f.get("name", "")
-            ftype = f.get("field_type", "") or f.get("type", "")
-            gmode = f.get("grounding_mode")
-            if name and ftype:
-                fields[name] = (ftype, gmode)
-        if fields:
-            field_info_by_group[group_name] = fields
-
-    ext_repo = ExtractionRepository(db)
-    filters = ExtractionFilters(project_id=project_id)
-    total_count = ext_repo.count(filters)
-
-    stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    processed = 0
-    updated = 0
-    skipped = 0
-    offset = 0
-    source_content_cache: dict[UUID, str] = {}
-
-    while offset < total_count:
-        extractions = ext_repo.list(filters, limit=batch_size, offset=offset)
-        if not extractions:
-            break
-
-        updates: list[tuple[UUID, dict]] = []
-        for ext in extractions:
-            if safe_data_version(ext) < 2:
-                skipped += 1
-                continue
-
-            field_info = field_info_by_group.get(ext.extraction_type, {})
-            if not field_info:
-                skipped += 1
-                continue
-
-            # Get source content (cached)
-            if ext.source_id not in source_content_cache:
-                source = ext.source
-                source_content_cache[ext.source_id] = (
-                    (source.cleaned_content or source.content or "") if source else ""
-                )
-            source_content = source_content_cache[ext.source_id]
-
-            data = ext.data
-            if not isinstance(data, dict):
-                skipped += 1
-                continue
-
-            changed = False
-            for field_name, (field_type, gmode_override) in field_info.items():
-                field_data = data.get(field_name)
-                if not isinstance(field_data, dict):
-                    continue
-                value = field_data.get("value")
-                if value is None:
-                    continue
-                quote = field_data.get("quote")
-
-                effective_mode = gmode_override or GROUNDING_DEFAULTS.get(
-                    field_type, "required"
-                )
-                if effective_mode == "none":
-                    continue
-
-                new_score = ground_field_item(
-                    field_name,
-                    value,
-                    quote,
-                    source_content,
-                    field_type,
-                    grounding_mode=gmode_override,
-                )
-                old_score = float(field_data.get("grounding", 1.0))
-
-                if abs(new_score - old_score) > 0.001:
-                    field_data["grounding"] = round(new_score, 4)
-                    changed = True
-                    bucket = "grounded" if new_score >= 0.5 else "ungrounded"
-                    stats[field_name][bucket] += 1
-                    if old_score >= 0.5 and new_score < 0.5:
-                        stats[field_name]["downgraded"] += 1
-
-            if changed:
-                updates.append((ext.id, data))
-            processed += 1
-
-        if updates and not dry_run:
-            updated += ext_repo.update_v2_data_batch(updates)
-            db.commit()
-        elif updates:
-            updated += len(updates)
-
-        # Clear source cache between batches to limit memory
-        source_content_cache.clear()
-        offset += batch_size
-
-    return {
-        "total_extractions": total_count,
-        "processed": processed,
-        "updated": updated,
-        "skipped": skipped,
-        "dry_run": dry_run,
-        "field_stats": {field: dict(counts) for field, counts in sorted(stats.items())},
-    }
+    return _queue_backfill(db, project_id, "v2", dry_run, batch_size)
 
 
 @router.post("/{project_id}/consolidate")
@@ -583,6 +419,7 @@ async def consolidate_project(
     """
     from uuid import uuid4
 
+    from config import settings
     from constants import JobStatus, JobType
     from orm_models import Job
     from services.extraction.consolidation_service import ConsolidationService
@@ -620,7 +457,7 @@ async def consolidate_project(
         )
 
     # Non-LLM consolidation runs inline (fast)
-    service = ConsolidationService(db, repo)
+    service = ConsolidationService.from_config(db, repo, settings.consolidation)
 
     try:
         if source_group:
@@ -3,22 +3,29 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from config import settings
+from constants import JobStatus, JobType
 from database import get_db
 from models import ReportRequest, ReportResponse
-from orm_models import Report
+from orm_models import Job, Report
 from services.llm.client import LLMClient
 from services.projects.repository import ProjectRepository
 from services.reports.pdf import PDFConversionError, PDFConverter
 from services.reports.service import ReportService
+from services.storage.artifact_store import ArtifactNotFoundError, get_artifact_store
+from services.storage.pagination import CountMode, Keyset, count_rows, paginate
 from services.storage.repositories.entity import EntityRepository
 from services.storage.repositories.extraction import ExtractionRepository
 
 router = APIRouter(prefix="/api/v1", tags=["reports"])
 
+# Newest first; id breaks ties for keyset cursors
+_REPORT_ORDER = Keyset(Report.created_at, Report.id)
+
 
 @router.post(
     "/projects/{project_id}/reports",
@@ -28,13 +35,22 @@ router = APIRouter(prefix="/api/v1", tags=["reports"])
 async def create_report(
     project_id: UUID,
     request: ReportRequest,
+    background: bool = Query(
+        default=False, description="Generate the report as a background job"
+    ),
     db: Session = Depends(get_db),
 ) -> ReportResponse:
     """Generate a report for a project.
 
+    When background=True, creates a report job and returns 202 with a job_id.
+    Poll GET /jobs/{job_id} for progress; the finished job's result holds
+    the report_id. Use this for domain-grouped or large table reports that
+    would otherwise exceed HTTP timeouts.
+
     Args:
         project_id: Project UUID
         request: Report generation request
+        background: Queue generation instead of running it in the request
         db: Database session
 
     Returns:
@@ -52,6 +68,27 @@ async def create_report(
             detail=f"Project {project_id} not found",
         )
 
+    if background:
+        job = Job(
+            type=JobType.REPORT,
+            status=JobStatus.QUEUED,
+            project_id=project_id,
+            payload={
+                "project_id": str(project_id),
+                "request": request.model_dump(mode="json"),
+            },
+        )
+        db.add(job)
+        db.commit()
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "job_id": str(job.id),
+                "status": "queued",
+                "project_id": str(project_id),
+            },
+        )
+
     # Create service dependencies
     extraction_repo = ExtractionRepository(db)
     entity_repo = EntityRepository(db)
@@ -64,6 +101,7 @@ async def create_report(
             llm_client=llm_client,
             db_session=db,
             project_repo=project_repo,
+            artifact_store=get_artifact_store(),
         )
 
         try:
@@ -96,6 +134,12 @@ async def list_reports(
     project_id: UUID,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces offset)"
+    ),
+    count: CountMode = Query(
+        default="exact", description="Total: exact count or fast estimate"
+    ),
     db: Session = Depends(get_db),
 ) -> dict:
     """List reports for a project.
@@ -104,6 +148,8 @@ async def list_reports(
         project_id: Project UUID
         limit: Maximum number of reports to return
         offset: Number of reports to skip
+        cursor: Keyset cursor from the previous page (offset is then ignored)
+        count: "exact" total or "estimate" (planner estimate on large lists)
         db: Database session
 
     Returns:
@@ -122,10 +168,11 @@ async def list_reports(
         )
 
     # Query reports
-    query = db.query(Report).filter(Report.project_id == project_id)
-    total = query.count()
-
-    reports = query.order_by(Report.created_at.desc()).limit(limit).offset(offset).all()
+    query = select(Report).where(Report.project_id == project_id)
+    total, total_estimated = count_rows(db, query, count)
+    reports, next_cursor = paginate(
+        db, query, _REPORT_ORDER, limit, offset=offset, cursor=cursor
+    )
 
     # Convert to response format
     report_list = [
@@ -144,6 +191,8 @@ async def list_reports(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
+        "total_estimated": total_estimated,
     }
 
 
@@ -300,7 +349,11 @@ async def download_report(
     report_id: UUID,
     db: Session = Depends(get_db),
 ) -> Response:
-    """Download report in original format (markdown or xlsx)."""
+    """Download report in original format (markdown or xlsx).
+
+    Workbooks kept in the artifact store are streamed from disk; reports
+    created before the store existed fall back to the database column.
+    """
     report = (
         db.query(Report)
         .filter(Report.id == report_id, Report.project_id == project_id)
@@ -317,6 +370,25 @@ async def download_report(
     title = report.title or "report"
     safe_title = "".join(c for c in title if c.isalnum() or c in " -_")[:50]
 
+    if report.format == "xlsx" and report.artifact_key:
+        store = get_artifact_store()
+        try:
+            size = store.size(report.artifact_key)
+            chunks = store.iter_chunks(report.artifact_key)
+        except ArtifactNotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Artifact for report {report_id} is missing",
+            ) from e
+        return StreamingResponse(
+            chunks,
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={
+                "Content-Disposition": f'attachment; filename="{safe_title}.xlsx"',
+                "Content-Length": str(size),
+            },
+        )
+
     if report.format == "xlsx" and report.binary_content:
         return Response(
             content=report.binary_content,
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_project_or_404
@@ -16,9 +16,13 @@ from models import (
     SourceSummaryResponse,
 )
 from orm_models import Project, Source
+from services.storage.pagination import CountMode, Keyset, count_rows, paginate
 
 router = APIRouter(prefix="/api/v1", tags=["sources"])
 
+# Newest first; id breaks ties for keyset cursors
+_SOURCE_ORDER = Keyset(Source.created_at, Source.id)
+
 
 @router.get(
     "/projects/{project_id}/sources",
@@ -42,25 +46,30 @@ async def list_sources(
         default=50, ge=1, le=100, description="Number of results to return"
     ),
     offset: int = Query(default=0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces offset)"
+    ),
+    count: CountMode = Query(
+        default="exact", description="Total: exact count or fast estimate"
+    ),
     db: Session = Depends(get_db),
     project: Project = Depends(get_project_or_404),
 ) -> SourceListResponse:
     """List sources for a project with optional filtering and pagination."""
     # Build query
-    query = db.query(Source).filter(Source.project_id == project_id)
+    query = select(Source).where(Source.project_id == project_id)
 
     if source_group:
-        query = query.filter(Source.source_group == source_group)
+        query = query.where(Source.source_group == source_group)
     if status_filter:
-        query = query.filter(Source.status == status_filter)
+        query = query.where(Source.status == status_filter)
     if source_type:
-        query = query.filter(Source.source_type == source_type)
+        query = query.where(Source.source_type == source_type)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination and ordering
-    sources = query.order_by(Source.created_at.desc()).offset(offset).limit(limit).all()
+    total, total_estimated = count_rows(db, query, count)
+    sources, next_cursor = paginate(
+        db, query, _SOURCE_ORDER, limit, offset=offset, cursor=cursor
+    )
 
     # Convert to response models
     source_responses = [
@@ -82,6 +91,8 @@ async def list_sources(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
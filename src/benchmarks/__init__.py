@@ -0,0 +1 @@
+"""Offline benchmarks for the extraction pipeline (see scripts/bench_pipeline.py)."""
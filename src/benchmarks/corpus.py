@@ -0,0 +1,189 @@
+"""Benchmark page corpora: seeded synthetic pages or recorded JSONL pages.
+
+Synthetic pages imitate crawled company sites (product tables, locations,
+service and certification paragraphs, plus a few careers/privacy pages the
+rule-based classifier skips), so every field group of the drivetrain
+templates has something to extract. The same seed always yields the same
+pages.
+
+Recorded corpora are JSONL files with one page per line::
+
+    {"url": "...", "title": "...", "content": "<markdown>", "source_group": "..."}
+
+``title`` and ``source_group`` are optional; the group defaults to the URL
+host, matching how crawls group pages by company.
+"""
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+_CITIES = [
+    ("Munich", "Germany"),
+    ("Stuttgart", "Germany"),
+    ("Lyon", "France"),
+    ("Turin", "Italy"),
+    ("Brno", "Czech Republic"),
+    ("Gothenburg", "Sweden"),
+    ("Pittsburgh", "United States"),
+    ("Pune", "India"),
+    ("Suzhou", "China"),
+    ("Monterrey", "Mexico"),
+]
+_SITE_TYPES = ["headquarters", "manufacturing plant", "service center", "sales office"]
+_PRODUCT_KINDS = [
+    ("helical gearbox", "gearbox"),
+    ("planetary gearbox", "gearbox"),
+    ("worm gear unit", "gearbox"),
+    ("IE3 induction motor", "motor"),
+    ("servo motor", "motor"),
+    ("flexible coupling", "accessory"),
+]
+_SERIES = ["HX", "PL", "WG", "KM", "SV", "FC", "TR", "DX"]
+_SERVICES = [
+    "gearbox repair",
+    "motor rewinding",
+    "field service",
+    "condition monitoring",
+    "spare parts supply",
+    "commissioning",
+]
+_CERTIFICATIONS = ["ISO 9001", "ISO 14001", "ISO 45001", "ATEX", "IATF 16949"]
+_FILLER = [
+    "Our engineers support customers from the first sizing study to commissioning.",
+    "Every unit is tested on our own load test bench before shipment.",
+    "Customers in mining, cement and water treatment rely on our drives.",
+    "We keep a large stock of standard components for short delivery times.",
+    "Digital twins help us predict maintenance needs before failures occur.",
+    "Our team speaks twelve languages and serves customers in sixty countries.",
+]
+_SKIP_PATHS = ["careers", "privacy-policy", "login"]
+
+
+@dataclass(frozen=True)
+class BenchPage:
+    """One page to ingest as a source."""
+
+    url: str
+    title: str | None
+    content: str
+    source_group: str
+
+
+def synthetic_pages(
+    count: int,
+    *,
+    companies: int = 5,
+    page_chars: int = 6000,
+    seed: int = 42,
+) -> list[BenchPage]:
+    """Generate ``count`` deterministic company pages.
+
+    Args:
+        count: Number of pages.
+        companies: Source groups the pages are spread over.
+        page_chars: Approximate content length per page.
+        seed: Random seed.
+    """
+    rng = random.Random(seed)
+    names = [f"Synthdrive {i:02d} GmbH" for i in range(max(1, companies))]
+    pages = []
+    for i in range(count):
+        company = names[i % len(names)]
+        slug = company.split()[1]
+        host = f"https://www.synthdrive-{slug}.example"
+        if i % 17 == 16:
+            path = rng.choice(_SKIP_PATHS)
+            content = _skip_page(rng, company, path)
+            title = f"{path.replace('-', ' ').title()} | {company}"
+        else:
+            path = f"products/page-{i}"
+            content = _company_page(rng, company, page_chars)
+            title = f"Products and services | {company}"
+        pages.append(
+            BenchPage(
+                url=f"{host}/{path}",
+                title=title,
+                content=content,
+                source_group=company,
+            )
+        )
+    return pages
+
+
+def _company_page(rng: random.Random, company: str, page_chars: int) -> str:
+    employees = rng.randrange(80, 9000)
+    sites = rng.randrange(2, 14)
+    parts = [
+        f"# {company}",
+        (
+            f"{company} designs and manufactures industrial drive systems. "
+            f"The company employs {employees} people at {sites} sites worldwide."
+        ),
+    ]
+    while sum(len(p) + 2 for p in parts) < page_chars:
+        section = rng.randrange(4)
+        if section == 0:
+            kind, _ = rng.choice(_PRODUCT_KINDS)
+            series = f"{rng.choice(_SERIES)}-{rng.randrange(100, 990)}"
+            parts.append(
+                f"## {series} {kind}\n\n"
+                f"The {series} {kind} delivers {rng.randrange(1, 900)} kW "
+                f"and a rated torque of {rng.randrange(100, 90000)} Nm. "
+                f"Nominal speed is {rng.choice([750, 1000, 1500, 3000])} rpm "
+                f"at an efficiency of {rng.randrange(90, 98)} percent."
+            )
+        elif section == 1:
+            city, country = rng.choice(_CITIES)
+            parts.append(
+                f"Our {rng.choice(_SITE_TYPES)} in {city}, {country} serves "
+                f"customers across the region."
+            )
+        elif section == 2:
+            services = rng.sample(_SERVICES, 3)
+            parts.append(
+                f"We offer {services[0]}, {services[1]} and {services[2]} "
+                f"for gearboxes and motors of all brands."
+            )
+        else:
+            cert = rng.choice(_CERTIFICATIONS)
+            parts.append(f"All plants are certified to {cert}. {rng.choice(_FILLER)}")
+    return "\n\n".join(parts)
+
+
+def _skip_page(rng: random.Random, company: str, path: str) -> str:
+    return "\n\n".join(
+        [
+            f"# {path.replace('-', ' ').title()}",
+            f"This page belongs to {company}.",
+            rng.choice(_FILLER),
+        ]
+    )
+
+
+def load_pages(path: str | Path) -> list[BenchPage]:
+    """Read a recorded JSONL corpus.
+
+    Raises:
+        ValueError: If a line lacks ``url`` or ``content``.
+    """
+    pages = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not record.get("url") or not record.get("content"):
+                raise ValueError(f"{path}:{line_no}: url and content are required")
+            pages.append(
+                BenchPage(
+                    url=record["url"],
+                    title=record.get("title"),
+                    content=record["content"],
+                    source_group=record.get("source_group")
+                    or urlparse(record["url"]).netloc,
+                )
+            )
+    return pages
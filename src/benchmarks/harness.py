@@ -0,0 +1,546 @@
+"""End-to-end pipeline benchmark against mock LLM and embedding servers.
+
+Runs the real SchemaExtractionPipeline.extract_project (classification,
+chunked extraction, grounding and the grounding gate) followed by
+ConsolidationService.consolidate_project over a page corpus, wired the way
+ExtractionWorker wires them, with three substitutions that keep it offline:
+
+- LLM and embedding calls go to a MockOpenAIServer (see mock_openai).
+- The database is an in-memory SQLite session holding only the tables the
+  pipeline touches.
+- The smart classifier's Redis cache is an in-process dict.
+
+Stages are timed by wrapping the pipeline's own methods for the duration of
+the run; the time to each entity-list chunk's first grounded entity is
+reported as the ``first_grounded_entity`` stage, and entities salvaged from
+cut-off streams under ``streaming``. Things that need a live service are not
+exercised: Qdrant upserts (schema embedding is disabled), the Redis LLM
+queue (direct mode) and factAPI field validation.
+"""
+
+import resource
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.corpus import BenchPage
+from benchmarks.mock_openai import MockOpenAIServer
+
+# Orchestrator-level grounding helpers timed as the "grounding" stage
+_GROUNDING_FUNCTIONS = (
+    "compute_chunk_grounding",
+    "compute_chunk_grounding_entities",
+    "ground_field_item",
+    "ground_entity_item",
+    "ground_entity_fields",
+)
+
+# Report metrics compared against a baseline, and whether higher is better
+_TOP_LEVEL_METRICS = {
+    "throughput_sources_per_s": True,
+    "llm_calls_per_source": False,
+    "peak_rss_mb": False,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkOptions:
+    """What to run. None keeps the value from settings.
+
+    Args:
+        template: Project template whose schema is extracted.
+        data_version: Extraction data format (1 = flat, 2 = per-field).
+        max_concurrent_sources: Sources extracted concurrently.
+        extraction_batch_size: Sources per pipeline chunk (commit unit).
+        smart_classification: Embedding-based page classification.
+        skip_gate: LLM skip-gate (takes precedence over smart classification).
+        grounding_verifier: LLM rescue of borderline-grounded fields.
+        consolidate: Run consolidation after extraction.
+        stream_entities: Stream entity-list completions (ground entities as
+            they arrive, keep them if the stream is cut off).
+        llm_timeout: LLM HTTP timeout in seconds (bounds a whole stream).
+    """
+
+    template: str = "drivetrain_company_analysis"
+    data_version: int | None = None
+    max_concurrent_sources: int | None = None
+    extraction_batch_size: int | None = None
+    smart_classification: bool = True
+    skip_gate: bool = False
+    grounding_verifier: bool = True
+    consolidate: bool = True
+    stream_entities: bool = False
+    llm_timeout: int | None = None
+
+
+class StageTimer:
+    """Collects wall-clock samples per stage."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.samples[stage].append(seconds)
+
+    def wrap(self, func: Callable, stage: str) -> Callable:
+        """Return ``func`` timed under ``stage`` (sync or async)."""
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter() - start)
+
+            return timed_async
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+
+        return timed
+
+    def instrument(self, stack: ExitStack, target: Any, name: str, stage: str) -> None:
+        """Time ``target.name`` until ``stack`` closes."""
+        original = getattr(target, name)
+        setattr(target, name, self.wrap(original, stage))
+        stack.callback(setattr, target, name, original)
+
+    def tap(
+        self,
+        stack: ExitStack,
+        module: Any,
+        name: str,
+        record: Callable[[float, dict], None],
+    ) -> None:
+        """Also pass values of metrics instrument ``module.name`` to ``record``."""
+        original = getattr(module, name)
+        setattr(module, name, _InstrumentTap(original, record))
+        stack.callback(setattr, module, name, original)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            stage: {
+                "count": len(values),
+                "total_s": round(sum(values), 4),
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p99_ms": round(percentile(values, 99) * 1000, 3),
+            }
+            for stage, values in sorted(self.samples.items())
+        }
+
+
+class _InstrumentTap:
+    """Stand-in for a Counter or Histogram that also reports each value."""
+
+    def __init__(self, instrument: Any, record: Callable[[float, dict], None]):
+        self._instrument = instrument
+        self._record = record
+
+    def observe(self, value: float, **labels: Any) -> None:
+        self._record(value, labels)
+        self._instrument.observe(value, **labels)
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        self._record(amount, labels)
+        self._instrument.inc(amount, **labels)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+class _MemoryCache:
+    """Dict standing in for the smart classifier's Redis embedding cache."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self._data.get(k) for k in keys]
+
+    async def setex(self, key: str, _ttl: int, value: str) -> None:
+        self._data[key] = value
+
+
+def _create_session() -> Session:
+    from orm_models import (
+        Base,
+        ConsolidatedExtraction,
+        ContentBlob,
+        Extraction,
+        Job,
+        Project,
+        Source,
+    )
+
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            model.__table__
+            for model in (
+                Job,
+                Project,
+                Source,
+                ContentBlob,
+                Extraction,
+                ConsolidatedExtraction,
+            )
+        ],
+    )
+    return Session(engine)
+
+
+def _seed_project(session: Session, template_name: str, pages: list[BenchPage]):
+    from constants import SourceStatus
+    from orm_models import Project, Source
+    from services.projects.template_loader import get_template
+    from services.storage.content_hash import compute_content_hash
+
+    template = get_template(template_name)
+    if template is None:
+        raise ValueError(f"unknown template: {template_name}")
+
+    # Same embedding of config sections as project creation from a template
+    schema = dict(template["extraction_schema"])
+    for key in ("extraction_context", "classification_config"):
+        if template.get(key):
+            schema[key] = template[key]
+
+    project = Project(
+        name=f"benchmark-{template_name}",
+        source_config=template["source_config"],
+        extraction_schema=schema,
+        entity_types=template.get("entity_types", []),
+    )
+    session.add(project)
+    session.flush()
+    session.add_all(
+        Source(
+            project_id=project.id,
+            uri=page.url,
+            source_group=page.source_group,
+            title=page.title,
+            content=page.content,
+            content_hash=compute_content_hash(page.content),
+            status=SourceStatus.READY,
+        )
+        for page in pages
+    )
+    session.commit()
+    return project
+
+
+def _build_pipeline(session: Session, project, llm, options: BenchmarkOptions):
+    """Assemble the pipeline as ExtractionWorker._create_schema_pipeline does."""
+    from config import settings
+    from services.extraction.llm_grounding import LLMGroundingVerifier
+    from services.extraction.llm_skip_gate import LLMSkipGate
+    from services.extraction.pipeline import SchemaExtractionPipeline
+    from services.extraction.schema_adapter import (
+        ClassificationConfig,
+        ExtractionContext,
+    )
+    from services.extraction.schema_extractor import SchemaExtractor
+    from services.extraction.schema_orchestrator import SchemaExtractionOrchestrator
+    from services.extraction.smart_classifier import SmartClassifier
+    from services.llm.client import LLMClient
+    from services.storage.embedding import EmbeddingService
+
+    extraction = replace(
+        settings.extraction,
+        schema_embedding_enabled=False,
+        data_version=options.data_version or settings.extraction.data_version,
+        max_concurrent_sources=options.max_concurrent_sources
+        or settings.extraction.max_concurrent_sources,
+        extraction_batch_size=options.extraction_batch_size
+        or settings.extraction.extraction_batch_size,
+        stream_entities=options.stream_entities,
+    )
+    classification = replace(
+        settings.classification,
+        smart_enabled=options.smart_classification,
+        skip_gate_enabled=options.skip_gate,
+    )
+    schema = project.extraction_schema
+
+    extractor = SchemaExtractor(
+        llm,
+        content_limit=extraction.content_limit,
+        source_quoting=extraction.source_quoting_enabled,
+    )
+
+    smart_classifier = None
+    if options.smart_classification:
+        # Fresh semaphore bound to this run's event loop
+        EmbeddingService.configure_concurrency(extraction.embedding_max_concurrent)
+        embedding_service = EmbeddingService(
+            llm,
+            reranker_model=classification.reranker_model,
+            max_concurrent=extraction.embedding_max_concurrent,
+        )
+        smart_classifier = SmartClassifier(
+            embedding_service=embedding_service,
+            redis_client=_MemoryCache(),
+            app_config=classification,
+            classification_config=ClassificationConfig.from_dict(
+                schema.get("classification_config")
+            ),
+            embedding_model_name=embedding_service.model,
+        )
+
+    grounding_verifier = None
+    if options.grounding_verifier:
+        grounding_verifier = LLMGroundingVerifier(llm_client=LLMClient(llm))
+
+    skip_gate = None
+    if options.skip_gate:
+        skip_gate = LLMSkipGate(
+            llm_client=LLMClient(llm),
+            content_limit=classification.skip_gate_content_limit,
+            batch_size=classification.skip_gate_batch_size,
+        )
+
+    orchestrator = SchemaExtractionOrchestrator(
+        extractor,
+        extraction_config=extraction,
+        classification_config=classification,
+        context=ExtractionContext.from_dict(schema.get("extraction_context")),
+        smart_classifier=smart_classifier,
+        grounding_verifier=grounding_verifier,
+        skip_gate=skip_gate,
+        extraction_schema=schema,
+    )
+    pipeline = SchemaExtractionPipeline(
+        orchestrator, session, extraction_config=extraction
+    )
+    return pipeline, orchestrator, extractor
+
+
+async def run_benchmark(
+    pages: list[BenchPage],
+    server: MockOpenAIServer,
+    options: BenchmarkOptions | None = None,
+    name: str = "pipeline",
+) -> dict:
+    """Extract and consolidate ``pages`` once and return the report.
+
+    Args:
+        pages: Corpus to ingest as sources of a fresh project.
+        server: Running mock server the LLM and embedding clients call.
+        options: What to run.
+        name: Label stored in the report.
+    """
+    from config import settings
+    from services.extraction import schema_extractor, schema_orchestrator
+    from services.extraction.consolidation_service import ConsolidationService
+    from services.llm.client import LLMClient
+    from services.projects.repository import ProjectRepository
+
+    options = options or BenchmarkOptions()
+    llm = replace(
+        settings.llm,
+        base_url=server.base_url,
+        embedding_base_url=server.base_url,
+        api_key="benchmark",
+        http_timeout=options.llm_timeout or settings.llm.http_timeout,
+    )
+    session = _create_session()
+    project = _seed_project(session, options.template, pages)
+    pipeline, orchestrator, extractor = _build_pipeline(session, project, llm, options)
+    calls_before = server.stats()["calls"]
+    timer = StageTimer()
+    streaming: defaultdict[str, int] = defaultdict(int)
+
+    def count_interruption(amount: float, labels: dict) -> None:
+        streaming[f"interrupted_{labels['outcome']}"] += int(amount)
+
+    def count_salvaged(amount: float, labels: dict) -> None:
+        streaming["salvaged_entities"] += int(amount)
+
+    with ExitStack() as stack:
+        timer.instrument(stack, pipeline, "_classify_chunk", "classify")
+        timer.instrument(stack, pipeline, "extract_source", "extract_source")
+        timer.instrument(
+            stack, orchestrator, "extract_all_groups", "extract_all_groups"
+        )
+        timer.instrument(stack, extractor, "extract_field_group", "llm_extract")
+        for function in _GROUNDING_FUNCTIONS:
+            timer.instrument(stack, schema_orchestrator, function, "grounding")
+        timer.instrument(
+            stack, schema_orchestrator, "apply_grounding_gate", "grounding_gate"
+        )
+        timer.tap(
+            stack,
+            schema_orchestrator,
+            "ENTITY_FIRST_GROUNDED_SECONDS",
+            lambda seconds, _: timer.record("first_grounded_entity", seconds),
+        )
+        timer.tap(
+            stack, schema_extractor, "LLM_STREAM_INTERRUPTIONS", count_interruption
+        )
+        timer.tap(
+            stack, schema_extractor, "LLM_STREAM_SALVAGED_ENTITIES", count_salvaged
+        )
+
+        start = time.perf_counter()
+        result = await pipeline.extract_project(project.id)
+        extract_seconds = time.perf_counter() - start
+        timer.record("extract_project", extract_seconds)
+
+        consolidated = {}
+        if options.consolidate:
+            service = ConsolidationService(
+                session,
+                ProjectRepository(session),
+                max_concurrent_groups=settings.consolidation.max_concurrent_groups,
+                llm_max_concurrent=settings.consolidation.llm_max_concurrent,
+            )
+            timer.instrument(stack, service, "_consolidate_group", "consolidate_group")
+            llm_client = LLMClient(llm)
+            consolidate_start = time.perf_counter()
+            consolidated = await service.consolidate_project(
+                project.id, llm_client=llm_client
+            )
+            session.commit()
+            timer.record("consolidate", time.perf_counter() - consolidate_start)
+            await llm_client.close()
+        wall_seconds = time.perf_counter() - start
+
+    session.close()
+    calls = {
+        kind: count - calls_before.get(kind, 0)
+        for kind, count in server.stats()["calls"].items()
+    }
+    llm_calls = sum(
+        count
+        for kind, count in calls.items()
+        if kind not in ("embedding", "embedding_texts", "rerank")
+    )
+    sources = len(pages)
+    return {
+        "name": name,
+        "created_at": datetime.now(UTC).isoformat(),
+        "options": {
+            **asdict(options),
+            "pages": sources,
+            "chat_latency_ms": server.settings.chat_latency.mean_ms,
+            "embedding_latency_ms": server.settings.embedding_latency.mean_ms,
+            "stream_stall_at": server.settings.stream_stall_at,
+        },
+        "sources": sources,
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_sources_per_s": round(sources / wall_seconds, 3)
+        if wall_seconds
+        else 0.0,
+        "stages": timer.summary(),
+        "calls": calls,
+        "llm_calls": llm_calls,
+        "llm_calls_per_source": round(llm_calls / sources, 3) if sources else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "streaming": {
+            "interrupted_salvaged": streaming["interrupted_salvaged"],
+            "interrupted_failed": streaming["interrupted_failed"],
+            "salvaged_entities": streaming["salvaged_entities"],
+        },
+        "result": {
+            "sources_processed": result.sources_processed,
+            "sources_failed": result.sources_failed,
+            "sources_skipped": result.sources_skipped,
+            "total_extractions": result.total_extractions,
+            "consolidated_records": consolidated.get("records_created", 0),
+        },
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than the baseline by more than the threshold."""
+
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.metric}: {self.baseline:g} -> {self.current:g} "
+            f"({self.change_pct:+.1f}%)"
+        )
+
+
+def compare_reports(
+    current: dict,
+    baseline: dict,
+    threshold_pct: float = 10.0,
+    min_latency_ms: float = 1.0,
+) -> list[Regression]:
+    """List metrics of ``current`` that regressed against ``baseline``.
+
+    Compared: throughput, LLM calls per source, peak RSS and each stage's
+    p50/p99 latency. Latencies whose absolute change is below
+    ``min_latency_ms`` are ignored as timer noise.
+
+    Args:
+        current: Report from run_benchmark.
+        baseline: Stored report to compare with.
+        threshold_pct: Allowed relative worsening per metric.
+        min_latency_ms: Noise floor for stage latencies.
+    """
+    regressions = []
+
+    def check(metric: str, old: float, new: float, higher_is_better: bool) -> None:
+        if not old:
+            return
+        change = (new - old) / old * 100
+        worse = -change if higher_is_better else change
+        if worse > threshold_pct:
+            regressions.append(Regression(metric, old, new, round(change, 1)))
+
+    for metric, higher_is_better in _TOP_LEVEL_METRICS.items():
+        if metric in baseline and metric in current:
+            check(metric, baseline[metric], current[metric], higher_is_better)
+
+    for stage, old_stats in baseline.get("stages", {}).items():
+        new_stats = current.get("stages", {}).get(stage)
+        if new_stats is None:
+            continue
+        for key in ("p50_ms", "p99_ms"):
+            if abs(new_stats[key] - old_stats[key]) >= min_latency_ms:
+                check(f"stages.{stage}.{key}", old_stats[key], new_stats[key], False)
+
+    return regressions
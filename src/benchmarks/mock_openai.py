@@ -0,0 +1,595 @@
+"""Deterministic mock of the OpenAI-compatible LLM and embedding servers.
+
+Serves the endpoints the pipeline calls:
+
+- ``POST /v1/chat/completions``: recognises the prompts of the schema
+  extractor (v1 and v2, field groups and entity lists), the LLM skip-gate
+  (single and batched), the grounding verifier (rescue and verify) and
+  consolidation summaries, and answers with well-formed JSON built from the
+  page content in the prompt. Quotes are verbatim 15-50 character excerpts,
+  so grounding behaves as it does on a good model. With ``"stream": true``
+  the answer is sent as server-sent event chunks spread over the simulated
+  latency, and can be made to stall part-way to simulate a timeout.
+- ``POST /v1/embeddings``: hashed bag-of-words vectors (similar texts give
+  similar vectors).
+- ``POST /v1/rerank``: word-overlap relevance scores.
+- ``GET /_stats``: request counts per kind and token totals.
+
+Answers depend only on the request body, and so do the simulated latencies
+(seeded per request), so two runs over the same corpus issue the same
+calls and wait the same total time regardless of scheduling.
+
+The server runs in a child process so it neither shares the benchmarked
+event loop nor the GIL, and its memory is not counted in the pipeline's
+peak RSS.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import multiprocessing
+import random
+import re
+import socket
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+
+import httpx
+
+_FIELD_SPEC = re.compile(r'^- "(?P<name>[^"]+)" \((?P<type>\w+)\):(?P<rest>.*)$', re.M)
+_OPTIONS = re.compile(r"\[options: (?P<options>[^\]]*)\]")
+_ENTITY_KEY = re.compile(r'^\s*"(?P<key>\w+)": \[\s*$', re.M)
+_ALREADY_FOUND = re.compile(
+    r"Already extracted entities \(DO NOT repeat these\): \[(.*)\]"
+)
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_MARKUP_PREFIX = re.compile(r"^[#>*\-\s|]+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)?")
+_WORD = re.compile(r"\w+")
+_PAGE_COUNT = re.compile(r"Should each of the (\d+) pages")
+
+_MIN_QUOTE = 15
+_MAX_QUOTE = 50
+
+# Characters per streamed chunk (a few tokens)
+_STREAM_CHUNK_CHARS = 16
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Simulated response time: ``mean_ms`` ± uniform ``jitter_ms``."""
+
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def delay(self, seed: int, body: bytes) -> float:
+        """Seconds to wait for a request, reproducible per body."""
+        if self.mean_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+        rng = random.Random(seed ^ _stable_hash(body))
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.mean_ms + jitter) / 1000
+
+
+@dataclass(frozen=True)
+class MockSettings:
+    """Behaviour of a mock server instance.
+
+    ``stream_stall_at`` (0-1): streamed answers stop sending after this
+    fraction of their content and hold the connection open, as a server
+    that hangs mid-generation does. None streams every answer to the end.
+    """
+
+    chat_latency: Latency = Latency()
+    embedding_latency: Latency = Latency()
+    embedding_dimension: int = 1024
+    seed: int = 0
+    stream_stall_at: float | None = None
+
+
+def _stable_hash(data: bytes | str) -> int:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+# ── Content helpers ──
+
+
+def _sentences(content: str) -> list[str]:
+    """Candidate quote sources: content sentences without leading markup."""
+    found = []
+    for raw in _SENTENCE_SPLIT.split(content):
+        sentence = _MARKUP_PREFIX.sub("", raw).strip()
+        if len(sentence) >= _MIN_QUOTE:
+            found.append(sentence)
+    return found
+
+
+def _clip(sentence: str, start: int = 0) -> str:
+    """A verbatim excerpt of at most 50 chars beginning at ``start``."""
+    text = sentence[start:]
+    if len(text) <= _MAX_QUOTE:
+        return text.rstrip()
+    cut = text.rfind(" ", _MIN_QUOTE, _MAX_QUOTE + 1)
+    return text[: cut if cut > 0 else _MAX_QUOTE].rstrip()
+
+
+def _words(text: str, count: int) -> str:
+    """The first ``count`` words of a text, verbatim."""
+    matches = list(_WORD.finditer(text))[:count]
+    return text[: matches[-1].end()] if matches else text
+
+
+def _prompt_content(user_prompt: str) -> str:
+    """Page content between the extractor's ``---`` markers."""
+    start = user_prompt.find("\n---\n")
+    end = user_prompt.rfind("\n---")
+    if start < 0 or end <= start:
+        return user_prompt
+    return user_prompt[start + 5 : end]
+
+
+def _field_specs(system_prompt: str) -> list[tuple[str, str, list[str]]]:
+    specs = []
+    for match in _FIELD_SPEC.finditer(system_prompt):
+        options = _OPTIONS.search(match["rest"])
+        enum_values = (
+            [o.strip() for o in options["options"].split(",")] if options else []
+        )
+        specs.append((match["name"], match["type"], enum_values))
+    return specs
+
+
+class _Picker:
+    """Deterministic choices keyed on the content and a label."""
+
+    def __init__(self, content: str) -> None:
+        self._content_hash = _stable_hash(content)
+
+    def rng(self, label: str) -> random.Random:
+        return random.Random(self._content_hash ^ _stable_hash(label))
+
+
+def _field_value(
+    field_type: str,
+    enum_values: list[str],
+    sentences: list[str],
+    rng: random.Random,
+) -> tuple[object, str | None]:
+    """(value, quote) for one field, drawn from the sentences."""
+    if field_type in ("integer", "float"):
+        numeric = [s for s in sentences if _NUMBER.search(s)]
+        if not numeric:
+            return None, None
+        sentence = rng.choice(numeric)
+        number = _NUMBER.search(sentence)
+        quote = _clip(sentence, max(0, number.start() - 20))
+        text = number.group().replace(",", ".")
+        if number.group() not in quote:
+            quote = _clip(sentence, number.start())
+        value = float(text) if field_type == "float" else int(float(text))
+        return value, quote
+    sentence = rng.choice(sentences)
+    quote = _clip(sentence)
+    if field_type == "boolean":
+        return True, quote
+    if field_type == "enum":
+        return (rng.choice(enum_values) if enum_values else None), quote
+    if field_type == "list":
+        picked = rng.sample(sentences, min(2, len(sentences)))
+        return [_words(_clip(s), 3) for s in picked], _clip(picked[0])
+    if field_type == "summary":
+        return quote, quote
+    return _words(quote, 3), quote
+
+
+def _entity_value(
+    field_type: str, enum_values: list[str], quote: str, index: int
+) -> object:
+    """Value of the ``index``-th entity field, taken from the entity quote."""
+    if field_type in ("integer", "float"):
+        numbers = _NUMBER.findall(quote)
+        if not numbers:
+            return None
+        value = float(numbers[index % len(numbers)].replace(",", "."))
+        return value if field_type == "float" else int(value)
+    if field_type == "boolean":
+        return True
+    if field_type == "enum":
+        return enum_values[index % len(enum_values)] if enum_values else None
+    words = list(_WORD.finditer(quote))
+    if index == 0 or len(words) < 2:
+        return _words(quote, 3)
+    # Later text fields take a two-word span further into the quote
+    start = words[index % (len(words) - 1)].start()
+    return _words(quote[start:], 2)
+
+
+# ── Chat responders ──
+
+
+def _extract_fields(system_prompt: str, user_prompt: str, v2: bool) -> dict:
+    content = _prompt_content(user_prompt)
+    sentences = _sentences(content)
+    picker = _Picker(content)
+    values, quotes, confidences = {}, {}, {}
+    for name, field_type, enum_values in _field_specs(system_prompt):
+        rng = picker.rng(name)
+        # Roughly one field in five has nothing on the page
+        if not sentences or rng.random() < 0.2:
+            values[name] = None
+            continue
+        values[name], quotes[name] = _field_value(
+            field_type, enum_values, sentences, rng
+        )
+        confidences[name] = round(rng.uniform(0.6, 0.95), 2)
+
+    if v2:
+        return {
+            "fields": {
+                name: {
+                    "value": value,
+                    "confidence": confidences.get(name, 0.0),
+                    "quote": quotes.get(name),
+                }
+                for name, value in values.items()
+            }
+        }
+    result = dict(values)
+    result["confidence"] = max(confidences.values(), default=0.0)
+    result["_quotes"] = quotes
+    return result
+
+
+def _extract_entities(system_prompt: str, user_prompt: str, key: str) -> dict:
+    v2 = '"has_more"' in system_prompt
+    content = _prompt_content(user_prompt)
+    sentences = _sentences(content)
+    picker = _Picker(content)
+    specs = _field_specs(system_prompt)
+    excluded = set()
+    if match := _ALREADY_FOUND.search(system_prompt):
+        excluded = {e.strip().lower() for e in match.group(1).split(",")}
+
+    rng = picker.rng(key)
+    count = min(len(sentences), rng.randrange(1, 4))
+    entities = []
+    for sentence in rng.sample(sentences, count):
+        quote = _clip(sentence)
+        entity: dict = {}
+        for i, (name, field_type, enum_values) in enumerate(specs):
+            entity[name] = _entity_value(field_type, enum_values, quote, i)
+        if specs and str(entity[specs[0][0]]).lower() in excluded:
+            continue
+        entity["_quote"] = quote
+        if v2:
+            entity["_confidence"] = round(rng.uniform(0.6, 0.95), 2)
+        entities.append(entity)
+
+    if v2:
+        return {key: entities, "has_more": False}
+    return {key: entities, "confidence": 0.8 if entities else 0.0}
+
+
+def _skip_gate(system_prompt: str, user_prompt: str) -> dict:
+    if '"decisions"' in system_prompt:
+        match = _PAGE_COUNT.search(user_prompt)
+        count = int(match.group(1)) if match else 0
+        return {
+            "decisions": [
+                {"page": n, "decision": "extract"} for n in range(1, count + 1)
+            ]
+        }
+    return {"decision": "extract"}
+
+
+def _rescue(user_prompt: str) -> dict:
+    claimed = re.search(r"^Claimed value: (.*)$", user_prompt, re.M)
+    start = user_prompt.find("Source text:\n")
+    end = user_prompt.rfind("\n\nFind the exact verbatim passage")
+    source = user_prompt[start + len("Source text:\n") : end] if start >= 0 else ""
+    value = claimed.group(1).strip() if claimed else ""
+    pos = source.find(value) if value else -1
+    if pos < 0:
+        return {"found": False, "quote": None}
+    line_start = source.rfind("\n", 0, pos) + 1
+    return {"found": True, "quote": _clip(source, max(line_start, pos - 10))}
+
+
+def _summary(user_prompt: str) -> str:
+    lines = [line.strip("-* ").strip() for line in user_prompt.splitlines()]
+    candidates = [line for line in lines[1:] if line]
+    return candidates[-1] if candidates else ""
+
+
+def chat_reply(body: dict) -> tuple[str, str]:
+    """Answer a chat completion request.
+
+    Returns:
+        Tuple of (request kind, assistant message content).
+    """
+    messages = body.get("messages") or []
+    system = next((m["content"] for m in messages if m["role"] == "system"), "")
+    user = next((m["content"] for m in messages if m["role"] == "user"), "")
+
+    if "You classify web pages" in system:
+        return "skip_gate", json.dumps(_skip_gate(system, user))
+    if "source verification assistant" in system:
+        return "grounding_rescue", json.dumps(_rescue(user))
+    if "fact verification assistant" in system:
+        return "grounding_verify", json.dumps(
+            {"supported": True, "reason": "The quote states the value."}
+        )
+    if "concise information synthesizer" in system:
+        return "summarize", _summary(user)
+    if '"fields": {' in system:
+        return "extract", json.dumps(_extract_fields(system, user, v2=True))
+    if match := _ENTITY_KEY.search(system):
+        return "extract_entities", json.dumps(
+            _extract_entities(system, user, match["key"])
+        )
+    if "Output JSON with exactly these fields" in system:
+        return "extract", json.dumps(_extract_fields(system, user, v2=False))
+    return "other", "{}"
+
+
+# ── Embeddings and rerank ──
+
+
+def embed_text(text: str, dimension: int) -> list[float]:
+    """Unit-length hashed bag-of-words vector."""
+    vector = [0.0] * dimension
+    for word in _WORD.findall(text.lower()):
+        h = _stable_hash(word)
+        vector[h % dimension] += 1.0 if (h >> 32) & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def rerank_scores(query: str, documents: list[str]) -> list[float]:
+    """Share of the document's words that also appear in the query."""
+    query_words = set(_WORD.findall(query.lower()))
+    scores = []
+    for doc in documents:
+        words = set(_WORD.findall(doc.lower()))
+        scores.append(round(len(words & query_words) / len(words), 4) if words else 0.0)
+    return scores
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# ── Server ──
+
+
+def _sse(payload: dict | str) -> str:
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    return f"data: {data}\n\n"
+
+
+async def _stream_chunks(
+    body: dict,
+    completion_id: str,
+    content: str,
+    delay: float,
+    usage: dict,
+    stall_at: float | None,
+):
+    """Server-sent events for a streamed chat completion."""
+    pieces = [
+        content[i : i + _STREAM_CHUNK_CHARS]
+        for i in range(0, len(content), _STREAM_CHUNK_CHARS)
+    ] or [""]
+    stall_after = len(pieces) if stall_at is None else int(len(pieces) * stall_at)
+    chunk = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": body.get("model", "mock"),
+    }
+    for index, piece in enumerate(pieces):
+        if index >= stall_after:
+            # Hang until the client gives up and disconnects
+            await asyncio.sleep(3600)
+        await asyncio.sleep(delay / len(pieces))
+        delta = {"content": piece}
+        if index == 0:
+            delta["role"] = "assistant"
+        yield _sse(
+            {
+                **chunk,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+            }
+        )
+    yield _sse(
+        {**chunk, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+    )
+    if (body.get("stream_options") or {}).get("include_usage"):
+        yield _sse({**chunk, "choices": [], "usage": usage})
+    yield _sse("[DONE]")
+
+
+def create_app(settings: MockSettings):
+    """Build the FastAPI app for a mock server."""
+    from fastapi import FastAPI, Request
+    from fastapi.responses import StreamingResponse
+
+    app = FastAPI()
+    calls: Counter[str] = Counter()
+    tokens: Counter[str] = Counter()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        raw = await request.body()
+        body = json.loads(raw)
+        kind, content = chat_reply(body)
+        delay = settings.chat_latency.delay(settings.seed, raw)
+        prompt_tokens = sum(_tokens(m.get("content") or "") for m in body["messages"])
+        completion_tokens = _tokens(content)
+        calls[kind] += 1
+        tokens["prompt"] += prompt_tokens
+        tokens["completion"] += completion_tokens
+        completion_id = f"chatcmpl-bench-{_stable_hash(raw):x}"
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        if body.get("stream"):
+            return StreamingResponse(
+                _stream_chunks(
+                    body,
+                    completion_id,
+                    content,
+                    delay,
+                    usage,
+                    settings.stream_stall_at,
+                ),
+                media_type="text/event-stream",
+            )
+        await asyncio.sleep(delay)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": 0,
+            "model": body.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request) -> dict:
+        raw = await request.body()
+        body = json.loads(raw)
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        await asyncio.sleep(settings.embedding_latency.delay(settings.seed, raw))
+        calls["embedding"] += 1
+        calls["embedding_texts"] += len(texts)
+        usage = sum(_tokens(t) for t in texts)
+        return {
+            "object": "list",
+            "model": body.get("model", "mock"),
+            "data": [
+                {
+                    "object": "embedding",
+                    "index": i,
+                    "embedding": embed_text(text, settings.embedding_dimension),
+                }
+                for i, text in enumerate(texts)
+            ],
+            "usage": {"prompt_tokens": usage, "total_tokens": usage},
+        }
+
+    @app.post("/v1/rerank")
+    async def rerank(request: Request) -> dict:
+        raw = await request.body()
+        body = json.loads(raw)
+        await asyncio.sleep(settings.embedding_latency.delay(settings.seed, raw))
+        calls["rerank"] += 1
+        scores = rerank_scores(body["query"], body["documents"])
+        return {
+            "results": [
+                {"index": i, "relevance_score": score} for i, score in enumerate(scores)
+            ]
+        }
+
+    @app.get("/_stats")
+    async def stats() -> dict:
+        return {"calls": dict(calls), "tokens": dict(tokens)}
+
+    return app
+
+
+def _serve(settings: dict, conn) -> None:
+    import uvicorn
+
+    settings["chat_latency"] = Latency(**settings["chat_latency"])
+    settings["embedding_latency"] = Latency(**settings["embedding_latency"])
+    app = create_app(MockSettings(**settings))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    conn.send(sock.getsockname()[1])
+    conn.close()
+    config = uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class MockOpenAIServer:
+    """Mock server in a child process; use as a context manager.
+
+    Args:
+        settings: Latency, embedding size and seed.
+        startup_timeout: Seconds to wait for the child to bind its port.
+    """
+
+    def __init__(
+        self, settings: MockSettings | None = None, startup_timeout: float = 30.0
+    ) -> None:
+        self.settings = settings or MockSettings()
+        self._startup_timeout = startup_timeout
+        self._process: multiprocessing.Process | None = None
+        self.port: int | None = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-style base URL (ends in ``/v1``)."""
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    def start(self) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        parent, child = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_serve, args=(asdict(self.settings), child), daemon=True
+        )
+        self._process.start()
+        child.close()
+        try:
+            if not parent.poll(self._startup_timeout):
+                raise EOFError
+            self.port = parent.recv()
+        except EOFError:
+            self.stop()
+            raise RuntimeError("mock OpenAI server did not start") from None
+        self._wait_ready()
+
+    def _wait_ready(self) -> None:
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            try:
+                httpx.get(f"http://127.0.0.1:{self.port}/_stats", timeout=1.0)
+                return
+            except httpx.TransportError as e:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("mock OpenAI server is not answering") from e
+                time.sleep(0.05)
+
+    def stats(self) -> dict:
+        """Request counts per kind and token totals so far."""
+        response = httpx.get(f"http://127.0.0.1:{self.port}/_stats", timeout=10.0)
+        response.raise_for_status()
+        return response.json()
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=10)
+            self._process = None
+
+    def __enter__(self) -> "MockOpenAIServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -67,8 +67,19 @@ class ExtractionConfig:
     domain_dedup_threshold_pct: float
     domain_dedup_min_pages: int
     domain_dedup_min_block_chars: int
+    domain_dedup_process_workers: int
     source_grounding_min_ratio: float
     data_version: int
+    skip_unchanged_sources: bool
+    stream_entities: bool = False
+    grounding_backfill_process_workers: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ConsolidationConfig:
+    max_concurrent_groups: int
+    process_workers: int
+    llm_max_concurrent: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -86,6 +97,8 @@ class ClassificationConfig:
     skip_gate_enabled: bool = False
     skip_gate_model: str = ""
     skip_gate_content_limit: int = 2000
+    skip_gate_batch_size: int = 8
+    embed_batch_size: int = 32
 
 
 @dataclass(frozen=True, slots=True)
@@ -110,6 +123,7 @@ class CrawlConfig:
     max_concurrency: int
     max_concurrent_crawls: int
     poll_interval: int
+    extract_batch_size: int
     smart_relevance_threshold: float
     smart_map_limit: int
     smart_batch_max_concurrency: int
@@ -144,6 +158,13 @@ class ValidationConfig:
     factapi_api_key: str
     factapi_timeout: float
     cache_ttl_seconds: int
+    snapshot_dir: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SourceStorageConfig:
+    mode: str
+    compression_level: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -154,6 +175,7 @@ class ObservabilityConfig:
     alerting_enabled: bool
     alert_webhook_url: str | None
     alert_webhook_format: str
+    metrics_max_staleness: int = 60
 
 
 class Settings(BaseSettings):
@@ -309,6 +331,26 @@ class Settings(BaseSettings):
         description="Generate embeddings for schema pipeline extractions (enables semantic search)",
     )
 
+    # Consolidation Concurrency
+    consolidation_max_concurrent_groups: int = Field(
+        default=8,
+        ge=1,
+        le=100,
+        description="Max source groups consolidated concurrently",
+    )
+    consolidation_process_workers: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Process pool size for pure consolidation (0 = run inline)",
+    )
+    consolidation_llm_max_concurrent: int = Field(
+        default=16,
+        ge=1,
+        le=200,
+        description="Max concurrent LLM summarization calls during consolidation",
+    )
+
     # LLM Worker Queue Settings
     llm_worker_concurrency: int = Field(
         default=10,
@@ -396,6 +438,12 @@ class Settings(BaseSettings):
         default=10,
         description="Interval in seconds between polling Firecrawl for crawl job status updates",
     )
+    crawl_extract_batch_size: int = Field(
+        default=50,
+        ge=0,
+        le=10000,
+        description="New crawl sources per extraction job while a crawl runs (0 = extract once after the crawl)",
+    )
 
     # Smart Crawl Settings
     smart_crawl_default_relevance_threshold: float = Field(
@@ -430,6 +478,18 @@ class Settings(BaseSettings):
         le=1.0,
         description="Minimum extraction confidence to include in merge candidates",
     )
+    smart_merge_max_concurrent: int = Field(
+        default=16,
+        ge=1,
+        le=200,
+        description="Max concurrent LLM column merges across all domains of a report",
+    )
+    smart_merge_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        le=1000000,
+        description="Memoised LLM merge results kept in-process (0 = disabled)",
+    )
 
     # Camoufox Timeout Strategy
     camoufox_networkidle_timeout: int = Field(
@@ -522,6 +582,12 @@ class Settings(BaseSettings):
         default=True,
         description="Enable Prometheus metrics",
     )
+    metrics_max_staleness: int = Field(
+        default=60,
+        ge=0,
+        description="Maximum age in seconds of the database metrics snapshot "
+        "served by /metrics; refreshed in the background. 0 = query on every scrape",
+    )
 
     # Alerting
     alerting_enabled: bool = Field(
@@ -565,6 +631,27 @@ class Settings(BaseSettings):
         description="Path to Pandoc executable",
     )
 
+    # Source Storage
+    source_storage_mode: str = Field(
+        default="inline",
+        description=(
+            "Where page bodies are stored: inline (Text columns) or blob "
+            "(zstd-compressed, content-addressed content_blobs table)"
+        ),
+    )
+    source_blob_compression_level: int = Field(
+        default=3,
+        ge=1,
+        le=22,
+        description="zstd compression level for blob source storage",
+    )
+
+    # Report Artifacts
+    report_artifact_dir: str = Field(
+        default="reports/artifacts",
+        description="Directory for content-addressed report artifacts (xlsx)",
+    )
+
     # Job recovery settings
     job_stale_threshold_scrape: int = Field(
         default=300,
@@ -614,6 +701,42 @@ class Settings(BaseSettings):
         le=500,
         description="Minimum characters for a content block to be considered",
     )
+    domain_dedup_process_workers: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Process pool size for project boilerplate analysis jobs (0 = run inline)",
+    )
+
+    # Change Detection
+    extraction_skip_unchanged_sources: bool = Field(
+        default=True,
+        description=(
+            "Skip re-extracting sources whose content hash and schema fingerprint "
+            "match their last extraction"
+        ),
+    )
+
+    # Streaming
+    extraction_stream_entities: bool = Field(
+        default=False,
+        description=(
+            "Stream entity-list completions in direct LLM mode: entities are "
+            "grounded as they arrive, and entities received before a stream is "
+            "cut off are kept"
+        ),
+    )
+
+    # Grounding Backfill
+    grounding_backfill_process_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description=(
+            "Process pool size for grounding backfill jobs (0 = score in a "
+            "worker thread; a pool only pays off with spare cores)"
+        ),
+    )
 
     # Source Grounding (quote-in-content verification)
     source_grounding_min_ratio: float = Field(
@@ -695,6 +818,12 @@ class Settings(BaseSettings):
         le=30000,
         description="Max characters of content for classifier embedding/reranking",
     )
+    classification_embed_batch_size: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Page summaries per embedding request when classifying a batch",
+    )
     classification_skip_gate_enabled: bool = Field(
         default=False,
         description="Enable LLM-based skip-gate (binary extract/skip) before extraction",
@@ -709,6 +838,12 @@ class Settings(BaseSettings):
         le=5000,
         description="Max characters of content sent to skip-gate LLM",
     )
+    classification_skip_gate_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Pages classified per skip-gate LLM request (1 = one page per request)",
+    )
 
     # Field Validation (factAPI-backed declarative validators)
     field_validation_enabled: bool = Field(
@@ -734,6 +869,11 @@ class Settings(BaseSettings):
         ge=0,
         description="TTL for factAPI lookup set cache (0 = indefinite for process lifetime)",
     )
+    factapi_snapshot_dir: str = Field(
+        default="",
+        description="Directory for lookup snapshots shared by all worker processes "
+        "(empty = per-process in-memory cache)",
+    )
 
     # Extraction Pipeline Reliability
     extraction_content_limit: int = Field(
@@ -803,6 +943,17 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level. Must be one of: {valid_levels}")
         return v.upper()
 
+    @field_validator("source_storage_mode")
+    @classmethod
+    def validate_source_storage_mode(cls, v: str) -> str:
+        """Validate source storage mode is supported."""
+        valid_modes = ["inline", "blob"]
+        if v.lower() not in valid_modes:
+            raise ValueError(
+                f"Invalid source storage mode. Must be one of: {valid_modes}"
+            )
+        return v.lower()
+
     @field_validator("flaresolverr_blocked_domains", mode="after")
     @classmethod
     def parse_blocked_domains(cls, v):
@@ -933,8 +1084,25 @@ class Settings(BaseSettings):
                 domain_dedup_threshold_pct=self.domain_dedup_threshold_pct,
                 domain_dedup_min_pages=self.domain_dedup_min_pages,
                 domain_dedup_min_block_chars=self.domain_dedup_min_block_chars,
+                domain_dedup_process_workers=self.domain_dedup_process_workers,
                 source_grounding_min_ratio=self.source_grounding_min_ratio,
                 data_version=self.extraction_data_version,
+                skip_unchanged_sources=self.extraction_skip_unchanged_sources,
+                stream_entities=self.extraction_stream_entities,
+                grounding_backfill_process_workers=(
+                    self.grounding_backfill_process_workers
+                ),
+            ),
+        )
+
+    @property
+    def consolidation(self) -> ConsolidationConfig:
+        return self._get_facade(
+            "consolidation",
+            lambda: ConsolidationConfig(
+                max_concurrent_groups=self.consolidation_max_concurrent_groups,
+                process_workers=self.consolidation_process_workers,
+                llm_max_concurrent=self.consolidation_llm_max_concurrent,
             ),
         )
 
@@ -949,6 +1117,7 @@ class Settings(BaseSettings):
                 skip_gate_enabled=self.classification_skip_gate_enabled,
                 skip_gate_model=self.classification_skip_gate_model,
                 skip_gate_content_limit=self.classification_skip_gate_content_limit,
+                skip_gate_batch_size=self.classification_skip_gate_batch_size,
                 reranker_model=self.reranker_model,
                 embedding_high_threshold=self.classification_embedding_high_threshold,
                 embedding_low_threshold=self.classification_embedding_low_threshold,
@@ -956,6 +1125,7 @@ class Settings(BaseSettings):
                 cache_ttl=self.classification_cache_ttl,
                 use_default_skip_patterns=self.classification_use_default_skip_patterns,
                 classifier_content_limit=self.classification_content_limit,
+                embed_batch_size=self.classification_embed_batch_size,
             ),
         )
 
@@ -988,6 +1158,7 @@ class Settings(BaseSettings):
                 max_concurrency=self.crawl_max_concurrency,
                 max_concurrent_crawls=self.max_concurrent_crawls,
                 poll_interval=self.crawl_poll_interval,
+                extract_batch_size=self.crawl_extract_batch_size,
                 smart_relevance_threshold=self.smart_crawl_default_relevance_threshold,
                 smart_map_limit=self.smart_crawl_map_limit,
                 smart_batch_max_concurrency=self.smart_crawl_batch_max_concurrency,
@@ -1047,6 +1218,17 @@ class Settings(BaseSettings):
                 alerting_enabled=self.alerting_enabled,
                 alert_webhook_url=self.alert_webhook_url,
                 alert_webhook_format=self.alert_webhook_format,
+                metrics_max_staleness=self.metrics_max_staleness,
+            ),
+        )
+
+    @property
+    def source_storage(self) -> SourceStorageConfig:
+        return self._get_facade(
+            "source_storage",
+            lambda: SourceStorageConfig(
+                mode=self.source_storage_mode,
+                compression_level=self.source_blob_compression_level,
             ),
         )
 
@@ -1060,6 +1242,7 @@ class Settings(BaseSettings):
                 factapi_api_key=self.factapi_api_key,
                 factapi_timeout=self.factapi_timeout,
                 cache_ttl_seconds=self.factapi_cache_ttl_seconds,
+                snapshot_dir=self.factapi_snapshot_dir,
             ),
         )
 
@@ -1071,6 +1254,7 @@ __all__ = [
     "LLMConfig",
     "LLMQueueConfig",
     "ExtractionConfig",
+    "ConsolidationConfig",
     "ClassificationConfig",
     "ScrapingConfig",
     "CrawlConfig",
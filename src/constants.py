@@ -38,6 +38,9 @@ class JobType(StrEnum):
     SCRAPE = "scrape"
     EXTRACT = "extract"
     CONSOLIDATE = "consolidate"
+    REPORT = "report"
+    DEDUP = "dedup"
+    BACKFILL = "backfill"
 
 
 # LLM retry hint appended to system prompts on retry attempts
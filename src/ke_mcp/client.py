@@ -408,7 +408,7 @@ class KnowledgeExtractionClient:
         min_pages: int | None = None,
         min_block_chars: int | None = None,
     ) -> dict[str, Any]:
-        """Analyze domains for boilerplate and clean sources.
+        """Queue boilerplate analysis for a project's domains.
 
         Args:
             project_id: Project UUID.
@@ -416,8 +416,11 @@ class KnowledgeExtractionClient:
             threshold_pct: Boilerplate threshold (default 0.7).
             min_pages: Min pages per domain (default 5).
             min_block_chars: Min block chars (default 50).
+
+        Returns:
+            Job creation response with job_id.
         """
-        params: dict[str, Any] = {}
+        params: dict[str, Any] = {"async": True}
         if source_groups:
             params["source_groups"] = source_groups
         if threshold_pct is not None:
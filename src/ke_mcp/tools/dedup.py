@@ -32,6 +32,9 @@ def register_dedup_tools(mcp: FastMCP) -> None:
         navs, footers), stores cleaned versions. Extraction automatically uses
         cleaned content when domain_dedup_enabled=True.
 
+        Runs as a background job; use get_job_status(job_id) to follow
+        progress. The completed job's result holds per-domain statistics.
+
         After crawling, use extract_knowledge() to process the content.
 
         Example:
@@ -44,7 +47,7 @@ def register_dedup_tools(mcp: FastMCP) -> None:
         client = ctx.request_context.lifespan_context["client"]
 
         try:
-            result = await client.analyze_boilerplate(
+            job = await client.analyze_boilerplate(
                 project_id=project_id,
                 source_groups=source_groups,
                 threshold_pct=threshold_pct,
@@ -53,11 +56,9 @@ def register_dedup_tools(mcp: FastMCP) -> None:
             )
             return {
                 "success": True,
-                "domains_analyzed": result["domains_analyzed"],
-                "domains_with_boilerplate": result["domains_with_boilerplate"],
-                "total_pages_cleaned": result["total_pages_cleaned"],
-                "total_bytes_removed": result["total_bytes_removed"],
-                "domains": result.get("domains", []),
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "message": f"Boilerplate analysis started. Use get_job_status('{job['job_id']}') to check progress.",
             }
         except APIError as e:
             return {"success": False, "error": e.message}
@@ -35,6 +35,7 @@ from middleware.security_headers import SecurityHeadersMiddleware
 from qdrant_connection import check_qdrant_connection, qdrant_client
 from redis_client import check_redis_connection
 from services.alerting import close_alert_service
+from services.metrics.snapshot import start_metrics_refresher, stop_metrics_refresher
 from services.projects.template_loader import TemplateLoadError, load_templates
 from services.scraper.scheduler import start_scheduler, stop_scheduler
 from services.storage.qdrant.repository import QdrantRepository
@@ -152,9 +153,11 @@ async def lifespan(app: FastAPI):
                 )
 
     await start_scheduler()
+    await start_metrics_refresher()
 
     # Register cleanup callbacks
     shutdown_manager.register_cleanup(stop_scheduler)
+    shutdown_manager.register_cleanup(stop_metrics_refresher)
     shutdown_manager.register_cleanup(close_alert_service)
 
     yield
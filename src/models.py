@@ -322,6 +322,13 @@ class ExtractionListResponse(BaseModel):
         ...,
         description="Pagination offset",
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; None on the last page",
+    )
+    total_estimated: bool = Field(
+        default=False, description="Whether total is a planner estimate"
+    )
 
 
 # Project-related Pydantic models for API
@@ -606,6 +613,13 @@ class EntityListResponse(BaseModel):
     total: int = Field(..., description="Total count of entities")
     limit: int = Field(..., description="Page size")
     offset: int = Field(..., description="Pagination offset")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; None on the last page",
+    )
+    total_estimated: bool = Field(
+        default=False, description="Whether total is a planner estimate"
+    )
 
 
 class EntityTypeCount(BaseModel):
@@ -735,6 +749,8 @@ class JobListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
 
 class JobDetailResponse(BaseModel):
@@ -774,6 +790,13 @@ class SourceListResponse(BaseModel):
     total: int = Field(..., description="Total count of sources")
     limit: int = Field(..., description="Page size")
     offset: int = Field(..., description="Pagination offset")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; None on the last page",
+    )
+    total_estimated: bool = Field(
+        default=False, description="Whether total is a planner estimate"
+    )
 
 
 class SourceStatusCount(BaseModel):
@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     Text,
@@ -66,6 +67,7 @@ class Job(Base):
     """Job table for tracking scrape, extraction, and report jobs."""
 
     __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_created_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid4)
     project_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -128,6 +130,9 @@ class Report(Base):
     """Report table for generated reports."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_project_created", "project_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid4)
     project_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -141,6 +146,7 @@ class Report(Base):
     extraction_ids: Mapped[list] = mapped_column(JSON, default=list)
     format: Mapped[str] = mapped_column(Text, default="md")
     binary_content: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    artifact_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     meta_data: Mapped[dict] = mapped_column("metadata", JSON, default=dict)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
@@ -206,6 +212,7 @@ class Source(Base):
     __tablename__ = "sources"
     __table_args__ = (
         UniqueConstraint("project_id", "uri", name="uq_sources_project_uri"),
+        Index("ix_sources_project_created", "project_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid4)
@@ -218,9 +225,31 @@ class Source(Base):
     source_group: Mapped[str] = mapped_column(Text, nullable=False)
 
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
-    content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    raw_content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    cleaned_content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Bodies are deferred so listings never detoast them (bulk readers use
+    # undefer_group("body")). In blob storage mode they are NULL and live in
+    # content_blobs; read them via services.extraction.content_selector.
+    content: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
+    )
+    raw_content: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
+    )
+    cleaned_content: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
+    )
+    content_blob_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
+    raw_content_blob_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # {"hashes": [...], "min_block_chars": n}: boilerplate blocks stripped
+    # from content, replayed by get_extraction_content
+    cleaned_content_delta: Mapped[dict | None] = mapped_column(
+        JSON(none_as_null=True), nullable=True
+    )
+
+    # Normalised SHA-256 of content, computed at ingest (change detection)
+    content_hash: Mapped[str | None] = mapped_column(Text, nullable=True, index=True)
+    # content_hash and schema fingerprint the last full extraction ran against
+    extraction_content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
+    extraction_schema_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     meta_data: Mapped[dict] = mapped_column("metadata", JSON, default=dict)
     outbound_links: Mapped[list] = mapped_column(JSON, default=list)
@@ -261,10 +290,31 @@ class Source(Base):
         )
 
 
+class ContentBlob(Base):
+    """Compressed, content-addressed page body shared across sources."""
+
+    __tablename__ = "content_blobs"
+
+    # SHA-256 of the uncompressed UTF-8 bytes
+    hash: Mapped[str] = mapped_column(Text, primary_key=True)
+    codec: Mapped[str] = mapped_column(Text, nullable=False, default="zstd")
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    def __repr__(self) -> str:
+        return f"<ContentBlob(hash={self.hash[:12]}, size={self.size})>"
+
+
 class Extraction(Base):
     """Extraction table for generalized extracted data."""
 
     __tablename__ = "extractions"
+    __table_args__ = (
+        Index("ix_extractions_project_created", "project_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(
@@ -284,6 +334,7 @@ class Extraction(Base):
 
     # Provenance
     profile_used: Mapped[str | None] = mapped_column(Text, nullable=True)
+    source_content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
     chunk_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
     chunk_context: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
@@ -328,6 +379,7 @@ class Entity(Base):
     """Entity table for project-scoped entity recognition."""
 
     __tablename__ = "entities"
+    __table_args__ = (Index("ix_entities_project_value", "project_id", "value", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(
@@ -410,6 +462,9 @@ class DomainBoilerplate(Base):
     min_pages: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
     min_block_chars: Mapped[int] = mapped_column(Integer, nullable=False, default=50)
 
+    # Digest of the analysed sources' content hashes; unchanged means skip
+    content_digest: Mapped[str | None] = mapped_column(Text, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
@@ -0,0 +1,422 @@
+"""On-disk cache of rendered pages for the Camoufox service.
+
+Rendering a page costs seconds of browser time, while Firecrawl retries,
+crawl re-runs and projects sharing a company ask for the same URL again.
+Successful renders are stored as gzip-compressed JSON files keyed on the
+URL plus the request options that change the rendered result.
+
+Freshness follows the origin's response headers where present:
+
+- ``Cache-Control: no-store`` responses are never stored.
+- ``max-age``/``s-maxage`` set the lifetime, capped at the configured TTL;
+  without them the configured TTL is used.
+- ``no-cache`` (or ``max-age=0``) entries are stored only if they carry an
+  ``ETag`` or ``Last-Modified`` validator and are revalidated before reuse.
+- Expired entries with a validator are revalidated with a conditional GET;
+  a 304 refreshes the entry without rendering the page again.
+
+Callers can bypass the cache per request with the ``Cache-Control`` request
+header: ``no-cache`` renders and replaces the entry, ``no-store`` renders
+without reading or writing the cache.
+
+Total size is bounded: least recently used entries are evicted once the
+files exceed ``max_bytes``. The index is kept in memory and rebuilt from
+the directory on startup. This module has no browser dependency.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from services.camoufox.models import ScrapeRequest
+
+logger = structlog.get_logger(__name__)
+
+# Response headers kept with a render to decide freshness and revalidate
+CACHE_RESPONSE_HEADERS = ("cache-control", "etag", "last-modified")
+
+# Values for the X-Cache response header
+HIT = "HIT"
+MISS = "MISS"
+REVALIDATED = "REVALIDATED"
+BYPASS = "BYPASS"
+
+REVALIDATE_TIMEOUT_SECONDS = 10
+
+_ENTRY_SUFFIX = ".json.gz"
+
+Revalidator = Callable[[str, dict[str, str]], Awaitable[int]]
+
+
+def cache_key(request: ScrapeRequest) -> str:
+    """Hash the URL and the request options that affect the rendered result.
+
+    The timeout is left out: it decides whether a render succeeds, not what
+    it returns.
+    """
+    material = json.dumps(
+        [
+            request.url,
+            sorted((k.lower(), v) for k, v in (request.headers or {}).items()),
+            request.wait_after_load,
+            request.check_selector,
+            request.skip_tls_verification,
+            request.discover_ajax,
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a Cache-Control header into lowercase directives."""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers: dict[str, str], max_ttl: float) -> float | None:
+    """Seconds a render stays fresh, or None if it must not be stored.
+
+    Args:
+        headers: Lowercase cache response headers of the origin response.
+        max_ttl: Configured TTL, used when the origin gives no lifetime and
+            as an upper bound otherwise.
+    """
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-store" in directives:
+        return None
+
+    lifetime = max_ttl
+    if "no-cache" in directives:
+        lifetime = 0
+    else:
+        for name in ("s-maxage", "max-age"):
+            try:
+                lifetime = min(max_ttl, max(0, int(directives[name] or "")))
+                break
+            except (KeyError, ValueError):
+                continue
+
+    has_validator = bool(headers.get("etag") or headers.get("last-modified"))
+    if lifetime <= 0 and not has_validator:
+        return None
+    return lifetime
+
+
+def request_cache_mode(cache_control: str | None) -> tuple[bool, bool]:
+    """Return (read, write) for a client's Cache-Control request header."""
+    directives = parse_cache_control(cache_control)
+    if "no-store" in directives:
+        return False, False
+    if "no-cache" in directives or directives.get("max-age") == "0":
+        return False, True
+    return True, True
+
+
+async def conditional_get(url: str, headers: dict[str, str]) -> int:
+    """Send a conditional GET and return the status code (0 on failure)."""
+
+    def send() -> int:
+        req = urllib.request.Request(url, headers=headers, method="GET")
+        try:
+            with urllib.request.urlopen(
+                req, timeout=REVALIDATE_TIMEOUT_SECONDS
+            ) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+        except Exception:
+            return 0
+
+    return await asyncio.to_thread(send)
+
+
+@dataclass
+class CachedRender:
+    """A stored render and the metadata needed to reuse it."""
+
+    result: dict[str, Any]
+    stored_at: float
+    expires_at: float
+    headers: dict[str, str]
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this render."""
+        validators = {}
+        if self.headers.get("etag"):
+            validators["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+
+@dataclass
+class RenderCacheStats:
+    """Counters since startup."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    bypassed: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class RenderCache:
+    """Size-bounded on-disk store of rendered pages with TTL.
+
+    Args:
+        directory: Directory holding one file per entry.
+        max_bytes: Upper bound on the total size of entry files.
+        ttl_seconds: Default and maximum freshness lifetime.
+        revalidate: Sends a conditional GET for an expired entry and
+            returns the status code.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int,
+        ttl_seconds: float,
+        revalidate: Revalidator = conditional_get,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._revalidate = revalidate
+        # key -> file size, least recently used first
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self.stats = RenderCacheStats()
+
+    @property
+    def entries(self) -> int:
+        return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def load(self) -> None:
+        """Build the index from the entry files, oldest access first."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        found = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime, path.name[: -len(_ENTRY_SUFFIX)], st.st_size))
+        with self._lock:
+            self._index.clear()
+            self._total_bytes = 0
+            for _, key, size in sorted(found):
+                self._index[key] = size
+                self._total_bytes += size
+            self._evict_locked()
+        logger.info(
+            "render_cache_loaded",
+            entries=len(self._index),
+            total_bytes=self._total_bytes,
+        )
+
+    def get(self, key: str) -> CachedRender | None:
+        """Read an entry, fresh or not, marking it recently used."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        except (OSError, ValueError, EOFError):
+            self._remove(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        return CachedRender(
+            result=data["result"],
+            stored_at=data["stored_at"],
+            expires_at=data["expires_at"],
+            headers=data["headers"],
+        )
+
+    def put(
+        self,
+        key: str,
+        result: dict[str, Any],
+        headers: dict[str, str],
+        now: float | None = None,
+    ) -> bool:
+        """Store a render if its headers allow it. Returns True if stored."""
+        lifetime = freshness_lifetime(headers, self.ttl_seconds)
+        if lifetime is None:
+            return False
+        now = time.time() if now is None else now
+        payload = json.dumps(
+            {
+                "result": result,
+                "stored_at": now,
+                "expires_at": now + lifetime,
+                "headers": headers,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        data = gzip.compress(payload, compresslevel=6)
+        if len(data) > self.max_bytes:
+            return False
+
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("render_cache_write_failed", error=str(e))
+            tmp.unlink(missing_ok=True)
+            return False
+
+        with self._lock:
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._evict_locked()
+        self.stats.stores += 1
+        return True
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+
+    def _remove(self, key: str) -> None:
+        self._forget(key)
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._path(key).unlink(missing_ok=True)
+            self.stats.evictions += 1
+
+    async def get_or_render(
+        self,
+        request: ScrapeRequest,
+        render: Callable[[ScrapeRequest], Awaitable[dict[str, Any]]],
+        *,
+        read: bool = True,
+        write: bool = True,
+    ) -> tuple[dict[str, Any], str]:
+        """Serve a request from the cache or render it.
+
+        Concurrent cacheable requests for the same key share one render.
+
+        Args:
+            request: Scrape request.
+            render: Renders the page; returns the scraper result dict.
+            read: Whether a stored render may be served.
+            write: Whether a new render may be stored.
+
+        Returns:
+            Tuple of (result, X-Cache status).
+        """
+        if not read:
+            self.stats.bypassed += 1
+            result = await render(request)
+            if write:
+                await self._store(cache_key(request), result)
+            return result, BYPASS
+
+        key = cache_key(request)
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            try:
+                result, status = await asyncio.shield(pending)
+                return result, HIT if status == MISS else status
+            except asyncio.CancelledError:
+                # Only the leading request was cancelled; render ourselves
+                if not pending.cancelled():
+                    raise
+                return await self.get_or_render(request, render, write=write)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            outcome = await self._lookup_or_render(key, request, render, write)
+            future.set_result(outcome)
+            return outcome
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure with no waiters is not logged
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def _lookup_or_render(
+        self,
+        key: str,
+        request: ScrapeRequest,
+        render: Callable[[ScrapeRequest], Awaitable[dict[str, Any]]],
+        write: bool,
+    ) -> tuple[dict[str, Any], str]:
+        entry = await asyncio.to_thread(self.get, key)
+        if entry is not None:
+            if entry.is_fresh(time.time()):
+                self.stats.hits += 1
+                return entry.result, HIT
+            validators = entry.validators()
+            if validators:
+                status = await self._revalidate(
+                    request.url, {**(request.headers or {}), **validators}
+                )
+                if status == 304:
+                    self.stats.revalidated += 1
+                    if write:
+                        await asyncio.to_thread(
+                            self.put, key, entry.result, entry.headers
+                        )
+                    return entry.result, REVALIDATED
+
+        self.stats.misses += 1
+        result = await render(request)
+        if write:
+            await self._store(key, result)
+        return result, MISS
+
+    async def _store(self, key: str, result: dict[str, Any]) -> None:
+        if "error" in result or result.get("pageStatusCode") != 200:
+            return
+        headers = result.get("cacheHeaders") or {}
+        stored = {k: v for k, v in result.items() if k != "cacheHeaders"}
+        await asyncio.to_thread(self.put, key, stored, headers)
@@ -1,8 +1,10 @@
 """Configuration for Camoufox browser service."""
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from services.camoufox.blocking import BLOCKABLE_RESOURCE_TYPES
+
 
 class CamoufoxSettings(BaseSettings):
     """Camoufox service configuration loaded from environment variables."""
@@ -75,6 +77,60 @@ class CamoufoxSettings(BaseSettings):
         description="Run browser in headless mode",
     )
 
+    # Request blocking
+    blocked_resource_types: str | list[str] = Field(
+        default="",
+        description=(
+            "Resource types aborted during scrapes (comma-separated: "
+            "image, media, font, stylesheet; empty loads everything)"
+        ),
+    )
+
+    @field_validator("blocked_resource_types", mode="after")
+    @classmethod
+    def parse_blocked_resource_types(cls, v: str | list[str]) -> list[str]:
+        """Parse comma-separated string into list and validate types."""
+        if isinstance(v, str):
+            v = v.split(",")
+        types = [t.strip().lower() for t in v if t.strip()]
+        unknown = set(types) - BLOCKABLE_RESOURCE_TYPES
+        if unknown:
+            raise ValueError(
+                f"Unsupported resource types: {sorted(unknown)}; "
+                f"allowed: {sorted(BLOCKABLE_RESOURCE_TYPES)}"
+            )
+        return types
+
+    # Context pool
+    context_pool_size: int = Field(
+        default=2,
+        description=(
+            "Clean browser contexts pre-created per browser so scrapes skip "
+            "context creation (0 to disable)"
+        ),
+    )
+
+    # Render cache
+    cache_enabled: bool = Field(
+        default=False,
+        description="Serve repeated scrapes from an on-disk cache of rendered pages",
+    )
+    cache_dir: str = Field(
+        default="/tmp/camoufox-cache",
+        description="Directory for cached renders",
+    )
+    cache_max_mb: int = Field(
+        default=1024,
+        description="Maximum total size of cached renders in megabytes",
+    )
+    cache_ttl_seconds: int = Field(
+        default=86400,
+        description=(
+            "Lifetime of cached renders; origin Cache-Control max-age "
+            "shortens it but never extends it"
+        ),
+    )
+
     # Browser recycling
     recycle_after_requests: int = Field(
         default=100,
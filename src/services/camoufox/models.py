@@ -96,3 +96,58 @@ class HealthResponse(BaseModel):
         ...,
         description="Currently active pages",
     )
+
+
+class BrowserStats(BaseModel):
+    """Load counters for one pooled browser."""
+
+    index: int = Field(..., description="Browser index in the pool")
+    connected: bool = Field(..., description="Whether the browser is connected")
+    inFlight: int = Field(..., description="Pages currently open on this browser")
+    requests: int = Field(
+        ...,
+        description="Requests served since the browser was (re)started",
+    )
+    pooledContexts: int = Field(
+        ...,
+        description="Clean contexts ready for the next scrapes",
+    )
+
+
+class RenderCacheStats(BaseModel):
+    """Render cache size and hit counters."""
+
+    entries: int = Field(..., description="Cached renders on disk")
+    totalBytes: int = Field(..., description="Total size of cached renders")
+    hits: int = Field(..., description="Scrapes served from a fresh entry")
+    misses: int = Field(..., description="Cacheable scrapes that were rendered")
+    revalidated: int = Field(
+        ...,
+        description="Expired entries reused after a 304 from the origin",
+    )
+    bypassed: int = Field(
+        ...,
+        description="Scrapes that skipped the cache on request",
+    )
+    evictions: int = Field(..., description="Entries evicted to stay in size")
+
+
+class PoolStatsResponse(BaseModel):
+    """Browser pool load and context pool metrics."""
+
+    browsers: list[BrowserStats] = Field(
+        default_factory=list,
+        description="Per-browser load",
+    )
+    contextPoolHits: int = Field(
+        ...,
+        description="Scrapes that used a pre-created context",
+    )
+    contextPoolMisses: int = Field(
+        ...,
+        description="Scrapes that had to create their context",
+    )
+    renderCache: RenderCacheStats | None = Field(
+        default=None,
+        description="Render cache metrics (absent when the cache is disabled)",
+    )
@@ -12,6 +12,12 @@ import structlog
 from camoufox.async_api import AsyncCamoufox
 from playwright.async_api import Browser, BrowserContext, Page, Response
 
+from services.camoufox.blocking import (
+    AD_DOMAIN_MATCHER,
+    AD_DOMAIN_URL_PATTERN,
+    RequestBlocker,
+)
+from services.camoufox.cache import CACHE_RESPONSE_HEADERS
 from services.camoufox.config import CamoufoxSettings, settings
 from services.camoufox.models import ScrapeRequest
 
@@ -61,23 +67,6 @@ HTTP_ERROR_MESSAGES = {
     511: "Network Authentication Required",
 }
 
-# Ad-serving domains to block (matching Firecrawl's api.ts)
-AD_SERVING_DOMAINS = [
-    "doubleclick.net",
-    "adservice.google.com",
-    "googlesyndication.com",
-    "googletagservices.com",
-    "googletagmanager.com",
-    "google-analytics.com",
-    "adsystem.com",
-    "adservice.com",
-    "adnxs.com",
-    "ads-twitter.com",
-    "facebook.net",
-    "fbcdn.net",
-    "amazon-adsystem.com",
-]
-
 # Standard browser headers to send with all requests
 # These supplement Camoufox's built-in header handling
 #
@@ -122,9 +111,13 @@ class CamoufoxScraper:
 
     Uses multiple browser instances to enable true parallelism, since a single
     Firefox browser cannot handle concurrent page.goto() calls efficiently.
+    Each scrape goes to the connected browser with the fewest pages in flight.
 
-    This follows Firecrawl's pattern of creating a new context per request
-    and closing it immediately after scraping. No session persistence.
+    This follows Firecrawl's pattern of using a fresh context per request
+    and closing it immediately after scraping. No session persistence: each
+    browser keeps a few clean, never-used contexts pre-created so a scrape
+    does not pay context creation latency, and the pool is refilled in the
+    background after every take.
     """
 
     def __init__(self, config: CamoufoxSettings | None = None) -> None:
@@ -139,9 +132,15 @@ class CamoufoxScraper:
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent_pages)
         self._active_pages = 0
         self._lock = asyncio.Lock()
-        self._browser_index = 0  # For round-robin selection
+        self._browser_index = 0  # Round-robin tie-break among equally loaded
         self._restarting_browsers: set[int] = set()  # Track browsers being restarted
         self._browser_request_counts: list[int] = []  # Per-browser request counters
+        self._browser_in_flight: list[int] = []  # Per-browser pages in flight
+        # Per-browser clean contexts: (owning browser, context)
+        self._context_pools: list[list[tuple[Browser, BrowserContext]]] = []
+        self._refilling_pools: set[int] = set()
+        self._context_pool_hits = 0
+        self._context_pool_misses = 0
 
     @property
     def active_pages(self) -> int:
@@ -153,9 +152,40 @@ class CamoufoxScraper:
         """Get maximum concurrent pages allowed."""
         return self.config.max_concurrent_pages
 
+    def pool_stats(self) -> dict[str, Any]:
+        """Per-browser load and context pool counters."""
+        return {
+            "browsers": [
+                {
+                    "index": i,
+                    "connected": browser.is_connected(),
+                    "inFlight": self._in_flight(i),
+                    "requests": (
+                        self._browser_request_counts[i]
+                        if i < len(self._browser_request_counts)
+                        else 0
+                    ),
+                    "pooledContexts": (
+                        len(self._context_pools[i])
+                        if i < len(self._context_pools)
+                        else 0
+                    ),
+                }
+                for i, browser in enumerate(self._browsers)
+            ],
+            "contextPoolHits": self._context_pool_hits,
+            "contextPoolMisses": self._context_pool_misses,
+        }
+
+    def _in_flight(self, index: int) -> int:
+        if index < len(self._browser_in_flight):
+            return self._browser_in_flight[index]
+        return 0
+
     def _get_next_browser(self) -> tuple[Browser, int]:
-        """Get the next connected browser in round-robin order.
+        """Get the connected browser with the fewest pages in flight.
 
+        Ties are broken round-robin so idle browsers share sequential work.
         Checks browser connectivity and skips dead browsers to prevent
         cascade failures when a browser dies from a timeout. Schedules
         background restarts for any dead browsers found.
@@ -171,29 +201,36 @@ class CamoufoxScraper:
 
         # Track dead browsers to restart after finding a live one
         dead_browser_indices: list[int] = []
-
-        # Try each browser once, starting from current index
-        start_index = self._browser_index
-        for _ in range(len(self._browsers)):
-            browser = self._browsers[self._browser_index]
-            current_index = self._browser_index
-            self._browser_index = (self._browser_index + 1) % len(self._browsers)
-
-            if browser.is_connected():
-                # Schedule background restarts for any dead browsers we found
-                for dead_idx in dead_browser_indices:
-                    self._schedule_browser_restart(dead_idx)
-                return browser, current_index
-            else:
+        best_index: int | None = None
+
+        # Scan each browser once, starting from the round-robin position
+        count = len(self._browsers)
+        start_index = self._browser_index % count
+        for offset in range(count):
+            current_index = (start_index + offset) % count
+            if not self._browsers[current_index].is_connected():
                 logger.warning(
                     "browser_disconnected_skipping",
                     browser_index=current_index,
                     checked_from=start_index,
                 )
                 dead_browser_indices.append(current_index)
+                continue
+            if best_index is None or self._in_flight(current_index) < self._in_flight(
+                best_index
+            ):
+                best_index = current_index
 
-        # All browsers are dead
-        raise RuntimeError("All browsers in pool are disconnected")
+        # Schedule background restarts for any dead browsers we found
+        for dead_idx in dead_browser_indices:
+            self._schedule_browser_restart(dead_idx)
+
+        if best_index is None:
+            # All browsers are dead
+            raise RuntimeError("All browsers in pool are disconnected")
+
+        self._browser_index = (best_index + 1) % count
+        return self._browsers[best_index], best_index
 
     def _should_recycle_browser(self, index: int) -> bool:
         """Check if browser should be recycled based on request count.
@@ -267,8 +304,13 @@ class CamoufoxScraper:
         if not self._browsers:
             raise RuntimeError("Failed to start any Camoufox browsers")
 
-        # Initialize request counters for each browser
+        # Initialize per-browser counters and warm the context pools
         self._browser_request_counts = [0] * len(self._browsers)
+        self._browser_in_flight = [0] * len(self._browsers)
+        self._context_pools = [[] for _ in self._browsers]
+        await asyncio.gather(
+            *(self._refill_context_pool(i) for i in range(len(self._browsers)))
+        )
 
         logger.info(
             "camoufox_browser_pool_started",
@@ -311,6 +353,8 @@ class CamoufoxScraper:
         self._camoufox_instances = []
         self._browser_index = 0
         self._browser_request_counts = []
+        self._browser_in_flight = []
+        self._context_pools = []
 
         logger.info("camoufox_browser_pool_stopped")
 
@@ -335,6 +379,10 @@ class CamoufoxScraper:
         try:
             logger.info("restarting_browser", browser_index=index)
 
+            # Pooled contexts die with the old browser
+            if index < len(self._context_pools):
+                self._context_pools[index] = []
+
             # Clean up old camoufox instance (with timeout to prevent hanging)
             old_camoufox = self._camoufox_instances[index]
             try:
@@ -370,6 +418,7 @@ class CamoufoxScraper:
                     self._browser_request_counts[index] = 0
 
                 logger.info("browser_restarted", browser_index=index)
+                self._schedule_context_pool_refill(index)
                 return browser
             except Exception as e:
                 logger.error(
@@ -394,6 +443,70 @@ class CamoufoxScraper:
             # but log it just in case
             logger.error("browser_restart_task_unexpected_error", error=str(e))
 
+    async def _refill_context_pool(self, index: int) -> None:
+        """Pre-create clean contexts for a browser up to context_pool_size."""
+        if index >= len(self._context_pools) or index in self._refilling_pools:
+            return
+        self._refilling_pools.add(index)
+        try:
+            browser = self._browsers[index]
+            pool = self._context_pools[index]
+            while len(pool) < self.config.context_pool_size and browser.is_connected():
+                context = await browser.new_context()
+                if self._browsers[index] is not browser:
+                    # Browser was restarted meanwhile; drop the stale context
+                    await context.close()
+                    return
+                pool = self._context_pools[index]
+                pool.append((browser, context))
+        except Exception as e:
+            logger.warning(
+                "context_pool_refill_failed", browser_index=index, error=str(e)
+            )
+        finally:
+            self._refilling_pools.discard(index)
+
+    def _schedule_context_pool_refill(self, index: int) -> None:
+        if (
+            self.config.context_pool_size > 0
+            and index < len(self._context_pools)
+            and index not in self._refilling_pools
+        ):
+            asyncio.create_task(self._refill_context_pool(index))
+
+    async def _new_context(
+        self, browser: Browser, index: int | None, options: dict[str, Any]
+    ) -> BrowserContext:
+        """Take a pre-created clean context for the browser, or create one.
+
+        Pooled contexts are created with default options, so requests that
+        need other options (e.g. ignore_https_errors) always create their own.
+        """
+        if index is not None and index < len(self._context_pools):
+            pool = self._context_pools[index]
+            if not options:
+                while pool:
+                    owner, context = pool.pop()
+                    if owner is browser:
+                        self._context_pool_hits += 1
+                        self._schedule_context_pool_refill(index)
+                        return context
+            self._context_pool_misses += 1
+            self._schedule_context_pool_refill(index)
+        return await browser.new_context(**options)
+
+    @asynccontextmanager
+    async def _track_in_flight(self, index: int):
+        """Count a page in flight on a browser for least-loaded selection."""
+        if len(self._browser_in_flight) != len(self._browsers):
+            self._browser_in_flight = [0] * len(self._browsers)
+        self._browser_in_flight[index] += 1
+        try:
+            yield
+        finally:
+            if index < len(self._browser_in_flight):
+                self._browser_in_flight[index] -= 1
+
     @asynccontextmanager
     async def _acquire_page(self):
         """Context manager to acquire and release a page slot."""
@@ -429,7 +542,7 @@ class CamoufoxScraper:
             # Also capture requests with common AJAX query patterns
             if (
                 url != base_url
-                and not any(domain in url for domain in AD_SERVING_DOMAINS)
+                and not AD_DOMAIN_MATCHER.matches_url(url)
                 and (
                     resource_type in ("xhr", "fetch", "document")
                     or "ajax" in url.lower()
@@ -698,7 +811,7 @@ class CamoufoxScraper:
             return {"error": "Browser pool not started"}
 
         async with self._semaphore:
-            # Select a connected browser (round-robin with health check)
+            # Select the least-loaded connected browser (with health check)
             try:
                 browser, browser_idx = self._get_next_browser()
             except RuntimeError as e:
@@ -709,8 +822,8 @@ class CamoufoxScraper:
                     return {"error": str(e)}
                 browser_idx = 0
 
-            async with self._acquire_page():
-                result = await self._do_scrape(request, browser)
+            async with self._acquire_page(), self._track_in_flight(browser_idx):
+                result = await self._do_scrape(request, browser, browser_idx)
 
                 # Increment request count (even on failure - browser still did work)
                 if browser_idx < len(self._browser_request_counts):
@@ -742,13 +855,14 @@ class CamoufoxScraper:
                 return result
 
     async def _do_scrape(
-        self, request: ScrapeRequest, browser: Browser
+        self, request: ScrapeRequest, browser: Browser, browser_idx: int | None = None
     ) -> dict[str, Any]:
         """Internal scrape implementation.
 
         Args:
             request: Scrape request with URL and options.
             browser: Browser instance from the pool to use.
+            browser_idx: Pool index of the browser, for its context pool.
 
         Returns:
             Scrape result dictionary.
@@ -760,24 +874,38 @@ class CamoufoxScraper:
         log.info("scrape_started")
 
         try:
-            # Create new context for this request (matches Firecrawl pattern)
+            # Fresh context for this request (matches Firecrawl pattern)
             context_options: dict[str, Any] = {}
 
             # Handle TLS verification
             if request.skip_tls_verification:
                 context_options["ignore_https_errors"] = True
 
-            context = await browser.new_context(**context_options)
+            context = await self._new_context(browser, browser_idx, context_options)
+
+            # Abort ad-domain requests (matching Firecrawl's api.ts) and
+            # configured heavy resource types
+            blocker = RequestBlocker(self.config.blocked_resource_types)
+
+            if blocker.routes_all_requests:
 
-            # Set up ad-blocking route (matching Firecrawl's api.ts)
-            async def block_ads(route):
-                url = route.request.url
-                if any(domain in url for domain in AD_SERVING_DOMAINS):
+                async def block_requests(route):
+                    request = route.request
+                    if blocker.should_block(request.url, request.resource_type):
+                        await route.abort()
+                    else:
+                        await route.continue_()
+
+                await context.route("**/*", block_requests)
+            else:
+                # The driver matches the pattern, so only ad requests are
+                # routed through Python
+                async def block_ads(route):
+                    blocker.stats.blocked_ads += 1
                     await route.abort()
-                else:
-                    await route.continue_()
 
-            await context.route("**/*", block_ads)
+                context.on("request", blocker.count_request)
+                await context.route(AD_DOMAIN_URL_PATTERN, block_ads)
 
             page = await context.new_page()
 
@@ -837,14 +965,20 @@ class CamoufoxScraper:
                     log.warning("selector_not_found", selector=request.check_selector)
                     return {"error": "Required selector not found"}
 
-            # Extract content-type header from response
+            # Extract content-type and cache headers from response
             content_type: str | None = None
+            cache_headers: dict[str, str] = {}
             if response:
                 headers = await response.all_headers()
                 content_type = next(
                     (v for k, v in headers.items() if k.lower() == "content-type"),
                     None,
                 )
+                cache_headers = {
+                    k.lower(): v
+                    for k, v in headers.items()
+                    if k.lower() in CACHE_RESPONSE_HEADERS
+                }
 
             # For JSON/plain-text, return raw body instead of DOM
             if content_type and (
@@ -887,6 +1021,9 @@ class CamoufoxScraper:
                 content_length=len(content),
                 content_type=content_type,
                 discovered_urls=len(discovered_urls) if discovered_urls else 0,
+                requests_allowed=blocker.stats.allowed,
+                requests_blocked_ads=blocker.stats.blocked_ads,
+                requests_blocked_resources=blocker.stats.blocked_resources,
             )
 
             result = {
@@ -894,6 +1031,8 @@ class CamoufoxScraper:
                 "pageStatusCode": status_code,
                 "pageError": page_error,
                 "contentType": content_type,
+                # For the render cache; not part of the API response
+                "cacheHeaders": cache_headers,
             }
 
             # Include discovered URLs if any were found
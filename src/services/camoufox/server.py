@@ -11,12 +11,14 @@ from urllib.parse import urlparse
 
 import structlog
 import uvicorn
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
+from services.camoufox.cache import RenderCache, request_cache_mode
 from services.camoufox.config import settings
 from services.camoufox.models import (
     HealthResponse,
+    PoolStatsResponse,
     ScrapeErrorResponse,
     ScrapeRequest,
     ScrapeSuccessResponse,
@@ -102,6 +104,16 @@ def configure_logging() -> None:
 configure_logging()
 logger = structlog.get_logger(__name__)
 
+render_cache: RenderCache | None = (
+    RenderCache(
+        settings.cache_dir,
+        max_bytes=settings.cache_max_mb * 1024 * 1024,
+        ttl_seconds=settings.cache_ttl_seconds,
+    )
+    if settings.cache_enabled
+    else None
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -112,6 +124,9 @@ async def lifespan(app: FastAPI):
         max_concurrent_pages=settings.max_concurrent_pages,
     )
 
+    if render_cache is not None:
+        render_cache.load()
+
     await scraper.start()
 
     yield
@@ -139,6 +154,23 @@ async def health_check() -> HealthResponse:
     )
 
 
+@app.get("/stats", response_model=PoolStatsResponse)
+async def pool_stats() -> PoolStatsResponse:
+    """Per-browser load, context pool and render cache metrics."""
+    stats = scraper.pool_stats()
+    if render_cache is not None:
+        stats["renderCache"] = {
+            "entries": render_cache.entries,
+            "totalBytes": render_cache.total_bytes,
+            "hits": render_cache.stats.hits,
+            "misses": render_cache.stats.misses,
+            "revalidated": render_cache.stats.revalidated,
+            "bypassed": render_cache.stats.bypassed,
+            "evictions": render_cache.stats.evictions,
+        }
+    return PoolStatsResponse(**stats)
+
+
 @app.post(
     "/scrape",
     response_model=ScrapeSuccessResponse,
@@ -148,14 +180,20 @@ async def health_check() -> HealthResponse:
         500: {"model": ScrapeErrorResponse},
     },
 )
-async def scrape_url(request: ScrapeRequest) -> JSONResponse:
+async def scrape_url(request: ScrapeRequest, http_request: Request) -> JSONResponse:
     """Scrape a URL and return rendered HTML content.
 
     This endpoint matches the Firecrawl Playwright service API exactly.
     Returns the DOM after JavaScript execution, not raw HTML source.
 
+    When the render cache is enabled, repeated requests are served from it
+    and the X-Cache response header reports HIT, MISS, REVALIDATED or
+    BYPASS. A ``Cache-Control: no-cache`` request header forces a fresh
+    render; ``no-store`` also keeps it out of the cache.
+
     Args:
         request: Scrape request with URL and options.
+        http_request: Raw HTTP request, for cache bypass headers.
 
     Returns:
         JSON response with content and status, or error message.
@@ -181,7 +219,14 @@ async def scrape_url(request: ScrapeRequest) -> JSONResponse:
         check_selector=request.check_selector,
     )
 
-    result = await scraper.scrape(request)
+    cache_status: str | None = None
+    if render_cache is not None:
+        read, write = request_cache_mode(http_request.headers.get("cache-control"))
+        result, cache_status = await render_cache.get_or_render(
+            request, scraper.scrape, read=read, write=write
+        )
+    else:
+        result = await scraper.scrape(request)
 
     if "error" in result:
         log.error("scrape_request_failed", error=result["error"])
@@ -194,6 +239,7 @@ async def scrape_url(request: ScrapeRequest) -> JSONResponse:
         "scrape_request_completed",
         status=result.get("pageStatusCode"),
         content_length=len(result.get("content", "")),
+        cache=cache_status,
     )
 
     # Build response - only include optional fields if they have values
@@ -213,6 +259,7 @@ async def scrape_url(request: ScrapeRequest) -> JSONResponse:
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content=response_content,
+        headers={"X-Cache": cache_status} if cache_status else None,
     )
 
 
@@ -0,0 +1,200 @@
+"""Background worker for processing grounding backfill jobs."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+from sqlalchemy.orm import Session
+
+from constants import JobStatus
+from orm_models import Job
+from services.extraction.domain_dedup import init_worker_process
+from services.extraction.grounding_backfill import (
+    DEFAULT_BATCH_SIZE,
+    BackfillCancelledError,
+    BackfillTotals,
+    GroundingBackfillService,
+)
+from services.storage.repositories.job import JobRepository
+
+if TYPE_CHECKING:
+    from config import ExtractionConfig
+
+logger = structlog.get_logger(__name__)
+
+# Minimum seconds between cancellation lookups during a backfill
+_CANCEL_CHECK_INTERVAL = 5.0
+
+
+class BackfillWorker:
+    """Background worker for processing grounding backfill jobs.
+
+    Handles queued backfill jobs by:
+    1. Updating job status to "running"
+    2. Running GroundingBackfillService.run, scoring batches in a process
+       pool or worker thread, from the job checkpoint if a previous run was
+       interrupted
+    3. Updating job with the final totals and completion status
+
+    After every committed batch the totals are saved to
+    ``job.payload["checkpoint"]`` and progress is published to
+    ``job.result`` as ``{"stage": "extractions", "completed": n,
+    "total": m, "extractions_per_second": r}``.
+
+    Args:
+        db: Database session for persistence.
+        extraction: Extraction settings (process pool size). None scores
+            in a worker thread.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        extraction: ExtractionConfig | None = None,
+    ) -> None:
+        self.db = db
+        self._extraction = extraction
+        self.job_repo = JobRepository(db)
+
+    def _checkpoint_callback(self, job: Job):
+        def callback(totals: BackfillTotals) -> None:
+            checkpoint = {
+                **totals.to_dict(),
+                "last_checkpoint_at": datetime.now(UTC).isoformat(),
+            }
+            # New dicts so the JSON columns are marked dirty; the service
+            # commits them together with the batch's scores
+            job.payload = {**(job.payload or {}), "checkpoint": checkpoint}
+            job.result = {
+                "stage": "extractions",
+                "completed": totals.scanned,
+                "total": totals.total_extractions,
+                "extractions_per_second": totals.extractions_per_second,
+            }
+            job.updated_at = datetime.now(UTC)
+
+        return callback
+
+    def _cancellation_check(self, job: Job):
+        last_check = 0.0
+        last_result = False
+
+        async def check() -> bool:
+            nonlocal last_check, last_result
+            now = time.monotonic()
+            if now - last_check < _CANCEL_CHECK_INTERVAL:
+                return last_result
+            last_check = now
+            last_result = self.job_repo.is_cancellation_requested(job.id)
+            return last_result
+
+        return check
+
+    def _get_resume_state(self, job: Job) -> BackfillTotals | None:
+        checkpoint = (job.payload or {}).get("checkpoint")
+        if not checkpoint or not checkpoint.get("resume_after"):
+            return None
+        logger.info(
+            "backfill_resuming_from_checkpoint",
+            job_id=str(job.id),
+            already_scanned=checkpoint.get("processed", 0)
+            + checkpoint.get("skipped", 0),
+            last_checkpoint=checkpoint.get("last_checkpoint_at"),
+        )
+        return BackfillTotals.from_dict(checkpoint)
+
+    async def process_job(self, job: Job) -> None:
+        """Process a single grounding backfill job.
+
+        Args:
+            job: Job instance with type="backfill" and payload containing
+                project_id, mode ("v1" or "v2"), dry_run, optional batch_size
+                and, after an interrupted run, checkpoint.
+        """
+        if self.job_repo.is_cancellation_requested(job.id):
+            logger.info("backfill_job_cancelled_early", job_id=str(job.id))
+            self.job_repo.mark_cancelled(job.id)
+            self.db.commit()
+            return
+
+        job.status = JobStatus.RUNNING
+        if not job.started_at:
+            job.started_at = datetime.now(UTC)
+        self.db.commit()
+
+        try:
+            payload = job.payload or {}
+            project_id = UUID(payload["project_id"])
+            mode = payload.get("mode", "v1")
+            dry_run = payload.get("dry_run", False)
+
+            executor = None
+            workers = 0
+            if self._extraction is not None:
+                workers = self._extraction.grounding_backfill_process_workers
+                if workers > 0:
+                    executor = ProcessPoolExecutor(
+                        max_workers=workers, initializer=init_worker_process
+                    )
+            service = GroundingBackfillService(
+                self.db,
+                executor=executor,
+                parallelism=workers,
+                batch_size=payload.get("batch_size") or DEFAULT_BATCH_SIZE,
+            )
+
+            try:
+                totals = await service.run(
+                    project_id,
+                    mode,
+                    dry_run=dry_run,
+                    resume=self._get_resume_state(job),
+                    checkpoint_callback=self._checkpoint_callback(job),
+                    cancellation_check=self._cancellation_check(job),
+                )
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            job.status = JobStatus.COMPLETED
+            result = totals.to_dict()
+            del result["resume_after"]
+            job.result = {"mode": mode, "dry_run": dry_run, **result}
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.info(
+                "backfill_job_completed",
+                job_id=str(job.id),
+                project_id=str(project_id),
+                mode=mode,
+                processed=totals.processed,
+                updated=totals.updated,
+                extractions_per_second=totals.extractions_per_second,
+            )
+
+        except BackfillCancelledError:
+            self.db.rollback()
+            self.job_repo.mark_cancelled(job.id)
+            self.db.commit()
+            logger.info("backfill_job_cancelled", job_id=str(job.id))
+
+        except Exception as e:
+            self.db.rollback()
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.error(
+                "backfill_job_failed",
+                job_id=str(job.id),
+                error=str(e),
+                exc_info=True,
+            )
@@ -20,6 +20,7 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
+from services.extraction.entity_resolution import cluster_entity_keys
 from services.extraction.grounding import GROUNDING_DEFAULTS
 
 # Default consolidation strategy per field type
@@ -248,29 +249,25 @@ def longest_top_k(values: list[WeightedValue], k: int = 3) -> str | None:
 def union_dedup(
     values: list[WeightedValue],
     entity_id_fields: list[str] | None = None,
+    entity_match_threshold: float | None = None,
 ) -> list:
     """Union all list values, deduplicate by identity fields.
 
     Handles both string lists and entity dicts (deduped by identity fields).
-    Keeps first occurrence as canonical form.
+    Keeps first occurrence as canonical form. With entity_match_threshold
+    set, entity dicts whose identities are similar (not just equal) are
+    merged via blocking-based fuzzy resolution.
     """
     if not values:
         return []
 
-    # Flatten all values into a single list
-    all_items: list = []
-    for wv in values:
-        if isinstance(wv.value, list):
-            all_items.extend(wv.value)
-        elif wv.value is not None:
-            all_items.append(wv.value)
-
+    all_items = _flatten_values(values)
     if not all_items:
         return []
 
     # Detect if items are dicts (entity lists)
     if isinstance(all_items[0], dict):
-        return _dedup_dicts(all_items, entity_id_fields)
+        return _dedup_dicts(all_items, entity_id_fields, entity_match_threshold)
 
     return _dedup_strings(all_items)
 
@@ -309,6 +306,7 @@ def consolidate_field(
     values: list[WeightedValue],
     strategy: str,
     entity_id_fields: list[str] | None = None,
+    entity_match_threshold: float | None = None,
     **kwargs: Any,
 ) -> ConsolidatedField:
     """Apply a named strategy to a list of weighted values."""
@@ -334,8 +332,12 @@ def consolidate_field(
 
     func = strategies.get(strategy, frequency)
     # Pass entity_id_fields to union_dedup for template-agnostic entity matching
-    if strategy == "union_dedup" and entity_id_fields:
-        result_value = func(values, entity_id_fields=entity_id_fields)
+    if strategy == "union_dedup" and (entity_id_fields or entity_match_threshold):
+        result_value = func(
+            values,
+            entity_id_fields=entity_id_fields,
+            entity_match_threshold=entity_match_threshold,
+        )
     elif kwargs:
         result_value = func(values, **kwargs)
     else:
@@ -432,6 +434,7 @@ def consolidate_extractions(
     extraction_type: str,
     entity_list_key: str | None = None,
     entity_id_fields: list[str] | None = None,
+    entity_match_threshold: float | None = None,
 ) -> ConsolidatedRecord:
     """Produce one consolidated record from N extractions.
 
@@ -445,6 +448,9 @@ def consolidate_extractions(
         entity_list_key: If set, data is entity list format:
             {"key": [entity_dicts], "confidence": ...}. Consolidation
             unions all entity lists weighted by extraction quality.
+        entity_id_fields: Identity fields used to dedup entity lists.
+        entity_match_threshold: If set, similarity threshold (0-1] for
+            fuzzy entity resolution; None keeps exact identity matching.
 
     Returns:
         ConsolidatedRecord with one ConsolidatedField per field.
@@ -459,7 +465,12 @@ def consolidate_extractions(
 
     if entity_list_key:
         return _consolidate_entity_list(
-            extractions, field_definitions, record, entity_list_key, entity_id_fields
+            extractions,
+            field_definitions,
+            record,
+            entity_list_key,
+            entity_id_fields,
+            entity_match_threshold,
         )
 
     for field_def in field_definitions:
@@ -548,6 +559,7 @@ def _consolidate_entity_list(
     record: ConsolidatedRecord,
     entity_key: str,
     entity_id_fields: list[str] | None = None,
+    entity_match_threshold: float | None = None,
 ) -> ConsolidatedRecord:
     """Consolidate entity list extractions via weighted union_dedup.
 
@@ -627,13 +639,16 @@ def _consolidate_entity_list(
         return record
 
     result = consolidate_field(
-        weighted_values, "union_dedup", entity_id_fields=entity_id_fields
+        weighted_values,
+        "union_dedup",
+        entity_id_fields=entity_id_fields,
+        entity_match_threshold=entity_match_threshold,
     )
 
     # Compute per-entity provenance by tracing each deduped entity
     # back to its source extraction(s).
     entity_prov = _compute_entity_provenance(
-        result.value, weighted_values, entity_id_fields
+        result.value, weighted_values, entity_id_fields, entity_match_threshold
     )
 
     # Replace the field with entity_provenance attached
@@ -678,11 +693,11 @@ def get_llm_summarize_candidates(
 # ── Internal helpers ──
 
 
-def _entity_match_key(
+def _entity_identity(
     entity: dict,
     id_fields: list[str] | None = None,
 ) -> str:
-    """Compute a dedup key for an entity dict, matching _dedup_dicts logic."""
+    """Normalized value of the first non-empty identity field ("" if none)."""
     _fields = id_fields or ["entity_id", "name", "id"]
     name = None
     for f in _fields:
@@ -690,7 +705,15 @@ def _entity_match_key(
         if name:
             break
     name = name or ""
-    key = str(name).strip().lower()
+    return str(name).strip().lower()
+
+
+def _entity_match_key(
+    entity: dict,
+    id_fields: list[str] | None = None,
+) -> str:
+    """Compute a dedup key for an entity dict, matching _dedup_dicts logic."""
+    key = _entity_identity(entity, id_fields)
     if not key:
         key = hashlib.sha256(json.dumps(entity, sort_keys=True).encode()).hexdigest()[
             :16
@@ -698,15 +721,36 @@ def _entity_match_key(
     return key
 
 
+def _entity_cluster_keys(
+    items: list[dict],
+    id_fields: list[str] | None,
+    threshold: float,
+) -> list[str]:
+    """Map each entity to the match key of its fuzzy cluster representative.
+
+    Entities without an identity value keep their exact content-hash key.
+    """
+    match_keys = [_entity_match_key(item, id_fields) for item in items]
+    named = [i for i, item in enumerate(items) if _entity_identity(item, id_fields)]
+    clusters = cluster_entity_keys([match_keys[i] for i in named], threshold)
+    representative: dict[int, str] = {}
+    for i, cluster in zip(named, clusters, strict=True):
+        match_keys[i] = representative.setdefault(cluster, match_keys[i])
+    return match_keys
+
+
 def _compute_entity_provenance(
     deduped_entities: list[dict] | None,
     weighted_values: list[WeightedValue],
     entity_id_fields: list[str] | None = None,
+    entity_match_threshold: float | None = None,
 ) -> list[dict]:
     """Compute per-entity provenance by tracing each entity back to sources.
 
     For each entity in the deduped result, find which source extraction(s)
     contributed it and compute winning_weight as the max weight among those.
+    With fuzzy matching, every member of an entity's cluster counts as a
+    contributor.
 
     Returns:
         List of dicts (one per entity), each with winning_weight and top_sources.
@@ -714,6 +758,11 @@ def _compute_entity_provenance(
     if not deduped_entities:
         return []
 
+    if entity_match_threshold is not None:
+        return _compute_cluster_provenance(
+            deduped_entities, weighted_values, entity_id_fields, entity_match_threshold
+        )
+
     # Build index: match_key → [(weight, source_id)] from all input extractions
     source_index: dict[str, list[tuple[float, str]]] = {}
     for wv in weighted_values:
@@ -746,6 +795,57 @@ def _compute_entity_provenance(
     return result
 
 
+def _compute_cluster_provenance(
+    deduped_entities: list[dict],
+    weighted_values: list[WeightedValue],
+    entity_id_fields: list[str] | None,
+    entity_match_threshold: float,
+) -> list[dict]:
+    """Provenance for fuzzy-deduped entities.
+
+    Re-clusters the same flattened input that union_dedup saw. Cluster keys
+    appear in the same first-seen order as the deduped entities, so the
+    i-th distinct key belongs to the i-th deduped entity.
+    """
+    items: list[dict] = []
+    owners: list[WeightedValue] = []
+    for wv in weighted_values:
+        for item in _flatten_values([wv]):
+            items.append(item)
+            owners.append(wv)
+
+    keys = _entity_cluster_keys(items, entity_id_fields, entity_match_threshold)
+    sources: dict[str, list[tuple[float, str]]] = {}
+    for key, wv in zip(keys, owners, strict=True):
+        sources.setdefault(key, []).append((wv.weight, wv.source_id))
+
+    result: list[dict] = []
+    for key in list(dict.fromkeys(keys))[: len(deduped_entities)]:
+        grounded = sorted(
+            ((w, sid) for w, sid in sources[key] if w > 0 and sid),
+            key=lambda x: x[0],
+            reverse=True,
+        )
+        result.append(
+            {
+                "winning_weight": round(grounded[0][0], 4) if grounded else 0.0,
+                "top_sources": [sid for _, sid in grounded][:5],
+            }
+        )
+    return result
+
+
+def _flatten_values(values: list[WeightedValue]) -> list:
+    """Flatten list values (and wrap scalars) in input order."""
+    all_items: list = []
+    for wv in values:
+        if isinstance(wv.value, list):
+            all_items.extend(wv.value)
+        elif wv.value is not None:
+            all_items.append(wv.value)
+    return all_items
+
+
 def _median(sorted_vals: list) -> Any:
     """Simple unweighted median of a sorted list."""
     n = len(sorted_vals)
@@ -775,17 +875,23 @@ def _dedup_strings(items: list) -> list:
 def _dedup_dicts(
     items: list[dict],
     id_fields: list[str] | None = None,
+    match_threshold: float | None = None,
 ) -> list[dict]:
     """Deduplicate dict items by identity fields, merging attributes across occurrences.
 
     When duplicates are found, attributes from later occurrences fill in
-    keys that were None or missing in the first occurrence.
+    keys that were None or missing in the first occurrence. With
+    match_threshold set, similar identities are clustered fuzzily.
     """
     groups: dict[str, list[dict]] = {}
     order: list[str] = []
 
-    for item in items:
-        key = _entity_match_key(item, id_fields)
+    if match_threshold is not None:
+        keys = _entity_cluster_keys(items, id_fields, match_threshold)
+    else:
+        keys = [_entity_match_key(item, id_fields) for item in items]
+
+    for item, key in zip(items, keys, strict=True):
         if key not in groups:
             groups[key] = []
             order.append(key)
@@ -4,10 +4,18 @@ Reads raw extractions + grounding_scores from DB, delegates to pure
 consolidation functions, writes results to consolidated_extractions table.
 
 Supports optional LLM post-processing for fields with strategy="llm_summarize".
+
+Source groups are consolidated concurrently: DB reads and writes stay on the
+shared session (never held across an await), the pure consolidate_extractions
+step can be offloaded to a process pool, and all LLM summaries for a group are
+dispatched together under a shared concurrency limit.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -26,9 +34,13 @@ from services.extraction.consolidation import (
     get_llm_summarize_candidates,
 )
 from services.extraction.extraction_items import safe_data_version
+from services.extraction.process_pools import get_process_pool
 from services.projects.repository import ProjectRepository
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from config import ConsolidationConfig
     from services.llm.client import LLMClient
 
 logger = structlog.get_logger(__name__)
@@ -41,12 +53,74 @@ Do NOT add information not present in the summaries.
 {candidates}"""
 
 
+@dataclass(frozen=True)
+class _SchemaContext:
+    """Per-project schema information shared by all source groups."""
+
+    field_defs_by_group: dict[str, list[dict]]
+    entity_list_groups: set[str]
+    entity_id_fields: list[str] | None
+    entity_match_threshold: float | None
+
+
+@dataclass(frozen=True)
+class _SummarizeTask:
+    """One pending llm_summarize synthesis for a record field."""
+
+    record: ConsolidatedRecord
+    field_name: str
+    prompt: str
+    candidate_count: int
+
+
 class ConsolidationService:
-    """Orchestrates consolidation from raw extractions to consolidated records."""
+    """Orchestrates consolidation from raw extractions to consolidated records.
+
+    Args:
+        session: Database session (used only between awaits).
+        project_repo: Project repository for schema lookup.
+        executor: Optional executor (typically a ProcessPoolExecutor) for the
+            CPU-bound consolidate_extractions step. None runs it inline.
+        max_concurrent_groups: Source groups consolidated concurrently.
+        llm_max_concurrent: Concurrent LLM summarization calls across groups.
+    """
 
-    def __init__(self, session: Session, project_repo: ProjectRepository):
+    def __init__(
+        self,
+        session: Session,
+        project_repo: ProjectRepository,
+        *,
+        executor: Executor | None = None,
+        max_concurrent_groups: int = 1,
+        llm_max_concurrent: int = 8,
+    ):
         self._session = session
         self._project_repo = project_repo
+        self._executor = executor
+        self._max_concurrent_groups = max(1, max_concurrent_groups)
+        self._llm_semaphore = asyncio.Semaphore(max(1, llm_max_concurrent))
+
+    @classmethod
+    def from_config(
+        cls,
+        session: Session,
+        project_repo: ProjectRepository,
+        consolidation: ConsolidationConfig | None,
+    ) -> ConsolidationService:
+        """Build a service with the configured concurrency and shared pool.
+
+        None consolidates one source group at a time with the pure step
+        running inline.
+        """
+        if consolidation is None:
+            return cls(session, project_repo)
+        return cls(
+            session,
+            project_repo,
+            executor=get_process_pool("consolidation", consolidation.process_workers),
+            max_concurrent_groups=consolidation.max_concurrent_groups,
+            llm_max_concurrent=consolidation.llm_max_concurrent,
+        )
 
     async def consolidate_source_group(
         self,
@@ -62,95 +136,15 @@ class ConsolidationService:
         3. Load field definitions from project schema
         4. Call consolidate_extractions() for each type
         5. Optionally run LLM post-processing for llm_summarize fields
-        6. Upsert into consolidated_extractions table
+        6. Replace consolidated_extractions rows with one multi-row upsert
         """
-        project = self._project_repo.get(project_id)
-        if not project:
-            return []
-
-        schema = project.extraction_schema
-        if not schema or not schema.get("field_groups"):
+        context = self._load_schema_context(project_id)
+        if context is None:
             return []
-
-        field_defs_by_group, entity_list_groups = _extract_field_definitions(schema)
-
-        # Extract entity_id_fields from schema context for template-agnostic dedup
-        _ctx = schema.get("extraction_context") or {}
-        entity_id_fields: list[str] | None = _ctx.get("entity_id_fields")
-
-        # Delete existing consolidated records for this source group so that
-        # removed extraction types don't leave stale rows behind.
-        self._session.execute(
-            delete(ConsolidatedExtraction).where(
-                ConsolidatedExtraction.project_id == project_id,
-                ConsolidatedExtraction.source_group == source_group,
-            )
-        )
-
-        # Load all extractions for this source group
-        extractions = (
-            self._session.execute(
-                select(Extraction).where(
-                    Extraction.project_id == project_id,
-                    Extraction.source_group == source_group,
-                )
-            )
-            .scalars()
-            .all()
+        return await self._consolidate_group(
+            project_id, source_group, context, llm_client
         )
 
-        if not extractions:
-            return []
-
-        # Group by extraction_type
-        by_type: dict[str, list[Extraction]] = {}
-        for ext in extractions:
-            by_type.setdefault(ext.extraction_type, []).append(ext)
-
-        records: list[ConsolidatedRecord] = []
-        for ext_type, type_extractions in by_type.items():
-            field_defs = field_defs_by_group.get(ext_type, [])
-            if not field_defs:
-                continue
-
-            # Convert ORM objects to dicts for pure function
-            ext_dicts = [
-                {
-                    "data": ext.data,
-                    "data_version": safe_data_version(ext),
-                    "confidence": ext.confidence if ext.confidence is not None else 0.5,
-                    "grounding_scores": ext.grounding_scores or {},
-                    "source_id": str(ext.source_id),
-                }
-                for ext in type_extractions
-            ]
-
-            is_entity_list = ext_type in entity_list_groups
-            record = consolidate_extractions(
-                ext_dicts,
-                field_defs,
-                source_group,
-                ext_type,
-                entity_list_key=ext_type if is_entity_list else None,
-                entity_id_fields=entity_id_fields,
-            )
-
-            # LLM post-processing for llm_summarize fields
-            if llm_client and not is_entity_list:
-                record = await self._llm_post_process(
-                    record,
-                    ext_dicts,
-                    field_defs,
-                    llm_client,
-                )
-
-            records.append(record)
-
-            # Upsert to DB
-            self._upsert_record(project_id, record, len(type_extractions))
-
-        return records
-
     async def consolidate_project(
         self,
         project_id: UUID,
@@ -201,63 +195,200 @@ class ConsolidationService:
         *,
         llm_client: LLMClient | None = None,
     ) -> dict[str, int]:
-        """Process a list of source groups with per-group error isolation.
+        """Process source groups concurrently with per-group error isolation.
 
-        Uses SAVEPOINTs so that a failure in one group does not roll back
-        previously successful groups within the same outer transaction.
+        At most ``max_concurrent_groups`` groups are in flight at once. Each
+        group's reads and writes run inside their own SAVEPOINT, so a failure
+        in one group does not roll back other groups within the same outer
+        transaction.
         """
-        total_records = 0
-        errors = 0
-
-        for sg in source_groups:
-            savepoint = self._session.begin_nested()
-            try:
-                records = await self.consolidate_source_group(
-                    project_id,
-                    sg,
-                    llm_client=llm_client,
-                )
-                savepoint.commit()
-                total_records += len(records)
-            except Exception:
-                savepoint.rollback()
-                logger.exception(
-                    "consolidation_error",
-                    project_id=str(project_id),
-                    source_group=sg,
-                )
-                errors += 1
+        context = self._load_schema_context(project_id)
+        semaphore = asyncio.Semaphore(self._max_concurrent_groups)
+
+        async def _run(sg: str) -> int | None:
+            if context is None:
+                return 0
+            async with semaphore:
+                try:
+                    records = await self._consolidate_group(
+                        project_id, sg, context, llm_client
+                    )
+                except Exception:
+                    logger.exception(
+                        "consolidation_error",
+                        project_id=str(project_id),
+                        source_group=sg,
+                    )
+                    return None
+                return len(records)
+
+        outcomes = await asyncio.gather(*(_run(sg) for sg in source_groups))
 
         return {
             "source_groups": len(source_groups),
-            "records_created": total_records,
-            "errors": errors,
+            "records_created": sum(n for n in outcomes if n is not None),
+            "errors": sum(1 for n in outcomes if n is None),
         }
 
-    async def _llm_post_process(
+    def _load_schema_context(self, project_id: UUID) -> _SchemaContext | None:
+        """Resolve field definitions for a project, or None if not consolidatable."""
+        project = self._project_repo.get(project_id)
+        if not project:
+            return None
+
+        schema = project.extraction_schema
+        if not schema or not schema.get("field_groups"):
+            return None
+
+        field_defs_by_group, entity_list_groups = _extract_field_definitions(schema)
+
+        # Extract entity_id_fields (and optional fuzzy entity_match_threshold)
+        # from schema context for template-agnostic dedup
+        _ctx = schema.get("extraction_context") or {}
+        return _SchemaContext(
+            field_defs_by_group=field_defs_by_group,
+            entity_list_groups=entity_list_groups,
+            entity_id_fields=_ctx.get("entity_id_fields"),
+            entity_match_threshold=_ctx.get("entity_match_threshold"),
+        )
+
+    async def _consolidate_group(
+        self,
+        project_id: UUID,
+        source_group: str,
+        context: _SchemaContext,
+        llm_client: LLMClient | None,
+    ) -> list[ConsolidatedRecord]:
+        """Load, consolidate, summarize and persist one source group.
+
+        Session access happens only in the synchronous load and write steps,
+        so concurrent groups never interleave statements inside a SAVEPOINT.
+        """
+        with self._session.begin_nested():
+            extractions = (
+                self._session.execute(
+                    select(Extraction).where(
+                        Extraction.project_id == project_id,
+                        Extraction.source_group == source_group,
+                    )
+                )
+                .scalars()
+                .all()
+            )
+
+            # Group by extraction_type, converting ORM objects to dicts for
+            # the pure (and picklable) consolidation step
+            by_type: dict[str, list[dict]] = {}
+            for ext in extractions:
+                if not context.field_defs_by_group.get(ext.extraction_type):
+                    continue
+                by_type.setdefault(ext.extraction_type, []).append(
+                    {
+                        "data": ext.data,
+                        "data_version": safe_data_version(ext),
+                        "confidence": ext.confidence
+                        if ext.confidence is not None
+                        else 0.5,
+                        "grounding_scores": ext.grounding_scores or {},
+                        "source_id": str(ext.source_id),
+                    }
+                )
+
+        ext_types = list(by_type)
+        records = list(
+            await asyncio.gather(
+                *(
+                    self._run_consolidate(
+                        by_type[ext_type],
+                        context.field_defs_by_group[ext_type],
+                        source_group,
+                        ext_type,
+                        entity_list_key=ext_type
+                        if ext_type in context.entity_list_groups
+                        else None,
+                        entity_id_fields=context.entity_id_fields,
+                        entity_match_threshold=context.entity_match_threshold,
+                    )
+                    for ext_type in ext_types
+                )
+            )
+        )
+
+        # LLM post-processing for llm_summarize fields, batched per group
+        if llm_client:
+            tasks: list[_SummarizeTask] = []
+            for ext_type, record in zip(ext_types, records, strict=True):
+                if ext_type in context.entity_list_groups:
+                    continue
+                tasks.extend(
+                    self._build_summarize_tasks(
+                        record,
+                        by_type[ext_type],
+                        context.field_defs_by_group[ext_type],
+                    )
+                )
+            await self._run_summarize_tasks(tasks, llm_client)
+
+        # Delete existing consolidated records for this source group so that
+        # removed extraction types don't leave stale rows behind, then write
+        # every record of the group in a single statement.
+        with self._session.begin_nested():
+            self._session.execute(
+                delete(ConsolidatedExtraction).where(
+                    ConsolidatedExtraction.project_id == project_id,
+                    ConsolidatedExtraction.source_group == source_group,
+                )
+            )
+            self._upsert_records(
+                project_id,
+                [
+                    (record, len(by_type[ext_type]))
+                    for ext_type, record in zip(ext_types, records, strict=True)
+                ],
+            )
+
+        return records
+
+    async def _run_consolidate(
+        self,
+        extractions: list[dict],
+        field_definitions: list[dict],
+        source_group: str,
+        extraction_type: str,
+        *,
+        entity_list_key: str | None,
+        entity_id_fields: list[str] | None,
+        entity_match_threshold: float | None,
+    ) -> ConsolidatedRecord:
+        """Run consolidate_extractions in the executor, or inline without one."""
+        call = partial(
+            consolidate_extractions,
+            extractions,
+            field_definitions,
+            source_group,
+            extraction_type,
+            entity_list_key=entity_list_key,
+            entity_id_fields=entity_id_fields,
+            entity_match_threshold=entity_match_threshold,
+        )
+        if self._executor is None:
+            return call()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+
+    def _build_summarize_tasks(
         self,
         record: ConsolidatedRecord,
         ext_dicts: list[dict],
         field_defs: list[dict],
-        llm_client: LLMClient,
-    ) -> ConsolidatedRecord:
-        """Replace llm_summarize fields with LLM-synthesized text.
-
-        Collects candidate values from extractions, builds a synthesis prompt,
-        and replaces the longest_top_k fallback with the LLM result.
-        Falls back to the existing value on LLM failure.
-        """
+    ) -> list[_SummarizeTask]:
+        """Build synthesis prompts for every llm_summarize field with 2+ candidates."""
         from services.extraction.grounding import GROUNDING_DEFAULTS
 
-        summarize_fields: list[dict] = [
-            fd
-            for fd in field_defs
-            if fd.get("consolidation_strategy") == "llm_summarize"
-        ]
-        if not summarize_fields:
-            return record
-
-        for field_def in summarize_fields:
+        tasks: list[_SummarizeTask] = []
+        for field_def in field_defs:
+            if field_def.get("consolidation_strategy") != "llm_summarize":
+                continue
             field_name = field_def["name"]
             if field_name not in record.fields:
                 continue
@@ -306,91 +437,94 @@ class ConsolidationService:
                 # Not enough distinct values to synthesize — keep fallback
                 continue
 
-            # Build synthesis prompt
             candidate_lines = "\n".join(
                 f'{i + 1}. (weight: {w}) "{text}"'
                 for i, (text, w) in enumerate(candidates)
             )
-            prompt = _SUMMARIZE_PROMPT.format(
-                field_name=field_name,
-                candidates=candidate_lines,
+            tasks.append(
+                _SummarizeTask(
+                    record=record,
+                    field_name=field_name,
+                    prompt=_SUMMARIZE_PROMPT.format(
+                        field_name=field_name,
+                        candidates=candidate_lines,
+                    ),
+                    candidate_count=len(candidates),
+                )
             )
+        return tasks
 
-            try:
+    async def _run_summarize_tasks(
+        self,
+        tasks: list[_SummarizeTask],
+        llm_client: LLMClient,
+    ) -> None:
+        """Dispatch summarization prompts concurrently and apply the results."""
+        if not tasks:
+            return
+        await asyncio.gather(*(self._summarize(task, llm_client) for task in tasks))
+
+    async def _summarize(self, task: _SummarizeTask, llm_client: LLMClient) -> None:
+        """Run one synthesis call; keeps the longest_top_k value on failure."""
+        record = task.record
+        try:
+            async with self._llm_semaphore:
                 response = await llm_client.complete(
                     system_prompt="You are a concise information synthesizer.",
-                    user_prompt=prompt,
-                )
-                synthesized = response.get("text", "").strip()
-                if synthesized:
-                    existing = record.fields[field_name]
-                    record.fields[field_name] = ConsolidatedField(
-                        value=synthesized,
-                        strategy="llm_summarize",
-                        source_count=existing.source_count,
-                        grounded_count=existing.grounded_count,
-                        agreement=existing.agreement,
-                        winning_weight=existing.winning_weight,
-                        top_sources=existing.top_sources,
-                    )
-                    logger.info(
-                        "llm_summarize_success",
-                        field=field_name,
-                        source_group=record.source_group,
-                        candidates=len(candidates),
-                    )
-            except Exception:
-                logger.warning(
-                    "llm_summarize_failed",
-                    field=field_name,
-                    source_group=record.source_group,
-                    exc_info=True,
+                    user_prompt=task.prompt,
                 )
-                # Keep longest_top_k fallback value
-
-        return record
+        except Exception:
+            logger.warning(
+                "llm_summarize_failed",
+                field=task.field_name,
+                source_group=record.source_group,
+                exc_info=True,
+            )
+            return
+
+        synthesized = response.get("text", "").strip()
+        if not synthesized:
+            return
+        existing = record.fields[task.field_name]
+        record.fields[task.field_name] = ConsolidatedField(
+            value=synthesized,
+            strategy="llm_summarize",
+            source_count=existing.source_count,
+            grounded_count=existing.grounded_count,
+            agreement=existing.agreement,
+            winning_weight=existing.winning_weight,
+            top_sources=existing.top_sources,
+        )
+        logger.info(
+            "llm_summarize_success",
+            field=task.field_name,
+            source_group=record.source_group,
+            candidates=task.candidate_count,
+        )
 
-    def _upsert_record(
+    def _upsert_records(
         self,
         project_id: UUID,
-        record: ConsolidatedRecord,
-        source_count: int,
+        records: list[tuple[ConsolidatedRecord, int]],
     ) -> None:
-        """Upsert a consolidated record into the DB."""
-        # Build data and provenance dicts from ConsolidatedRecord
-        data: dict = {}
-        provenance: dict = {}
-        total_grounded = 0
-
-        for field_name, field in record.fields.items():
-            data[field_name] = field.value
-            prov_entry: dict = {
-                "strategy": field.strategy,
-                "source_count": field.source_count,
-                "grounded_count": field.grounded_count,
-                "agreement": field.agreement,
-                "winning_weight": field.winning_weight,
-                "top_sources": field.top_sources,
-            }
-            if field.entity_provenance is not None:
-                prov_entry["entity_provenance"] = field.entity_provenance
-            provenance[field_name] = prov_entry
-            # Record-level grounded_count = max across fields. Per-field
-            # breakdown is in the provenance JSONB for detailed queries.
-            total_grounded = max(total_grounded, field.grounded_count)
-
-        # PostgreSQL upsert (INSERT ... ON CONFLICT UPDATE)
-        stmt = pg_insert(ConsolidatedExtraction).values(
-            project_id=project_id,
-            source_group=record.source_group,
-            extraction_type=record.extraction_type,
-            data=data,
-            provenance=provenance,
-            source_count=source_count,
-            grounded_count=total_grounded,
-        )
+        """Upsert consolidated records with one multi-row INSERT ... ON CONFLICT.
+
+        Args:
+            project_id: Owning project.
+            records: (record, source_count) pairs to write.
+        """
+        if not records:
+            return
+
+        rows = [
+            _record_to_row(project_id, record, source_count)
+            for record, source_count in records
+        ]
+        stmt = pg_insert(ConsolidatedExtraction).values(rows)
+        # Conflict target by columns (uq_consolidated_project_sg_type), which
+        # SQLite understands as well as PostgreSQL
         stmt = stmt.on_conflict_do_update(
-            constraint="uq_consolidated_project_sg_type",
+            index_elements=["project_id", "source_group", "extraction_type"],
             set_={
                 "data": stmt.excluded.data,
                 "provenance": stmt.excluded.provenance,
@@ -400,7 +534,44 @@ class ConsolidationService:
             },
         )
         self._session.execute(stmt)
-        self._session.flush()
+
+
+def _record_to_row(
+    project_id: UUID,
+    record: ConsolidatedRecord,
+    source_count: int,
+) -> dict:
+    """Build a consolidated_extractions row from a ConsolidatedRecord."""
+    data: dict = {}
+    provenance: dict = {}
+    total_grounded = 0
+
+    for field_name, field in record.fields.items():
+        data[field_name] = field.value
+        prov_entry: dict = {
+            "strategy": field.strategy,
+            "source_count": field.source_count,
+            "grounded_count": field.grounded_count,
+            "agreement": field.agreement,
+            "winning_weight": field.winning_weight,
+            "top_sources": field.top_sources,
+        }
+        if field.entity_provenance is not None:
+            prov_entry["entity_provenance"] = field.entity_provenance
+        provenance[field_name] = prov_entry
+        # Record-level grounded_count = max across fields. Per-field
+        # breakdown is in the provenance JSONB for detailed queries.
+        total_grounded = max(total_grounded, field.grounded_count)
+
+    return {
+        "project_id": project_id,
+        "source_group": record.source_group,
+        "extraction_type": record.extraction_type,
+        "data": data,
+        "provenance": provenance,
+        "source_count": source_count,
+        "grounded_count": total_grounded,
+    }
 
 
 def _extract_field_definitions(
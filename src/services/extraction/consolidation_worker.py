@@ -16,7 +16,7 @@ from services.projects.repository import ProjectRepository
 from services.storage.repositories.job import JobRepository
 
 if TYPE_CHECKING:
-    from config import LLMConfig
+    from config import ConsolidationConfig, LLMConfig
 
 logger = structlog.get_logger(__name__)
 
@@ -32,6 +32,8 @@ class ConsolidationWorker:
     Args:
         db: Database session for persistence.
         llm_config: LLM configuration (required for llm_summarize fields).
+        consolidation: Concurrency settings. None consolidates one source
+            group at a time with the pure step running inline.
     """
 
     def __init__(
@@ -39,9 +41,11 @@ class ConsolidationWorker:
         db: Session,
         *,
         llm_config: LLMConfig | None = None,
+        consolidation: ConsolidationConfig | None = None,
     ) -> None:
         self.db = db
         self._llm_config = llm_config
+        self._consolidation = consolidation
         self.job_repo = JobRepository(db)
 
     async def process_job(self, job: Job) -> None:
@@ -62,7 +66,9 @@ class ConsolidationWorker:
             use_llm = payload.get("use_llm", False)
 
             repo = ProjectRepository(self.db)
-            service = ConsolidationService(self.db, repo)
+            service = ConsolidationService.from_config(
+                self.db, repo, self._consolidation
+            )
 
             llm_client = None
             if use_llm and self._llm_config:
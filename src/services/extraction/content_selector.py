@@ -1,4 +1,77 @@
-"""Content selection for domain-dedup-aware extraction."""
+"""Content selection for domain-dedup-aware extraction.
+
+Bodies may be stored inline on the source row or, in blob storage mode,
+in the content_blobs table with cleaned_content kept as a delta (the
+boilerplate block hashes stripped from content). These helpers hide the
+difference and reconstruct cleaned content lazily.
+"""
+
+from sqlalchemy.orm import object_session
+
+
+def get_source_content(source) -> str | None:
+    """Return the source's content, loading it from blob storage if needed.
+
+    Args:
+        source: Source ORM object.
+
+    Returns:
+        The content string, or None if the source has no content.
+    """
+    if source.content is not None:
+        return source.content
+    if not source.content_blob_hash:
+        return None
+
+    from services.storage.repositories.content_blob import ContentBlobRepository
+
+    return ContentBlobRepository(object_session(source)).get(source.content_blob_hash)
+
+
+def prefetch_source_contents(session, sources: list) -> None:
+    """Load blob-stored bodies for many sources in one query.
+
+    Subsequent get_source_content calls for these sources are served from
+    the blob cache instead of issuing one query per source.
+    """
+    keys = [
+        s.content_blob_hash
+        for s in sources
+        if s.content is None and s.content_blob_hash
+    ]
+    if keys:
+        from services.storage.repositories.content_blob import (
+            ContentBlobRepository,
+        )
+
+        ContentBlobRepository(session).get_many(keys)
+
+
+def get_cleaned_content(source) -> str | None:
+    """Return domain-deduped content, or None if the source was not cleaned.
+
+    Args:
+        source: Source ORM object.
+
+    Returns:
+        cleaned_content, the content with its recorded boilerplate delta
+        replayed, or None.
+    """
+    if source.cleaned_content is not None:
+        return source.cleaned_content
+    delta = source.cleaned_content_delta
+    if not isinstance(delta, dict) or not delta.get("hashes"):
+        return None
+
+    from services.extraction.domain_dedup import strip_boilerplate
+
+    content = get_source_content(source)
+    if content is None:
+        return None
+    cleaned, _ = strip_boilerplate(
+        content, set(delta["hashes"]), min_block_chars=delta["min_block_chars"]
+    )
+    return cleaned
 
 
 def get_extraction_content(source, *, domain_dedup_enabled: bool = True) -> str:
@@ -12,9 +85,7 @@ def get_extraction_content(source, *, domain_dedup_enabled: bool = True) -> str:
         The appropriate content string for extraction.
     """
     if domain_dedup_enabled:
-        return (
-            source.cleaned_content
-            if source.cleaned_content is not None
-            else source.content
-        )
-    return source.content
+        cleaned = get_cleaned_content(source)
+        if cleaned is not None:
+            return cleaned
+    return get_source_content(source)
@@ -0,0 +1,114 @@
+"""Background worker for processing domain boilerplate analysis jobs."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+from sqlalchemy.orm import Session
+
+from constants import JobStatus
+from orm_models import Job
+from services.extraction.domain_dedup import DomainDedupService
+from services.storage.repositories.job import JobRepository
+
+if TYPE_CHECKING:
+    from config import ExtractionConfig
+
+logger = structlog.get_logger(__name__)
+
+
+class DedupWorker:
+    """Background worker for processing boilerplate analysis jobs.
+
+    Handles queued dedup jobs by:
+    1. Updating job status to "running"
+    2. Running DomainDedupService.analyze_project_parallel, fingerprinting
+       domains in the shared process pool
+    3. Updating job with results and completion status
+
+    Progress is published to ``job.result`` as
+    ``{"stage": "domains", "completed": n, "total": m}`` while the job runs.
+    Each domain commits on its own, so a failed job keeps the domains it
+    finished and a re-run only analyzes the rest.
+
+    Args:
+        db: Database session for persistence.
+        extraction: Extraction settings (dedup defaults and pool size).
+            None analyzes domains inline with module defaults.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        extraction: ExtractionConfig | None = None,
+    ) -> None:
+        self.db = db
+        self._extraction = extraction
+        self.job_repo = JobRepository(db)
+
+    def _progress_callback(self, job: Job):
+        def callback(stage: str, completed: int, total: int) -> None:
+            job.result = {"stage": stage, "completed": completed, "total": total}
+            job.updated_at = datetime.now(UTC)
+            self.db.commit()
+
+        return callback
+
+    async def process_job(self, job: Job) -> None:
+        """Process a single boilerplate analysis job.
+
+        Args:
+            job: Job instance with type="dedup" and payload containing
+                project_id and optional source_groups, threshold_pct,
+                min_pages and min_block_chars.
+        """
+        job.status = JobStatus.RUNNING
+        if not job.started_at:
+            job.started_at = datetime.now(UTC)
+        self.db.commit()
+
+        try:
+            payload = job.payload or {}
+            project_id = UUID(payload["project_id"])
+
+            service = DomainDedupService.from_config(self.db, self._extraction)
+            result = await service.analyze_project_parallel(
+                project_id,
+                source_groups=payload.get("source_groups"),
+                threshold_pct=payload.get("threshold_pct"),
+                min_pages=payload.get("min_pages"),
+                min_block_chars=payload.get("min_block_chars"),
+                progress_callback=self._progress_callback(job),
+            )
+            self.db.commit()
+
+            job.status = JobStatus.COMPLETED
+            job.result = result.to_dict()
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.info(
+                "dedup_job_completed",
+                job_id=str(job.id),
+                project_id=str(project_id),
+                domains_analyzed=result.domains_analyzed,
+                total_pages_cleaned=result.total_pages_cleaned,
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.error(
+                "dedup_job_failed",
+                job_id=str(job.id),
+                error=str(e),
+                exc_info=True,
+            )
@@ -13,10 +13,13 @@ Blocks appearing on ≥70% of pages (configurable) are boilerplate.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import re
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -26,6 +29,7 @@ from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
     from config import ExtractionConfig
+    from services.storage.repositories.source import SourceBody
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,8 @@ logger = logging.getLogger(__name__)
 DEFAULT_THRESHOLD_PCT = 0.7
 DEFAULT_MIN_PAGES = 5
 DEFAULT_MIN_BLOCK_CHARS = 50
+# Sources read and written per round trip while streaming a domain
+STREAM_BATCH_SIZE = 500
 
 
 @dataclass
@@ -56,6 +62,7 @@ class DomainAnalysisResult:
     bytes_removed_total: int
     sections_analyzed: int = 0
     sections_with_boilerplate: int = 0
+    unchanged: bool = False
 
 
 @dataclass
@@ -68,6 +75,27 @@ class ProjectAnalysisResult:
     total_bytes_removed: int
     domain_results: list[DomainAnalysisResult]
 
+    def to_dict(self) -> dict:
+        return {
+            "domains_analyzed": self.domains_analyzed,
+            "domains_with_boilerplate": self.domains_with_boilerplate,
+            "total_pages_cleaned": self.total_pages_cleaned,
+            "total_bytes_removed": self.total_bytes_removed,
+            "domains": [
+                {
+                    "domain": d.domain,
+                    "pages_analyzed": d.pages_analyzed,
+                    "pages_cleaned": d.pages_cleaned,
+                    "blocks_boilerplate": d.blocks_boilerplate,
+                    "bytes_removed_total": d.bytes_removed_total,
+                    "sections_analyzed": d.sections_analyzed,
+                    "sections_with_boilerplate": d.sections_with_boilerplate,
+                    "unchanged": d.unchanged,
+                }
+                for d in self.domain_results
+            ],
+        }
+
 
 def split_into_blocks(content: str, min_block_chars: int = 50) -> list[str]:
     """Split content on double-newlines, filtering short blocks.
@@ -98,6 +126,57 @@ def hash_block(block: str) -> str:
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
 
+def page_block_hashes(content: str, min_block_chars: int) -> tuple[set[str], int]:
+    """Return a page's distinct block hashes and its block count."""
+    blocks = split_into_blocks(content, min_block_chars)
+    return {hash_block(b) for b in blocks}, len(blocks)
+
+
+class BlockHashCounter:
+    """Counts, per block hash, how many pages of a page set contain it.
+
+    Pages are added one at a time so callers can stream them; memory grows
+    with the number of distinct block hashes, not with page bytes.
+    """
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self.blocks_total = 0
+        self.counts: Counter[str] = Counter()
+
+    def add_page(self, page_hashes: set[str], n_blocks: int) -> None:
+        """Add one page's distinct block hashes (a block counts once per page)."""
+        self.pages += 1
+        self.blocks_total += n_blocks
+        self.counts.update(page_hashes)
+
+    def fingerprint(
+        self,
+        threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+        min_pages: int = DEFAULT_MIN_PAGES,
+        threshold_floor: int | None = None,
+    ) -> DomainFingerprintResult:
+        """Select boilerplate hashes from the counts (see compute_domain_fingerprint)."""
+        if self.pages < min_pages:
+            return DomainFingerprintResult(
+                boilerplate_hashes=[],
+                pages_analyzed=self.pages,
+                blocks_total=0,
+                blocks_boilerplate=0,
+            )
+
+        floor = threshold_floor if threshold_floor is not None else min_pages
+        threshold = max(floor, int(self.pages * threshold_pct))
+        boilerplate = [h for h, count in self.counts.items() if count >= threshold]
+
+        return DomainFingerprintResult(
+            boilerplate_hashes=boilerplate,
+            pages_analyzed=self.pages,
+            blocks_total=self.blocks_total,
+            blocks_boilerplate=len(boilerplate),
+        )
+
+
 def compute_domain_fingerprint(
     pages: list[str],
     threshold_pct: float = DEFAULT_THRESHOLD_PCT,
@@ -120,36 +199,13 @@ def compute_domain_fingerprint(
     Returns:
         DomainFingerprintResult with boilerplate hashes and statistics.
     """
-    n_pages = len(pages)
-    if n_pages < min_pages:
-        return DomainFingerprintResult(
-            boilerplate_hashes=[],
-            pages_analyzed=n_pages,
-            blocks_total=0,
-            blocks_boilerplate=0,
-        )
-
-    # Count how many pages each block hash appears on
-    hash_page_count: Counter[str] = Counter()
-    blocks_total = 0
-
-    for page in pages:
-        blocks = split_into_blocks(page, min_block_chars)
-        blocks_total += len(blocks)
-        # Dedupe per-page: a block appearing twice on one page counts once
-        page_hashes = {hash_block(b) for b in blocks}
-        hash_page_count.update(page_hashes)
-
-    floor = threshold_floor if threshold_floor is not None else min_pages
-    threshold = max(floor, int(n_pages * threshold_pct))
-    boilerplate = [h for h, count in hash_page_count.items() if count >= threshold]
-
-    return DomainFingerprintResult(
-        boilerplate_hashes=boilerplate,
-        pages_analyzed=n_pages,
-        blocks_total=blocks_total,
-        blocks_boilerplate=len(boilerplate),
-    )
+    counter = BlockHashCounter()
+    if len(pages) < min_pages:
+        counter.pages = len(pages)
+    else:
+        for page in pages:
+            counter.add_page(*page_block_hashes(page, min_block_chars))
+    return counter.fingerprint(threshold_pct, min_pages, threshold_floor)
 
 
 def extract_path_prefix(uri: str, depth: int = 1) -> str:
@@ -216,24 +272,59 @@ def compute_section_fingerprints(
     if not pages_with_uris:
         return SectionFingerprintResult()
 
-    exclude = exclude_hashes or set()
-
     # Group pages by path prefix
     sections: dict[str, list[str]] = {}
     for content, uri in pages_with_uris:
         prefix = extract_path_prefix(uri, depth=path_depth)
         sections.setdefault(prefix, []).append(content)
 
-    result = SectionFingerprintResult()
+    counters: dict[str, BlockHashCounter] = {}
     for prefix, pages in sections.items():
+        counter = counters[prefix] = BlockHashCounter()
         if len(pages) < min_pages:
+            counter.pages = len(pages)
             continue
+        for page in pages:
+            counter.add_page(*page_block_hashes(page, min_block_chars))
+
+    return section_fingerprints_from_counters(
+        counters,
+        threshold_pct=threshold_pct,
+        min_pages=min_pages,
+        exclude_hashes=exclude_hashes,
+        threshold_floor=threshold_floor,
+    )
 
-        fp = compute_domain_fingerprint(
-            pages,
+
+def section_fingerprints_from_counters(
+    counters: dict[str, BlockHashCounter],
+    threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+    min_pages: int = DEFAULT_MIN_PAGES,
+    exclude_hashes: set[str] | None = None,
+    threshold_floor: int = 3,
+) -> SectionFingerprintResult:
+    """Build section fingerprints from per-prefix block hash counters.
+
+    Args:
+        counters: BlockHashCounter per URL path prefix.
+        threshold_pct: Fraction of section pages a block must appear on.
+        min_pages: Minimum pages per section before analysis runs (gate).
+        exclude_hashes: Hashes to exclude (e.g. domain-level boilerplate).
+        threshold_floor: Minimum absolute occurrences within a section.
+
+    Returns:
+        SectionFingerprintResult with per-section results.
+    """
+    exclude = exclude_hashes or set()
+
+    result = SectionFingerprintResult()
+    for prefix, counter in counters.items():
+        if counter.pages < min_pages:
+            continue
+
+        fp = counter.fingerprint(
             threshold_pct=threshold_pct,
             min_pages=min_pages,
-            min_block_chars=min_block_chars,
             threshold_floor=threshold_floor,
         )
 
@@ -255,6 +346,40 @@ def compute_section_fingerprints(
     return result
 
 
+def compute_domain_content_digest(
+    sources: list,
+    threshold_pct: float,
+    min_pages: int,
+    min_block_chars: int,
+) -> str:
+    """Digest a domain's analysis inputs: source content hashes and parameters.
+
+    Equal digests mean re-running the analysis would reproduce the stored
+    result, so it can be skipped.
+
+    Args:
+        sources: Sources or rows with id, uri and content_hash attributes.
+        threshold_pct: Boilerplate threshold fraction.
+        min_pages: Minimum pages parameter.
+        min_block_chars: Minimum block chars parameter.
+
+    Returns:
+        SHA-256 hex digest.
+    """
+    entries = []
+    for source in sources:
+        if source.content_hash is None:
+            continue
+        entries.append(f"{source.uri or source.id}\t{source.content_hash}")
+    entries.sort()
+
+    h = hashlib.sha256(f"{threshold_pct}|{min_pages}|{min_block_chars}".encode())
+    for entry in entries:
+        h.update(b"\n")
+        h.update(entry.encode("utf-8"))
+    return h.hexdigest()
+
+
 def strip_boilerplate(
     content: str,
     boilerplate_hashes: set[str],
@@ -299,6 +424,31 @@ def strip_boilerplate(
     return cleaned, bytes_removed
 
 
+_CLEARED = {"cleaned_content": None, "cleaned_content_delta": None}
+
+
+def _cleaned_values(
+    body: SourceBody, cleaned: str, effective: set[str], min_block_chars: int
+) -> dict:
+    """Build the bulk-update row recording a source's cleaned content.
+
+    Blob-stored sources keep only the stripped block hashes (a delta against
+    content, replayed by get_extraction_content); inline sources store the
+    cleaned text.
+    """
+    if body.blob_stored:
+        hashes, _ = page_block_hashes(body.content, min_block_chars)
+        return {
+            "id": body.id,
+            "cleaned_content": None,
+            "cleaned_content_delta": {
+                "hashes": sorted(hashes & effective),
+                "min_block_chars": min_block_chars,
+            },
+        }
+    return {"id": body.id, "cleaned_content": cleaned, "cleaned_content_delta": None}
+
+
 class DomainDedupService:
     """Orchestrates domain boilerplate analysis with DB persistence."""
 
@@ -306,6 +456,8 @@ class DomainDedupService:
         self,
         session: Session,
         extraction: ExtractionConfig | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        executor: Executor | None = None,
     ):
         from services.storage.repositories.domain_boilerplate import (
             DomainBoilerplateRepository,
@@ -314,9 +466,55 @@ class DomainDedupService:
 
         self._session = session
         self._extraction = extraction
+        self._batch_size = batch_size
+        self._executor = executor
         self._source_repo = SourceRepository(session)
         self._bp_repo = DomainBoilerplateRepository(session)
 
+    @classmethod
+    def from_config(
+        cls, session: Session, extraction: ExtractionConfig | None
+    ) -> DomainDedupService:
+        """Build a service that fingerprints domains in the shared process pool.
+
+        Without settings, or with DOMAIN_DEDUP_PROCESS_WORKERS=0, domains are
+        analyzed inline.
+        """
+        from services.extraction.process_pools import get_process_pool
+
+        executor = None
+        if extraction is not None:
+            executor = get_process_pool(
+                "domain_dedup",
+                extraction.domain_dedup_process_workers,
+                initializer=init_worker_process,
+            )
+        return cls(session, extraction, executor=executor)
+
+    def _resolve_params(
+        self,
+        threshold_pct: float | None,
+        min_pages: int | None,
+        min_block_chars: int | None,
+    ) -> tuple[float, int, int]:
+        """Apply config and module defaults to unset analysis parameters."""
+        t_pct = threshold_pct if threshold_pct is not None else DEFAULT_THRESHOLD_PCT
+        m_pages = min_pages if min_pages is not None else DEFAULT_MIN_PAGES
+        m_chars = (
+            min_block_chars if min_block_chars is not None else DEFAULT_MIN_BLOCK_CHARS
+        )
+
+        # Load config overrides if available
+        if self._extraction is not None:
+            if threshold_pct is None:
+                t_pct = self._extraction.domain_dedup_threshold_pct
+            if min_pages is None:
+                m_pages = self._extraction.domain_dedup_min_pages
+            if min_block_chars is None:
+                m_chars = self._extraction.domain_dedup_min_block_chars
+
+        return t_pct, m_pages, m_chars
+
     def analyze_domain(
         self,
         project_id: UUID,
@@ -337,55 +535,114 @@ class DomainDedupService:
         Returns:
             DomainAnalysisResult with statistics.
         """
-        t_pct = threshold_pct if threshold_pct is not None else DEFAULT_THRESHOLD_PCT
-        m_pages = min_pages if min_pages is not None else DEFAULT_MIN_PAGES
-        m_chars = (
-            min_block_chars if min_block_chars is not None else DEFAULT_MIN_BLOCK_CHARS
+        result, record = self.clean_domain(
+            project_id,
+            domain,
+            *self._resolve_params(threshold_pct, min_pages, min_block_chars),
         )
+        if record is not None:
+            self._bp_repo.upsert(**record)
 
-        # Load config overrides if available
-        if self._extraction is not None:
-            if threshold_pct is None:
-                t_pct = self._extraction.domain_dedup_threshold_pct
-            if min_pages is None:
-                m_pages = self._extraction.domain_dedup_min_pages
-            if min_block_chars is None:
-                m_chars = self._extraction.domain_dedup_min_block_chars
+        # flush (caller manages transaction)
+        self._session.flush()
+        return result
 
-        # 1. Query sources for this domain — single-pass construction
-        sources = self._source_repo.get_by_project_and_domain(project_id, domain)
-        pages = []
-        pages_with_uris = []
-        for s in sources:
-            if s.content:
-                pages.append(s.content)
-                if s.uri:
-                    pages_with_uris.append((s.content, s.uri))
-
-        if not pages:
-            return DomainAnalysisResult(
-                domain=domain,
-                pages_analyzed=0,
-                pages_cleaned=0,
-                blocks_boilerplate=0,
-                bytes_removed_total=0,
-            )
+    def clean_domain(
+        self,
+        project_id: UUID,
+        domain: str,
+        t_pct: float,
+        m_pages: int,
+        m_chars: int,
+    ) -> tuple[DomainAnalysisResult, dict | None]:
+        """Fingerprint a domain and write cleaned content to its sources.
+
+        Does not persist the DomainBoilerplate record; analyze_domain
+        upserts it in the same transaction.
+
+        Args:
+            project_id: Project UUID.
+            domain: Domain to analyze.
+            t_pct: Boilerplate threshold fraction.
+            m_pages: Minimum pages parameter.
+            m_chars: Minimum block chars parameter.
 
-        # 2. Pass 1: Domain-level fingerprint
-        fp = compute_domain_fingerprint(
-            pages, threshold_pct=t_pct, min_pages=m_pages, min_block_chars=m_chars
+        Returns:
+            (DomainAnalysisResult, DomainBoilerplate upsert kwargs). The
+            kwargs are None when the domain was unchanged or had no pages.
+        """
+        # Skip re-analysis when no page content or parameter changed
+        self._source_repo.backfill_content_hashes(
+            project_id, domain, batch_size=self._batch_size
+        )
+        digest = compute_domain_content_digest(
+            self._source_repo.get_domain_content_hashes(project_id, domain),
+            t_pct,
+            m_pages,
+            m_chars,
         )
+        existing = self._bp_repo.get(project_id, domain)
+        if existing is not None and existing.content_digest == digest:
+            pages_cleaned = self._source_repo.count_cleaned_in_domain(
+                project_id, domain
+            )
+            logger.info(
+                "domain_dedup_unchanged",
+                extra={"domain": domain, "pages": existing.pages_analyzed},
+            )
+            return (
+                DomainAnalysisResult(
+                    domain=domain,
+                    pages_analyzed=existing.pages_analyzed,
+                    pages_cleaned=pages_cleaned,
+                    blocks_boilerplate=existing.blocks_boilerplate,
+                    bytes_removed_total=existing.bytes_removed_avg * pages_cleaned,
+                    unchanged=True,
+                ),
+                None,
+            )
+
+        # 1. Pass 1: stream bodies once, counting block hashes per page for
+        # the domain and for each URL section. Memory is bounded by the
+        # number of distinct blocks, not by page bytes.
+        domain_counter = BlockHashCounter()
+        section_counters: dict[str, BlockHashCounter] = {}
+        for batch in self._source_repo.iter_domain_bodies(
+            project_id, domain, batch_size=self._batch_size
+        ):
+            for body in batch:
+                page_hashes, n_blocks = page_block_hashes(body.content, m_chars)
+                domain_counter.add_page(page_hashes, n_blocks)
+                if body.uri:
+                    prefix = extract_path_prefix(body.uri)
+                    section_counters.setdefault(prefix, BlockHashCounter()).add_page(
+                        page_hashes, n_blocks
+                    )
+
+        if not domain_counter.pages:
+            return (
+                DomainAnalysisResult(
+                    domain=domain,
+                    pages_analyzed=0,
+                    pages_cleaned=0,
+                    blocks_boilerplate=0,
+                    bytes_removed_total=0,
+                ),
+                None,
+            )
+
+        # 2. Domain-level and section-level fingerprints
+        fp = domain_counter.fingerprint(threshold_pct=t_pct, min_pages=m_pages)
         domain_hashes = set(fp.boilerplate_hashes)
-        del pages  # Free memory before section pass
+        del domain_counter
 
-        # 3. Pass 2: Section-level fingerprints
-        section_fp = compute_section_fingerprints(
-            pages_with_uris,
+        section_fp = section_fingerprints_from_counters(
+            section_counters,
             threshold_pct=t_pct,
             min_pages=m_pages,
-            min_block_chars=m_chars,
             exclude_hashes=domain_hashes,
         )
+        del section_counters
 
         # Build a lookup: prefix → section hashes
         section_hash_lookup: dict[str, set[str]] = {}
@@ -396,59 +653,60 @@ class DomainDedupService:
                 section_hash_lookup[prefix] = h_set
                 all_section_hashes |= h_set
 
-        # 4. Strip boilerplate from each source using merged hashes
+        # 3. Pass 2: stream bodies again, strip boilerplate and write the
+        # cleaned content back in batches
         bytes_removed_total = 0
         pages_cleaned = 0
-        has_any_hashes = bool(domain_hashes or all_section_hashes)
-
-        if has_any_hashes:
-            for source in sources:
-                if not source.content:
-                    continue
-                # Effective hashes = domain ∪ section(for this source's prefix)
-                effective = set(domain_hashes)
-                if source.uri and section_hash_lookup:
-                    src_prefix = extract_path_prefix(source.uri)
-                    if src_prefix in section_hash_lookup:
-                        effective |= section_hash_lookup[src_prefix]
-
-                cleaned, removed = strip_boilerplate(
-                    source.content, effective, min_block_chars=m_chars
-                )
-                if removed > 0:
-                    source.cleaned_content = cleaned
-                    pages_cleaned += 1
-                    bytes_removed_total += removed
-                else:
-                    source.cleaned_content = None
+
+        if domain_hashes or all_section_hashes:
+            for batch in self._source_repo.iter_domain_bodies(
+                project_id, domain, batch_size=self._batch_size
+            ):
+                updates = []
+                for body in batch:
+                    # Effective hashes = domain ∪ section(for this source's prefix)
+                    effective = domain_hashes
+                    if body.uri and section_hash_lookup:
+                        src_prefix = extract_path_prefix(body.uri)
+                        if src_prefix in section_hash_lookup:
+                            effective = domain_hashes | section_hash_lookup[src_prefix]
+
+                    cleaned, removed = strip_boilerplate(
+                        body.content, effective, min_block_chars=m_chars
+                    )
+                    if removed > 0:
+                        updates.append(
+                            _cleaned_values(body, cleaned, effective, m_chars)
+                        )
+                        pages_cleaned += 1
+                        bytes_removed_total += removed
+                    elif body.is_cleaned:
+                        updates.append(_CLEARED | {"id": body.id})
+                self._source_repo.bulk_update_cleaned(updates)
 
             avg_removed = bytes_removed_total // pages_cleaned if pages_cleaned else 0
         else:
             avg_removed = 0
             # Clear any stale cleaned_content
-            for source in sources:
-                if source.cleaned_content is not None:
-                    source.cleaned_content = None
+            self._source_repo.clear_cleaned_in_domain(project_id, domain)
 
         # Persist merged hashes (domain ∪ all section hashes)
         all_hashes = sorted(domain_hashes | all_section_hashes)
         total_bp_blocks = fp.blocks_boilerplate + section_fp.total_section_hashes
 
-        self._bp_repo.upsert(
-            project_id=project_id,
-            domain=domain,
-            boilerplate_hashes=all_hashes,
-            pages_analyzed=fp.pages_analyzed,
-            blocks_total=fp.blocks_total,
-            blocks_boilerplate=total_bp_blocks,
-            bytes_removed_avg=avg_removed,
-            threshold_pct=t_pct,
-            min_pages=m_pages,
-            min_block_chars=m_chars,
-        )
-
-        # 5. flush (caller manages transaction)
-        self._session.flush()
+        record = {
+            "project_id": project_id,
+            "domain": domain,
+            "boilerplate_hashes": all_hashes,
+            "pages_analyzed": fp.pages_analyzed,
+            "blocks_total": fp.blocks_total,
+            "blocks_boilerplate": total_bp_blocks,
+            "bytes_removed_avg": avg_removed,
+            "threshold_pct": t_pct,
+            "min_pages": m_pages,
+            "min_block_chars": m_chars,
+            "content_digest": digest,
+        }
 
         logger.info(
             "domain_dedup_analyzed",
@@ -463,14 +721,17 @@ class DomainDedupService:
             },
         )
 
-        return DomainAnalysisResult(
-            domain=domain,
-            pages_analyzed=fp.pages_analyzed,
-            pages_cleaned=pages_cleaned,
-            blocks_boilerplate=total_bp_blocks,
-            bytes_removed_total=bytes_removed_total,
-            sections_analyzed=section_fp.sections_analyzed,
-            sections_with_boilerplate=section_fp.sections_with_boilerplate,
+        return (
+            DomainAnalysisResult(
+                domain=domain,
+                pages_analyzed=fp.pages_analyzed,
+                pages_cleaned=pages_cleaned,
+                blocks_boilerplate=total_bp_blocks,
+                bytes_removed_total=bytes_removed_total,
+                sections_analyzed=section_fp.sections_analyzed,
+                sections_with_boilerplate=section_fp.sections_with_boilerplate,
+            ),
+            record,
         )
 
     def analyze_project(
@@ -511,9 +772,84 @@ class DomainDedupService:
         # Flush — caller manages transaction commit
         self._session.flush()
 
+        return self._summarize(project_id, domain_results)
+
+    async def analyze_project_parallel(
+        self,
+        project_id: UUID,
+        source_groups: list[str] | None = None,
+        threshold_pct: float | None = None,
+        min_pages: int | None = None,
+        min_block_chars: int | None = None,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+    ) -> ProjectAnalysisResult:
+        """Analyze all domains of a project, fingerprinting domains in parallel.
+
+        With an executor, each domain is cleaned in a worker process that
+        commits the cleaned sources and the DomainBoilerplate record together
+        in its own session. Without one, domains are analyzed inline one
+        after another. Either way a domain is written all-or-nothing, so a
+        failed run can simply be repeated: finished domains are skipped by
+        their content digest.
+
+        Args:
+            project_id: Project UUID.
+            source_groups: Optional filter by source groups.
+            threshold_pct: Override default threshold.
+            min_pages: Override default min pages.
+            min_block_chars: Override default min block chars.
+            progress_callback: Called as (stage, completed, total) after
+                each domain.
+
+        Returns:
+            ProjectAnalysisResult with per-domain statistics.
+        """
+        params = self._resolve_params(threshold_pct, min_pages, min_block_chars)
+        domains = [
+            domain_name
+            for domain_name, _page_count in self._source_repo.get_domains_for_project(
+                project_id, source_groups=source_groups
+            )
+        ]
+        total = len(domains)
+        by_domain: dict[str, DomainAnalysisResult] = {}
+
+        def record_progress(result: DomainAnalysisResult) -> None:
+            by_domain[result.domain] = result
+            if progress_callback is not None:
+                progress_callback("domains", len(by_domain), total)
+
+        if self._executor is None:
+            for domain_name in domains:
+                record_progress(self.analyze_domain(project_id, domain_name, *params))
+        else:
+            loop = asyncio.get_running_loop()
+            futures = [
+                loop.run_in_executor(
+                    self._executor,
+                    clean_domain_in_worker,
+                    project_id,
+                    domain_name,
+                    *params,
+                    self._batch_size,
+                )
+                for domain_name in domains
+            ]
+            for future in asyncio.as_completed(futures):
+                record_progress(await future)
+
+        # Flush — caller manages transaction commit
+        self._session.flush()
+
+        return self._summarize(project_id, [by_domain[d] for d in domains])
+
+    def _summarize(
+        self, project_id: UUID, domain_results: list[DomainAnalysisResult]
+    ) -> ProjectAnalysisResult:
         domains_with_bp = sum(1 for r in domain_results if r.blocks_boilerplate > 0)
         total_cleaned = sum(r.pages_cleaned for r in domain_results)
         total_removed = sum(r.bytes_removed_total for r in domain_results)
+        domains_unchanged = sum(1 for r in domain_results if r.unchanged)
 
         logger.info(
             "domain_dedup_project_complete",
@@ -523,6 +859,7 @@ class DomainDedupService:
                 "domains_with_boilerplate": domains_with_bp,
                 "total_pages_cleaned": total_cleaned,
                 "total_bytes_removed": total_removed,
+                "domains_unchanged": domains_unchanged,
             },
         )
 
@@ -557,3 +894,41 @@ class DomainDedupService:
             }
             for r in records
         ]
+
+
+def init_worker_process() -> None:
+    """ProcessPoolExecutor initializer: drop pooled connections inherited on fork."""
+    from database import engine
+
+    engine.dispose(close=False)
+
+
+def clean_domain_in_worker(
+    project_id: UUID,
+    domain: str,
+    threshold_pct: float,
+    min_pages: int,
+    min_block_chars: int,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> DomainAnalysisResult:
+    """Process-pool entry point: clean one domain in a fresh session.
+
+    The cleaned source content and the DomainBoilerplate record commit in
+    one transaction, so an interrupted job never leaves a domain cleaned
+    without the record whose digest lets a re-run skip it.
+    """
+    from database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        service = DomainDedupService(session, batch_size=batch_size)
+        result = service.analyze_domain(
+            project_id, domain, threshold_pct, min_pages, min_block_chars
+        )
+        session.commit()
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,137 @@
+"""Blocking-based fuzzy entity resolution for entity-list consolidation.
+
+Pure functions with zero external dependencies. Clusters entity identity
+strings such as "MOTOX 80" and "Motox-80 gearmotor" that exact
+lower()-matching keeps apart, while staying near-linear on large groups:
+
+1. Normalise each key into tokens (letters / numbers, split at letter-digit
+   boundaries) and a compact form ("motox80").
+2. Exact compact-form matches join a cluster immediately.
+3. Otherwise candidates come only from blocks keyed by the entity's tokens.
+   Tokens shared by more than ``max_block_size`` distinct entities carry little
+   identity signal and are not used for blocking, so each entity is compared
+   with at most a bounded number of cluster representatives.
+4. Candidates must have identical numeric tokens (model numbers never merge
+   across values) and an IDF-weighted token Jaccard >= threshold. Generic
+   words common to the group ("gearmotor") weigh less than rare identifiers.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+
+# Blocks larger than this are treated like stop words for candidate lookup
+DEFAULT_MAX_BLOCK_SIZE = 64
+
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d+(?:[.,]\d+)*")
+
+
+def entity_tokens(text: str) -> list[str]:
+    """Split an identity string into lowercase letter and number tokens.
+
+    Letter-digit boundaries split tokens ("MOTOX80" -> ["motox", "80"]) and
+    accents are folded so "Müller" and "Muller" tokenize the same way.
+    """
+    folded = unicodedata.normalize("NFKD", text)
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _TOKEN_RE.findall(folded.lower())
+
+
+def _is_numeric(token: str) -> bool:
+    return token[0].isdigit()
+
+
+def cluster_entity_keys(
+    keys: list[str],
+    threshold: float,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+) -> list[int]:
+    """Assign a cluster id to each identity key.
+
+    Args:
+        keys: Identity strings, one per entity, in input order.
+        threshold: Minimum IDF-weighted token Jaccard (0-1] to merge.
+        max_block_size: Maximum distinct entities per blocking token.
+
+    Returns:
+        Cluster id per key. Ids are assigned in order of first appearance,
+        so the first key of every cluster is its representative.
+    """
+    token_lists = [entity_tokens(k) for k in keys]
+
+    # Frequencies over distinct entities, so repeated mentions of the same
+    # product across pages do not turn its own tokens into stop words
+    distinct: dict[str, list[str]] = {}
+    for tokens in token_lists:
+        distinct.setdefault("".join(tokens), tokens)
+    doc_freq: Counter[str] = Counter()
+    for tokens in distinct.values():
+        doc_freq.update(set(tokens))
+
+    n = max(len(distinct), 1)
+    idf = {t: math.log1p(n / c) for t, c in doc_freq.items()}
+
+    assignments: list[int] = []
+    by_compact: dict[str, int] = {}
+    by_raw: dict[str, int] = {}
+    blocks: dict[str, list[int]] = {}
+    reps: list[tuple[frozenset[str], tuple[str, ...], float]] = []
+
+    for key, tokens in zip(keys, token_lists, strict=True):
+        if not tokens:
+            # Nothing to compare fuzzily (e.g. punctuation-only) — exact only
+            raw = key.strip().lower()
+            cluster = by_raw.get(raw)
+            if cluster is None:
+                cluster = len(reps)
+                by_raw[raw] = cluster
+                reps.append((frozenset(), (), 0.0))
+            assignments.append(cluster)
+            continue
+
+        compact = "".join(tokens)
+        cluster = by_compact.get(compact)
+        if cluster is not None:
+            assignments.append(cluster)
+            continue
+
+        token_set = frozenset(tokens)
+        numeric = tuple(sorted(t for t in tokens if _is_numeric(t)))
+        weight = sum(idf[t] for t in token_set)
+
+        best: int | None = None
+        best_score = threshold
+        seen: set[int] = set()
+        for token in token_set:
+            if doc_freq[token] > max_block_size:
+                continue
+            for candidate in blocks.get(token, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                cand_tokens, cand_numeric, cand_weight = reps[candidate]
+                if cand_numeric != numeric:
+                    continue
+                shared = sum(idf[t] for t in token_set & cand_tokens)
+                union = weight + cand_weight - shared
+                score = shared / union if union else 0.0
+                if score >= best_score:
+                    best, best_score = candidate, score
+
+        if best is None:
+            best = len(reps)
+            reps.append((token_set, numeric, weight))
+            for token in token_set:
+                if doc_freq[token] > max_block_size:
+                    continue
+                block = blocks.setdefault(token, [])
+                if len(block) < max_block_size:
+                    block.append(best)
+
+        by_compact[compact] = best
+        assignments.append(best)
+
+    return assignments
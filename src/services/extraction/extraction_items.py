@@ -11,6 +11,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from services.metrics.instruments import GROUNDING_MATCHES
+
 
 @dataclass(frozen=True)
 class SourceLocation:
@@ -122,6 +124,7 @@ def locate_in_source(
         result = ground_and_locate_precomputed(quote, full_content, content_maps)
     else:
         result = ground_and_locate(quote, full_content)
+    GROUNDING_MATCHES.inc(tier=result.match_tier)
 
     return SourceLocation(
         heading_path=list(heading_path),
@@ -1,24 +1,84 @@
 """Declarative field validation backed by factAPI collections."""
 
 import asyncio
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import httpx
 import structlog
 
 from services.extraction.field_groups import FieldDefinition, FieldGroup
+from services.extraction.lookup_snapshot import (
+    FetchResult,
+    LookupMapping,
+    LookupSet,
+    LookupSnapshotStore,
+    lookup_records,
+    mapping_records,
+    normalize_value,
+)
 
 logger = structlog.get_logger(__name__)
 
 # Track which (collection, column) failures have been logged to avoid log spam
 _logged_unavailable: set[str] = set()
 
+# Lookup sets and mappings: in-memory containers or shared snapshots
+type LookupValues = frozenset[str] | LookupSet
+type LookupMap = dict[str, frozenset[str]] | LookupMapping
+
+
+def _log_unavailable(collection: str, column: str, error: Exception) -> None:
+    log_key = f"{collection}/{column}"
+    if log_key not in _logged_unavailable:
+        _logged_unavailable.add(log_key)
+        logger.warning(
+            "field_validation_factapi_unavailable",
+            collection=collection,
+            column=column,
+            error=str(error),
+        )
+
+
+def _response_rows(resp: httpx.Response) -> list[dict]:
+    resp.raise_for_status()
+    data = resp.json()
+    # factAPI returns {"data": [{column: value, ...}, ...]} or a list directly
+    return data if isinstance(data, list) else data.get("data", [])
+
+
+def _column_values(rows: list[dict], column: str, case_sensitive: bool) -> set[str]:
+    values: set[str] = set()
+    for row in rows:
+        val = row.get(column)
+        if val is not None:
+            values.add(normalize_value(val, case_sensitive))
+    return values
+
+
+def _column_mapping(
+    rows: list[dict], match_column: str, fill_column: str, case_sensitive: bool
+) -> dict[str, set[str]]:
+    mapping: dict[str, set[str]] = {}
+    for row in rows:
+        match_val = row.get(match_column)
+        fill_val = row.get(fill_column)
+        if match_val is None or fill_val is None:
+            continue
+        mapping.setdefault(normalize_value(match_val, case_sensitive), set()).add(
+            str(fill_val)
+        )
+    return mapping
+
 
 class FieldValidationService:
     """Validates extracted field values against factAPI reference collections.
 
     Validators are declared on FieldDefinition objects and resolved against
-    factAPI lookup sets fetched once per extraction run.
+    factAPI lookup sets fetched once per extraction run. With a snapshot
+    directory, lookup tables are kept in shared memory-mapped snapshots (see
+    lookup_snapshot) instead of per-process dicts.
     """
 
     def __init__(
@@ -27,11 +87,17 @@ class FieldValidationService:
         api_key: str,
         timeout: float = 5.0,
         cache_ttl: int = 0,
+        snapshot_dir: str = "",
     ) -> None:
         self._factapi_url = factapi_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
         self._cache_ttl = cache_ttl
+        self._snapshots = (
+            LookupSnapshotStore(snapshot_dir, ttl_seconds=cache_ttl)
+            if snapshot_dir
+            else None
+        )
         # Cache: key → frozenset | None (None = fetch failed)
         self._cache: dict[str, frozenset[str] | None] = {}
         self._in_flight: dict[str, asyncio.Lock] = {}
@@ -53,19 +119,35 @@ class FieldValidationService:
 
     async def get_lookup_set(
         self, collection: str, column: str, case_sensitive: bool = False
-    ) -> frozenset[str] | None:
+    ) -> LookupValues | None:
         """Fetch and cache a lookup set from factAPI.
 
         Args:
             collection: factAPI collection name (e.g. "worldcities").
             column: Column to retrieve (e.g. "country").
-            case_sensitive: If False, values are lowercased.
+            case_sensitive: If False, values are normalised (see normalize_value).
 
         Returns:
-            frozenset of values, or None if factAPI is unreachable.
+            Set of values (frozenset, or a LookupSet snapshot), or None if
+            factAPI is unreachable.
         """
         key = self._cache_key(collection, column, case_sensitive)
 
+        if self._snapshots is not None:
+            fetch = partial(
+                self._fetch_snapshot,
+                collection,
+                column,
+                to_records=lambda rows: lookup_records(
+                    _column_values(rows, column, case_sensitive)
+                ),
+            )
+            try:
+                return await self._snapshots.get_set(key, fetch)
+            except Exception as e:
+                _log_unavailable(collection, column, e)
+                return None
+
         if key in self._cache:
             return self._cache[key]
 
@@ -85,68 +167,91 @@ class FieldValidationService:
     async def _fetch_lookup_set(
         self, collection: str, column: str, case_sensitive: bool
     ) -> frozenset[str] | None:
-        url = f"{self._factapi_url}/api/v1/collections/{collection}"
-        params = {"_fields": column, "_limit": 100000}
-        headers = {"X-API-Key": self._api_key} if self._api_key else {}
-
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.get(url, params=params, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
-
-            # factAPI returns {"data": [{column: value, ...}, ...]} or a list directly
-            rows = data if isinstance(data, list) else data.get("data", [])
-            values: set[str] = set()
-            for row in rows:
-                val = row.get(column)
-                if val is not None:
-                    s = str(val)
-                    values.add(s if case_sensitive else s.lower())
-
+            rows = _response_rows(await self._get_collection(collection, column))
+            values = frozenset(_column_values(rows, column, case_sensitive))
             logger.info(
                 "field_validation_lookup_fetched",
                 collection=collection,
                 column=column,
                 count=len(values),
             )
-            return frozenset(values)
+            return values
 
         except Exception as e:
-            log_key = f"{collection}/{column}"
-            if log_key not in _logged_unavailable:
-                _logged_unavailable.add(log_key)
-                logger.warning(
-                    "field_validation_factapi_unavailable",
-                    collection=collection,
-                    column=column,
-                    error=str(e),
-                )
+            _log_unavailable(collection, column, e)
             return None
 
+    async def _get_collection(
+        self,
+        collection: str,
+        fields: str,
+        conditional: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url = f"{self._factapi_url}/api/v1/collections/{collection}"
+        params = {"_fields": fields, "_limit": 100000}
+        headers = {"X-API-Key": self._api_key} if self._api_key else {}
+        headers.update(conditional or {})
+
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            return await client.get(url, params=params, headers=headers)
+
+    async def _fetch_snapshot(
+        self,
+        collection: str,
+        fields: str,
+        conditional: dict[str, str],
+        *,
+        to_records: Callable[[list[dict]], list[bytes]],
+    ) -> FetchResult:
+        """Conditional fetch of a collection for the snapshot store."""
+        resp = await self._get_collection(collection, fields, conditional)
+        if resp.status_code == 304:
+            return FetchResult(not_modified=True)
+        return FetchResult(
+            records=to_records(_response_rows(resp)),
+            etag=resp.headers.get("etag"),
+            last_modified=resp.headers.get("last-modified"),
+        )
+
     async def get_mapping(
         self,
         collection: str,
         match_column: str,
         fill_column: str,
         case_sensitive: bool = False,
-    ) -> dict[str, frozenset[str]] | None:
+    ) -> LookupMap | None:
         """Fetch and cache a value→fill mapping from factAPI.
 
         Args:
             collection: factAPI collection name (e.g. "worldcities").
             match_column: Column whose value is looked up (e.g. "city").
             fill_column: Column whose value is used to fill (e.g. "country").
-            case_sensitive: If False, match keys are lowercased.
+            case_sensitive: If False, match keys are normalised.
 
         Returns:
-            Dict mapping match_value → frozenset of fill_values,
-            or None if factAPI is unreachable.
+            Mapping (dict, or a LookupMapping snapshot) of match_value →
+            frozenset of fill_values, or None if factAPI is unreachable.
         """
         key = self._mapping_cache_key(
             collection, match_column, fill_column, case_sensitive
         )
 
+        if self._snapshots is not None:
+            fetch = partial(
+                self._fetch_snapshot,
+                collection,
+                f"{match_column},{fill_column}",
+                to_records=lambda rows: mapping_records(
+                    _column_mapping(rows, match_column, fill_column, case_sensitive)
+                ),
+            )
+            try:
+                return await self._snapshots.get_mapping(key, fetch)
+            except Exception as e:
+                _log_unavailable(collection, f"{match_column}\u2192{fill_column}", e)
+                return None
+
         if key in self._mapping_cache:
             return self._mapping_cache[key]
 
@@ -170,27 +275,11 @@ class FieldValidationService:
         fill_column: str,
         case_sensitive: bool,
     ) -> dict[str, frozenset[str]] | None:
-        url = f"{self._factapi_url}/api/v1/collections/{collection}"
-        params = {"_fields": f"{match_column},{fill_column}", "_limit": 100000}
-        headers = {"X-API-Key": self._api_key} if self._api_key else {}
-
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.get(url, params=params, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
-
-            rows = data if isinstance(data, list) else data.get("data", [])
-            mapping: dict[str, set[str]] = {}
-            for row in rows:
-                match_val = row.get(match_column)
-                fill_val = row.get(fill_column)
-                if match_val is None or fill_val is None:
-                    continue
-                mk = str(match_val) if case_sensitive else str(match_val).lower()
-                fv = str(fill_val)
-                mapping.setdefault(mk, set()).add(fv)
-
+            rows = _response_rows(
+                await self._get_collection(collection, f"{match_column},{fill_column}")
+            )
+            mapping = _column_mapping(rows, match_column, fill_column, case_sensitive)
             result = {k: frozenset(v) for k, v in mapping.items()}
             logger.info(
                 "field_validation_mapping_fetched",
@@ -202,15 +291,7 @@ class FieldValidationService:
             return result
 
         except Exception as e:
-            log_key = f"{collection}/{match_column}\u2192{fill_column}"
-            if log_key not in _logged_unavailable:
-                _logged_unavailable.add(log_key)
-                logger.warning(
-                    "field_validation_factapi_unavailable",
-                    collection=collection,
-                    column=f"{match_column}\u2192{fill_column}",
-                    error=str(e),
-                )
+            _log_unavailable(collection, f"{match_column}\u2192{fill_column}", e)
             return None
 
     async def prefetch_for_groups(
@@ -303,11 +384,7 @@ class FieldValidationService:
                     mapping = lookup_sets.get(mapping_key)
                     if mapping is None:
                         continue
-                    check_value = (
-                        str(current_value)
-                        if spec.case_sensitive
-                        else str(current_value).lower()
-                    )
+                    check_value = normalize_value(current_value, spec.case_sensitive)
                     mapped_values = mapping.get(check_value)
                     if not mapped_values:
                         continue
@@ -339,7 +416,7 @@ class FieldValidationService:
                     # factAPI unavailable — skip silently (already logged)
                     continue
 
-                check_value = str(value) if spec.case_sensitive else str(value).lower()
+                check_value = normalize_value(value, spec.case_sensitive)
 
                 if spec.type == "factapi_not_in_column":
                     violated = check_value in lookup_set
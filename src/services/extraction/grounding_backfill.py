@@ -0,0 +1,519 @@
+"""Grounding backfill: re-score the stored extractions of a project.
+
+Two modes:
+
+- ``v1`` recomputes the string-match ``grounding_scores`` column of flat
+  (data_version 1) extractions.
+- ``v2`` re-grounds the inline per-field ``grounding`` of structured
+  (data_version 2) extractions against their source content with the
+  current grounding defaults.
+
+Extractions are walked in ``(created_at, id)`` keyset order, so every batch
+is an index range scan however deep the walk is, and the cursor of the last
+row of a batch doubles as the resume checkpoint. Scoring is pure and
+CPU-bound: each batch is split into slices scored in a process pool (in a
+worker thread without one), and the batch's updates are committed together
+with its checkpoint, so a crashed or cancelled backfill resumes after the
+last committed batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from orm_models import Extraction, Project, Source
+from services.extraction.content_selector import (
+    get_extraction_content,
+    prefetch_source_contents,
+)
+from services.extraction.grounding import (
+    GROUNDING_DEFAULTS,
+    compute_entity_list_grounding_scores,
+    compute_grounding_scores,
+    extract_entity_list_groups,
+    extract_field_types_from_schema,
+    ground_field_item,
+)
+from services.storage.pagination import Keyset, count_rows
+from services.storage.repositories.extraction import ExtractionRepository
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+logger = structlog.get_logger(__name__)
+
+BackfillMode = Literal["v1", "v2"]
+
+# Ascending, so rows inserted while a backfill runs are visited at the end
+BACKFILL_ORDER = Keyset(Extraction.created_at, Extraction.id, descending=False)
+
+DEFAULT_BATCH_SIZE = 500
+
+# Called after each batch, before its commit, with the running totals
+CheckpointCallback = Callable[["BackfillTotals"], None]
+CancellationCheck = Callable[[], Awaitable[bool]]
+
+# Field name -> {"grounded" | "ungrounded" | "downgraded": count}
+FieldStats = dict[str, dict[str, int]]
+
+
+class BackfillCancelledError(Exception):
+    """Raised when a backfill stops because cancellation was requested."""
+
+
+@dataclass
+class BackfillTotals:
+    """Running totals of a backfill, persisted as the job checkpoint.
+
+    ``resume_after`` is the keyset cursor of the last committed batch and
+    ``elapsed_seconds`` accumulates across resumed runs, so throughput stays
+    meaningful after a restart.
+    """
+
+    total_extractions: int = 0
+    processed: int = 0
+    updated: int = 0
+    skipped: int = 0
+    field_stats: FieldStats = field(default_factory=dict)
+    resume_after: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def scanned(self) -> int:
+        return self.processed + self.skipped
+
+    @property
+    def extractions_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.scanned / self.elapsed_seconds, 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_extractions": self.total_extractions,
+            "processed": self.processed,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "field_stats": {
+                name: dict(counts) for name, counts in sorted(self.field_stats.items())
+            },
+            "resume_after": self.resume_after,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "extractions_per_second": self.extractions_per_second,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BackfillTotals:
+        return cls(
+            total_extractions=data.get("total_extractions", 0),
+            processed=data.get("processed", 0),
+            updated=data.get("updated", 0),
+            skipped=data.get("skipped", 0),
+            field_stats={
+                name: dict(counts)
+                for name, counts in (data.get("field_stats") or {}).items()
+            },
+            resume_after=data.get("resume_after"),
+            elapsed_seconds=data.get("elapsed_seconds", 0.0),
+        )
+
+
+@dataclass
+class SliceResult:
+    """Scores of one slice of a batch, returned from a pool worker."""
+
+    updates: list[tuple[UUID, dict]] = field(default_factory=list)
+    processed: int = 0
+    skipped: int = 0
+    field_stats: FieldStats = field(default_factory=dict)
+
+
+def _count(stats: dict, field_name: str, bucket: str) -> None:
+    counts = stats.setdefault(field_name, {})
+    counts[bucket] = counts.get(bucket, 0) + 1
+
+
+def score_v1_slice(
+    items: list[tuple[UUID, str, dict]],
+    field_types_by_group: dict[str, dict[str, str]],
+    entity_list_groups: set[str],
+    id_fields: tuple[str, ...],
+) -> SliceResult:
+    """Compute string-match grounding scores for flat extractions.
+
+    Process-pool entry point: arguments and result are plain picklable data.
+
+    Args:
+        items: (extraction_id, extraction_type, data) of data_version 1 rows.
+        field_types_by_group: Field types per field group from the schema.
+        entity_list_groups: Field groups that hold entity lists.
+        id_fields: Entity identity fields for entity-list groups.
+
+    Returns:
+        grounding_scores updates and per-field grounded/ungrounded counts.
+    """
+    result = SliceResult()
+    for extraction_id, extraction_type, data in items:
+        field_types = field_types_by_group.get(extraction_type, {})
+        if not field_types:
+            result.skipped += 1
+            continue
+
+        if extraction_type in entity_list_groups:
+            scores = compute_entity_list_grounding_scores(
+                data, extraction_type, field_types, id_fields
+            )
+        else:
+            scores = compute_grounding_scores(data, field_types)
+        if scores:
+            result.updates.append((extraction_id, scores))
+            for field_name, score in scores.items():
+                bucket = "grounded" if score >= 0.5 else "ungrounded"
+                _count(result.field_stats, field_name, bucket)
+        result.processed += 1
+    return result
+
+
+def score_v2_slice(
+    items: list[tuple[UUID, str, dict, UUID]],
+    field_info_by_group: dict[str, dict[str, tuple[str, str | None]]],
+    source_contents: dict[UUID, str],
+) -> SliceResult:
+    """Re-ground the inline per-field scores of structured extractions.
+
+    Process-pool entry point: arguments and result are plain picklable data.
+    A field is updated when its score moves by more than 0.001.
+
+    Args:
+        items: (extraction_id, extraction_type, data, source_id) of
+            data_version 2 rows.
+        field_info_by_group: (field_type, grounding_mode override) per field
+            per field group.
+        source_contents: Extraction content of the sources of ``items``.
+
+    Returns:
+        Updated data of changed extractions and per-field
+        grounded/ungrounded/downgraded counts of changed fields.
+    """
+    result = SliceResult()
+    for extraction_id, extraction_type, data, source_id in items:
+        field_info = field_info_by_group.get(extraction_type, {})
+        if not field_info or not isinstance(data, dict):
+            result.skipped += 1
+            continue
+
+        source_content = source_contents.get(source_id, "")
+        changed = False
+        for field_name, (field_type, gmode_override) in field_info.items():
+            field_data = data.get(field_name)
+            if not isinstance(field_data, dict):
+                continue
+            value = field_data.get("value")
+            if value is None:
+                continue
+
+            effective_mode = gmode_override or GROUNDING_DEFAULTS.get(
+                field_type, "required"
+            )
+            if effective_mode == "none":
+                continue
+
+            new_score = ground_field_item(
+                field_name,
+                value,
+                field_data.get("quote"),
+                source_content,
+                field_type,
+                grounding_mode=gmode_override,
+            )
+            old_score = float(field_data.get("grounding", 1.0))
+
+            if abs(new_score - old_score) > 0.001:
+                field_data["grounding"] = round(new_score, 4)
+                changed = True
+                bucket = "grounded" if new_score >= 0.5 else "ungrounded"
+                _count(result.field_stats, field_name, bucket)
+                if old_score >= 0.5 and new_score < 0.5:
+                    _count(result.field_stats, field_name, "downgraded")
+
+        if changed:
+            result.updates.append((extraction_id, data))
+        result.processed += 1
+    return result
+
+
+def _field_info_by_group(
+    schema: dict,
+) -> dict[str, dict[str, tuple[str, str | None]]]:
+    """(field_type, grounding_mode override) per field, per field group."""
+    info: dict[str, dict[str, tuple[str, str | None]]] = {}
+    for fg in schema.get("field_groups", []):
+        group_name = fg.get("name", "")
+        if not group_name:
+            continue
+        fields: dict[str, tuple[str, str | None]] = {}
+        for f in fg.get("fields", []):
+            name = f.get("name", "")
+            ftype = f.get("field_type", "") or f.get("type", "")
+            if name and ftype:
+                fields[name] = (ftype, f.get("grounding_mode"))
+        if fields:
+            info[group_name] = fields
+    return info
+
+
+def _slices(items: list, count: int) -> list[list]:
+    """Split ``items`` into at most ``count`` contiguous, near-equal slices."""
+    size = max(1, -(-len(items) // max(1, count)))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _merge(totals: BackfillTotals, part: SliceResult) -> None:
+    totals.processed += part.processed
+    totals.skipped += part.skipped
+    for field_name, counts in part.field_stats.items():
+        merged = totals.field_stats.setdefault(field_name, {})
+        for bucket, n in counts.items():
+            merged[bucket] = merged.get(bucket, 0) + n
+
+
+class GroundingBackfillService:
+    """Re-scores the extractions of a project in keyset-ordered batches.
+
+    Args:
+        session: Database session; each batch is committed with its
+            checkpoint.
+        executor: Optional executor (typically a ProcessPoolExecutor) for
+            scoring. None scores in a worker thread.
+        parallelism: Slices each batch is split into for the executor
+            (usually its worker count).
+        batch_size: Extractions read, scored and committed per batch.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        executor: Executor | None = None,
+        parallelism: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self._session = session
+        self._executor = executor
+        self._parallelism = max(1, parallelism) if executor is not None else 1
+        self._batch_size = max(1, batch_size)
+        self._extraction_repo = ExtractionRepository(session)
+
+    async def run(
+        self,
+        project_id: UUID,
+        mode: BackfillMode,
+        *,
+        dry_run: bool = False,
+        resume: BackfillTotals | None = None,
+        checkpoint_callback: CheckpointCallback | None = None,
+        cancellation_check: CancellationCheck | None = None,
+    ) -> BackfillTotals:
+        """Backfill grounding for every extraction of a project.
+
+        Args:
+            project_id: Project whose extractions are re-scored.
+            mode: ``v1`` for flat extractions, ``v2`` for structured ones.
+            dry_run: Score and count without writing scores.
+            resume: Totals from the checkpoint of an interrupted run; the
+                walk continues after its ``resume_after`` cursor.
+            checkpoint_callback: Called after each batch, before its commit.
+            cancellation_check: Async callback polled between batches.
+
+        Returns:
+            Final totals.
+
+        Raises:
+            ValueError: If the project is missing or has no field groups.
+            BackfillCancelledError: If cancellation_check returned True.
+        """
+        project = self._session.get(Project, project_id)
+        if project is None:
+            raise ValueError(f"Project {project_id} not found")
+        schema = project.extraction_schema or {}
+        if not schema.get("field_groups"):
+            raise ValueError("Project has no extraction schema with field_groups")
+
+        query = select(
+            Extraction.id,
+            Extraction.created_at,
+            Extraction.extraction_type,
+            Extraction.data,
+            Extraction.data_version,
+            Extraction.source_id,
+        ).where(Extraction.project_id == project_id)
+
+        totals = resume or BackfillTotals()
+        if resume is None:
+            totals.total_extractions, _ = count_rows(self._session, query)
+
+        score = self._v1_scorer(schema) if mode == "v1" else self._v2_scorer(schema)
+        started = time.monotonic() - totals.elapsed_seconds
+
+        logger.info(
+            "grounding_backfill_started",
+            project_id=str(project_id),
+            mode=mode,
+            total_extractions=totals.total_extractions,
+            resume_after=totals.resume_after,
+            parallelism=self._parallelism,
+        )
+
+        while True:
+            if cancellation_check is not None and await cancellation_check():
+                raise BackfillCancelledError(
+                    f"Backfill cancelled after {totals.scanned} extractions"
+                )
+
+            batch = query.order_by(*BACKFILL_ORDER.order_by())
+            if totals.resume_after is not None:
+                batch = batch.where(BACKFILL_ORDER.after(totals.resume_after))
+            rows = self._session.execute(batch.limit(self._batch_size)).all()
+            if not rows:
+                break
+
+            updates = await score(rows, totals)
+            if updates:
+                if not dry_run:
+                    write = (
+                        self._extraction_repo.update_grounding_scores_batch
+                        if mode == "v1"
+                        else self._extraction_repo.update_v2_data_batch
+                    )
+                    write(updates)
+                totals.updated += len(updates)
+
+            totals.resume_after = BACKFILL_ORDER.cursor_for(rows[-1])
+            totals.elapsed_seconds = time.monotonic() - started
+            if checkpoint_callback is not None:
+                checkpoint_callback(totals)
+            self._session.commit()
+
+            if len(rows) < self._batch_size:
+                break
+
+        totals.elapsed_seconds = time.monotonic() - started
+        logger.info(
+            "grounding_backfill_completed",
+            project_id=str(project_id),
+            mode=mode,
+            processed=totals.processed,
+            updated=totals.updated,
+            skipped=totals.skipped,
+            extractions_per_second=totals.extractions_per_second,
+        )
+        return totals
+
+    async def _score_slices(self, fn, calls: list[tuple]) -> list[SliceResult]:
+        """Run ``fn(*args)`` per slice in the executor, or in a thread without one.
+
+        Without an executor the slices still run off the event loop, so the
+        scheduler's other workers keep polling during a large backfill.
+        """
+        if self._executor is None:
+            return await asyncio.to_thread(lambda: [fn(*args) for args in calls])
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, fn, *args) for args in calls)
+            )
+        )
+
+    def _v1_scorer(self, schema: dict):
+        field_types_by_group = extract_field_types_from_schema(schema)
+        entity_list_groups = extract_entity_list_groups(schema)
+        ctx = schema.get("extraction_context") or {}
+        id_fields = tuple(ctx.get("entity_id_fields") or ("entity_id", "name", "id"))
+
+        async def score(rows, totals: BackfillTotals) -> list[tuple[UUID, dict]]:
+            items = []
+            for row in rows:
+                # v2 extractions have inline grounding
+                if row.data_version >= 2:
+                    totals.skipped += 1
+                    continue
+                items.append((row.id, row.extraction_type, row.data))
+            parts = await self._score_slices(
+                score_v1_slice,
+                [
+                    (s, field_types_by_group, entity_list_groups, id_fields)
+                    for s in _slices(items, self._parallelism)
+                ],
+            )
+            return self._collect(parts, totals)
+
+        return score
+
+    def _v2_scorer(self, schema: dict):
+        field_info_by_group = _field_info_by_group(schema)
+
+        async def score(rows, totals: BackfillTotals) -> list[tuple[UUID, dict]]:
+            items = []
+            for row in rows:
+                if row.data_version < 2:
+                    totals.skipped += 1
+                    continue
+                items.append((row.id, row.extraction_type, row.data, row.source_id))
+
+            contents = self._source_contents(
+                {
+                    source_id
+                    for _, extraction_type, data, source_id in items
+                    if extraction_type in field_info_by_group and isinstance(data, dict)
+                }
+            )
+            # Each slice is shipped only the source bodies it needs
+            parts = await self._score_slices(
+                score_v2_slice,
+                [
+                    (
+                        s,
+                        field_info_by_group,
+                        {i[3]: contents[i[3]] for i in s if i[3] in contents},
+                    )
+                    for s in _slices(items, self._parallelism)
+                ],
+            )
+            return self._collect(parts, totals)
+
+        return score
+
+    def _source_contents(self, source_ids: set[UUID]) -> dict[UUID, str]:
+        """Extraction content of ``source_ids``, loaded in one query."""
+        if not source_ids:
+            return {}
+        sources = (
+            self._session.execute(select(Source).where(Source.id.in_(source_ids)))
+            .scalars()
+            .all()
+        )
+        prefetch_source_contents(self._session, sources)
+        contents = {s.id: get_extraction_content(s) or "" for s in sources}
+        # Keep source bodies from accumulating in the identity map
+        for s in sources:
+            self._session.expunge(s)
+        return contents
+
+    @staticmethod
+    def _collect(
+        parts: list[SliceResult], totals: BackfillTotals
+    ) -> list[tuple[UUID, dict]]:
+        updates: list[tuple[UUID, dict]] = []
+        for part in parts:
+            updates.extend(part.updates)
+            _merge(totals, part)
+        return updates
@@ -5,29 +5,51 @@ Uses a small/fast LLM (e.g., gemma3-4B) to avoid wasting expensive extraction ca
 on pages with no relevant data.
 
 Safety: defaults to "extract" on any error, ambiguity, or missing input.
+
+Batched mode (should_extract_many) classifies several pages per request so
+the schema summary prefix is sent once per batch instead of once per page.
+Pages without a usable decision in the batch response are re-asked one by
+one through should_extract.
 """
 
+import asyncio
+import hashlib
 import json
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import structlog
 
-logger = structlog.get_logger(__name__)
-
-SYSTEM_PROMPT = """You classify web pages for a structured data extraction pipeline.
+from services.extraction.page_classifier import PageToClassify
 
-You receive an extraction schema describing target data types, plus a web page.
+logger = structlog.get_logger(__name__)
 
-Decision rules:
+_DECISION_RULES = """Decision rules:
 - "extract" = page contains data matching ANY field group in the schema
 - "skip" = page has NO matching data (wrong industry, empty, navigation-only,
   login, job listings, holiday notices, legal/privacy, forum index)
 
 When genuinely uncertain, prefer "extract" — missing data costs more than
-a wasted extraction call.
+a wasted extraction call."""
+
+SYSTEM_PROMPT = f"""You classify web pages for a structured data extraction pipeline.
+
+You receive an extraction schema describing target data types, plus a web page.
+
+{_DECISION_RULES}
+
+Output JSON only: {{"decision": "extract" or "skip"}}"""
+
+BATCH_SYSTEM_PROMPT = f"""You classify web pages for a structured data extraction pipeline.
+
+You receive an extraction schema describing target data types, plus several
+numbered web pages. Decide for each page independently.
 
-Output JSON only: {"decision": "extract" or "skip"}"""
+{_DECISION_RULES}
+
+Output JSON only, one entry per page in page order:
+{{"decisions": [{{"page": 1, "decision": "extract" or "skip"}}, ...]}}"""
 
 USER_TEMPLATE = """EXTRACTION SCHEMA:
 {schema_summary}
@@ -41,6 +63,20 @@ Content:
 
 Should this page be extracted or skipped? JSON only:"""
 
+BATCH_USER_TEMPLATE = """EXTRACTION SCHEMA:
+{schema_summary}
+
+{pages}
+
+Should each of the {count} pages be extracted or skipped? JSON only:"""
+
+BATCH_PAGE_TEMPLATE = """PAGE {number}:
+URL: {url}
+Title: {title}
+
+Content:
+{content}"""
+
 
 @dataclass(frozen=True)
 class SkipGateResult:
@@ -52,12 +88,65 @@ class SkipGateResult:
     method: str = "llm_skip_gate"
 
 
+@dataclass
+class SkipGateStats:
+    """Throughput counters for the single-page and batched gate paths.
+
+    Seconds are summed LLM request latencies, so pages per second compare
+    what one request slot achieves on each path.
+    """
+
+    single_pages: int = 0
+    single_seconds: float = 0.0
+    batched_pages: int = 0
+    batched_seconds: float = 0.0
+    batch_requests: int = 0
+    fallback_pages: int = 0
+
+    @property
+    def single_pages_per_second(self) -> float:
+        if not self.single_seconds:
+            return 0.0
+        return self.single_pages / self.single_seconds
+
+    @property
+    def batched_pages_per_second(self) -> float:
+        if not self.batched_seconds:
+            return 0.0
+        return self.batched_pages / self.batched_seconds
+
+
 class LLMSkipGate:
-    """Binary LLM classifier: should this page be extracted or skipped?"""
+    """Binary LLM classifier: should this page be extracted or skipped?
+
+    Args:
+        llm_client: Client with an async ``complete`` method.
+        content_limit: Characters sampled from each page.
+        batch_size: Pages per request in should_extract_many (1 sends each
+            page on its own).
+    """
 
-    def __init__(self, llm_client, content_limit: int = 2000):
+    def __init__(self, llm_client, content_limit: int = 2000, batch_size: int = 1):
         self._llm = llm_client
         self._content_limit = content_limit
+        self._batch_size = max(1, batch_size)
+        self._schema_summaries: dict[str, str] = {}
+        self.stats = SkipGateStats()
+
+    def _schema_summary(self, schema: dict) -> str:
+        """build_schema_summary, memoised per schema hash."""
+        key = hashlib.sha256(
+            json.dumps(schema, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        summary = self._schema_summaries.get(key)
+        if summary is None:
+            summary = build_schema_summary(schema)
+            self._schema_summaries[key] = summary
+        return summary
+
+    def _needs_llm(self, content: str, schema: dict) -> bool:
+        # Safety: no schema or very short content (may be truncated) → extract
+        return bool(schema) and len(content.strip()) >= 100
 
     async def should_extract(
         self,
@@ -79,23 +168,15 @@ class LLMSkipGate:
         """
         start = time.monotonic()
 
-        # Safety: no schema → extract everything
-        if not schema:
-            return SkipGateResult(
-                decision="extract",
-                confidence=0.0,
-                latency=time.monotonic() - start,
-            )
-
-        # Safety: very short content → extract (may be truncated)
-        if len(content.strip()) < 100:
+        # Safety: no schema or very short content → extract
+        if not self._needs_llm(content, schema):
             return SkipGateResult(
                 decision="extract",
                 confidence=0.0,
                 latency=time.monotonic() - start,
             )
 
-        schema_summary = build_schema_summary(schema)
+        schema_summary = self._schema_summary(schema)
         sampled = _sample_content(content, self._content_limit)
         user_prompt = USER_TEMPLATE.format(
             schema_summary=schema_summary,
@@ -112,6 +193,8 @@ class LLMSkipGate:
                 temperature=0.0,
             )
             latency = time.monotonic() - start
+            self.stats.single_pages += 1
+            self.stats.single_seconds += latency
 
             # response is a dict from json_object mode
             if isinstance(response, dict):
@@ -145,6 +228,167 @@ class LLMSkipGate:
                 latency=latency,
             )
 
+    async def should_extract_many(
+        self,
+        pages: Sequence[PageToClassify],
+        schema: dict,
+    ) -> list[SkipGateResult]:
+        """Classify pages in batches of ``batch_size`` per LLM request.
+
+        Args:
+            pages: Pages to classify.
+            schema: Extraction schema dict with field_groups.
+
+        Returns:
+            One SkipGateResult per page, in input order.
+        """
+        results: dict[int, SkipGateResult] = {}
+        pending: list[int] = []
+        for i, page in enumerate(pages):
+            if self._needs_llm(page.content, schema):
+                pending.append(i)
+            else:
+                results[i] = SkipGateResult(
+                    decision="extract", confidence=0.0, latency=0.0
+                )
+
+        if self._batch_size == 1:
+            decided = await asyncio.gather(
+                *(
+                    self.should_extract(
+                        pages[i].url, pages[i].title, pages[i].content, schema
+                    )
+                    for i in pending
+                )
+            )
+            results.update(zip(pending, decided, strict=True))
+        else:
+            batches = [
+                pending[start : start + self._batch_size]
+                for start in range(0, len(pending), self._batch_size)
+            ]
+            for batch, decided in zip(
+                batches,
+                await asyncio.gather(
+                    *(
+                        self._should_extract_batch([pages[i] for i in batch], schema)
+                        for batch in batches
+                    )
+                ),
+                strict=True,
+            ):
+                results.update(zip(batch, decided, strict=True))
+
+        if pending:
+            logger.info(
+                "skip_gate_batch_completed",
+                pages=len(pages),
+                llm_pages=len(pending),
+                skipped=sum(1 for r in results.values() if r.decision == "skip"),
+                batched_pages_per_second=round(self.stats.batched_pages_per_second, 2),
+                single_pages_per_second=round(self.stats.single_pages_per_second, 2),
+                fallback_pages=self.stats.fallback_pages,
+            )
+        return [results[i] for i in range(len(pages))]
+
+    async def _should_extract_batch(
+        self,
+        pages: list[PageToClassify],
+        schema: dict,
+    ) -> list[SkipGateResult]:
+        """One LLM request for several pages; re-ask pages it did not decide."""
+        start = time.monotonic()
+        user_prompt = BATCH_USER_TEMPLATE.format(
+            schema_summary=self._schema_summary(schema),
+            pages="\n\n".join(
+                BATCH_PAGE_TEMPLATE.format(
+                    number=n,
+                    url=page.url,
+                    title=page.title or "(no title)",
+                    content=_sample_content(page.content, self._content_limit),
+                )
+                for n, page in enumerate(pages, start=1)
+            ),
+            count=len(pages),
+        )
+
+        decisions: dict[int, str] = {}
+        try:
+            response = await self._llm.complete(
+                system_prompt=BATCH_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                response_format={"type": "json_object"},
+                temperature=0.0,
+            )
+            decisions = _parse_batch_decisions(response, len(pages))
+        except Exception:
+            logger.warning(
+                "skip_gate_batch_error_falling_back",
+                pages=len(pages),
+                exc_info=True,
+            )
+        latency = time.monotonic() - start
+        self.stats.batch_requests += 1
+        self.stats.batched_pages += len(decisions)
+        self.stats.batched_seconds += latency
+
+        missing = [n for n in range(len(pages)) if n not in decisions]
+        if missing:
+            self.stats.fallback_pages += len(missing)
+            logger.info(
+                "skip_gate_batch_fallback",
+                pages=len(pages),
+                undecided=len(missing),
+            )
+        fallback = await asyncio.gather(
+            *(
+                self.should_extract(
+                    pages[n].url, pages[n].title, pages[n].content, schema
+                )
+                for n in missing
+            )
+        )
+        fallback_by_page = dict(zip(missing, fallback, strict=True))
+
+        return [
+            fallback_by_page.get(n)
+            or SkipGateResult(decision=decisions[n], confidence=0.0, latency=latency)
+            for n in range(len(pages))
+        ]
+
+
+def _parse_batch_decisions(response: dict | list | str, count: int) -> dict[int, str]:
+    """Map 0-based page positions to decisions from a batch response.
+
+    Accepts {"decisions": [...]} or a bare list, with entries either
+    {"page": n, "decision": ...} (1-based) or decision strings in page order.
+    Entries that cannot be attributed to a page are dropped.
+    """
+    if isinstance(response, str):
+        try:
+            response = json.loads(_strip_wrappers(response))
+        except json.JSONDecodeError:
+            return {}
+    entries = response.get("decisions") if isinstance(response, dict) else response
+    if not isinstance(entries, list):
+        return {}
+
+    decisions: dict[int, str] = {}
+    for position, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            page = entry.get("page", position + 1)
+            value = entry.get("decision")
+        else:
+            page, value = position + 1, entry
+        if not isinstance(page, int) or not 1 <= page <= count:
+            continue
+        if not isinstance(value, str):
+            continue
+        value = value.strip().lower()
+        if value in ("extract", "skip"):
+            decisions[page - 1] = value
+    return decisions
+
 
 def _sample_content(content: str, limit: int) -> str:
     """Sample content from beginning, middle, and end.
@@ -182,16 +426,7 @@ def _parse_decision_from_dict(d: dict) -> str:
 
 def _parse_decision(text: str) -> str:
     """Parse LLM response text into 'extract' or 'skip'. Default: 'extract'."""
-    text = text.strip()
-    # Handle thinking tags
-    if "<think>" in text:
-        idx = text.rfind("</think>")
-        if idx != -1:
-            text = text[idx + 8 :].strip()
-    # Handle markdown fences
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-        text = text.rsplit("```", 1)[0].strip()
+    text = _strip_wrappers(text)
     # Try JSON
     try:
         d = json.loads(text)
@@ -206,6 +441,21 @@ def _parse_decision(text: str) -> str:
     return "extract"
 
 
+def _strip_wrappers(text: str) -> str:
+    """Remove thinking tags and markdown fences around a JSON reply."""
+    text = text.strip()
+    # Handle thinking tags
+    if "<think>" in text:
+        idx = text.rfind("</think>")
+        if idx != -1:
+            text = text[idx + 8 :].strip()
+    # Handle markdown fences
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        text = text.rsplit("```", 1)[0].strip()
+    return text
+
+
 def build_schema_summary(schema: dict) -> str:
     """Build a human-readable schema summary from extraction_schema.
 
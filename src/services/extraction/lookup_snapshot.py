@@ -0,0 +1,369 @@
+"""Shared on-disk snapshots of factAPI lookup tables.
+
+Field validators need whole factAPI columns (up to 100k rows). Instead of
+every worker process downloading them into its own dict, each table is
+materialised once into a snapshot file that all processes memory-map:
+
+- Records are sorted, de-duplicated byte strings behind an offset table,
+  so membership is a binary search over the mapped file and costs no
+  per-value Python objects; pages are shared through the OS page cache.
+- A per-table lock file serialises refreshes across processes, so one
+  process fetches while the others wait and then map the new file.
+- Refreshes are conditional requests using the stored ETag/Last-Modified;
+  a 304 only bumps the snapshot's fetch time.
+
+A snapshot is reused without contacting factAPI while it is younger than
+the TTL. With TTL 0 it is revalidated once per process start (by whichever
+process gets the lock first) and then kept for the process lifetime.
+
+Snapshot files use native byte order and are meant for a host-local
+directory or volume.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_MAGIC = b"KELOOK01"
+_HEADER = struct.Struct("=8sQ")
+# Separators inside mapping records: key \x00 fill \x1f fill ...
+_KEY_SEP = b"\x00"
+_FILL_SEP = b"\x1f"
+_CONTROL_CHARS = re.compile(r"[\x00\x1f]")
+_WHITESPACE = re.compile(r"\s+")
+
+_PROCESS_STARTED = time.time()
+
+
+def normalize_value(value: object, case_sensitive: bool) -> str:
+    """Normalise a value for lookup matching.
+
+    Case-insensitive lookups also trim and collapse whitespace, so
+    "Czech  Republic " matches "czech republic". Stored values and checked
+    values must go through the same function.
+    """
+    text = str(value)
+    if case_sensitive:
+        return text
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def _encode(text: str) -> bytes:
+    return _CONTROL_CHARS.sub(" ", text).encode("utf-8")
+
+
+def lookup_records(values: Iterable[str]) -> list[bytes]:
+    """Snapshot records for a lookup set."""
+    return [_encode(v) for v in values]
+
+
+def mapping_records(mapping: dict[str, Iterable[str]]) -> list[bytes]:
+    """Snapshot records for a value→fills mapping."""
+    return [
+        _encode(key) + _KEY_SEP + _FILL_SEP.join(_encode(f) for f in sorted(fills))
+        for key, fills in mapping.items()
+    ]
+
+
+class _SortedRecords:
+    """Sorted byte records in a memory-mapped snapshot file."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC:
+            raise ValueError(f"not a lookup snapshot: {path}")
+        self._count = count
+        offsets_end = _HEADER.size + 8 * (count + 1)
+        self._offsets = memoryview(self._mm)[_HEADER.size : offsets_end].cast("Q")
+        self._data_start = offsets_end
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mm.closed
+
+    def close(self) -> None:
+        """Unmap the snapshot file. The view is unusable afterwards."""
+        if not self._mm.closed:
+            self._offsets.release()
+            self._mm.close()
+
+    def _record(self, i: int) -> bytes:
+        start = self._data_start + self._offsets[i]
+        return self._mm[start : self._data_start + self._offsets[i + 1]]
+
+    def _key(self, i: int) -> bytes:
+        return self._record(i)
+
+    def _bisect(self, key: bytes) -> int:
+        """Index of the first record whose key is >= key."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self._record(i) for i in range(self._count))
+
+
+class LookupSet(_SortedRecords):
+    """Set-like view of a lookup snapshot (supports ``in`` and ``len``)."""
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        key = _encode(value)
+        i = self._bisect(key)
+        return i < self._count and self._key(i) == key
+
+
+class LookupMapping(_SortedRecords):
+    """Mapping view of a value→fills snapshot (supports ``get``)."""
+
+    def _key(self, i: int) -> bytes:
+        record = self._record(i)
+        return record[: record.index(_KEY_SEP)]
+
+    def get(self, value: str, default=None) -> frozenset[str] | None:
+        key = _encode(value)
+        i = self._bisect(key)
+        if i >= self._count:
+            return default
+        record = self._record(i)
+        record_key, _, fills = record.partition(_KEY_SEP)
+        if record_key != key:
+            return default
+        return frozenset(f.decode("utf-8") for f in fills.split(_FILL_SEP))
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and self.get(value) is not None
+
+
+def write_snapshot(path: Path, records: Iterable[bytes]) -> int:
+    """Atomically write sorted, de-duplicated records. Returns the count."""
+    unique = sorted(set(records))
+    offsets = array("Q", [0])
+    for record in unique:
+        offsets.append(offsets[-1] + len(record))
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(unique)))
+            f.write(offsets.tobytes())
+            for record in unique:
+                f.write(record)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return len(unique)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a (conditional) fetch of one lookup table."""
+
+    not_modified: bool = False
+    records: list[bytes] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+# Receives conditional request headers; raises on failure
+type Fetcher = Callable[[dict[str, str]], Awaitable[FetchResult]]
+
+
+@dataclass
+class SnapshotStats:
+    """Counters since startup."""
+
+    fetches: int = 0
+    not_modified: int = 0
+    reused: int = 0
+    failures: int = 0
+
+
+class LookupSnapshotStore:
+    """Directory of lookup snapshots shared by all processes on a host.
+
+    A snapshot returned by the store stays usable for as long as the caller
+    holds it, even across a reload of that key (TTL expiry): superseded
+    snapshots are unmapped when their last reference goes, not on reload.
+    Closing the store unmaps the current snapshots.
+
+    Args:
+        directory: Snapshot directory (created on demand).
+        ttl_seconds: Age after which a snapshot is revalidated
+            (0 = once per process start).
+    """
+
+    def __init__(self, directory: str | Path, ttl_seconds: int = 0) -> None:
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        # key -> (snapshot or None on failure, monotonic time loaded)
+        self._opened: dict[str, tuple[LookupSet | LookupMapping | None, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.stats = SnapshotStats()
+
+    def _paths(self, key: str) -> tuple[Path, Path, Path]:
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", key)[:80]
+        name = f"{slug}-{hashlib.sha256(key.encode()).hexdigest()[:16]}"
+        return (
+            self.directory / f"{name}.snap",
+            self.directory / f"{name}.meta.json",
+            self.directory / f"{name}.lock",
+        )
+
+    def _expired(self, loaded_at: float) -> bool:
+        return bool(self.ttl_seconds) and (
+            time.monotonic() - loaded_at > self.ttl_seconds
+        )
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        if self.ttl_seconds:
+            return time.time() - fetched_at <= self.ttl_seconds
+        return fetched_at >= _PROCESS_STARTED
+
+    async def get_set(self, key: str, fetch: Fetcher) -> LookupSet | None:
+        """Return a lookup set snapshot, refreshing it if stale.
+
+        If there is no snapshot and the fetch fails, the error is raised
+        once; later calls return None until the entry is re-checked.
+        """
+        return await self._get(key, fetch, LookupSet)
+
+    async def get_mapping(self, key: str, fetch: Fetcher) -> LookupMapping | None:
+        """Return a mapping snapshot, refreshing it if stale."""
+        return await self._get(key, fetch, LookupMapping)
+
+    async def _get(self, key: str, fetch: Fetcher, kind: type):
+        opened = self._opened.get(key)
+        if opened and not self._expired(opened[1]):
+            return opened[0]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            opened = self._opened.get(key)
+            if opened and not self._expired(opened[1]):
+                return opened[0]
+            try:
+                snapshot = await self._load(key, fetch, kind)
+            except Exception:
+                # Remember the failure so callers don't retry per source
+                self._swap(key, None)
+                raise
+            self._swap(key, snapshot)
+            return snapshot
+
+    def _swap(self, key: str, snapshot: LookupSet | LookupMapping | None) -> None:
+        # The previous snapshot may still be in use by a source between
+        # prefetch and apply, so it is left for garbage collection to unmap
+        self._opened[key] = (snapshot, time.monotonic())
+
+    def close(self) -> None:
+        """Unmap the current snapshot of every key."""
+        for snapshot, _ in self._opened.values():
+            if snapshot is not None:
+                snapshot.close()
+        self._opened.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _load(self, key: str, fetch: Fetcher, kind: type):
+        snap_path, meta_path, lock_path = self._paths(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Blocks while another process refreshes this table
+            await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_EX)
+            meta = _read_meta(meta_path) if snap_path.exists() else None
+            if meta and self._is_fresh(meta.get("fetched_at", 0)):
+                self.stats.reused += 1
+                return kind(snap_path)
+
+            conditional = {}
+            if meta and meta.get("etag"):
+                conditional["If-None-Match"] = meta["etag"]
+            if meta and meta.get("last_modified"):
+                conditional["If-Modified-Since"] = meta["last_modified"]
+
+            try:
+                result = await fetch(conditional)
+            except Exception as e:
+                self.stats.failures += 1
+                if meta is None:
+                    raise
+                logger.warning(
+                    "lookup_snapshot_refresh_failed_using_stale",
+                    key=key,
+                    error=str(e),
+                )
+                return kind(snap_path)
+
+            if result.not_modified and meta is not None:
+                self.stats.not_modified += 1
+                meta["fetched_at"] = time.time()
+                _write_meta(meta_path, meta)
+                return kind(snap_path)
+
+            self.stats.fetches += 1
+            count = await asyncio.to_thread(
+                write_snapshot, snap_path, result.records or []
+            )
+            _write_meta(
+                meta_path,
+                {
+                    "fetched_at": time.time(),
+                    "etag": result.etag,
+                    "last_modified": result.last_modified,
+                    "count": count,
+                },
+            )
+            logger.info("lookup_snapshot_written", key=key, count=count)
+            return kind(snap_path)
+        finally:
+            os.close(lock_fd)
+
+
+def _read_meta(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(path: Path, meta: dict) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, path)
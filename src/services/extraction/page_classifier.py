@@ -29,6 +29,15 @@ class ClassificationResult:
     reasoning: str | None = None
 
 
+@dataclass
+class PageToClassify:
+    """A page passed to the batch classifiers (classify_many, skip-gate)."""
+
+    url: str
+    title: str | None
+    content: str
+
+
 class PageClassifier:
     """Classifies pages to determine relevant extraction field groups.
 
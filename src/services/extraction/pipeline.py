@@ -8,17 +8,42 @@ from uuid import UUID
 import structlog
 
 from constants import SourceStatus
-from services.extraction.content_selector import get_extraction_content
+from services.extraction.content_selector import (
+    get_extraction_content,
+    get_source_content,
+    prefetch_source_contents,
+)
 from services.extraction.embedding_pipeline import ExtractionEmbeddingService
-from services.extraction.schema_adapter import SchemaAdapter
+from services.extraction.schema_adapter import SchemaAdapter, schema_fingerprint
 from services.projects.repository import ProjectRepository
 from services.projects.templates import DEFAULT_EXTRACTION_TEMPLATE
+from services.storage.content_hash import compute_content_hash
 
 logger = structlog.get_logger(__name__)
 
 # Type alias for checkpoint callback
-# Args: (processed_source_ids, total_extractions, total_entities)
-type CheckpointCallback = Callable[[list[str], int, int], None]
+# Args: (resume_after_source_id, sources_processed, total_extractions,
+#        failed_source_ids)
+type CheckpointCallback = Callable[[str, int, int, list[str]], None]
+
+# Statuses a source can hold after a completed full extraction
+_EXTRACTED_STATUSES = (SourceStatus.EXTRACTED, SourceStatus.SKIPPED)
+
+
+def _is_unchanged(source, schema_hash: str) -> bool:
+    """True if the source was fully extracted from identical content and schema.
+
+    Sources ingested before content hashing get their hash computed here, so
+    they are re-extracted once and skipped from then on.
+    """
+    if source.content_hash is None and source.content:
+        source.content_hash = compute_content_hash(source.content)
+    return (
+        source.status in _EXTRACTED_STATUSES
+        and source.content_hash is not None
+        and source.content_hash == source.extraction_content_hash
+        and source.extraction_schema_hash == schema_hash
+    )
 
 
 @dataclass
@@ -38,6 +63,7 @@ class SchemaPipelineResult:
     schema_name: str
     sources_skipped: int = 0
     sources_no_content: int = 0
+    sources_unchanged: int = 0
     total_embedded: int = 0
     embedding_errors: int = 0
     total_deduplicated: int = 0
@@ -74,6 +100,7 @@ class SchemaExtractionPipeline:
         field_groups: list | None = None,
         schema_name: str = "unknown",
         update_classification: bool = True,
+        precomputed_classification=None,  # ClassificationResult | None
     ) -> list:  # list[Extraction]
         """Extract all field groups from a source.
 
@@ -85,6 +112,8 @@ class SchemaExtractionPipeline:
             update_classification: If True, store classification result on source.
                 Set to False for partial field_groups extraction to preserve
                 existing classification from a prior full extraction.
+            precomputed_classification: Skip-gate or smart classification
+                from classify_sources for this source, if any.
 
         Returns:
             List of created Extraction objects.
@@ -93,7 +122,7 @@ class SchemaExtractionPipeline:
 
         context_value = source_context
 
-        if not source.content:
+        if not get_source_content(source):
             logger.warning("source_has_no_content", source_id=str(source.id))
             return []
 
@@ -117,6 +146,7 @@ class SchemaExtractionPipeline:
             field_groups=field_groups,
             source_url=source.uri,
             source_title=source.title,
+            precomputed_classification=precomputed_classification,
         )
 
         # Store classification result on source if available
@@ -178,6 +208,7 @@ class SchemaExtractionPipeline:
                 if data_version < 2
                 else None,
                 profile_used=schema_name,
+                source_content_hash=source.content_hash,
                 chunk_context=chunk_context,
             )
             self._db.add(extraction)
@@ -186,6 +217,39 @@ class SchemaExtractionPipeline:
         self._db.flush()
         return extractions
 
+    async def _classify_chunk(self, sources: list, field_groups: list) -> dict:
+        """Batch skip-gate or smart classification for a chunk, by source ID.
+
+        Sources without a result are classified inside extract_source.
+        """
+        if not self._orchestrator.batch_classification_enabled:
+            return {}
+
+        from services.extraction.page_classifier import PageToClassify
+
+        sources = [s for s in sources if get_source_content(s)]
+        pages = [
+            PageToClassify(
+                url=s.uri,
+                title=s.title,
+                content=get_extraction_content(
+                    s, domain_dedup_enabled=self._extraction.domain_dedup_enabled
+                ),
+            )
+            for s in sources
+        ]
+        try:
+            classified = await self._orchestrator.classify_sources(pages, field_groups)
+            return {
+                s.id: result
+                for s, result in zip(sources, classified, strict=True)
+                if result is not None
+            }
+        except Exception as e:
+            # extract_source classifies each source on its own instead
+            logger.warning("chunk_classification_failed", error=str(e))
+            return {}
+
     async def extract_project(
         self,
         project_id: UUID,
@@ -195,7 +259,8 @@ class SchemaExtractionPipeline:
         field_groups_filter: list[str] | None = None,
         cancellation_check: Callable[[], Awaitable[bool]] | None = None,
         checkpoint_callback: CheckpointCallback | None = None,
-        resume_from: set[str] | None = None,
+        resume_after: UUID | None = None,
+        retry_source_ids: list[UUID] | None = None,
     ) -> SchemaPipelineResult:
         """Extract all sources in a project.
 
@@ -205,19 +270,34 @@ class SchemaExtractionPipeline:
                         only these sources are extracted (ignores skip_extracted).
             source_groups: Optional filter by company names.
             skip_extracted: If True, skip sources with 'extracted' status.
-                           Ignored when source_ids is provided.
+                           Ignored when source_ids is provided. When False,
+                           extracted sources whose content hash and schema
+                           fingerprint are unchanged are still skipped unless
+                           skip_unchanged_sources is disabled.
             cancellation_check: Optional async callback that returns True if
                               processing should be cancelled.
             checkpoint_callback: Optional callback invoked after each chunk commit.
-                               Called with (processed_source_ids, total_extractions, total_entities).
-            resume_from: Optional set of source IDs to skip (already processed in prior run).
+                               Called with (resume_after_source_id, sources_processed,
+                               total_extractions, failed_source_ids) for this run.
+                               failed_source_ids lists the sources that failed so
+                               far plus retry_source_ids not yet reached.
+            resume_after: Optional cursor from a prior run's checkpoint. Sources
+                          are processed in ID order, so only sources with a
+                          greater ID, or earlier ones still pending (failed in
+                          the prior run), are loaded.
+            retry_source_ids: Sources the prior run failed before its cursor.
+                          Loaded again on resume whatever their status, since
+                          a source that was already extracted keeps that
+                          status when a forced re-extraction of it fails.
 
         Returns:
             Summary dict with extraction counts including sources_failed.
         """
-        from sqlalchemy import select
+        from sqlalchemy import or_, select
+        from sqlalchemy.orm import undefer_group
 
         from orm_models import Source
+        from services.storage.repositories.source import source_has_content
 
         # Load project to get extraction_schema
         project_repo = self._project_repo or ProjectRepository(self._db)
@@ -318,10 +398,14 @@ class SchemaExtractionPipeline:
         # Build query based on whether specific source_ids are provided
         if source_ids:
             # When specific source_ids provided, extract those regardless of status
-            stmt = select(Source).where(
-                Source.project_id == project_id,
-                Source.id.in_(source_ids),
-                Source.content.isnot(None),
+            stmt = (
+                select(Source)
+                .options(undefer_group("body"))
+                .where(
+                    Source.project_id == project_id,
+                    Source.id.in_(source_ids),
+                    source_has_content(),
+                )
             )
         else:
             # Build list of allowed statuses based on skip_extracted flag
@@ -330,22 +414,52 @@ class SchemaExtractionPipeline:
                 allowed_statuses.append(SourceStatus.EXTRACTED)
 
             # Include sources that are ready (and optionally extracted)
-            stmt = select(Source).where(
-                Source.project_id == project_id,
-                Source.status.in_(allowed_statuses),
-                Source.content.isnot(None),
+            stmt = (
+                select(Source)
+                .options(undefer_group("body"))
+                .where(
+                    Source.project_id == project_id,
+                    Source.status.in_(allowed_statuses),
+                    source_has_content(),
+                )
             )
 
         if source_groups:
             stmt = stmt.where(Source.source_group.in_(source_groups))
 
+        retry_ids = sorted(retry_source_ids or [])
+        if resume_after:
+            # Sources that failed before the cursor kept their status: pending
+            # ones are still selectable, extracted ones come from retry_ids
+            resumable = [
+                Source.id > resume_after,
+                Source.status.in_([SourceStatus.READY, SourceStatus.PENDING]),
+            ]
+            if retry_ids:
+                resumable.append(Source.id.in_(retry_ids))
+            stmt = stmt.where(or_(*resumable))
+
+        # ID order makes the last committed source a resume cursor
+        stmt = stmt.order_by(Source.id)
         sources = list(self._db.execute(stmt).scalars().all())
 
+        # Change detection: only full-schema runs record (and can skip on)
+        # the content hash and schema fingerprint a source was extracted from
+        track_hashes = not field_groups_filter
+        schema_hash = schema_fingerprint(schema, self._extraction.data_version)
+        sources_unchanged = 0
+        if track_hashes and self._extraction.skip_unchanged_sources:
+            changed = [s for s in sources if not _is_unchanged(s, schema_hash)]
+            sources_unchanged = len(sources) - len(changed)
+            sources = changed
+
         logger.info(
             "project_extraction_started",
             project_id=str(project_id),
             source_count=len(sources),
+            sources_unchanged=sources_unchanged,
             field_groups_count=len(field_groups),
+            resume_after=str(resume_after) if resume_after else None,
         )
 
         # Get schema name for tracking
@@ -382,7 +496,9 @@ class SchemaExtractionPipeline:
         # Collect extractions per source for batch embedding
         chunk_extractions: list = []  # Extraction ORM objects from current chunk
 
-        async def extract_with_limit(source) -> tuple[int, bool, str]:
+        async def extract_with_limit(
+            source, precomputed_classification=None
+        ) -> tuple[int, bool, str]:
             """Extract source and return (extraction_count, success, status).
 
             Status is one of: "extracted", "skipped", "no_content", "failed".
@@ -395,7 +511,11 @@ class SchemaExtractionPipeline:
                         field_groups=field_groups,
                         schema_name=schema_name,
                         update_classification=not bool(field_groups_filter),
+                        precomputed_classification=precomputed_classification,
                     )
+                    if track_hashes:
+                        source.extraction_content_hash = source.content_hash
+                        source.extraction_schema_hash = schema_hash
                     # Update source status based on classification result
                     if source.page_type == "skip":
                         source.status = SourceStatus.SKIPPED
@@ -404,7 +524,7 @@ class SchemaExtractionPipeline:
                     # Collect for batch embedding
                     if embed_enabled:
                         chunk_extractions.extend(extractions)
-                    if not extractions and not source.content:
+                    if not extractions and not get_source_content(source):
                         return 0, True, "no_content"
                     return len(extractions), True, "extracted"
                 except Exception as e:
@@ -418,13 +538,14 @@ class SchemaExtractionPipeline:
 
         # Process in chunks to allow cancellation checks and batch commits
         all_results = []
-        all_processed_ids: list[str] = []
+        failed_ids: list[str] = []
+        total_succeeded = 0
+        total_extractions_so_far = 0
         total_embedded = 0
         total_embedding_errors = 0
         cancelled = False
-        chunk_idx = 0
 
-        for i in range(0, len(sources), chunk_size):
+        for chunk_idx, i in enumerate(range(0, len(sources), chunk_size)):
             # Check for cancellation between chunks
             if cancellation_check and await cancellation_check():
                 logger.info(
@@ -438,29 +559,26 @@ class SchemaExtractionPipeline:
 
             chunk = sources[i : i + chunk_size]
 
-            # Filter already-processed sources when resuming
-            if resume_from:
-                chunk = [s for s in chunk if str(s.id) not in resume_from]
-                if not chunk:
-                    chunk_idx += 1
-                    continue
-
             # Reset chunk extraction collector
             chunk_extractions.clear()
+            prefetch_source_contents(self._db, chunk)
+            classifications = await self._classify_chunk(chunk, field_groups)
 
             chunk_results = await asyncio.gather(
-                *[extract_with_limit(s) for s in chunk],
+                *[extract_with_limit(s, classifications.get(s.id)) for s in chunk],
             )
             all_results.extend(chunk_results)
 
-            # Track only successfully processed source IDs for checkpoint
-            # Failed sources keep their original status and can be retried
-            chunk_processed_ids = [
+            # Failed sources keep their original status. Pending ones are picked
+            # up again by status; the checkpoint lists them all so a resumed
+            # forced run also retries those that were already extracted.
+            failed_ids.extend(
                 str(s.id)
-                for s, (_, success, _status) in zip(chunk, chunk_results, strict=True)
-                if success
-            ]
-            all_processed_ids.extend(chunk_processed_ids)
+                for s, (_, success, _) in zip(chunk, chunk_results, strict=True)
+                if not success
+            )
+            total_succeeded += sum(1 for _, success, _ in chunk_results if success)
+            total_extractions_so_far += sum(count for count, _, _ in chunk_results)
 
             # Flush to ensure extraction IDs are assigned before embedding
             self._db.flush()
@@ -485,8 +603,13 @@ class SchemaExtractionPipeline:
 
             # Call checkpoint callback to update job payload before commit
             if checkpoint_callback:
-                total_extractions_so_far = sum(count for count, _, _ in all_results)
-                checkpoint_callback(all_processed_ids, total_extractions_so_far, 0)
+                cursor = chunk[-1].id
+                checkpoint_callback(
+                    str(cursor),
+                    total_succeeded,
+                    total_extractions_so_far,
+                    failed_ids + [str(r) for r in retry_ids if r > cursor],
+                )
 
             # Commit after each chunk for durability (includes checkpoint update)
             self._db.commit()
@@ -494,12 +617,10 @@ class SchemaExtractionPipeline:
                 "chunk_committed",
                 chunk=chunk_idx + 1,
                 chunk_sources=len(chunk),
-                total_processed=len(all_processed_ids),
+                total_processed=total_succeeded,
                 embedded=total_embedded if embed_enabled else None,
             )
 
-            chunk_idx += 1
-
         # Count successes, failures, and categories
         total_extractions = sum(count for count, _, _ in all_results)
         sources_failed = sum(1 for _, success, _ in all_results if not success)
@@ -520,6 +641,7 @@ class SchemaExtractionPipeline:
             schema_name=schema.get("name", "unknown"),
             sources_skipped=sources_skipped,
             sources_no_content=sources_no_content,
+            sources_unchanged=sources_unchanged,
             total_embedded=total_embedded,
             embedding_errors=total_embedding_errors,
             cancelled=cancelled,
@@ -0,0 +1,54 @@
+"""Shared process pools for CPU-bound job steps.
+
+Spawning worker processes costs far more than a small job's CPU work, so
+jobs borrow a pool per purpose that is created on first use and lives until
+``shutdown_process_pools`` runs at application shutdown.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_pools: dict[str, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_process_pool(
+    name: str,
+    max_workers: int,
+    initializer: Callable[[], None] | None = None,
+) -> ProcessPoolExecutor | None:
+    """Return the shared pool for ``name``, creating it on first use.
+
+    Args:
+        name: Pool purpose (e.g. "consolidation"); one pool per name.
+        max_workers: Pool size used when the pool is created. 0 or less
+            means no pool: the caller runs the work inline.
+        initializer: Optional per-process initializer.
+
+    Returns:
+        The shared executor, or None when ``max_workers`` disables the pool.
+    """
+    if max_workers <= 0:
+        return None
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer)
+            _pools[name] = pool
+            logger.info("process_pool_created", name=name, max_workers=max_workers)
+        return pool
+
+
+def shutdown_process_pools() -> None:
+    """Shut down every shared pool, cancelling work not yet started."""
+    with _pools_lock:
+        pools = list(_pools.items())
+        _pools.clear()
+    for name, pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("process_pool_shutdown", name=name)
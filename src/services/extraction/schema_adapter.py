@@ -1,5 +1,7 @@
 """Schema adapter for converting JSONB extraction schemas to FieldGroup objects."""
 
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
 
@@ -212,6 +214,29 @@ class ExtractionContext:
         )
 
 
+def schema_fingerprint(schema: dict, data_version: int = 1) -> str:
+    """Return a stable hash identifying an extraction schema version.
+
+    Any edit to the schema (fields, prompts, context) or to the extraction
+    data format changes the fingerprint, so sources extracted under an older
+    schema are re-extracted while unchanged ones can be skipped.
+
+    Args:
+        schema: Project extraction_schema dict.
+        data_version: Extraction data format version.
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding.
+    """
+    canonical = json.dumps(
+        {"schema": schema, "data_version": data_version},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 class SchemaAdapter:
     """Converts extraction_schema JSONB to FieldGroup objects."""
 
@@ -466,6 +491,18 @@ class SchemaAdapter:
                         f"got: {max_items}"
                     )
 
+        # Validate fuzzy entity matching threshold if provided
+        threshold = (extraction_context or {}).get("entity_match_threshold")
+        if threshold is not None and (
+            isinstance(threshold, bool)
+            or not isinstance(threshold, int | float)
+            or not 0.0 < threshold <= 1.0
+        ):
+            errors.append(
+                "extraction_context.entity_match_threshold must be a number in "
+                f"(0, 1], got: {threshold}"
+            )
+
         return ValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
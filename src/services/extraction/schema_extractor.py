@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -14,7 +16,17 @@ from constants import LLM_RETRY_HINT
 from exceptions import LLMExtractionError
 from services.extraction.content_cleaner import strip_structural_junk
 from services.extraction.field_groups import FieldGroup
-from services.llm.json_repair import try_repair_json
+from services.llm.json_repair import (
+    StreamingArrayParser,
+    decode_tolerant,
+    try_repair_json,
+)
+from services.metrics.instruments import (
+    EXTRACTION_LLM_SECONDS,
+    LLM_STREAM_INTERRUPTIONS,
+    LLM_STREAM_SALVAGED_ENTITIES,
+    record_token_usage,
+)
 
 if TYPE_CHECKING:
     from services.extraction.schema_adapter import ExtractionContext
@@ -30,6 +42,9 @@ CRITICAL CONSTRAINT: You are a text extraction tool, NOT a knowledge base.
 - If you are unsure whether information is in the text or from your own memory, return null.
 """
 
+# Finish reason for a streamed response cut off after some entities arrived
+_STREAM_INTERRUPTED = "interrupted"
+
 _QUOTE_NOT_VALUE_NOTE = (
     '\nThe "quote" must be a VERBATIM excerpt copied directly from the source text, '
     "NOT a restatement of your extracted value. "
@@ -37,53 +52,6 @@ _QUOTE_NOT_VALUE_NOTE = (
 )
 
 
-def _salvage_truncated_array(text: str) -> str | None:
-    """Remove the last incomplete JSON object from a truncated array response.
-
-    Finds the last complete }, before the truncation point and closes the array.
-    Returns None if no complete items can be found.
-    """
-    bracket_pos = text.find("[")
-    if bracket_pos < 0:
-        return None
-
-    # Walk through the text tracking brace depth to find last complete top-level item
-    last_complete = -1
-    depth = 0
-    in_string = False
-    escape = False
-
-    for i, ch in enumerate(text):
-        if escape:
-            escape = False
-            continue
-        if ch == "\\" and in_string:
-            escape = True
-            continue
-        if ch == '"' and not escape:
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 1:  # Just closed a top-level array item
-                last_complete = i
-
-    if last_complete < 0:
-        return None
-
-    # Take everything up to and including the last complete item, close the array
-    salvaged = text[: last_complete + 1].rstrip().rstrip(",") + "]"
-    # If there was content before the array (like {"field_name": [...}), close that too
-    open_braces = salvaged.count("{") - salvaged.count("}")
-    salvaged += "}" * max(0, open_braces)
-
-    return salvaged
-
-
 def _singularize(word: str) -> str:
     """Naive singularization for English plural nouns.
 
@@ -164,6 +132,7 @@ class SchemaExtractor:
         source_context: str | None = None,
         strict_quoting: bool = False,
         already_found: list[str] | None = None,
+        on_entity: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
         """Extract fields for a specific field group.
 
@@ -173,6 +142,11 @@ class SchemaExtractor:
             source_context: Optional source context (e.g., company name, website name).
             strict_quoting: If True, use stricter quoting instructions (retry mode).
             already_found: Entity IDs already extracted (for pagination exclusion).
+            on_entity: For entity lists in direct mode, stream the response
+                and call this with each raw entity as soon as it is complete.
+                Entities may be repeated if an attempt is retried; the
+                returned dict remains the authoritative result. Ignored in
+                queue mode.
 
         Returns:
             Dictionary of extracted field values.
@@ -181,22 +155,33 @@ class SchemaExtractor:
             LLMExtractionError: If extraction fails.
         """
         context_value = source_context
-
-        if self.llm_queue is not None:
-            return await self._extract_via_queue(
-                content,
-                field_group,
-                context_value,
-                strict_quoting=strict_quoting,
-                already_found=already_found,
-            )
-        else:
-            return await self._extract_direct(
-                content,
-                field_group,
-                context_value,
-                strict_quoting=strict_quoting,
-                already_found=already_found,
+        start = time.perf_counter()
+        status = "error"
+        try:
+            if self.llm_queue is not None:
+                result = await self._extract_via_queue(
+                    content,
+                    field_group,
+                    context_value,
+                    strict_quoting=strict_quoting,
+                    already_found=already_found,
+                )
+            else:
+                result = await self._extract_direct(
+                    content,
+                    field_group,
+                    context_value,
+                    strict_quoting=strict_quoting,
+                    already_found=already_found,
+                    on_entity=on_entity if field_group.is_entity_list else None,
+                )
+            status = "success"
+            return result
+        finally:
+            EXTRACTION_LLM_SECONDS.observe(
+                time.perf_counter() - start,
+                field_group=field_group.name,
+                status=status,
             )
 
     async def _extract_via_queue(
@@ -303,6 +288,7 @@ class SchemaExtractor:
         source_context: str | None,
         strict_quoting: bool = False,
         already_found: list[str] | None = None,
+        on_entity: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
         """Extract via direct LLM call with retry and variation.
 
@@ -315,6 +301,7 @@ class SchemaExtractor:
             source_context: Optional source context.
             strict_quoting: If True, use stricter quoting instructions.
             already_found: Entity IDs already extracted (for pagination exclusion).
+            on_entity: If set, stream the completion (see _stream_completion).
 
         Returns:
             Extracted field values.
@@ -353,23 +340,34 @@ class SchemaExtractor:
                 temperature=temperature,
             )
 
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
             try:
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+                streamed: list[dict[str, Any]] = []
+                if on_entity is not None:
+                    stream_result = await self._stream_completion(
+                        messages, temperature, max_tokens, field_group, on_entity
+                    )
+                    result_text, finish_reason, usage, streamed = stream_result
+                else:
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        response_format={"type": "json_object"},
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    usage = response.usage
+                    result_text = response.choices[0].message.content
+                    finish_reason = response.choices[0].finish_reason
 
-                result_text = response.choices[0].message.content
-                finish_reason = response.choices[0].finish_reason
+                record_token_usage(usage, field_group.name)
 
-                # Check for truncation due to max_tokens limit
-                if finish_reason == "length":
+                # Check for truncation due to max_tokens limit (or a stream
+                # cut off after some entities arrived)
+                if finish_reason in ("length", _STREAM_INTERRUPTED):
                     logger.warning(
                         "schema_extraction_truncated",
                         field_group=field_group.name,
@@ -378,47 +376,46 @@ class SchemaExtractor:
                         max_tokens=max_tokens,
                         attempt=attempt,
                     )
-                    # For entity lists, truncation means incomplete JSON array
-                    # Try to repair, but if it fails, return empty result
-                    if field_group.is_entity_list:
+                    interrupted = finish_reason == _STREAM_INTERRUPTED
+                    # A cut-off stream keeps only the entities whose closing
+                    # brace arrived; a half-written trailing entity is dropped
+                    if field_group.is_entity_list and interrupted:
+                        result_data = {field_group.name: streamed, "_truncated": True}
+                        logger.info(
+                            "schema_extraction_truncated_salvaged",
+                            field_group=field_group.name,
+                            salvaged_items=len(streamed),
+                        )
+                    # For entity lists, truncation means incomplete JSON array:
+                    # keep the entities that were fully or partly written
+                    elif field_group.is_entity_list:
                         try:
-                            result_data = try_repair_json(
-                                result_text, context="schema_extract_truncated"
-                            )
+                            decoded = decode_tolerant(result_text or "")
                         except json.JSONDecodeError:
-                            # Attempt partial salvage: remove last incomplete item
-                            result_data = None
-                            salvaged = _salvage_truncated_array(result_text)
-                            if salvaged:
-                                try:
-                                    result_data = try_repair_json(
-                                        salvaged,
-                                        context="schema_extract_salvaged",
-                                    )
-                                except json.JSONDecodeError:
-                                    pass
-
-                            if result_data is None:
-                                logger.warning(
-                                    "schema_extraction_truncated_unrecoverable",
-                                    field_group=field_group.name,
-                                    response_preview=result_text[:500]
-                                    if result_text
-                                    else None,
-                                )
-                                return {
-                                    field_group.name: [],
-                                    "confidence": 0.0,
-                                    "_truncated": True,
-                                }
-
-                            logger.info(
-                                "schema_extraction_truncated_salvaged",
+                            logger.warning(
+                                "schema_extraction_truncated_unrecoverable",
                                 field_group=field_group.name,
-                                salvaged_items=len(result_data)
-                                if isinstance(result_data, list)
-                                else 1,
+                                response_preview=result_text[:500]
+                                if result_text
+                                else None,
                             )
+                            return {
+                                field_group.name: [],
+                                "confidence": 0.0,
+                                "_truncated": True,
+                            }
+                        result_data = decoded.value
+                        items = (
+                            result_data.get(field_group.name)
+                            if isinstance(result_data, dict)
+                            else result_data
+                        )
+                        logger.info(
+                            "schema_extraction_truncated_salvaged",
+                            field_group=field_group.name,
+                            salvaged_items=len(items) if isinstance(items, list) else 1,
+                            dropped=decoded.dropped[:20],
+                        )
                     else:
                         # Non-entity fields - try normal repair
                         result_data = try_repair_json(
@@ -437,7 +434,7 @@ class SchemaExtractor:
                         [k for k, v in result.items() if v is not None]
                     ),
                     attempt=attempt,
-                    truncated=finish_reason == "length",
+                    truncated=finish_reason in ("length", _STREAM_INTERRUPTED),
                 )
 
                 return result
@@ -477,6 +474,79 @@ class SchemaExtractor:
             f"Schema extraction failed after {max_retries} attempts: {last_error}"
         ) from last_error
 
+    async def _stream_completion(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        field_group: FieldGroup,
+        on_entity: Callable[[dict[str, Any]], None],
+    ) -> tuple[str, str | None, Any]:
+        """Stream an entity-list completion, reporting entities as they finish.
+
+        Each object of the ``field_group.name`` array is passed to
+        ``on_entity`` as soon as its closing brace arrives. The whole stream
+        is bounded by ``http_timeout``. If it breaks off (timeout, dropped
+        connection, server error or no finish reason) after at least one
+        entity arrived, the text received so far is returned with finish
+        reason ``_STREAM_INTERRUPTED`` instead of failing the attempt.
+
+        Returns:
+            Tuple of (response text, finish reason, usage or None, completed
+            entities).
+        """
+        parser = StreamingArrayParser(field_group.name)
+        finish_reason = None
+        usage = None
+        error: Exception | None = None
+        try:
+            async with asyncio.timeout(self._llm.http_timeout):
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.delta is not None and choice.delta.content:
+                        for entity in parser.feed(choice.delta.content):
+                            on_entity(entity)
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+        except Exception as e:
+            if not parser.items_parsed:
+                LLM_STREAM_INTERRUPTIONS.inc(
+                    field_group=field_group.name, outcome="failed"
+                )
+                raise
+            error = e
+
+        if finish_reason is None and parser.items_parsed:
+            LLM_STREAM_INTERRUPTIONS.inc(
+                field_group=field_group.name, outcome="salvaged"
+            )
+            LLM_STREAM_SALVAGED_ENTITIES.inc(
+                parser.items_parsed, field_group=field_group.name
+            )
+            logger.warning(
+                "schema_extraction_stream_interrupted",
+                field_group=field_group.name,
+                entities_received=parser.items_parsed,
+                response_length=len(parser.text),
+                error=str(error) if error else None,
+                error_type=type(error).__name__ if error else None,
+            )
+            finish_reason = _STREAM_INTERRUPTED
+        return parser.text, finish_reason, usage, parser.items
+
     def _build_system_prompt(
         self,
         field_group: FieldGroup,
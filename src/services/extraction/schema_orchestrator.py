@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -40,16 +42,22 @@ from services.extraction.page_classifier import (
     ClassificationMethod,
     ClassificationResult,
     PageClassifier,
+    PageToClassify,
 )
 from services.extraction.schema_extractor import SchemaExtractor
 from services.extraction.schema_validator import SchemaValidator
 from services.llm.chunking import chunk_document
+from services.metrics.instruments import (
+    ENTITY_FIRST_GROUNDED_SECONDS,
+    GROUNDING_RESCUE_SECONDS,
+    GROUNDING_RESCUES,
+)
 
 if TYPE_CHECKING:
     from config import ClassificationConfig, ExtractionConfig
     from services.extraction.field_groups import FieldDefinition
-    from services.extraction.llm_grounding import LLMGroundingVerifier
-    from services.extraction.llm_skip_gate import LLMSkipGate
+    from services.extraction.llm_grounding import LLMGroundingVerifier, RescueResult
+    from services.extraction.llm_skip_gate import LLMSkipGate, SkipGateResult
     from services.extraction.schema_adapter import ExtractionContext
     from services.extraction.smart_classifier import SmartClassifier
 
@@ -78,6 +86,11 @@ def _avg_chunk_grounding(result: ChunkExtractionResult) -> float:
     return sum(scores) / len(scores) if scores else 1.0
 
 
+def _entity_key(entity_data: dict) -> str:
+    """Content key matching a streamed entity to the same final entity."""
+    return json.dumps(entity_data, sort_keys=True, default=str)
+
+
 def _collect_quotes(result: dict) -> list[str]:
     """Extract all quote strings from a result dict.
 
@@ -215,6 +228,14 @@ async def apply_grounding_gate(
         ftype = ft.get(name, "string")
         return GROUNDING_DEFAULTS.get(ftype, "required")
 
+    async def _rescue(name: str, value: Any) -> RescueResult:
+        async with rescue_sem:
+            rescue = await verifier.rescue_quote(name, value, chunk_content)
+        rescued = bool(rescue.quote) and rescue.grounding >= keep_threshold
+        GROUNDING_RESCUES.inc(outcome="rescued" if rescued else "failed")
+        GROUNDING_RESCUE_SECONDS.observe(rescue.latency)
+        return rescue
+
     async def _maybe_rescue_field(
         name: str, item: FieldItem
     ) -> tuple[str, FieldItem] | None:
@@ -243,8 +264,7 @@ async def apply_grounding_gate(
             # Fall through to rescue below
         # else: borderline + required — rescue (original behavior)
 
-        async with rescue_sem:
-            rescue = await verifier.rescue_quote(name, item.value, chunk_content)
+        rescue = await _rescue(name, item.value)
         if rescue.quote and rescue.grounding >= keep_threshold:
             return (
                 name,
@@ -268,8 +288,7 @@ async def apply_grounding_gate(
         mode = _grounding_mode(name)
         if mode != "required":
             return (name, item)
-        async with rescue_sem:
-            rescue = await verifier.rescue_quote(name, item.value, chunk_content)
+        rescue = await _rescue(name, item.value)
         if rescue.quote and rescue.grounding >= keep_threshold:
             return (
                 name,
@@ -301,8 +320,7 @@ async def apply_grounding_gate(
                 break
         if not entity_name:
             return None  # No identifiable field → drop borderline entity
-        async with rescue_sem:
-            rescue = await verifier.rescue_quote(group_name, entity_name, chunk_content)
+        rescue = await _rescue(group_name, entity_name)
         if rescue.quote and rescue.grounding >= keep_threshold:
             rescued = EntityItem(
                 fields=entity.fields,
@@ -357,6 +375,30 @@ async def apply_grounding_gate(
     )
 
 
+def _gate_classification(
+    gate_result: SkipGateResult,
+    page_type: str,
+    available_group_names: list[str],
+) -> ClassificationResult:
+    """Turn a skip-gate decision into a ClassificationResult."""
+    if gate_result.decision == "skip":
+        return ClassificationResult(
+            page_type="skip",
+            relevant_groups=[],
+            skip_extraction=True,
+            confidence=gate_result.confidence,
+            method=ClassificationMethod.LLM,
+            reasoning="LLM skip-gate: page does not match extraction schema",
+        )
+    return ClassificationResult(
+        page_type=page_type,
+        relevant_groups=available_group_names,
+        skip_extraction=False,
+        confidence=gate_result.confidence,
+        method=ClassificationMethod.LLM,
+    )
+
+
 class SchemaExtractionOrchestrator:
     """Orchestrates extraction across all field groups for a source."""
 
@@ -406,6 +448,75 @@ class SchemaExtractionOrchestrator:
         self._skip_gate = skip_gate
         self._extraction_schema = extraction_schema
 
+    @property
+    def _skip_gate_active(self) -> bool:
+        return bool(self._skip_gate and self._classification.skip_gate_enabled)
+
+    @property
+    def _smart_active(self) -> bool:
+        return bool(self._smart_classifier and self._classification.smart_enabled)
+
+    @property
+    def batch_classification_enabled(self) -> bool:
+        """Whether classify_sources classifies anything (skip-gate or smart)."""
+        return self._classification.enabled and (
+            self._skip_gate_active or self._smart_active
+        )
+
+    async def classify_sources(
+        self,
+        pages: list[PageToClassify],
+        field_groups: list[FieldGroup],
+    ) -> list[ClassificationResult | None]:
+        """Classify a batch of pages ahead of extract_all_groups.
+
+        Runs the level extract_all_groups would use after the rule-based
+        check: the LLM skip-gate (batched requests) if enabled, otherwise the
+        smart classifier (classify_many). Pages the rule-based level skips
+        are left out. Pass each result back as ``precomputed_classification``.
+
+        Args:
+            pages: Pages about to be extracted.
+            field_groups: Field groups to classify against.
+
+        Returns:
+            One result per page, None where no batch classification applies.
+        """
+        results: list[ClassificationResult | None] = [None] * len(pages)
+        if not pages or not field_groups or not self.batch_classification_enabled:
+            return results
+
+        # Pages the rule-based level will skip never reach the classifiers
+        available_group_names = [g.name for g in field_groups]
+        rule_classifier = PageClassifier(available_groups=available_group_names)
+        rule_results = [
+            rule_classifier.classify(url=page.url, title=page.title) for page in pages
+        ]
+        indices = [
+            i
+            for i, rule_result in enumerate(rule_results)
+            if not (rule_result.skip_extraction and self._classification.skip_enabled)
+        ]
+        if not indices:
+            return results
+
+        batch = [pages[i] for i in indices]
+        if self._skip_gate_active:
+            gate_results = await self._skip_gate.should_extract_many(
+                batch, self._extraction_schema or {}
+            )
+            classified = [
+                _gate_classification(
+                    gate_result, rule_results[i].page_type, available_group_names
+                )
+                for i, gate_result in zip(indices, gate_results, strict=True)
+            ]
+        else:
+            classified = await self._smart_classifier.classify_many(batch, field_groups)
+        for i, classification in zip(indices, classified, strict=True):
+            results[i] = classification
+        return results
+
     async def extract_all_groups(
         self,
         source_id: UUID,
@@ -414,6 +525,7 @@ class SchemaExtractionOrchestrator:
         field_groups: list[FieldGroup],
         source_url: str | None = None,
         source_title: str | None = None,
+        precomputed_classification: ClassificationResult | None = None,
     ) -> tuple[list[dict], ClassificationResult | None]:
         """Extract all field groups from source content.
 
@@ -424,6 +536,8 @@ class SchemaExtractionOrchestrator:
             field_groups: Field groups to extract (REQUIRED).
             source_url: Source URL for classification.
             source_title: Source title for classification.
+            precomputed_classification: Result from classify_sources for this page,
+                used instead of classifying it again.
 
         Returns:
             Tuple of (extraction results, classification result or None).
@@ -455,40 +569,32 @@ class SchemaExtractionOrchestrator:
                 classification = rule_result
                 classification_method = "rule"
 
-            elif self._skip_gate and self._classification.skip_gate_enabled:
+            elif self._skip_gate_active:
                 # Level 1: LLM skip-gate (binary extract/skip)
-                gate_result = await self._skip_gate.should_extract(
-                    url=source_url,
-                    title=source_title,
-                    content=markdown,
-                    schema=self._extraction_schema or {},
-                )
-                if gate_result.decision == "skip":
-                    classification = ClassificationResult(
-                        page_type="skip",
-                        relevant_groups=[],
-                        skip_extraction=True,
-                        confidence=gate_result.confidence,
-                        method=ClassificationMethod.LLM,
-                        reasoning="LLM skip-gate: page does not match extraction schema",
-                    )
+                if precomputed_classification is not None:
+                    classification = precomputed_classification
                 else:
-                    classification = ClassificationResult(
-                        page_type=rule_result.page_type,
-                        relevant_groups=available_group_names,
-                        skip_extraction=False,
-                        confidence=gate_result.confidence,
-                        method=ClassificationMethod.LLM,
+                    gate_result = await self._skip_gate.should_extract(
+                        url=source_url,
+                        title=source_title,
+                        content=markdown,
+                        schema=self._extraction_schema or {},
+                    )
+                    classification = _gate_classification(
+                        gate_result, rule_result.page_type, available_group_names
                     )
                 classification_method = "llm_skip_gate"
 
-            elif self._smart_classifier and self._classification.smart_enabled:
+            elif self._smart_active:
                 # Level 2: Embedding-based smart classifier (group filtering)
-                classification = await self._smart_classifier.classify(
-                    url=source_url,
-                    title=source_title,
-                    content=markdown,
-                    field_groups=field_groups,
+                classification = (
+                    precomputed_classification
+                    or await self._smart_classifier.classify(
+                        url=source_url,
+                        title=source_title,
+                        content=markdown,
+                        field_groups=field_groups,
+                    )
                 )
                 classification_method = "smart"
 
@@ -1261,12 +1367,16 @@ class SchemaExtractionOrchestrator:
         Uses _extract_entities_paginated to handle entity lists that exceed
         the per-call limit, then converts to ChunkExtractionResult with
         inline grounding.
+
+        With ``stream_entities`` enabled, each entity is grounded as soon as
+        the streamed response completes it, while the LLM is still
+        generating the rest; the final pass reuses those results.
         """
-        all_entities, _, any_truncated = await self._extract_entities_paginated(
-            chunk.content,
-            group,
-            source_context,
-        )
+        start = time.perf_counter()
+        stream = self._extraction.stream_entities
+        # Entities grounded while the response was streaming, keyed by content
+        streamed: dict[str, EntityItem | None] = {}
+        first_grounded = False
 
         # Build field definitions list for grounding/confidence scoring
         field_defs = [
@@ -1278,15 +1388,14 @@ class SchemaExtractionOrchestrator:
             for f in group.fields
         ]
 
-        entities: list[EntityItem] = []
-        for entity_data in all_entities:
+        def build_item(entity_data: dict) -> EntityItem | None:
             fields = entity_data.get("fields", {})
             raw_confidence = float(entity_data.get("_confidence", 0.5))
             quote = entity_data.get("_quote")
 
             # Skip entities with negation quotes ("No mention of...", etc.)
             if quote and is_negation_quote(quote):
-                continue
+                return None
 
             grounding = ground_entity_item(quote, chunk.content)
             location = locate_in_source(
@@ -1310,16 +1419,50 @@ class SchemaExtractionOrchestrator:
                 entity_grounding=grounding,
             )
 
-            entities.append(
-                EntityItem(
-                    fields=fields,
-                    confidence=confidence,
-                    quote=quote,
-                    grounding=grounding,
-                    location=location,
-                    field_grounding=field_gnd,
+            return EntityItem(
+                fields=fields,
+                confidence=confidence,
+                quote=quote,
+                grounding=grounding,
+                location=location,
+                field_grounding=field_gnd,
+            )
+
+        def ground(entity_data: dict) -> EntityItem | None:
+            """Ground one normalized entity (None for negation quotes)."""
+            nonlocal first_grounded
+            item = build_item(entity_data)
+            if item is not None and not first_grounded:
+                first_grounded = True
+                ENTITY_FIRST_GROUNDED_SECONDS.observe(
+                    time.perf_counter() - start,
+                    field_group=group.name,
+                    mode="streamed" if stream else "buffered",
                 )
+            return item
+
+        def on_entity(raw_entity: dict) -> None:
+            parsed = SchemaExtractor.parse_v2_entity_response(
+                {group.name: [raw_entity]}, group
             )
+            for entity_data in parsed[group.name]:
+                key = _entity_key(entity_data)
+                if key not in streamed:
+                    streamed[key] = ground(entity_data)
+
+        all_entities, _, any_truncated = await self._extract_entities_paginated(
+            chunk.content,
+            group,
+            source_context,
+            on_entity=on_entity if stream else None,
+        )
+
+        entities: list[EntityItem] = []
+        for entity_data in all_entities:
+            key = _entity_key(entity_data) if streamed else None
+            item = streamed.pop(key) if key in streamed else ground(entity_data)
+            if item is not None:
+                entities.append(item)
 
         return ChunkExtractionResult(
             chunk_index=chunk_idx,
@@ -1412,9 +1555,12 @@ class SchemaExtractionOrchestrator:
         chunk_content: str,
         field_group: FieldGroup,
         source_context: str | None,
+        on_entity: Callable[[dict], None] | None = None,
     ) -> tuple[list[dict], bool, bool]:
         """Iterative entity extraction with dedup and convergence detection.
 
+        ``on_entity`` is passed to extract_field_group to stream each call.
+
         Safety controls:
         1. has_more=False from LLM → stop
         2. Empty response (0 new entities after dedup) → stop
@@ -1442,6 +1588,7 @@ class SchemaExtractionOrchestrator:
                     field_group=field_group,
                     source_context=source_context,
                     already_found=already_found_ids or None,
+                    on_entity=on_entity,
                 )
             except Exception as e:
                 logger.error(
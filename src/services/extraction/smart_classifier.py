@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
 import redis.asyncio as aioredis
 import structlog
 
@@ -17,6 +20,7 @@ from services.extraction.page_classifier import (
     ClassificationMethod,
     ClassificationResult,
     PageClassifier,
+    PageToClassify,
 )
 from services.storage.embedding import EmbeddingService
 from utils import cosine_similarity
@@ -35,6 +39,13 @@ class SmartClassificationResult(ClassificationResult):
     reranker_scores: dict[str, float] | None = None  # group_name -> reranker score
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; zero rows stay zero (similarity 0.0)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 class SmartClassifier:
     """Embedding + reranker based page classification.
 
@@ -44,6 +55,10 @@ class SmartClassifier:
     3. High confidence (>0.75): Use matched groups directly
     4. Medium confidence (0.4-0.75): Use reranker to confirm relevance
     5. Low confidence (<0.4): Use all groups (conservative)
+
+    classify_many runs the same flow for a batch of pages: page summaries
+    are embedded in batched requests and scored against the field group
+    embedding matrix in one matrix product.
     """
 
     # Cache key prefix for field group embeddings
@@ -83,6 +98,9 @@ class SmartClassifier:
             skip_patterns=skip_patterns,
         )
 
+        # Unit-normalized field group embeddings, keyed by group cache keys
+        self._group_matrix: tuple[tuple[str, ...], list[str], np.ndarray] | None = None
+
     def _resolve_skip_patterns(self) -> list[str] | None:
         """Resolve skip patterns from config and settings.
 
@@ -159,14 +177,140 @@ class SmartClassifier:
                 url=url,
             )
             # Fall back to rule-based on any error
-            return ClassificationResult(
-                page_type="general",
-                relevant_groups=[],
-                skip_extraction=False,
-                confidence=0.5,
-                method=ClassificationMethod.RULE_BASED,
-                reasoning=f"Smart classification failed: {e}. Using all groups.",
+            return self._fallback_result(e)
+
+    async def classify_many(
+        self,
+        pages: Sequence[PageToClassify],
+        field_groups: list[FieldGroup],
+    ) -> list[ClassificationResult]:
+        """Classify a batch of pages; same decisions as calling classify per page.
+
+        Page summaries are embedded with embed_batch in batches of
+        embed_batch_size, and similarities to all field groups come from a
+        single matrix product. Medium-confidence pages are reranked
+        concurrently, one request per page with all groups as documents.
+
+        Args:
+            pages: Pages to classify.
+            field_groups: Available field groups to classify against.
+
+        Returns:
+            One ClassificationResult per page, in input order.
+        """
+        results: dict[int, ClassificationResult] = {}
+        pending: list[int] = []
+        for i, page in enumerate(pages):
+            rule_result = self._rule_classifier.classify(page.url, page.title)
+            if rule_result.skip_extraction:
+                logger.debug(
+                    "smart_classifier_skip",
+                    url=page.url,
+                    reason=rule_result.reasoning,
+                )
+                results[i] = rule_result
+            elif not self._app_config.smart_enabled:
+                results[i] = rule_result
+            else:
+                pending.append(i)
+
+        if not pending:
+            return [results[i] for i in range(len(pages))]
+
+        if not field_groups:
+            for i in pending:
+                results[i] = self._neutral_result("No field groups provided")
+            return [results[i] for i in range(len(pages))]
+
+        try:
+            page_scores = await self._score_pages(
+                [pages[i] for i in pending], field_groups
+            )
+            classified = await asyncio.gather(
+                *(
+                    self._classify_from_scores(
+                        pages[i].url, pages[i].content, field_groups, scores
+                    )
+                    for i, scores in zip(pending, page_scores, strict=True)
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "smart_classifier_batch_fallback",
+                error=str(e),
+                pages=len(pending),
             )
+            classified = [self._fallback_result(e) for _ in pending]
+
+        results.update(zip(pending, classified, strict=True))
+        return [results[i] for i in range(len(pages))]
+
+    async def _score_pages(
+        self,
+        pages: Sequence[PageToClassify],
+        field_groups: list[FieldGroup],
+    ) -> list[dict[str, float]]:
+        """Cosine similarity of each page summary to each field group."""
+        group_names, group_matrix = await self._get_group_matrix(field_groups)
+        if not group_names:
+            return [{} for _ in pages]
+
+        summaries = [
+            self._create_page_summary(p.url, p.title, p.content) for p in pages
+        ]
+        size = self._app_config.embed_batch_size
+        batches = await asyncio.gather(
+            *(
+                self._embedding_service.embed_batch(summaries[start : start + size])
+                for start in range(0, len(summaries), size)
+            )
+        )
+        page_matrix = _normalize_rows(
+            np.asarray([v for batch in batches for v in batch], dtype=np.float64)
+        )
+        similarities = page_matrix @ group_matrix.T
+        return [
+            dict(zip(group_names, row.tolist(), strict=True)) for row in similarities
+        ]
+
+    async def _get_group_matrix(
+        self, field_groups: list[FieldGroup]
+    ) -> tuple[list[str], np.ndarray]:
+        """Field group names and their unit-normalized embedding matrix.
+
+        Built once per set of field groups and reused across batches.
+        """
+        cache_keys = tuple(self._get_cache_key(g) for g in field_groups)
+        if self._group_matrix is not None and self._group_matrix[0] == cache_keys:
+            return self._group_matrix[1], self._group_matrix[2]
+
+        group_embeddings = await self._get_field_group_embeddings(field_groups)
+        names = [g.name for g in field_groups if g.name in group_embeddings]
+        matrix = _normalize_rows(
+            np.asarray([group_embeddings[n] for n in names], dtype=np.float64)
+        )
+        self._group_matrix = (cache_keys, names, matrix)
+        return names, matrix
+
+    def _fallback_result(self, error: Exception) -> ClassificationResult:
+        return ClassificationResult(
+            page_type="general",
+            relevant_groups=[],
+            skip_extraction=False,
+            confidence=0.5,
+            method=ClassificationMethod.RULE_BASED,
+            reasoning=f"Smart classification failed: {error}. Using all groups.",
+        )
+
+    def _neutral_result(self, reasoning: str) -> ClassificationResult:
+        return ClassificationResult(
+            page_type="general",
+            relevant_groups=[],
+            skip_extraction=False,
+            confidence=0.5,
+            method=ClassificationMethod.HYBRID,
+            reasoning=reasoning,
+        )
 
     async def _classify_with_embeddings(
         self,
@@ -187,14 +331,7 @@ class SmartClassifier:
             ClassificationResult based on embedding similarity.
         """
         if not field_groups:
-            return ClassificationResult(
-                page_type="general",
-                relevant_groups=[],
-                skip_extraction=False,
-                confidence=0.5,
-                method=ClassificationMethod.HYBRID,
-                reasoning="No field groups provided",
-            )
+            return self._neutral_result("No field groups provided")
 
         # Get embeddings for all field groups (cached)
         group_embeddings = await self._get_field_group_embeddings(field_groups)
@@ -214,15 +351,28 @@ class SmartClassifier:
                 )
                 scores[group.name] = similarity
 
+        return await self._classify_from_scores(url, content, field_groups, scores)
+
+    async def _classify_from_scores(
+        self,
+        url: str,
+        content: str,
+        field_groups: list[FieldGroup],
+        scores: dict[str, float],
+    ) -> ClassificationResult:
+        """Pick field groups from embedding similarity scores.
+
+        Args:
+            url: Page URL.
+            content: Page markdown content (for reranking).
+            field_groups: Field groups to classify against.
+            scores: Similarity of the page to each field group.
+
+        Returns:
+            ClassificationResult based on embedding similarity.
+        """
         if not scores:
-            return ClassificationResult(
-                page_type="general",
-                relevant_groups=[],
-                skip_extraction=False,
-                confidence=0.5,
-                method=ClassificationMethod.HYBRID,
-                reasoning="Could not compute similarity scores",
-            )
+            return self._neutral_result("Could not compute similarity scores")
 
         # Determine classification based on scores
         high_threshold = self._app_config.embedding_high_threshold
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Most failed source IDs a checkpoint carries over for retry on resume
+MAX_CHECKPOINT_FAILED_IDS = 1000
+
 
 class ExtractionWorker:
     """Background worker for processing extraction jobs.
@@ -94,58 +97,98 @@ class ExtractionWorker:
     def _create_checkpoint_callback(self, job: Job) -> CheckpointCallback:
         """Create a checkpoint callback that saves progress to job.payload.
 
+        The checkpoint is a resume cursor plus running totals, so its size and
+        write cost stay constant however many sources the job covers. Totals
+        carry over from the checkpoint of a previous run of the same job.
+        Failed source IDs are kept for retry on resume, capped at
+        MAX_CHECKPOINT_FAILED_IDS.
+
         Args:
             job: Job instance to update with checkpoint data.
 
         Returns:
             Callback function that persists checkpoint state.
         """
-
-        def callback(processed_ids: list[str], extractions: int, entities: int) -> None:
+        previous = (job.payload or {}).get("checkpoint") or {}
+        base_processed = previous.get("sources_processed", 0)
+        base_extractions = previous.get("total_extractions", 0)
+
+        def callback(
+            resume_after: str,
+            processed: int,
+            extractions: int,
+            failed_source_ids: list[str],
+        ) -> None:
+            if len(failed_source_ids) > MAX_CHECKPOINT_FAILED_IDS:
+                logger.warning(
+                    "checkpoint_failed_ids_truncated",
+                    job_id=str(job.id),
+                    failed=len(failed_source_ids),
+                    kept=MAX_CHECKPOINT_FAILED_IDS,
+                )
             checkpoint = {
-                "processed_source_ids": processed_ids,
+                "resume_after": resume_after,
+                "sources_processed": base_processed + processed,
+                "total_extractions": base_extractions + extractions,
+                "failed_source_ids": failed_source_ids[:MAX_CHECKPOINT_FAILED_IDS],
                 "last_checkpoint_at": datetime.now(UTC).isoformat(),
-                "total_extractions": extractions,
-                "total_entities": entities,
             }
-            payload = job.payload or {}
-            payload["checkpoint"] = checkpoint
-            job.payload = payload
+            # New dict so the JSON column is marked dirty
+            job.payload = {**(job.payload or {}), "checkpoint": checkpoint}
             # Note: No commit here - pipeline.extract_project already commits
             # after each chunk, which includes this payload update
             logger.debug(
                 "checkpoint_saved",
                 job_id=str(job.id),
-                processed_count=len(processed_ids),
-                extractions=extractions,
+                resume_after=resume_after,
+                processed_count=checkpoint["sources_processed"],
+                extractions=checkpoint["total_extractions"],
             )
 
         return callback
 
-    def _get_resume_state(self, job: Job) -> set[str] | None:
-        """Get the set of already-processed source IDs from job checkpoint.
+    def _get_resume_state(self, job: Job) -> UUID | None:
+        """Get the resume cursor from the job checkpoint.
 
         Args:
             job: Job instance to check for checkpoint data.
 
         Returns:
-            Set of source ID strings if checkpoint exists, None otherwise.
+            ID of the last source committed by a previous run, or None if
+            there is no usable checkpoint.
         """
         if not job.payload:
             return None
         checkpoint = job.payload.get("checkpoint")
         if not checkpoint:
             return None
-        processed = checkpoint.get("processed_source_ids", [])
-        if not processed:
+        resume_after = checkpoint.get("resume_after")
+        if not resume_after:
+            if checkpoint.get("processed_source_ids"):
+                # Pre-cursor checkpoint: extracted sources are still skipped
+                # by status, so restarting from the beginning is safe
+                logger.info("legacy_checkpoint_ignored", job_id=str(job.id))
             return None
         logger.info(
             "resuming_from_checkpoint",
             job_id=str(job.id),
-            already_processed=len(processed),
+            resume_after=resume_after,
+            already_processed=checkpoint.get("sources_processed"),
             last_checkpoint=checkpoint.get("last_checkpoint_at"),
         )
-        return set(processed)
+        return UUID(resume_after)
+
+    def _get_retry_source_ids(self, job: Job) -> list[UUID]:
+        """Get the sources a previous run of the job failed before its cursor.
+
+        Args:
+            job: Job instance to check for checkpoint data.
+
+        Returns:
+            Failed source IDs from the checkpoint, empty if there are none.
+        """
+        checkpoint = (job.payload or {}).get("checkpoint") or {}
+        return [UUID(s) for s in checkpoint.get("failed_source_ids") or []]
 
     async def _create_schema_pipeline(
         self, project: Project | None = None
@@ -253,6 +296,7 @@ class ExtractionWorker:
             skip_gate = LLMSkipGate(
                 llm_client=gate_client,
                 content_limit=self._classification.skip_gate_content_limit,
+                batch_size=self._classification.skip_gate_batch_size,
             )
 
         # Extract context (entity_id_fields, source_label, etc.) from schema
@@ -290,6 +334,7 @@ class ExtractionWorker:
                 api_key=_settings.validation.factapi_api_key,
                 timeout=_settings.validation.factapi_timeout,
                 cache_ttl=_settings.validation.cache_ttl_seconds,
+                snapshot_dir=_settings.validation.snapshot_dir,
             )
 
         return SchemaExtractionPipeline(
@@ -330,10 +375,13 @@ class ExtractionWorker:
 
         # Get checkpoint callback and resume state if job provided
         checkpoint_callback = None
-        resume_from = None
+        resume_after = None
+        retry_source_ids = None
         if job:
             checkpoint_callback = self._create_checkpoint_callback(job)
-            resume_from = self._get_resume_state(job)
+            resume_after = self._get_resume_state(job)
+            if resume_after:
+                retry_source_ids = self._get_retry_source_ids(job)
 
         # Schema pipeline processes sources for the project
         # skip_extracted=False when force=True to re-extract
@@ -345,7 +393,8 @@ class ExtractionWorker:
             field_groups_filter=field_groups_filter,
             cancellation_check=cancellation_check,
             checkpoint_callback=checkpoint_callback,
-            resume_from=resume_from,
+            resume_after=resume_after,
+            retry_source_ids=retry_source_ids,
         )
 
     async def process_job(self, job: Job) -> None:
@@ -489,6 +538,8 @@ class ExtractionWorker:
                 "total_deduplicated": result.total_deduplicated,
                 "total_entities": result.total_entities,
             }
+            if isinstance(result, SchemaPipelineResult) and result.sources_unchanged:
+                job.result["sources_unchanged"] = result.sources_unchanged
             self.db.commit()
 
         except Exception as e:
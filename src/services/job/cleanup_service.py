@@ -10,6 +10,7 @@ from models import JobCleanupStats
 from orm_models import Extraction, Source
 from services.dlq.service import DLQService
 from services.storage.qdrant.repository import QdrantRepository
+from services.storage.repositories.content_blob import ContentBlobRepository
 
 logger = structlog.get_logger(__name__)
 
@@ -22,6 +23,7 @@ class JobCleanupService:
     - Extractions (cascaded from source deletion)
     - Entities (cascaded from source deletion)
     - Sources (where created_by_job_id = job_id)
+    - Content blobs no longer referenced by any source
     - DLQ items (by job_id)
     """
 
@@ -48,7 +50,8 @@ class JobCleanupService:
         Cleanup order (respects FK constraints):
         1. Delete Qdrant embeddings (by extraction_id)
         2. Delete sources (cascades to extractions, entities via FK)
-        3. Delete DLQ items (Redis, by job_id)
+        3. Delete orphaned content blobs
+        4. Delete DLQ items (Redis, by job_id)
 
         Args:
             job_id: UUID of the job whose artifacts should be deleted.
@@ -130,6 +133,13 @@ class JobCleanupService:
                 sources_deleted=sources_deleted,
             )
 
+            blobs_deleted = ContentBlobRepository(self._db).delete_orphans()
+            logger.debug(
+                "job_cleanup_blobs_deleted",
+                job_id=str(job_id),
+                blobs_deleted=blobs_deleted,
+            )
+
         # Step 5: Delete DLQ items
         dlq_deleted = await self._dlq.remove_by_job_id(str(job_id))
         if dlq_deleted > 0:
@@ -4,6 +4,27 @@ import re
 
 from models import DocumentChunk
 
+# CJK Unified Ideographs, Extension A, Compatibility, Hiragana, Katakana, Hangul
+_CJK_RE = re.compile(
+    "[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af]"
+)
+
+
+def _cjk_count(text: str) -> int:
+    """Number of CJK characters in text (regex scan; ASCII short-circuits)."""
+    if text.isascii():
+        return 0
+    return len(_CJK_RE.findall(text))
+
+
+def _estimate_tokens(char_count: int, cjk_count: int) -> int:
+    """Token estimate from character counts (see count_tokens).
+
+    Both counts are additive over concatenation, which lets callers grow
+    windows incrementally instead of re-counting the joined text.
+    """
+    return ((char_count - cjk_count) // 4) + int(cjk_count / 1.5)
+
 
 def count_tokens(text: str) -> int:
     """Approximate token count, CJK-aware.
@@ -17,21 +38,7 @@ def count_tokens(text: str) -> int:
     Returns:
         Approximate number of tokens.
     """
-    cjk_count = 0
-    for ch in text:
-        cp = ord(ch)
-        if (
-            0x4E00 <= cp <= 0x9FFF  # CJK Unified Ideographs
-            or 0x3400 <= cp <= 0x4DBF  # CJK Extension A
-            or 0xF900 <= cp <= 0xFAFF  # CJK Compatibility
-            or 0x3040 <= cp <= 0x309F  # Hiragana
-            or 0x30A0 <= cp <= 0x30FF  # Katakana
-            or 0xAC00 <= cp <= 0xD7AF  # Hangul
-        ):
-            cjk_count += 1
-
-    non_cjk_count = len(text) - cjk_count
-    return (non_cjk_count // 4) + int(cjk_count / 1.5)
+    return _estimate_tokens(len(text), _cjk_count(text))
 
 
 def _get_tail_text(text: str, target_tokens: int) -> str:
@@ -58,16 +65,7 @@ def _get_tail_text(text: str, target_tokens: int) -> str:
     # Estimate chars_per_token based on CJK ratio
     total_chars = len(text)
     if total_chars > 0:
-        cjk_count = sum(
-            1
-            for ch in text
-            if 0x4E00 <= ord(ch) <= 0x9FFF
-            or 0x3400 <= ord(ch) <= 0x4DBF
-            or 0xF900 <= ord(ch) <= 0xFAFF
-            or 0x3040 <= ord(ch) <= 0x309F
-            or 0x30A0 <= ord(ch) <= 0x30FF
-            or 0xAC00 <= ord(ch) <= 0xD7AF
-        )
+        cjk_count = _cjk_count(text)
         cjk_ratio = cjk_count / total_chars
         # Blend between 4 chars/token (English) and 1.5 chars/token (CJK)
         chars_per_token = 4.0 * (1 - cjk_ratio) + 1.5 * cjk_ratio
@@ -160,6 +158,50 @@ def extract_header_path(markdown: str) -> list[str]:
     return headers
 
 
+def _split_words(para: str, header: str, max_tokens: int) -> list[str]:
+    """Split an oversized paragraph into word windows that fit max_tokens.
+
+    Greedily grows each window while ``header + window`` fits, tracking
+    character and CJK counts incrementally so the pass is linear in the
+    paragraph. A single word larger than the budget becomes its own chunk.
+
+    Args:
+        para: Paragraph to split.
+        header: Section header line prepended to every window ("" if none).
+        max_tokens: Maximum tokens per chunk including the header.
+
+    Returns:
+        Chunks of ``header`` plus space-joined words, stripped.
+    """
+    words = para.split()
+    if para.isascii():
+        word_cjk = [0] * len(words)
+    else:
+        word_cjk = [_cjk_count(word) for word in words]
+
+    header_chars = len(header)
+    header_cjk = _cjk_count(header)
+    chunks: list[str] = []
+    start = 0
+    chars = header_chars
+    cjk = header_cjk
+    for i, word in enumerate(words):
+        # Each word is followed by one space in the window
+        next_chars = chars + len(word) + 1
+        next_cjk = cjk + word_cjk[i]
+        if _estimate_tokens(next_chars, next_cjk) <= max_tokens:
+            chars, cjk = next_chars, next_cjk
+            continue
+        if i > start:
+            chunks.append((header + " ".join(words[start:i]) + " ").strip())
+        start = i
+        chars = header_chars + len(word) + 1
+        cjk = header_cjk + word_cjk[i]
+    if start < len(words):
+        chunks.append((header + " ".join(words[start:]) + " ").strip())
+    return chunks
+
+
 def split_large_section(section: str, max_tokens: int) -> list[str]:
     """Split a large section into smaller chunks by paragraphs.
 
@@ -205,21 +247,7 @@ def split_large_section(section: str, max_tokens: int) -> list[str]:
                 current_tokens = 0
 
             # Split by words
-            words = para.split()
-            word_chunk = ""
-            for word in words:
-                test_chunk = word_chunk + word + " "
-                test_chunk_with_header = header + test_chunk if header else test_chunk
-                if count_tokens(test_chunk_with_header) <= max_tokens:
-                    word_chunk = test_chunk
-                else:
-                    if word_chunk:
-                        chunk_text = header + word_chunk if header else word_chunk
-                        chunks.append(chunk_text.strip())
-                    word_chunk = word + " "
-            if word_chunk:
-                chunk_text = header + word_chunk if header else word_chunk
-                chunks.append(chunk_text.strip())
+            chunks.extend(_split_words(para, header, max_tokens))
 
         # Paragraph fits in current chunk
         elif current_tokens + para_tokens <= adjusted_max:
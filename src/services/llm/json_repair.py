@@ -2,34 +2,335 @@
 
 LLMs sometimes produce malformed JSON due to:
 - Truncation: Output hits max_tokens limit mid-string
-- Syntax errors: Missing closing quotes, braces, or brackets
-- Escape issues: Unescaped newlines or special characters in strings
-
-This module provides repair strategies to recover from common failures
-before triggering retries.
+- Syntax errors: Missing closing quotes, braces, brackets or commas
+- Escape issues: Unescaped newlines or invalid escapes in strings
+
+Instead of retrying a chain of whole-text rewrites, ``decode_tolerant``
+parses the document once, building the Python value as it goes: open
+strings, arrays and objects are closed where the text ends, and members it
+cannot complete (a half-written key, a key without a value, a cut-off
+number) are dropped and reported by path.
 """
 
 from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass, field
+from json.decoder import scanstring
 from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Bare token: number, true/false/null, or garbage up to the next delimiter
+_SCALAR = re.compile(r"[^\s,:\[\]{}\"']+")
+# String bodies (unrolled loop, so long strings don't backtrack)
+_DOUBLE_QUOTED_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_SINGLE_QUOTED_BODY = re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL)
+_ESCAPE = re.compile(r'\\(["\\/bfnrt]|u[0-9a-fA-F]{4})?')
+_PARTIAL_ESCAPE_AT_END = re.compile(r"(?<!\\)((?:\\\\)*)\\(?:u[0-9a-fA-F]{0,3})?$")
+# Python literals LLMs occasionally emit instead of JSON ones
+_PYTHON_LITERALS = {"True": True, "False": False, "None": None}
+
+_CLOSERS = {"}": "{", "]": "["}
+
+
+@dataclass
+class TolerantDecodeResult:
+    """Outcome of ``decode_tolerant``.
+
+    Attributes:
+        value: Decoded document (the longest recoverable prefix).
+        dropped: Paths of members that could not be recovered, e.g.
+            ``$.products[3]`` or ``$.products[2].price``.
+        complete: False if the text ended before the document was closed.
+    """
+
+    value: Any
+    dropped: list[str] = field(default_factory=list)
+    complete: bool = True
+
+
+class _Frame:
+    """An open array or object on the decoder stack."""
+
+    __slots__ = ("container", "is_object", "key", "path")
+
+    def __init__(self, container: dict | list, path: str):
+        self.container = container
+        self.is_object = isinstance(container, dict)
+        self.path = path
+        # Object: key read, waiting for its value
+        self.key: str | None = None
+
+    def child_path(self, key: str | None = None) -> str:
+        if self.is_object:
+            key = key if key is not None else self.key
+            return f"{self.path}.{key if key is not None else '?'}"
+        return f"{self.path}[{len(self.container)}]"
+
+
+def _decode_string_body(body: str) -> str:
+    """Decode the inside of a JSON string, keeping invalid escapes literally."""
+    body = _ESCAPE.sub(lambda m: m[0] if m[1] else r"\\", body)
+    return scanstring(body + '"', 0, False)[0]
+
+
+def _scan_string(text: str, pos: int) -> tuple[str, int | None]:
+    """Read the string starting at ``text[pos]``.
+
+    Returns the decoded string and the index after its closing quote, or
+    ``None`` as the index when the text ends inside the string.
+    """
+    quote = text[pos]
+    if quote == '"':
+        try:
+            return scanstring(text, pos + 1, False)
+        except json.JSONDecodeError:
+            pass  # Unterminated or invalid escape: slow path below
+        body_re = _DOUBLE_QUOTED_BODY
+    else:
+        body_re = _SINGLE_QUOTED_BODY
+
+    end = body_re.match(text, pos + 1).end()
+    body = text[pos + 1 : end]
+    if quote == "'":
+        body = body.replace("\\'", "'").replace('"', '\\"')
+    if end < len(text) and text[end] == quote:
+        return _decode_string_body(body), end + 1
+    return _decode_string_body(_PARTIAL_ESCAPE_AT_END.sub(r"\1", body)), None
+
+
+def _parse_scalar(token: str) -> tuple[bool, Any]:
+    """Parse a bare token; returns (ok, value)."""
+    if token in _PYTHON_LITERALS:
+        return True, _PYTHON_LITERALS[token]
+    try:
+        return True, json.loads(token)
+    except json.JSONDecodeError:
+        return False, None
+
+
+def decode_tolerant(text: str) -> TolerantDecodeResult:
+    """Decode possibly malformed JSON in a single pass.
+
+    Recovers the longest valid prefix of an array or object document:
+    open strings, arrays and objects are closed at the end of the text, and
+    incomplete trailing members are dropped (and listed in ``dropped``).
+    Along the way it tolerates markdown code fences, trailing and missing
+    commas, mismatched closers, single-quoted strings, invalid escapes, raw
+    control characters in strings, Python literals and text after the
+    document.
+
+    Args:
+        text: Raw LLM output
+
+    Returns:
+        TolerantDecodeResult with the decoded value and dropped member paths
+
+    Raises:
+        json.JSONDecodeError: If the text does not start with an array or
+            object (after stripping code fences)
+    """
+    text = _strip_code_fences(text)
+    if not text or text[0] not in "{[":
+        raise json.JSONDecodeError("Expecting '{' or '['", text, 0)
+
+    n = len(text)
+    dropped: list[str] = []
+    root: dict | list = {} if text[0] == "{" else []
+    stack = [_Frame(root, "$")]
+    pos = 1
+
+    def add_value(frame: _Frame, value: Any) -> None:
+        """Attach a value to the innermost container (dropped if keyless)."""
+        if frame.is_object:
+            if frame.key is None:
+                dropped.append(frame.child_path())
+                return
+            frame.container[frame.key] = value
+            frame.key = None
+        else:
+            frame.container.append(value)
+
+    while stack:
+        pos = _WHITESPACE.match(text, pos).end()
+        if pos >= n:
+            break
+        frame = stack[-1]
+        ch = text[pos]
+
+        if ch == ",":
+            if frame.is_object and frame.key is not None:
+                # "key": , -> the key never got a value
+                dropped.append(frame.child_path())
+                frame.key = None
+            pos += 1
+        elif ch == ":":
+            pos += 1
+        elif ch in _CLOSERS:
+            opener = _CLOSERS[ch]
+            # Mismatched closers close every frame up to the matching one;
+            # closers with no matching frame are ignored
+            if any(f.is_object == (opener == "{") for f in stack):
+                while True:
+                    closing = stack.pop()
+                    if closing.is_object and closing.key is not None:
+                        dropped.append(closing.child_path())
+                    if closing.is_object == (opener == "{"):
+                        break
+            pos += 1
+        elif ch in "\"'":
+            value, end = _scan_string(text, pos)
+            is_key = frame.is_object and frame.key is None
+            if end is None:
+                # Text ends inside the string: close it, unless it is a key
+                if is_key:
+                    dropped.append(frame.child_path(value))
+                else:
+                    add_value(frame, value)
+                pos = n
+                break
+            if is_key:
+                frame.key = value
+            else:
+                add_value(frame, value)
+            pos = end
+        elif ch in "{[":
+            container: dict | list = {} if ch == "{" else []
+            path = frame.child_path()
+            # A container in key position is still parsed, then discarded
+            add_value(frame, container)
+            stack.append(_Frame(container, path))
+            pos += 1
+        else:
+            end = _SCALAR.match(text, pos).end()
+            token = text[pos:end]
+            if frame.is_object and frame.key is None:
+                # Bare token where a key belongs
+                dropped.append(frame.child_path(token))
+            else:
+                ok, value = _parse_scalar(token)
+                if ok:
+                    add_value(frame, value)
+                else:
+                    # Cut-off (at end of text) or invalid token: drop the member
+                    dropped.append(frame.child_path())
+                    frame.key = None
+            pos = end
+
+    complete = not stack
+    for frame in reversed(stack):
+        if frame.is_object and frame.key is not None:
+            dropped.append(frame.child_path())
+    return TolerantDecodeResult(value=root, dropped=dropped, complete=complete)
+
+
+class StreamingArrayParser:
+    """Incrementally parse the items of one array in a streamed JSON object.
+
+    Fed the text deltas of a response such as ``{"products": [{...}, {...}],
+    "has_more": false}``, ``feed`` returns each object of the ``products``
+    array as soon as its closing brace arrives, so callers can act on early
+    items while the rest is still being generated. The full text is kept for
+    decoding the complete (or cut-off) response afterwards.
+    """
+
+    def __init__(self, key: str):
+        """Initialize StreamingArrayParser.
+
+        Args:
+            key: Top-level key of the array whose items are returned.
+        """
+        self._key = key
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        # Top-level string just read (the key when followed by ":")
+        self._top_string: list[str] = []
+        self._last_top_string = ""
+        self._in_target = False
+        # Pieces of the item being read, None outside an item
+        self._item: list[str] | None = None
+        # Items whose closing brace has arrived, in order
+        self.items: list[dict[str, Any]] = []
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._parts)
+
+    @property
+    def items_parsed(self) -> int:
+        """Number of completed array items so far."""
+        return len(self.items)
+
+    def feed(self, delta: str) -> list[dict[str, Any]]:
+        """Consume a text delta; returns the array items it completed."""
+        self._parts.append(delta)
+        completed: list[dict[str, Any]] = []
+        item_start = 0 if self._item is not None else -1
+
+        for i, ch in enumerate(delta):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_top_string = "".join(self._top_string)
+                elif self._depth == 1:
+                    self._top_string.append(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._top_string = []
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 2:
+                    self._in_target = ch == "[" and self._last_top_string == self._key
+                elif self._depth == 3 and ch == "{" and self._in_target:
+                    self._item = []
+                    item_start = i
+            elif ch in "}]":
+                if self._depth == 3 and self._item is not None:
+                    self._item.append(delta[item_start : i + 1])
+                    item = self._decode_item("".join(self._item))
+                    if item is not None:
+                        completed.append(item)
+                    self._item = None
+                    item_start = -1
+                self._depth -= 1
+                if self._depth < 2:
+                    self._in_target = False
+
+        if self._item is not None and item_start >= 0:
+            self._item.append(delta[item_start:])
+        self.items.extend(completed)
+        return completed
+
+    @staticmethod
+    def _decode_item(text: str) -> dict[str, Any] | None:
+        try:
+            value = json.loads(text, strict=False)
+        except json.JSONDecodeError:
+            value = decode_tolerant(text).value
+        return value if isinstance(value, dict) else None
+
 
 def repair_json(malformed: str) -> dict[str, Any]:
     """Attempt to repair and parse malformed JSON.
 
-    Repair strategies (in order):
-    1. Direct parse (fast path)
-    2. Strip markdown code fences
-    3. Fix unterminated strings
-    4. Balance braces/brackets
-    5. Remove trailing commas
-    6. Fix single quotes to double quotes
+    Tries a direct parse first (fast path for valid JSON), then recovers
+    what it can with ``decode_tolerant``.
 
     Args:
         malformed: Potentially malformed JSON string
@@ -38,87 +339,33 @@ def repair_json(malformed: str) -> dict[str, Any]:
         Parsed dictionary
 
     Raises:
-        json.JSONDecodeError: If all repair strategies fail
+        json.JSONDecodeError: If the text is not recoverable JSON
     """
     if not malformed or not malformed.strip():
         raise json.JSONDecodeError("Empty string", malformed, 0)
 
     text = malformed.strip()
 
-    # Strategy 1: Direct parse (fast path for valid JSON)
     try:
         return json.loads(text)
     except json.JSONDecodeError:
         pass
 
-    # Strategy 2: Strip markdown code fences (```json ... ```)
-    text = _strip_code_fences(text)
     try:
-        return json.loads(text)
+        return decode_tolerant(text).value
     except json.JSONDecodeError:
-        pass
-
-    # Strategy 3: Fix unterminated strings
-    repaired = _fix_unterminated_strings(text)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 4: Balance brackets and braces
-    repaired = _balance_brackets(text)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 5: Combine unterminated strings + balance brackets
-    repaired = _fix_unterminated_strings(text)
-    repaired = _balance_brackets(repaired)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 6: Remove trailing commas
-    repaired = _remove_trailing_commas(text)
-    repaired = _balance_brackets(repaired)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 7: Fix single quotes to double quotes
-    repaired = _fix_quotes(text)
-    repaired = _balance_brackets(repaired)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 8: Full repair chain
-    repaired = _strip_code_fences(text)
-    repaired = _fix_unterminated_strings(repaired)
-    repaired = _remove_trailing_commas(repaired)
-    repaired = _balance_brackets(repaired)
-    try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
-        pass
-
-    # All strategies failed - raise original error for debugging
-    raise json.JSONDecodeError(
-        f"All repair strategies failed for content length {len(malformed)}",
-        malformed,
-        0,
-    )
+        raise json.JSONDecodeError(
+            f"Unrecoverable JSON for content length {len(malformed)}",
+            malformed,
+            0,
+        ) from None
 
 
 def try_repair_json(text: str | None, context: str = "") -> dict[str, Any]:
     """Attempt JSON parse with repair fallback.
 
     This is the main entry point for use in LLM response handling.
-    Logs repair attempts for observability.
+    Logs repair attempts, including any dropped members, for observability.
 
     Args:
         text: JSON string to parse (None is handled gracefully)
@@ -145,13 +392,7 @@ def try_repair_json(text: str | None, context: str = "") -> dict[str, Any]:
         )
 
         try:
-            result = repair_json(text)
-            logger.info(
-                "json_repair_succeeded",
-                context=context,
-                content_length=len(text) if text else 0,
-            )
-            return result
+            result = decode_tolerant(text)
         except json.JSONDecodeError:
             logger.warning(
                 "json_repair_failed",
@@ -160,7 +401,17 @@ def try_repair_json(text: str | None, context: str = "") -> dict[str, Any]:
                 original_error=str(original_error),
             )
             # Re-raise original error for better debugging
-            raise original_error
+            raise original_error from None
+
+        logger.info(
+            "json_repair_succeeded",
+            context=context,
+            content_length=len(text),
+            complete=result.complete,
+            dropped=result.dropped[:20],
+            dropped_count=len(result.dropped),
+        )
+        return result.value
 
 
 def _strip_code_fences(text: str) -> str:
@@ -176,116 +427,3 @@ def _strip_code_fences(text: str) -> str:
     # Remove ``` at end
     text = re.sub(r"\n?```\s*$", "", text)
     return text.strip()
-
-
-def _fix_unterminated_strings(text: str) -> str:
-    """Fix unterminated strings by adding missing closing quotes.
-
-    Handles truncation mid-string like: {"name": "test
-    """
-    # Count quotes (simple heuristic - doesn't handle escaped quotes perfectly)
-    # but good enough for common LLM truncation cases
-    in_string = False
-    escaped = False
-    last_string_start = -1
-    result = list(text)
-
-    for i, char in enumerate(text):
-        if escaped:
-            escaped = False
-            continue
-
-        if char == "\\":
-            escaped = True
-            continue
-
-        if char == '"':
-            if in_string:
-                in_string = False
-            else:
-                in_string = True
-                last_string_start = i
-
-    # If we ended inside a string, close it
-    if in_string and last_string_start >= 0:
-        # If string seems truncated (no closing quote found), add one
-        result.append('"')
-        return "".join(result)
-
-    return text
-
-
-def _balance_brackets(text: str) -> str:
-    """Add missing closing brackets and braces.
-
-    Handles truncation like: {"items": [1, 2
-    """
-    # Track bracket stack in order (ignore brackets inside strings)
-    stack: list[str] = []
-    in_string = False
-    escaped = False
-
-    for char in text:
-        if escaped:
-            escaped = False
-            continue
-
-        if char == "\\":
-            escaped = True
-            continue
-
-        if char == '"':
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char in ("{", "["):
-            stack.append(char)
-        elif (
-            char == "}"
-            and stack
-            and stack[-1] == "{"
-            or char == "]"
-            and stack
-            and stack[-1] == "["
-        ):
-            stack.pop()
-
-    # Close unclosed openers in reverse order
-    result = text
-    for opener in reversed(stack):
-        result += "}" if opener == "{" else "]"
-
-    return result
-
-
-def _remove_trailing_commas(text: str) -> str:
-    """Remove trailing commas before ] or }.
-
-    Handles: [1, 2,] or {"a": 1,}
-    """
-    # Remove comma followed by optional whitespace and ] or }
-    text = re.sub(r",\s*]", "]", text)
-    text = re.sub(r",\s*}", "}", text)
-    return text
-
-
-def _fix_quotes(text: str) -> str:
-    """Convert single quotes to double quotes for JSON compatibility.
-
-    Handles: {'key': 'value'} -> {"key": "value"}
-
-    Note: This is a simple heuristic that may not work for all cases
-    (e.g., apostrophes in values), but handles common LLM outputs.
-    """
-    # Only apply if text looks like it uses single quotes for JSON
-    if "'" in text and '"' not in text:
-        return text.replace("'", '"')
-
-    # More careful replacement: single quotes around keys/values
-    # Match patterns like 'key': or : 'value'
-    result = re.sub(r"'([^']*)'(\s*:)", r'"\1"\2', text)  # Keys
-    result = re.sub(r"(:\s*)'([^']*)'", r'\1"\2"', result)  # String values
-    return result
@@ -12,6 +12,11 @@ from constants import LLM_RETRY_HINT
 from services.extraction.content_cleaner import strip_structural_junk
 from services.llm.json_repair import try_repair_json
 from services.llm.models import LLMRequest, LLMResponse
+from services.metrics.instruments import (
+    LLM_INFERENCE_SECONDS,
+    LLM_QUEUE_WAIT_SECONDS,
+    record_token_usage,
+)
 
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
@@ -221,6 +226,10 @@ class LLMWorker:
 
             start_time = time.time()
             response: LLMResponse
+            LLM_QUEUE_WAIT_SECONDS.observe(
+                max(0.0, (datetime.now(UTC) - request.created_at).total_seconds()),
+                request_type=request.request_type,
+            )
 
             try:
                 # Check if request expired
@@ -242,7 +251,11 @@ class LLMWorker:
                     # Execute LLM call
                     result = await self._execute_llm_call(request)
 
-                    processing_time = int((time.time() - start_time) * 1000)
+                    elapsed = time.time() - start_time
+                    LLM_INFERENCE_SECONDS.observe(
+                        elapsed, request_type=request.request_type, status="success"
+                    )
+                    processing_time = int(elapsed * 1000)
                     response = LLMResponse(
                         request_id=request.request_id,
                         status="success",
@@ -261,7 +274,11 @@ class LLMWorker:
                     )
 
             except Exception as e:
-                processing_time = int((time.time() - start_time) * 1000)
+                elapsed = time.time() - start_time
+                LLM_INFERENCE_SECONDS.observe(
+                    elapsed, request_type=request.request_type, status="error"
+                )
+                processing_time = int(elapsed * 1000)
                 error_msg = str(e)
 
                 if "timeout" in error_msg.lower():
@@ -436,6 +453,9 @@ class LLMWorker:
             max_tokens=self.max_tokens,
         )
 
+        record_token_usage(
+            response.usage, payload.get("field_group", {}).get("name", "unknown")
+        )
         result_text = response.choices[0].message.content
         finish_reason = response.choices[0].finish_reason
 
@@ -514,6 +534,7 @@ class LLMWorker:
             max_tokens=self.max_tokens,
         )
 
+        record_token_usage(response.usage, "extract_entities")
         result_text = response.choices[0].message.content
         return try_repair_json(result_text, context="extract_entities")
 
@@ -561,6 +582,7 @@ class LLMWorker:
             kwargs["response_format"] = response_format
 
         response = await self.llm_client.chat.completions.create(**kwargs)
+        record_token_usage(response.usage, "complete")
         result_text = response.choices[0].message.content
 
         # Parse as JSON if json_object format requested
@@ -0,0 +1,343 @@
+"""In-process latency histograms and counters for pipeline hot paths.
+
+The database-derived metrics in ``collector`` say how much work exists, not
+where a job spends its time. The instruments below are recorded inline by
+the LLM worker, SchemaExtractor, the grounding gate, EmbeddingService,
+QdrantRepository and the scraper, and rendered by the ``/metrics`` endpoint
+after the database metrics.
+
+Recording is a dict lookup, a bisect over fixed bucket bounds and two
+additions under an uncontended lock (a few microseconds), so instruments
+stay on under full load.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any
+
+# Seconds; covers cache hits through slow LLM calls
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# Queue waits can run to the request timeout
+QUEUE_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Label combinations beyond this collapse into a single "other" series so an
+# unbounded label (e.g. scraped domain) cannot grow the export without limit
+MAX_SERIES = 500
+
+_OVERFLOW = "other"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Instrument(ABC):
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        max_series: int = MAX_SERIES,
+    ):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._max_series = max_series
+        self._series: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple:
+        try:
+            if len(labels) != len(self.labelnames):
+                raise KeyError
+            key = tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            ) from None
+        if key not in self._series and len(self._series) >= self._max_series:
+            return (_OVERFLOW,) * len(key)
+        return key
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self._lock:
+            series = {key: self._snapshot(value) for key, value in self._series.items()}
+        for key in sorted(series):
+            lines.extend(self._render_series(key, series[key]))
+        return lines
+
+    def _snapshot(self, value: Any) -> Any:
+        return value
+
+    @abstractmethod
+    def _render_series(self, key: tuple, value: Any) -> list[str]:
+        """Exposition lines for one label combination."""
+
+
+class Counter(_Instrument):
+    """Monotonic counter with labels."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` to the series for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value for ``labels`` (0 if never incremented)."""
+        return self._series.get(self._key(labels), 0)
+
+    def _render_series(self, key: tuple, value: float) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+        ]
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: "Histogram", labels: dict[str, Any]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+
+
+class Histogram(_Instrument):
+    """Fixed-bucket histogram with labels, exported cumulatively."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        max_series: int = MAX_SERIES,
+    ):
+        super().__init__(name, description, labelnames, max_series)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for ``labels``."""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (last slot is +Inf), then sum
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def time(self, **labels: Any) -> _Timer:
+        """Context manager observing the elapsed wall time of its block."""
+        return _Timer(self, labels)
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return sum(series[:-1]) if series else 0
+
+    def sum(self, **labels: Any) -> float:
+        """Sum of observed values for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return series[-1] if series else 0.0
+
+    def _snapshot(self, value: list) -> list:
+        return list(value)
+
+    def _render_series(self, key: tuple, value: list) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), value[:-1], strict=True):
+            cumulative += count
+            le = f'le="{bound}"'
+            labels = _format_labels(self.labelnames, key, le)
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(value[-1])}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered set of instruments rendered together."""
+
+    def __init__(self):
+        self._instruments: list[_Instrument] = []
+
+    def counter(
+        self, name: str, description: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._add(Counter(name, description, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._add(Histogram(name, description, labelnames, buckets))
+
+    def _add(self, instrument):
+        self._instruments.append(instrument)
+        return instrument
+
+    def reset(self) -> None:
+        """Clear all recorded values (instruments stay registered)."""
+        for instrument in self._instruments:
+            instrument.reset()
+
+    def render(self) -> str:
+        """Render all instruments in Prometheus text exposition format."""
+        lines = []
+        for instrument in self._instruments:
+            lines.extend(instrument.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry()
+
+LLM_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "scristill_llm_queue_wait_seconds",
+    "Time LLM requests waited in the Redis queue before a worker picked them up",
+    ("request_type",),
+    buckets=QUEUE_WAIT_BUCKETS,
+)
+LLM_INFERENCE_SECONDS = REGISTRY.histogram(
+    "scristill_llm_inference_seconds",
+    "LLM worker inference time per request",
+    ("request_type", "status"),
+)
+LLM_PROMPT_TOKENS = REGISTRY.counter(
+    "scristill_llm_prompt_tokens_total",
+    "Prompt tokens reported by the LLM server by field group",
+    ("field_group",),
+)
+LLM_COMPLETION_TOKENS = REGISTRY.counter(
+    "scristill_llm_completion_tokens_total",
+    "Completion tokens reported by the LLM server by field group",
+    ("field_group",),
+)
+EXTRACTION_LLM_SECONDS = REGISTRY.histogram(
+    "scristill_extraction_llm_seconds",
+    "SchemaExtractor time per field group call, including queue wait and retries",
+    ("field_group", "status"),
+)
+ENTITY_FIRST_GROUNDED_SECONDS = REGISTRY.histogram(
+    "scristill_entity_first_grounded_seconds",
+    "Time from the start of an entity-list chunk extraction to its first "
+    "grounded entity, by response mode (streamed or buffered)",
+    ("field_group", "mode"),
+)
+LLM_STREAM_INTERRUPTIONS = REGISTRY.counter(
+    "scristill_llm_stream_interruptions_total",
+    "Streamed entity extractions cut off before the response finished, by "
+    "outcome (salvaged entities kept, or failed)",
+    ("field_group", "outcome"),
+)
+LLM_STREAM_SALVAGED_ENTITIES = REGISTRY.counter(
+    "scristill_llm_stream_salvaged_entities_total",
+    "Complete entities kept from streamed extractions that were cut off",
+    ("field_group",),
+)
+GROUNDING_MATCHES = REGISTRY.counter(
+    "scristill_grounding_match_tier_total",
+    "Quote locations by matching tier (1 exact ... 4 fuzzy, 0 unmatched)",
+    ("tier",),
+)
+GROUNDING_RESCUES = REGISTRY.counter(
+    "scristill_grounding_rescues_total",
+    "Grounding gate LLM rescue attempts by outcome",
+    ("outcome",),
+)
+GROUNDING_RESCUE_SECONDS = REGISTRY.histogram(
+    "scristill_grounding_rescue_seconds",
+    "Grounding gate LLM rescue latency",
+)
+EMBEDDING_REQUEST_SECONDS = REGISTRY.histogram(
+    "scristill_embedding_request_seconds",
+    "Embedding server request latency by operation",
+    ("operation",),
+)
+EMBEDDING_TEXTS = REGISTRY.counter(
+    "scristill_embedding_texts_total",
+    "Texts sent to the embedding server by operation",
+    ("operation",),
+)
+QDRANT_REQUEST_SECONDS = REGISTRY.histogram(
+    "scristill_qdrant_request_seconds",
+    "Qdrant request latency by operation",
+    ("operation",),
+)
+SCRAPE_SECONDS = REGISTRY.histogram(
+    "scristill_scrape_seconds",
+    "Firecrawl scrape time per URL by domain (excludes rate-limit waits)",
+    ("domain",),
+)
+
+
+def record_token_usage(usage: Any, field_group: str) -> None:
+    """Count prompt/completion tokens from an OpenAI ``usage`` object.
+
+    Servers that omit usage (or report non-integer counts) are skipped.
+    """
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if isinstance(prompt, int) and prompt > 0:
+        LLM_PROMPT_TOKENS.inc(prompt, field_group=field_group)
+    if isinstance(completion, int) and completion > 0:
+        LLM_COMPLETION_TOKENS.inc(completion, field_group=field_group)
@@ -0,0 +1,150 @@
+"""Periodically refreshed snapshot of database-derived system metrics.
+
+``MetricsCollector.collect`` runs full-table COUNT/GROUP BY queries, which
+take seconds on large databases. A background task refreshes a snapshot
+every half of ``metrics_max_staleness`` and the ``/metrics`` endpoint serves
+it from memory. A scrape only queries the database itself when the snapshot
+is missing or older than the bound (refresher not started or lagging), so
+served metrics are never staler than the setting.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+
+import structlog
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from services.metrics.collector import MetricsCollector, SystemMetrics
+
+logger = structlog.get_logger(__name__)
+
+
+class MetricsSnapshot:
+    """Latest ``SystemMetrics`` with the time it was collected."""
+
+    def __init__(
+        self,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize MetricsSnapshot.
+
+        Args:
+            max_age_seconds: Oldest snapshot served without re-collecting.
+                0 collects on every call.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._metrics: SystemMetrics | None = None
+        self._collected_at = 0.0
+
+    def _fresh(self) -> SystemMetrics | None:
+        metrics = self._metrics
+        if metrics is None or self.max_age_seconds <= 0:
+            return None
+        if self._clock() - self._collected_at > self.max_age_seconds:
+            return None
+        return metrics
+
+    def get(self, db: Session) -> SystemMetrics:
+        """Return the snapshot, collecting with ``db`` if it is too old."""
+        metrics = self._fresh()
+        if metrics is not None:
+            return metrics
+        with self._lock:
+            # A concurrent scrape or the refresher may have collected meanwhile
+            metrics = self._fresh()
+            if metrics is not None:
+                return metrics
+            return self._collect(db)
+
+    def refresh(self, db: Session) -> SystemMetrics:
+        """Collect a new snapshot unconditionally."""
+        with self._lock:
+            return self._collect(db)
+
+    def _collect(self, db: Session) -> SystemMetrics:
+        started = self._clock()
+        metrics = MetricsCollector(db).collect()
+        # Age counts from the start of collection (conservative)
+        self._metrics, self._collected_at = metrics, started
+        return metrics
+
+    def _refresh_with_new_session(self, session_factory: Callable[[], Session]) -> None:
+        db = session_factory()
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    async def run_refresher(
+        self, session_factory: Callable[[], Session] | None = None
+    ) -> None:
+        """Refresh the snapshot every ``max_age_seconds / 2`` until cancelled.
+
+        Collection runs in a thread with its own session (``SessionLocal`` by
+        default) so the event loop keeps serving requests. Failures are
+        logged and retried on the next tick.
+        """
+        session_factory = session_factory or SessionLocal
+        interval = max(1.0, self.max_age_seconds / 2)
+        while True:
+            started = time.monotonic()
+            try:
+                await asyncio.to_thread(self._refresh_with_new_session, session_factory)
+                logger.debug(
+                    "metrics_snapshot_refreshed",
+                    duration_ms=round((time.monotonic() - started) * 1000, 1),
+                )
+            except Exception as e:
+                logger.warning(
+                    "metrics_snapshot_refresh_failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+            await asyncio.sleep(interval)
+
+
+# Global instances for start_metrics_refresher()/stop_metrics_refresher()
+_snapshot: MetricsSnapshot | None = None
+_refresh_task: asyncio.Task | None = None
+
+
+def get_metrics_snapshot() -> MetricsSnapshot:
+    """Return the process-wide snapshot, configured from settings."""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = MetricsSnapshot(settings.observability.metrics_max_staleness)
+    return _snapshot
+
+
+async def start_metrics_refresher() -> None:
+    """Start refreshing the metrics snapshot in the background.
+
+    Should be called during application startup. Does nothing when caching
+    is disabled (``metrics_max_staleness`` = 0).
+    """
+    global _refresh_task
+    snapshot = get_metrics_snapshot()
+    if _refresh_task is None and snapshot.max_age_seconds > 0:
+        _refresh_task = asyncio.create_task(snapshot.run_refresher())
+
+
+async def stop_metrics_refresher() -> None:
+    """Stop the background refresher.
+
+    Should be called during application shutdown.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _refresh_task
+        _refresh_task = None
@@ -1,5 +1,9 @@
 """Report generation service."""
 
-from services.reports.service import ReportData, ReportService
+from services.reports.service import (
+    ReportCancelledError,
+    ReportData,
+    ReportService,
+)
 
-__all__ = ["ReportData", "ReportService"]
+__all__ = ["ReportCancelledError", "ReportData", "ReportService"]
@@ -1,6 +1,7 @@
 """Report generation service."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -22,8 +23,14 @@ from services.reports.consolidated_builder import (
 )
 from services.reports.excel_formatter import ExcelFormatter
 from services.reports.schema_table_generator import ColumnMetadata, SchemaTableGenerator
-from services.reports.smart_merge import MergeCandidate, SmartMergeService
+from services.reports.smart_merge import (
+    MergeCancelledError,
+    MergeCandidate,
+    SmartMergeService,
+    get_merge_cache,
+)
 from services.reports.synthesis import ReportSynthesizer, SynthesisResult
+from services.storage.artifact_store import LocalArtifactStore
 from services.storage.repositories.entity import EntityFilters, EntityRepository
 from services.storage.repositories.extraction import (
     ExtractionFilters,
@@ -32,6 +39,14 @@ from services.storage.repositories.extraction import (
 
 logger = structlog.get_logger(__name__)
 
+# Progress callback: (stage, completed, total)
+ProgressCallback = Callable[[str, int, int], None]
+CancellationCheck = Callable[[], Awaitable[bool]]
+
+
+class ReportCancelledError(Exception):
+    """Raised when report generation stops because cancellation was requested."""
+
 
 @dataclass
 class ReportData:
@@ -57,6 +72,7 @@ class ReportService:
         db_session,
         synthesizer: ReportSynthesizer | None = None,
         project_repo: ProjectRepository | None = None,
+        artifact_store: LocalArtifactStore | None = None,
     ):
         """Initialize with dependencies.
 
@@ -67,6 +83,8 @@ class ReportService:
             db_session: SQLAlchemy database session
             synthesizer: Optional ReportSynthesizer for LLM-based synthesis
             project_repo: Optional ProjectRepository for loading project schemas
+            artifact_store: Optional store for binary artifacts (xlsx). When
+                set, workbooks are written there instead of the database.
         """
         self._extraction_repo = extraction_repo
         self._entity_repo = entity_repo
@@ -77,6 +95,7 @@ class ReportService:
         # Create project repo and schema generator for table reports
         self._project_repo = project_repo or ProjectRepository(db_session)
         self._schema_generator = SchemaTableGenerator()
+        self._artifact_store = artifact_store
 
     def _get_all_source_groups(self, project_id: UUID) -> list[str]:
         """Get all distinct source groups for a project.
@@ -99,15 +118,25 @@ class ReportService:
         self,
         project_id: UUID,
         request: ReportRequest,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        cancellation_check: CancellationCheck | None = None,
     ) -> Report:
         """Generate a report based on the request.
 
         Args:
             project_id: Project UUID
             request: Report request parameters
+            progress_callback: Optional callback invoked with
+                (stage, completed, total) as generation advances.
+            cancellation_check: Optional async callback that returns True if
+                generation should stop.
 
         Returns:
             Generated Report ORM object
+
+        Raises:
+            ReportCancelledError: If cancellation_check returned True.
         """
         # Resolve source_groups - if None or empty, get all from project
         source_groups = request.source_groups
@@ -129,6 +158,9 @@ class ReportService:
                 output_format=request.output_format,
             )
             report_format = "xlsx" if excel_bytes else "md"
+            await _check_cancelled(cancellation_check)
+            _report_progress(progress_callback, "storing", 0, 1)
+            binary_content, artifact_key = self._store_binary(excel_bytes)
             entity_counts = summary.get("entity_counts", {})
             total_entities = sum(entity_counts.values())
             report = Report(
@@ -140,7 +172,8 @@ class ReportService:
                 categories=request.categories or [],
                 extraction_ids=[],
                 format=report_format,
-                binary_content=excel_bytes,
+                binary_content=binary_content,
+                artifact_key=artifact_key,
                 meta_data={
                     "group_by": "consolidated",
                     "entity_count": total_entities,
@@ -154,6 +187,7 @@ class ReportService:
             return report
 
         # Gather data
+        _report_progress(progress_callback, "gathering", 0, len(source_groups))
         data = self._gather_data(
             project_id=project_id,
             source_groups=source_groups,
@@ -166,6 +200,7 @@ class ReportService:
         schema = self._get_project_schema(project_id)
         _ctx = (schema or {}).get("extraction_context") or {}
         source_label = _ctx.get("source_label", "Source")
+        await _check_cancelled(cancellation_check)
 
         # Generate markdown content based on report type
         binary_content = None
@@ -184,6 +219,8 @@ class ReportService:
                 project_id=project_id,
                 group_by=request.group_by,
                 include_merge_metadata=request.include_merge_metadata,
+                progress_callback=progress_callback,
+                cancellation_check=cancellation_check,
             )
             content = md_content
             if excel_bytes:
@@ -199,6 +236,10 @@ class ReportService:
             n = len(source_groups)
             title = request.title or f"{source_label} Comparison ({n})"
 
+        await _check_cancelled(cancellation_check)
+        _report_progress(progress_callback, "storing", 0, 1)
+        binary_content, artifact_key = self._store_binary(binary_content)
+
         # Create and save report with provenance tracking
         report = Report(
             project_id=project_id,
@@ -210,6 +251,7 @@ class ReportService:
             extraction_ids=data.extraction_ids,
             format=report_format,
             binary_content=binary_content,
+            artifact_key=artifact_key,
             meta_data={"entity_count": data.entity_count},
         )
 
@@ -219,6 +261,17 @@ class ReportService:
 
         return report
 
+    def _store_binary(self, data: bytes | None) -> tuple[bytes | None, str | None]:
+        """Route binary report content to the artifact store when configured.
+
+        Returns:
+            Tuple of (binary_content for the DB row, artifact_key). Exactly one
+            is set when data is present.
+        """
+        if data is None or self._artifact_store is None:
+            return data, None
+        return None, self._artifact_store.put(data)
+
     def _gather_data(
         self,
         project_id: UUID,
@@ -813,16 +866,24 @@ class ReportService:
         data: ReportData,
         extraction_schema: dict,
         include_merge_metadata: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        cancellation_check: CancellationCheck | None = None,
     ) -> tuple[list[dict], list[str], dict[str, str]]:
         """Aggregate extractions into one row per domain with LLM smart merge.
 
         First aggregates by source (URL), then merges all URLs of a domain
-        using LLM-based column-by-column synthesis.
+        using LLM-based column-by-column synthesis. Domains are merged
+        concurrently; the shared SmartMergeService bounds LLM calls across
+        all domain x column merges and memoises repeated candidate sets.
 
         Args:
             data: Report data with extractions.
             extraction_schema: Project extraction schema.
             include_merge_metadata: Whether to include merge provenance.
+            progress_callback: Optional (stage, completed, total) callback,
+                invoked as each domain finishes merging.
+            cancellation_check: Optional async callback checked before each
+                domain merge starts and before each LLM column merge.
 
         Returns:
             Tuple of (rows, columns, labels).
@@ -843,11 +904,17 @@ class ReportService:
                 rows_by_domain[domain] = []
             rows_by_domain[domain].append(row)
 
-        # Create smart merge service with config settings
+        # Create smart merge service with config settings. One service is
+        # shared by every domain so its semaphore bounds LLM calls globally.
+        # Cancellation is re-checked before every LLM call, since merges
+        # spend most of their time waiting for an LLM slot.
         merge_service = SmartMergeService(
             self._llm_client,
             max_candidates=settings.smart_merge_max_candidates,
             min_confidence=settings.smart_merge_min_confidence,
+            max_concurrent=settings.smart_merge_max_concurrent,
+            cache=get_merge_cache(),
+            cancellation_check=cancellation_check,
         )
 
         # Columns to merge (skip metadata columns and internal tracking)
@@ -860,9 +927,61 @@ class ReportService:
             )  # Exclude internal fields like _column_confidences
         ]
 
-        # Merge each domain
-        domain_rows = []
-        for domain, domain_source_rows in rows_by_domain.items():
+        def get_column_confidence(row: dict, col: str) -> float | None:
+            """Get per-column confidence, falling back to avg if not available."""
+            col_conf = row.get("_column_confidences", {}).get(col)
+            if col_conf is not None:
+                return col_conf
+            return row.get("avg_confidence")
+
+        async def merge_column(
+            domain_source_rows: list[dict],
+            col_name: str,
+        ) -> tuple[str, Any, float, dict | None]:
+            """Merge a single column for one domain."""
+            candidates = [
+                MergeCandidate(
+                    value=row.get(col_name),
+                    source_url=row.get("source_url", ""),
+                    source_title=row.get("source_title"),
+                    # Use per-column confidence if available, otherwise fall back to avg
+                    confidence=get_column_confidence(row, col_name),
+                )
+                for row in domain_source_rows
+            ]
+
+            col_meta = col_metadata.get(col_name)
+            if not col_meta:
+                # Fallback metadata
+                col_meta = ColumnMetadata(
+                    name=col_name,
+                    label=labels.get(col_name, col_name),
+                    field_type="text",
+                    description=col_name,
+                    field_group="unknown",
+                )
+
+            result = await merge_service.merge_column(col_name, col_meta, candidates)
+
+            merge_meta = None
+            if include_merge_metadata:
+                merge_meta = {
+                    "confidence": result.confidence,
+                    "sources_used": result.sources_used,
+                    "reasoning": result.reasoning,
+                }
+
+            # Always return confidence for avg calculation
+            return col_name, result.value, result.confidence, merge_meta
+
+        total_domains = len(rows_by_domain)
+        completed_domains = 0
+        _report_progress(progress_callback, "merging", 0, total_domains)
+
+        async def merge_domain(domain: str, domain_source_rows: list[dict]) -> dict:
+            """Merge all columns of one domain into a single row."""
+            nonlocal completed_domains
+            await _check_cancelled(cancellation_check)
             domain_row: dict = {"domain": domain}
 
             # If single source, no merge needed
@@ -871,96 +990,68 @@ class ReportService:
                 domain_row.pop("source_url", None)
                 domain_row.pop("source_title", None)
                 domain_row.pop("_column_confidences", None)  # Remove internal tracking
-                domain_rows.append(domain_row)
-                continue
-
-            # Merge each column in parallel
-            async def merge_column(
-                col_name: str,
-            ) -> tuple[str, Any, float, dict | None]:
-                """Merge a single column for this domain."""
-
-                def get_column_confidence(row: dict, col: str) -> float | None:
-                    """Get per-column confidence, falling back to avg if not available."""
-                    col_conf = row.get("_column_confidences", {}).get(col)
-                    if col_conf is not None:
-                        return col_conf
-                    return row.get("avg_confidence")
-
-                candidates = [
-                    MergeCandidate(
-                        value=row.get(col_name),
-                        source_url=row.get("source_url", ""),
-                        source_title=row.get("source_title"),
-                        # Use per-column confidence if available, otherwise fall back to avg
-                        confidence=get_column_confidence(row, col_name),
-                    )
-                    for row in domain_source_rows
-                ]
-
-                col_meta = col_metadata.get(col_name)
-                if not col_meta:
-                    # Fallback metadata
-                    col_meta = ColumnMetadata(
-                        name=col_name,
-                        label=labels.get(col_name, col_name),
-                        field_type="text",
-                        description=col_name,
-                        field_group="unknown",
-                    )
-
-                result = await merge_service.merge_column(
-                    col_name, col_meta, candidates
+            else:
+                # Column merges of every domain share the service's LLM bound
+                merge_results = await asyncio.gather(
+                    *[merge_column(domain_source_rows, col) for col in merge_columns],
+                    return_exceptions=True,
                 )
 
-                merge_meta = None
-                if include_merge_metadata:
-                    merge_meta = {
-                        "confidence": result.confidence,
-                        "sources_used": result.sources_used,
-                        "reasoning": result.reasoning,
-                    }
-
-                # Always return confidence for avg calculation
-                return col_name, result.value, result.confidence, merge_meta
-
-            # Run all column merges in parallel
-            merge_results = await asyncio.gather(
-                *[merge_column(col) for col in merge_columns],
-                return_exceptions=True,
-            )
+                for result in merge_results:
+                    if isinstance(result, MergeCancelledError):
+                        raise ReportCancelledError(
+                            "Report generation cancelled"
+                        ) from result
+
+                # Build domain row from merge results
+                merge_metadata_all = {}
+                confidences = []
+                for i, result in enumerate(merge_results):
+                    # Handle any exceptions from individual merges
+                    if isinstance(result, Exception):
+                        col_name = merge_columns[i]
+                        logger.warning(
+                            "column_merge_failed",
+                            domain=domain,
+                            column=col_name,
+                            error=str(result),
+                        )
+                        domain_row[col_name] = None
+                        continue
 
-            # Build domain row from merge results
-            merge_metadata_all = {}
-            confidences = []
-            for i, result in enumerate(merge_results):
-                # Handle any exceptions from individual merges
-                if isinstance(result, Exception):
-                    col_name = merge_columns[i]
-                    logger.warning(
-                        "column_merge_failed",
-                        domain=domain,
-                        column=col_name,
-                        error=str(result),
-                    )
-                    domain_row[col_name] = None
-                    continue
+                    col_name, value, confidence, merge_meta = result
+                    domain_row[col_name] = value
+                    if confidence is not None:
+                        confidences.append(confidence)
+                    if merge_meta:
+                        merge_metadata_all[col_name] = merge_meta
 
-                col_name, value, confidence, merge_meta = result
-                domain_row[col_name] = value
-                if confidence is not None:
-                    confidences.append(confidence)
-                if merge_meta:
-                    merge_metadata_all[col_name] = merge_meta
+                # Calculate overall confidence from individual merges
+                if confidences:
+                    domain_row["avg_confidence"] = sum(confidences) / len(confidences)
 
-            # Calculate overall confidence from individual merges
-            if confidences:
-                domain_row["avg_confidence"] = sum(confidences) / len(confidences)
+                if include_merge_metadata:
+                    domain_row["_merge_metadata"] = merge_metadata_all
 
-            if include_merge_metadata:
-                domain_row["_merge_metadata"] = merge_metadata_all
+            completed_domains += 1
+            _report_progress(
+                progress_callback, "merging", completed_domains, total_domains
+            )
+            return domain_row
 
-            domain_rows.append(domain_row)
+        # Merge all domains concurrently; gather keeps input order
+        tasks = [
+            asyncio.ensure_future(merge_domain(domain, domain_source_rows))
+            for domain, domain_source_rows in rows_by_domain.items()
+        ]
+        try:
+            domain_rows = list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Stop sibling merges (e.g. on cancellation) before propagating
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         # Update columns for domain output (remove source-specific columns)
         domain_columns = ["domain"] + [
@@ -1045,6 +1136,8 @@ class ReportService:
         project_id: UUID | None = None,
         group_by: str = "source",
         include_merge_metadata: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        cancellation_check: CancellationCheck | None = None,
     ) -> tuple[str, bytes | None]:
         """Generate table report in markdown or Excel.
 
@@ -1056,6 +1149,8 @@ class ReportService:
             project_id: Project ID for schema-driven columns/labels.
             group_by: "source" (one row per URL) or "domain" (LLM merged per domain).
             include_merge_metadata: Include merge provenance for domain grouping.
+            progress_callback: Optional progress callback for domain merging.
+            cancellation_check: Optional cancellation callback for domain merging.
 
         Returns:
             Tuple of (markdown_content, excel_bytes or None).
@@ -1076,7 +1171,11 @@ class ReportService:
         # Aggregate based on group_by
         if group_by == "domain":
             rows, final_columns, labels = await self._aggregate_by_domain(
-                data, extraction_schema, include_merge_metadata
+                data,
+                extraction_schema,
+                include_merge_metadata,
+                progress_callback=progress_callback,
+                cancellation_check=cancellation_check,
             )
         else:  # "source" (default)
             rows, final_columns, labels, _ = self._aggregate_by_source(
@@ -1105,3 +1204,15 @@ class ReportService:
             return md_content, excel_bytes
 
         return md_content, None
+
+
+def _report_progress(
+    callback: ProgressCallback | None, stage: str, completed: int, total: int
+) -> None:
+    if callback is not None:
+        callback(stage, completed, total)
+
+
+async def _check_cancelled(check: CancellationCheck | None) -> None:
+    if check is not None and await check():
+        raise ReportCancelledError("Report generation cancelled")
@@ -1,16 +1,27 @@
 """LLM-based smart merge service for domain-level aggregation."""
 
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
 
+from config import settings
 from services.llm.client import LLMClient
 from services.reports.schema_table_generator import ColumnMetadata
 
 logger = structlog.get_logger(__name__)
 
+CancellationCheck = Callable[[], Awaitable[bool]]
+
+
+class MergeCancelledError(Exception):
+    """Raised before an LLM merge call when cancellation was requested."""
+
 
 @dataclass
 class MergeCandidate:
@@ -32,11 +43,90 @@ class MergeResult:
     reasoning: str | None = None
 
 
+class MergeCache:
+    """Bounded LRU memo of LLM merge results.
+
+    Keyed by column plus a hash of its type, description and allowed enum
+    values and of the candidate set (values, sources and confidences,
+    order-independent), so regenerating a report with unchanged data reuses
+    earlier merges instead of calling the LLM again.
+
+    Args:
+        max_size: Maximum entries kept; least recently used are evicted.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, MergeResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        column_name: str,
+        column_meta: ColumnMetadata,
+        candidates: list[MergeCandidate],
+    ) -> str:
+        """Build the memo key for a column merge."""
+        candidate_set = sorted(
+            json.dumps(
+                [c.source_url, c.source_title, c.value, c.confidence],
+                sort_keys=True,
+                default=str,
+            )
+            for c in candidates
+        )
+        enum_values = sorted(column_meta.enum_values or [], key=str)
+        digest = hashlib.sha256(
+            json.dumps(
+                [
+                    column_meta.field_type,
+                    column_meta.description,
+                    enum_values,
+                    candidate_set,
+                ],
+                default=str,
+            ).encode()
+        ).hexdigest()
+        return f"{column_name}:{digest}"
+
+    def get(self, key: str) -> MergeResult | None:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: MergeResult) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+_shared_cache: MergeCache | None = None
+
+
+def get_merge_cache() -> MergeCache | None:
+    """Return the process-wide merge cache, or None when caching is disabled.
+
+    The cache is sized from ``smart_merge_cache_size`` when first created.
+    """
+    global _shared_cache
+    if settings.smart_merge_cache_size <= 0:
+        return None
+    if _shared_cache is None:
+        _shared_cache = MergeCache(settings.smart_merge_cache_size)
+    return _shared_cache
+
+
 class SmartMergeService:
     """Service for intelligently merging column values across URLs using LLM.
 
     Handles per-column merging for domain-level aggregation. Uses short-circuits
     for trivial cases (all null, single value, all identical) to minimize LLM calls.
+    One service instance can be shared by concurrent merges across many domains;
+    ``max_concurrent`` bounds the LLM calls in flight across all of them.
     """
 
     def __init__(
@@ -44,6 +134,9 @@ class SmartMergeService:
         llm_client: LLMClient,
         max_candidates: int = 100,
         min_confidence: float = 0.3,
+        max_concurrent: int | None = None,
+        cache: MergeCache | None = None,
+        cancellation_check: CancellationCheck | None = None,
     ):
         """Initialize SmartMergeService.
 
@@ -51,10 +144,17 @@ class SmartMergeService:
             llm_client: LLM client for merge synthesis.
             max_candidates: Maximum candidates to include in merge prompt.
             min_confidence: Minimum confidence to include candidate.
+            max_concurrent: Maximum concurrent LLM merge calls (None = unbounded).
+            cache: Optional memo of LLM merge results.
+            cancellation_check: Optional async callback checked once a merge
+                holds an LLM slot, right before its LLM call.
         """
         self._llm_client = llm_client
         self._max_candidates = max_candidates
         self._min_confidence = min_confidence
+        self._semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        self._cache = cache
+        self._cancellation_check = cancellation_check
 
     async def merge_column(
         self,
@@ -76,6 +176,10 @@ class SmartMergeService:
 
         Returns:
             MergeResult with synthesized value and provenance.
+
+        Raises:
+            MergeCancelledError: If cancellation_check returned True before
+                the LLM call.
         """
         # Filter out low-confidence and unknown-confidence candidates
         filtered = [
@@ -122,8 +226,25 @@ class SmartMergeService:
         # Need LLM synthesis - limit candidates
         merge_candidates = non_null[: self._max_candidates]
 
+        cache_key = None
+        if self._cache is not None:
+            cache_key = MergeCache.make_key(column_name, column_meta, merge_candidates)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            return await self._llm_merge(column_name, column_meta, merge_candidates)
+            if self._semaphore is not None:
+                async with self._semaphore:
+                    result = await self._checked_llm_merge(
+                        column_name, column_meta, merge_candidates
+                    )
+            else:
+                result = await self._checked_llm_merge(
+                    column_name, column_meta, merge_candidates
+                )
+        except MergeCancelledError:
+            raise
         except Exception as e:
             logger.error(
                 "llm_merge_failed",
@@ -140,6 +261,22 @@ class SmartMergeService:
                 reasoning=f"LLM merge failed, using highest confidence value: {e}",
             )
 
+        # Only successful merges are memoised so failures are retried next time
+        if cache_key is not None:
+            self._cache.put(cache_key, result)
+        return result
+
+    async def _checked_llm_merge(
+        self,
+        column_name: str,
+        column_meta: ColumnMetadata,
+        candidates: list[MergeCandidate],
+    ) -> MergeResult:
+        """Check for cancellation, then run the LLM merge."""
+        if self._cancellation_check is not None and await self._cancellation_check():
+            raise MergeCancelledError(f"Merge of {column_name} cancelled")
+        return await self._llm_merge(column_name, column_meta, candidates)
+
     async def _llm_merge(
         self,
         column_name: str,
@@ -168,7 +305,7 @@ class SmartMergeService:
         )
 
         # Parse response (already a dict from LLM client)
-        return self._parse_merge_response(response, candidates)
+        return self._parse_merge_response(response)
 
     def _build_merge_prompt(
         self,
@@ -237,19 +374,20 @@ Rules:
 - Prefer values from authoritative pages (product specs, about us) over incidental mentions
 - Higher confidence scores indicate more reliable extractions"""
 
-    def _parse_merge_response(
-        self,
-        response: dict,
-        candidates: list[MergeCandidate],
-    ) -> MergeResult:
+    def _parse_merge_response(self, response: dict) -> MergeResult:
         """Parse LLM response into MergeResult.
 
+        A malformed response raises, so merge_column falls back to the
+        highest-confidence candidate without memoising the fallback.
+
         Args:
             response: Parsed LLM response dict from LLMClient.complete().
-            candidates: Original candidates for fallback.
 
         Returns:
             Parsed MergeResult.
+
+        Raises:
+            TypeError, ValueError: If the response cannot be parsed.
         """
         try:
             # Validate sources_used is a list
@@ -263,20 +401,13 @@ Rules:
                 sources_used=sources,
                 reasoning=response.get("reasoning"),
             )
-        except (KeyError, TypeError, ValueError) as e:
+        except (AttributeError, TypeError, ValueError) as e:
             logger.warning(
                 "merge_response_parse_failed",
                 error=str(e),
                 response=response,
             )
-            # Fallback to highest confidence
-            best = max(candidates, key=lambda c: c.confidence or 0.0)
-            return MergeResult(
-                value=best.value,
-                confidence=best.confidence or 0.5,
-                sources_used=[best.source_url],
-                reasoning=f"Failed to parse LLM response: {e}",
-            )
+            raise ValueError(f"Failed to parse LLM response: {e}") from e
 
     def _values_equal(self, a: Any, b: Any) -> bool:
         """Check if two values are equal, handling various types.
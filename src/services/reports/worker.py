@@ -0,0 +1,160 @@
+"""Background worker for processing report generation jobs."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+from sqlalchemy.orm import Session
+
+from constants import JobStatus
+from models import ReportRequest
+from orm_models import Job
+from services.llm.client import LLMClient
+from services.projects.repository import ProjectRepository
+from services.reports.service import ReportCancelledError, ReportService
+from services.storage.repositories.entity import EntityRepository
+from services.storage.repositories.extraction import ExtractionRepository
+from services.storage.repositories.job import JobRepository
+
+if TYPE_CHECKING:
+    from config import LLMConfig
+    from services.storage.artifact_store import LocalArtifactStore
+
+logger = structlog.get_logger(__name__)
+
+# Minimum seconds between cancellation lookups during generation
+_CANCEL_CHECK_INTERVAL = 5.0
+
+
+class ReportWorker:
+    """Background worker for processing report jobs.
+
+    Handles queued report jobs by:
+    1. Updating job status to "running"
+    2. Running ReportService.generate with progress and cancellation hooks
+    3. Writing binary artifacts to the artifact store
+    4. Updating job with the report id and completion status
+
+    Progress is published to ``job.result`` as
+    ``{"stage": ..., "completed": n, "total": m}`` while the job runs.
+
+    Args:
+        db: Database session for persistence.
+        llm_config: LLM configuration for synthesis and smart merge.
+        artifact_store: Store for xlsx artifacts. None keeps binary content
+            in the database.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        llm_config: LLMConfig,
+        artifact_store: LocalArtifactStore | None = None,
+    ) -> None:
+        self.db = db
+        self._llm_config = llm_config
+        self._artifact_store = artifact_store
+        self.job_repo = JobRepository(db)
+
+    def _progress_callback(self, job: Job):
+        def callback(stage: str, completed: int, total: int) -> None:
+            job.result = {"stage": stage, "completed": completed, "total": total}
+            job.updated_at = datetime.now(UTC)
+            self.db.commit()
+
+        return callback
+
+    def _cancellation_check(self, job: Job):
+        last_check = 0.0
+        last_result = False
+
+        async def check() -> bool:
+            nonlocal last_check, last_result
+            now = time.monotonic()
+            if now - last_check < _CANCEL_CHECK_INTERVAL:
+                return last_result
+            last_check = now
+            last_result = self.job_repo.is_cancellation_requested(job.id)
+            return last_result
+
+        return check
+
+    async def process_job(self, job: Job) -> None:
+        """Process a single report job.
+
+        Args:
+            job: Job instance with type="report" and payload containing
+                project_id and the serialized ReportRequest under "request".
+        """
+        if self.job_repo.is_cancellation_requested(job.id):
+            logger.info("report_job_cancelled_early", job_id=str(job.id))
+            self.job_repo.mark_cancelled(job.id)
+            self.db.commit()
+            return
+
+        job.status = JobStatus.RUNNING
+        if not job.started_at:
+            job.started_at = datetime.now(UTC)
+        self.db.commit()
+
+        try:
+            payload = job.payload or {}
+            project_id = UUID(payload["project_id"])
+            request = ReportRequest.model_validate(payload["request"])
+
+            async with LLMClient(self._llm_config) as llm_client:
+                service = ReportService(
+                    extraction_repo=ExtractionRepository(self.db),
+                    entity_repo=EntityRepository(self.db),
+                    llm_client=llm_client,
+                    db_session=self.db,
+                    project_repo=ProjectRepository(self.db),
+                    artifact_store=self._artifact_store,
+                )
+                report = await service.generate(
+                    project_id,
+                    request,
+                    progress_callback=self._progress_callback(job),
+                    cancellation_check=self._cancellation_check(job),
+                )
+
+            job.status = JobStatus.COMPLETED
+            job.result = {
+                "report_id": str(report.id),
+                "format": report.format,
+                "title": report.title,
+            }
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.info(
+                "report_job_completed",
+                job_id=str(job.id),
+                project_id=str(project_id),
+                report_id=str(report.id),
+            )
+
+        except ReportCancelledError:
+            self.db.rollback()
+            self.job_repo.mark_cancelled(job.id)
+            self.db.commit()
+            logger.info("report_job_cancelled", job_id=str(job.id))
+
+        except Exception as e:
+            self.db.rollback()
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.completed_at = datetime.now(UTC)
+            self.db.commit()
+
+            logger.error(
+                "report_job_failed",
+                job_id=str(job.id),
+                error=str(e),
+                exc_info=True,
+            )
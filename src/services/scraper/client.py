@@ -405,26 +405,36 @@ class FirecrawlClient:
             raise ScrapeError(data.get("error", "Failed to start crawl"))
         return data["id"]
 
-    async def get_crawl_status(self, crawl_id: str) -> CrawlStatus:
+    async def get_crawl_status(
+        self, crawl_id: str, skip: int | None = None
+    ) -> CrawlStatus:
         """Get crawl job status, fetching all paginated results.
 
         When a crawl is completed, Firecrawl may return results across multiple
         pages. This method follows the pagination cursor to collect all pages.
 
+        With ``skip`` set, only results after the first ``skip`` pages are
+        returned and pagination is followed while the crawl is still running,
+        so callers can ingest pages incrementally between polls.
+
         Args:
             crawl_id: Firecrawl job ID.
+            skip: Number of crawl results already consumed (incremental mode).
 
         Returns:
-            CrawlStatus with progress and all pages.
+            CrawlStatus with progress and all pages (past ``skip`` if given).
         """
+        endpoint = f"/v1/crawl/{crawl_id}"
+        if skip:
+            endpoint += f"?skip={skip}"
         logger.debug(
             "firecrawl_get_crawl_status_request",
             crawl_id=crawl_id,
-            endpoint=f"/v1/crawl/{crawl_id}",
+            endpoint=endpoint,
         )
 
         start_time = time.monotonic()
-        response = await self._http_client.get(f"{self.base_url}/v1/crawl/{crawl_id}")
+        response = await self._http_client.get(f"{self.base_url}{endpoint}")
         duration_ms = int((time.monotonic() - start_time) * 1000)
 
         try:
@@ -479,14 +489,16 @@ class FirecrawlClient:
                 error=error,
             )
 
-        # Follow pagination to get all pages when crawl is completed
-        # Max 100 iterations to prevent infinite loops
+        # Follow pagination to get all pages when crawl is completed (or on
+        # every poll in incremental mode). Max 100 iterations to prevent
+        # infinite loops
         page_num = 1
         max_pages = 100
         pagination_start = time.monotonic()
         pagination_errors: list[str] = []
+        follow_next = status == "completed" or skip is not None
 
-        while next_url and status == "completed" and page_num < max_pages:
+        while next_url and follow_next and page_num < max_pages:
             page_num += 1
             logger.debug(
                 "firecrawl_fetching_next_page",
@@ -559,11 +571,12 @@ class FirecrawlClient:
             error = "; ".join(all_errors) if all_errors else None
 
         # Log if we still have a mismatch after pagination
-        if status == "completed" and len(all_pages) != total and total > 0:
+        expected = total - (skip or 0)
+        if status == "completed" and len(all_pages) != expected and total > 0:
             logger.warning(
                 "firecrawl_page_count_mismatch",
                 crawl_id=crawl_id,
-                expected_pages=total,
+                expected_pages=expected,
                 actual_pages=len(all_pages),
                 pages_fetched=page_num,
             )
@@ -21,6 +21,9 @@ from services.storage.repositories.source import SourceRepository
 
 logger = structlog.get_logger(__name__)
 
+# Statuses the baseline "extract all pending" job picks up
+_PENDING_STATUSES = (SourceStatus.PENDING, SourceStatus.READY)
+
 # Minimum URLs from smart crawl map to consider it successful.
 # If fewer URLs are discovered, fall back to traditional crawl.
 SMART_CRAWL_MIN_URLS_THRESHOLD = 3
@@ -130,9 +133,13 @@ class CrawlWorker:
                 )
                 return  # Will be picked up again on next poll
 
-            # Step 2: Check crawl status
+            # Step 2: Check crawl status, fetching only pages past the
+            # ingestion offset so each poll stores what is new
+            pages_ingested = payload.get("pages_ingested", 0)
             poll_start = time.monotonic()
-            status = await self.client.get_crawl_status(firecrawl_job_id)
+            status = await self.client.get_crawl_status(
+                firecrawl_job_id, skip=pages_ingested
+            )
             poll_duration_ms = int((time.monotonic() - poll_start) * 1000)
 
             # Calculate elapsed time since job started
@@ -141,31 +148,6 @@ class CrawlWorker:
                 elapsed_seconds = (datetime.now(UTC) - job.started_at).total_seconds()
             stale_warning = _get_stale_warning(elapsed_seconds)
 
-            # Update progress in result and touch updated_at to prevent redundant polling
-            job.result = {
-                "pages_total": status.total,
-                "pages_completed": status.completed,
-                "sources_created": 0,
-            }
-            job.updated_at = datetime.now(UTC)
-            self.db.commit()
-
-            if status.status == "scraping":
-                log_data = {
-                    "job_id": str(job.id),
-                    "firecrawl_job_id": firecrawl_job_id,
-                    "completed": status.completed,
-                    "total": status.total,
-                    "elapsed_seconds": round(elapsed_seconds, 1),
-                    "poll_duration_ms": poll_duration_ms,
-                }
-                if stale_warning:
-                    log_data["stale_warning"] = stale_warning
-                    logger.warning("crawl_status_polled", **log_data)
-                else:
-                    logger.debug("crawl_status_polled", **log_data)
-                return  # Continue polling
-
             if status.status == "failed":
                 job.status = JobStatus.FAILED
                 job.error = status.error or "Crawl failed"
@@ -174,7 +156,7 @@ class CrawlWorker:
                 logger.error("crawl_failed", job_id=str(job.id), error=status.error)
                 return
 
-            if status.status == "completed":
+            if status.status in ("scraping", "completed"):
                 # Check for cancellation before storing pages
                 # Note: Firecrawl crawl cannot be cancelled, but we can skip storing results
                 if self.job_repo.is_cancellation_requested(job.id):
@@ -188,13 +170,50 @@ class CrawlWorker:
                     job.result = {
                         "cancelled_before_storage": True,
                         "pages_available": len(status.pages),
-                        "pages_stored": 0,
+                        "pages_stored": payload.get("sources_created", 0),
                     }
                     self.db.commit()
                     return
 
-                # Step 3: Store all pages as sources
-                sources_created = await self._store_pages(job, status.pages)
+                # Step 3: Store new pages as sources immediately
+                if status.pages:
+                    await self._ingest_pages(job, status.pages, pages_ingested)
+
+                # Update progress in result and touch updated_at to prevent
+                # redundant polling
+                job.result = {
+                    "pages_total": status.total,
+                    "pages_completed": status.completed,
+                    "sources_created": payload.get("sources_created", 0),
+                }
+                job.updated_at = datetime.now(UTC)
+                self.db.commit()
+
+            if status.status == "scraping" or (
+                # Pagination is capped per poll; keep polling while a
+                # completed crawl still yields pages
+                status.status == "completed"
+                and status.pages
+                and payload["pages_ingested"] < status.total
+            ):
+                log_data = {
+                    "job_id": str(job.id),
+                    "firecrawl_job_id": firecrawl_job_id,
+                    "completed": status.completed,
+                    "total": status.total,
+                    "pages_ingested": payload.get("pages_ingested", 0),
+                    "elapsed_seconds": round(elapsed_seconds, 1),
+                    "poll_duration_ms": poll_duration_ms,
+                }
+                if stale_warning:
+                    log_data["stale_warning"] = stale_warning
+                    logger.warning("crawl_status_polled", **log_data)
+                else:
+                    logger.debug("crawl_status_polled", **log_data)
+                return  # Continue polling
+
+            if status.status == "completed":
+                sources_created = payload.get("sources_created", 0)
 
                 job.status = JobStatus.COMPLETED
                 job.completed_at = datetime.now(UTC)
@@ -213,7 +232,7 @@ class CrawlWorker:
                         firecrawl_job_id=firecrawl_job_id,
                         pages_total=status.total,
                         pages_completed=status.completed,
-                        pages_in_response=len(status.pages),
+                        pages_ingested=payload.get("pages_ingested", 0),
                         url=payload.get("url"),
                         company=payload.get("company"),
                     )
@@ -227,7 +246,12 @@ class CrawlWorker:
 
                 # Step 4: Auto-extract if enabled
                 if payload.get("auto_extract", True):
-                    await self._create_extraction_job(job)
+                    if settings.crawl.extract_batch_size > 0:
+                        # Sources were batched into extraction jobs during
+                        # ingestion; flush the remainder
+                        await self._flush_extraction_batch(job)
+                    else:
+                        await self._create_extraction_job(job)
 
             elif status.status not in ("scraping", "failed", "completed"):
                 # Handle unknown status from Firecrawl
@@ -256,8 +280,88 @@ class CrawlWorker:
                 exc_info=True,
             )
 
-    async def _store_pages(self, job: Job, pages: list[dict]) -> int:
-        """Store crawled pages as Source records."""
+    async def _ingest_pages(
+        self, job: Job, pages: list[dict], pages_ingested: int
+    ) -> None:
+        """Store one poll's new pages and advance the ingestion offset.
+
+        The offset counts Firecrawl results (including skipped pages), so the
+        next poll resumes exactly after them. With auto-extract and a positive
+        extract batch size, stored sources awaiting extraction are queued in
+        micro-batches while the crawl is still running.
+        """
+        pending_source_ids: list[str] = []
+        created = await self._store_pages(
+            job, pages, pending_source_ids=pending_source_ids
+        )
+
+        payload = job.payload
+        payload["pages_ingested"] = pages_ingested + len(pages)
+        payload["sources_created"] = payload.get("sources_created", 0) + created
+
+        batch_size = settings.crawl.extract_batch_size
+        if payload.get("auto_extract", True) and batch_size > 0:
+            queued = payload.get("pending_extract_source_ids", [])
+            pending = queued + [s for s in pending_source_ids if s not in queued]
+            payload["pending_extract_source_ids"] = pending
+            if len(pending) >= batch_size:
+                await self._flush_extraction_batch(job)
+
+        flag_modified(job, "payload")
+        self.db.commit()
+
+        logger.info(
+            "crawl_pages_ingested",
+            job_id=str(job.id),
+            pages=len(pages),
+            sources_created=created,
+            pages_ingested=payload["pages_ingested"],
+        )
+
+    async def _flush_extraction_batch(self, crawl_job: Job) -> None:
+        """Queue extraction for sources ingested since the last batch."""
+        payload = crawl_job.payload
+        source_ids = payload.get("pending_extract_source_ids") or []
+        if not source_ids:
+            return
+
+        extract_job = Job(
+            id=uuid4(),
+            type="extract",
+            status="queued",
+            payload={
+                "project_id": payload["project_id"],
+                "source_ids": source_ids,
+                "profile": payload.get("profile"),
+            },
+        )
+        self.db.add(extract_job)
+        payload["pending_extract_source_ids"] = []
+        flag_modified(crawl_job, "payload")
+        self.db.commit()
+
+        logger.info(
+            "extraction_batch_created",
+            crawl_job_id=str(crawl_job.id),
+            extract_job_id=str(extract_job.id),
+            source_count=len(source_ids),
+        )
+
+    async def _store_pages(
+        self,
+        job: Job,
+        pages: list[dict],
+        pending_source_ids: list[str] | None = None,
+    ) -> int:
+        """Store crawled pages as Source records.
+
+        Args:
+            job: Crawl job the pages belong to.
+            pages: Firecrawl page results.
+            pending_source_ids: Optional list that receives the ids of stored
+                sources awaiting extraction: new ones, and re-crawled existing
+                ones that are still pending (the upsert keeps their status).
+        """
         project_id = job.payload["project_id"]
         company = job.payload["company"]
         sources_created = 0
@@ -369,6 +473,10 @@ class CrawlWorker:
                 sources_created += 1
             else:
                 logger.debug("source_already_exists", uri=url)
+            if pending_source_ids is not None and (
+                created or source.status in _PENDING_STATUSES
+            ):
+                pending_source_ids.append(str(source.id))
 
         self.db.commit()
         return sources_created
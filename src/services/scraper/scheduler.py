@@ -4,6 +4,7 @@ import asyncio
 from datetime import UTC, datetime, timedelta
 
 import structlog
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 logger = structlog.get_logger(__name__)
@@ -12,13 +13,25 @@ from config import settings
 from constants import JobStatus, JobType
 from database import SessionLocal
 from orm_models import Job
+from services.extraction.backfill_worker import BackfillWorker
 from services.extraction.consolidation_worker import ConsolidationWorker
+from services.extraction.dedup_worker import DedupWorker
 from services.extraction.worker import ExtractionWorker
+from services.reports.worker import ReportWorker
 from services.scraper.crawl_worker import CrawlWorker
 from services.scraper.service_container import ServiceContainer
 from services.scraper.worker import ScraperWorker
+from services.storage.artifact_store import (
+    delete_orphan_artifacts,
+    get_artifact_store,
+)
+from services.storage.repositories.content_blob import ContentBlobRepository
 from shutdown import get_shutdown_manager
 
+# Job types that checkpoint their progress: running jobs of these types left
+# behind by a crashed instance are requeued and resume instead of failing
+_RESUMABLE_TYPES = frozenset({JobType.BACKFILL})
+
 
 # Per-job-type stale thresholds
 # These prevent long-running jobs from being incorrectly marked as stale
@@ -35,6 +48,9 @@ def get_stale_thresholds() -> dict[str, timedelta]:
         JobType.CONSOLIDATE: timedelta(
             seconds=1800
         ),  # 30 minutes for LLM consolidation
+        JobType.REPORT: timedelta(seconds=1800),  # 30 minutes for LLM smart merge
+        JobType.DEDUP: timedelta(seconds=1800),  # 30 minutes for large projects
+        JobType.BACKFILL: timedelta(seconds=600),  # checkpoints after every batch
         "default": timedelta(seconds=600),  # 10 minutes default
     }
 
@@ -66,19 +82,25 @@ class JobScheduler:
         self._scrape_task: asyncio.Task | None = None
         self._extract_task: asyncio.Task | None = None
         self._consolidate_task: asyncio.Task | None = None
+        self._report_task: asyncio.Task | None = None
+        self._dedup_task: asyncio.Task | None = None
+        self._backfill_task: asyncio.Task | None = None
         self._crawl_tasks: list[asyncio.Task] = []
 
     async def start(self) -> None:
         """Start the background scheduler.
 
-        Performs startup cleanup of stale jobs, then starts worker loops
-        with a configurable stagger delay between each.
+        Performs startup cleanup of stale jobs, orphaned content blobs and
+        orphaned report artifacts, then starts worker loops with a
+        configurable stagger delay between each.
         """
         self._running = True
 
         # Startup resilience: cleanup stale jobs from previous instance
         if settings.scheduler.cleanup_stale_on_startup:
             await self._cleanup_stale_jobs()
+            await self._sweep_orphan_blobs()
+            await self._sweep_orphan_artifacts()
 
         # Startup resilience: stagger worker creation
         stagger = settings.scheduler.startup_stagger_seconds
@@ -104,6 +126,18 @@ class JobScheduler:
             await asyncio.sleep(stagger)
         self._consolidate_task = asyncio.create_task(self._run_consolidate_worker())
 
+        if stagger > 0:
+            await asyncio.sleep(stagger)
+        self._report_task = asyncio.create_task(self._run_report_worker())
+
+        if stagger > 0:
+            await asyncio.sleep(stagger)
+        self._dedup_task = asyncio.create_task(self._run_dedup_worker())
+
+        if stagger > 0:
+            await asyncio.sleep(stagger)
+        self._backfill_task = asyncio.create_task(self._run_backfill_worker())
+
     async def stop(self) -> None:
         """Stop the background scheduler gracefully.
 
@@ -119,6 +153,12 @@ class JobScheduler:
             await self._extract_task
         if self._consolidate_task:
             await self._consolidate_task
+        if self._report_task:
+            await self._report_task
+        if self._dedup_task:
+            await self._dedup_task
+        if self._backfill_task:
+            await self._backfill_task
 
     def _claim_and_release_lock(self, db: Session, job: Job) -> None:
         """Commit immediately to release FOR UPDATE row lock.
@@ -139,12 +179,14 @@ class JobScheduler:
 
         At startup, no jobs can be legitimately running since the process
         just started. Any jobs in running/cancelling state are leftovers
-        from a crashed previous instance.
+        from a crashed previous instance. Running jobs of resumable types
+        are requeued instead, to continue from their checkpoint.
         """
         db = SessionLocal()
         try:
             now = datetime.now(UTC)
             counts: dict[str, int] = {}
+            requeued = 0
             for status in (JobStatus.RUNNING, JobStatus.CANCELLING):
                 stale = (
                     db.query(Job)
@@ -153,6 +195,15 @@ class JobScheduler:
                     .all()
                 )
                 for job in stale:
+                    if status == JobStatus.RUNNING and job.type in _RESUMABLE_TYPES:
+                        job.status = JobStatus.QUEUED
+                        requeued += 1
+                        logger.warning(
+                            "startup_requeue_resumable_job",
+                            job_id=str(job.id),
+                            job_type=job.type,
+                        )
+                        continue
                     job.status = JobStatus.FAILED
                     job.error = (
                         f"Server restart: was {status} when previous instance stopped"
@@ -165,6 +216,7 @@ class JobScheduler:
                         previous_status=status,
                     )
                 counts[status] = len(stale)
+            counts["requeued"] = requeued
             db.commit()
             total = sum(counts.values())
             logger.info("scheduler_startup_cleanup", total=total, **counts)
@@ -176,6 +228,34 @@ class JobScheduler:
         finally:
             db.close()
 
+    async def _sweep_orphan_blobs(self) -> int:
+        """Delete content blobs left unreferenced by recrawls and deletes."""
+        db = SessionLocal()
+        try:
+            deleted = ContentBlobRepository(db).delete_orphans()
+            db.commit()
+            logger.info("scheduler_startup_blob_sweep", blobs_deleted=deleted)
+            return deleted
+        except Exception as e:
+            db.rollback()
+            logger.error("startup_blob_sweep_failed", error=str(e))
+            return 0
+        finally:
+            db.close()
+
+    async def _sweep_orphan_artifacts(self) -> int:
+        """Delete report artifacts whose reports were removed."""
+        db = SessionLocal()
+        try:
+            return await asyncio.to_thread(
+                delete_orphan_artifacts, db, get_artifact_store()
+            )
+        except Exception as e:
+            logger.error("startup_artifact_sweep_failed", error=str(e))
+            return 0
+        finally:
+            db.close()
+
     async def _run_scrape_worker(self) -> None:
         """Main loop for processing scrape jobs.
 
@@ -430,6 +510,7 @@ class JobScheduler:
                         worker = ConsolidationWorker(
                             db=db,
                             llm_config=settings.llm,
+                            consolidation=settings.consolidation,
                         )
                         await worker.process_job(job)
                     else:
@@ -442,6 +523,157 @@ class JobScheduler:
                 logger.error("consolidate_worker_error", error=str(e), exc_info=True)
                 await asyncio.sleep(self.poll_interval)
 
+    async def _run_report_worker(self) -> None:
+        """Main loop for processing report generation jobs.
+
+        Continuously polls database for queued report jobs and processes them.
+        """
+        shutdown = get_shutdown_manager()
+        while self._running and not shutdown.is_shutting_down:
+            try:
+                db: Session = SessionLocal()
+                try:
+                    job = (
+                        db.query(Job)
+                        .filter(
+                            Job.type == JobType.REPORT,
+                            # Jobs cancelled while still queued are picked up
+                            # so the worker can mark them cancelled
+                            or_(
+                                Job.status == JobStatus.QUEUED,
+                                and_(
+                                    Job.status == JobStatus.CANCELLING,
+                                    Job.started_at.is_(None),
+                                ),
+                            ),
+                        )
+                        .order_by(Job.priority.desc(), Job.created_at.asc())
+                        .with_for_update(skip_locked=True)
+                        .first()
+                    )
+
+                    if job:
+                        self._claim_and_release_lock(db, job)
+                        worker = ReportWorker(
+                            db=db,
+                            llm_config=settings.llm,
+                            artifact_store=get_artifact_store(),
+                        )
+                        await worker.process_job(job)
+                    else:
+                        await asyncio.sleep(self.poll_interval)
+
+                finally:
+                    db.close()
+
+            except Exception as e:
+                logger.error("report_worker_error", error=str(e), exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _run_dedup_worker(self) -> None:
+        """Main loop for processing boilerplate analysis jobs.
+
+        Continuously polls database for queued dedup jobs and processes them.
+        """
+        shutdown = get_shutdown_manager()
+        while self._running and not shutdown.is_shutting_down:
+            try:
+                db: Session = SessionLocal()
+                try:
+                    job = (
+                        db.query(Job)
+                        .filter(
+                            Job.type == JobType.DEDUP,
+                            Job.status == JobStatus.QUEUED,
+                        )
+                        .order_by(Job.priority.desc(), Job.created_at.asc())
+                        .with_for_update(skip_locked=True)
+                        .first()
+                    )
+
+                    if job:
+                        self._claim_and_release_lock(db, job)
+                        worker = DedupWorker(db=db, extraction=settings.extraction)
+                        await worker.process_job(job)
+                    else:
+                        await asyncio.sleep(self.poll_interval)
+
+                finally:
+                    db.close()
+
+            except Exception as e:
+                logger.error("dedup_worker_error", error=str(e), exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _run_backfill_worker(self) -> None:
+        """Main loop for processing grounding backfill jobs.
+
+        Continuously polls database for queued backfill jobs and processes
+        them. Running jobs whose checkpoint went stale (their worker died)
+        are picked up again and resume after their last committed batch.
+        """
+        shutdown = get_shutdown_manager()
+        while self._running and not shutdown.is_shutting_down:
+            try:
+                db: Session = SessionLocal()
+                try:
+                    job = (
+                        db.query(Job)
+                        .filter(
+                            Job.type == JobType.BACKFILL,
+                            # Jobs cancelled while still queued are picked up
+                            # so the worker can mark them cancelled
+                            or_(
+                                Job.status == JobStatus.QUEUED,
+                                and_(
+                                    Job.status == JobStatus.CANCELLING,
+                                    Job.started_at.is_(None),
+                                ),
+                            ),
+                        )
+                        .order_by(Job.priority.desc(), Job.created_at.asc())
+                        .with_for_update(skip_locked=True)
+                        .first()
+                    )
+
+                    # If no queued jobs, check for stale running jobs
+                    if not job:
+                        thresholds = get_stale_thresholds()
+                        stale_threshold = (
+                            datetime.now(UTC) - thresholds[JobType.BACKFILL]
+                        )
+                        job = (
+                            db.query(Job)
+                            .filter(
+                                Job.type == JobType.BACKFILL,
+                                Job.status == JobStatus.RUNNING,
+                                Job.updated_at < stale_threshold,
+                            )
+                            .order_by(Job.priority.desc(), Job.created_at.asc())
+                            .with_for_update(skip_locked=True)
+                            .first()
+                        )
+                        if job:
+                            logger.warning(
+                                "backfill_recovering_stale_job",
+                                job_id=str(job.id),
+                                updated_at=str(job.updated_at),
+                            )
+
+                    if job:
+                        self._claim_and_release_lock(db, job)
+                        worker = BackfillWorker(db=db, extraction=settings.extraction)
+                        await worker.process_job(job)
+                    else:
+                        await asyncio.sleep(self.poll_interval)
+
+                finally:
+                    db.close()
+
+            except Exception as e:
+                logger.error("backfill_worker_error", error=str(e), exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+
 
 # Global instances for start_scheduler()/stop_scheduler()
 _container: ServiceContainer | None = None
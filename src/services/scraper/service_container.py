@@ -15,6 +15,7 @@ from config import settings
 from qdrant_connection import qdrant_client
 from redis_client import get_async_redis, redis_client
 from services.extraction.embedding_pipeline import ExtractionEmbeddingService
+from services.extraction.process_pools import shutdown_process_pools
 from services.llm.queue import LLMRequestQueue
 from services.llm.worker import LLMWorker
 from services.scraper.client import FirecrawlClient
@@ -135,10 +136,14 @@ class ServiceContainer:
             if self._async_redis:
                 await self._async_redis.close()
 
+        async def _shutdown_pools() -> None:
+            shutdown_process_pools()
+
         for name, coro in [
             ("llm_worker", _stop_llm()),
             ("firecrawl", _close_firecrawl()),
             ("redis", _close_redis()),
+            ("process_pools", _shutdown_pools()),
         ]:
             try:
                 await asyncio.wait_for(coro, timeout=timeout)
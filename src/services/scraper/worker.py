@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from constants import JobStatus, SourceStatus
 from orm_models import Job
+from services.metrics.instruments import SCRAPE_SECONDS
 from services.projects.repository import ProjectRepository
 from services.scraper.client import FirecrawlClient
 from services.scraper.rate_limiter import DomainRateLimiter, RateLimitExceeded
@@ -240,7 +241,8 @@ class ScraperWorker:
         async def do_scrape():
             if self.rate_limiter:
                 await self.rate_limiter.acquire(domain)
-            return await self.client.scrape(url)
+            with SCRAPE_SECONDS.time(domain=domain):
+                return await self.client.scrape(url)
 
         try:
             return await retry_with_backoff(
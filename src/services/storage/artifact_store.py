@@ -0,0 +1,190 @@
+"""Content-addressed file store for generated artifacts (report workbooks).
+
+Artifacts are keyed by the SHA-256 of their bytes and written under a
+two-level fan-out (``<root>/ab/cd/abcd...``) so no directory grows unbounded.
+Identical artifacts share one file, writes are atomic (temp file + rename),
+and reads are chunked so downloads can be streamed without loading the whole
+file into memory. Because files are shared, they are not deleted with a
+report; ``delete_orphan_artifacts`` removes those no report references.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config import settings
+from orm_models import Report
+
+logger = structlog.get_logger(__name__)
+
+_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Unreferenced artifacts younger than this are kept: the report row pointing
+# at a freshly written artifact may not be committed yet
+ORPHAN_GRACE_PERIOD = timedelta(hours=1)
+
+
+class ArtifactNotFoundError(Exception):
+    """Raised when an artifact key has no stored file."""
+
+
+class LocalArtifactStore:
+    """Content-addressed artifact store backed by a local directory.
+
+    Args:
+        root: Directory under which artifacts are stored. Created on first write.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _path(self, key: str) -> Path:
+        if not _KEY_RE.match(key):
+            raise ValueError(f"Invalid artifact key: {key!r}")
+        return self._root / key[:2] / key[2:4] / key
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and return their content key.
+
+        Storing the same content twice is a no-op that returns the same key.
+        """
+        key = hashlib.sha256(data).hexdigest()
+        path = self._path(key)
+        if path.exists():
+            # Restart the orphan grace period for the report about to use it
+            try:
+                os.utime(path)
+                return key
+            except FileNotFoundError:
+                pass  # Swept concurrently; write it again
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.debug("artifact_stored", key=key, size=len(data))
+        return key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def size(self, key: str) -> int:
+        """Return the stored artifact size in bytes."""
+        try:
+            return self._path(key).stat().st_size
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(key) from e
+
+    def read(self, key: str) -> bytes:
+        """Read a whole artifact into memory."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(key) from e
+
+    def iter_chunks(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield an artifact in chunks for streaming responses.
+
+        The file is opened eagerly so a missing artifact raises
+        ArtifactNotFoundError before any response headers are sent.
+        """
+        try:
+            f = self._path(key).open("rb")
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(key) from e
+
+        def _chunks() -> Iterator[bytes]:
+            with f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+
+        return _chunks()
+
+    def delete(self, key: str) -> bool:
+        """Delete an artifact. Returns False if it did not exist."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield the keys of all stored artifacts."""
+        for path in self._root.glob("??/??/*"):
+            if _KEY_RE.match(path.name):
+                yield path.name
+
+    def delete_unreferenced(
+        self, referenced: set[str], older_than: timedelta = ORPHAN_GRACE_PERIOD
+    ) -> int:
+        """Delete artifacts not in ``referenced`` and unmodified for older_than.
+
+        Returns:
+            Number of artifacts deleted.
+        """
+        cutoff = time.time() - older_than.total_seconds()
+        deleted = 0
+        for key in list(self.iter_keys()):
+            if key in referenced:
+                continue
+            try:
+                if self._path(key).stat().st_mtime >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            deleted += self.delete(key)
+        return deleted
+
+
+def get_artifact_store() -> LocalArtifactStore:
+    """Build the artifact store configured in settings."""
+    return LocalArtifactStore(settings.report_artifact_dir)
+
+
+def delete_orphan_artifacts(
+    session: Session,
+    store: LocalArtifactStore,
+    older_than: timedelta = ORPHAN_GRACE_PERIOD,
+) -> int:
+    """Delete artifacts that no report references.
+
+    Reports removed by the project foreign-key cascade leave their files
+    behind; this reclaims them.
+
+    Returns:
+        Number of artifacts deleted.
+    """
+    referenced = set(
+        session.execute(
+            select(Report.artifact_key).where(Report.artifact_key.is_not(None))
+        ).scalars()
+    )
+    deleted = store.delete_unreferenced(referenced, older_than)
+    if deleted:
+        logger.info("orphan_artifacts_deleted", count=deleted)
+    return deleted
@@ -0,0 +1,43 @@
+"""Normalised content fingerprints for change detection.
+
+Sources are fingerprinted at ingest so that recrawls of unchanged pages can be
+recognised without comparing full markdown. Normalisation makes the hash stable
+across cosmetic differences a re-scrape commonly introduces (Unicode
+composition, line endings, trailing spaces, runs of blank lines) while any
+change to the visible text still produces a different hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+_HORIZONTAL_WS_RE = re.compile(r"[^\S\n]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def normalize_content(content: str) -> str:
+    """Normalise markdown content for hashing.
+
+    Applies NFC Unicode normalisation, converts line endings to ``\\n``,
+    collapses horizontal whitespace runs to a single space, strips each line
+    and collapses consecutive blank lines.
+    """
+    text = unicodedata.normalize("NFC", content)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _HORIZONTAL_WS_RE.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+def compute_content_hash(content: str | None) -> str | None:
+    """Return the SHA-256 hex digest of normalised content.
+
+    Returns None when there is no content, so empty sources never compare
+    equal to a previous extraction.
+    """
+    if not content:
+        return None
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
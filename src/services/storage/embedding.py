@@ -8,6 +8,7 @@ from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config import LLMConfig
+from services.metrics.instruments import EMBEDDING_REQUEST_SECONDS, EMBEDDING_TEXTS
 
 logger = structlog.get_logger(__name__)
 
@@ -97,10 +98,12 @@ class EmbeddingService:
             text = text[:MAX_EMBED_CHARS]
 
         async with self._get_semaphore():
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text,
-            )
+            with EMBEDDING_REQUEST_SECONDS.time(operation="embed"):
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=text,
+                )
+            EMBEDDING_TEXTS.inc(operation="embed")
             return response.data[0].embedding
 
     @retry(
@@ -131,10 +134,12 @@ class EmbeddingService:
                 truncated.append(t)
 
         async with self._get_semaphore():
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=truncated,
-            )
+            with EMBEDDING_REQUEST_SECONDS.time(operation="embed_batch"):
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=truncated,
+                )
+            EMBEDDING_TEXTS.inc(len(truncated), operation="embed_batch")
             return [item.embedding for item in response.data]
 
     async def _get_http_client(self) -> httpx.AsyncClient:
@@ -183,15 +188,17 @@ class EmbeddingService:
         async with self._get_semaphore():
             # Use shared httpx client for rerank (openai client doesn't support it)
             http_client = await self._get_http_client()
-            response = await http_client.post(
-                f"{self.client.base_url}rerank",
-                json={
-                    "model": model,
-                    "query": query,
-                    "documents": documents,
-                },
-                headers={"Authorization": f"Bearer {self.client.api_key}"},
-            )
+            with EMBEDDING_REQUEST_SECONDS.time(operation="rerank"):
+                response = await http_client.post(
+                    f"{self.client.base_url}rerank",
+                    json={
+                        "model": model,
+                        "query": query,
+                        "documents": documents,
+                    },
+                    headers={"Authorization": f"Bearer {self.client.api_key}"},
+                )
+            EMBEDDING_TEXTS.inc(len(documents), operation="rerank")
             response.raise_for_status()
             data = response.json()
 
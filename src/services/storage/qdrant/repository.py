@@ -15,6 +15,8 @@ from qdrant_client.models import (
     VectorParams,
 )
 
+from services.metrics.instruments import QDRANT_REQUEST_SECONDS
+
 
 @dataclass
 class EmbeddingItem:
@@ -96,20 +98,21 @@ class QdrantRepository:
 
         # Run sync operation in executor
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self.client.upsert,
-                collection_name=self.collection_name,
-                points=[
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload=payload,
-                    )
-                ],
-            ),
-        )
+        with QDRANT_REQUEST_SECONDS.time(operation="upsert"):
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.client.upsert,
+                    collection_name=self.collection_name,
+                    points=[
+                        PointStruct(
+                            id=point_id,
+                            vector=embedding,
+                            payload=payload,
+                        )
+                    ],
+                ),
+            )
 
         return point_id
 
@@ -137,14 +140,15 @@ class QdrantRepository:
 
         # Run sync operation in executor
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self.client.upsert,
-                collection_name=self.collection_name,
-                points=points,
-            ),
-        )
+        with QDRANT_REQUEST_SECONDS.time(operation="upsert"):
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.client.upsert,
+                    collection_name=self.collection_name,
+                    points=points,
+                ),
+            )
 
         return [str(item.extraction_id) for item in items]
 
@@ -175,16 +179,17 @@ class QdrantRepository:
 
         # Run sync operation in executor
         loop = asyncio.get_event_loop()
-        search_results = await loop.run_in_executor(
-            None,
-            partial(
-                self.client.search,
-                collection_name=self.collection_name,
-                query_vector=query_embedding,
-                limit=limit,
-                query_filter=query_filter,
-            ),
-        )
+        with QDRANT_REQUEST_SECONDS.time(operation="search"):
+            search_results = await loop.run_in_executor(
+                None,
+                partial(
+                    self.client.search,
+                    collection_name=self.collection_name,
+                    query_vector=query_embedding,
+                    limit=limit,
+                    query_filter=query_filter,
+                ),
+            )
 
         # Convert to SearchResult objects
         return [
@@ -209,14 +214,15 @@ class QdrantRepository:
 
         # Run sync operation in executor
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self.client.delete,
-                collection_name=self.collection_name,
-                points_selector=[point_id],
-            ),
-        )
+        with QDRANT_REQUEST_SECONDS.time(operation="delete"):
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.client.delete,
+                    collection_name=self.collection_name,
+                    points_selector=[point_id],
+                ),
+            )
 
         return True
 
@@ -236,13 +242,14 @@ class QdrantRepository:
 
         # Run sync operation in executor (consistent with other methods)
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            partial(
-                self.client.delete,
-                collection_name=self.collection_name,
-                points_selector=point_ids,
-            ),
-        )
+        with QDRANT_REQUEST_SECONDS.time(operation="delete"):
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.client.delete,
+                    collection_name=self.collection_name,
+                    points_selector=point_ids,
+                ),
+            )
 
         return len(point_ids)
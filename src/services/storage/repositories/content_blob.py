@@ -0,0 +1,146 @@
+"""Repository for compressed, content-addressed page bodies."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+import zstandard
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from orm_models import ContentBlob, Source
+
+ZSTD_CODEC = "zstd"
+
+# Decompressed bodies are immutable per hash, so a process-wide LRU is safe
+_CACHE_MAX_ENTRIES = 256
+_cache: OrderedDict[str, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Unreferenced blobs younger than this are kept: put() runs before the
+# source row referencing the blob is committed by a concurrent writer
+ORPHAN_GRACE_PERIOD = timedelta(hours=1)
+
+
+def blob_hash(text: str) -> str:
+    """Return the content address (SHA-256 of the UTF-8 bytes) for text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    with _cache_lock:
+        text = _cache.get(key)
+        if text is not None:
+            _cache.move_to_end(key)
+        return text
+
+
+def _cache_put(key: str, text: str) -> None:
+    with _cache_lock:
+        _cache[key] = text
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+class ContentBlobRepository:
+    """Stores text bodies zstd-compressed and deduplicated by SHA-256.
+
+    Identical bodies (recrawls, shared boilerplate pages, other projects)
+    are stored once; writing an existing hash only refreshes its created_at.
+    Blobs are never deleted on write, so bodies replaced by recrawls or left
+    behind by deleted sources are removed by delete_orphans().
+    """
+
+    def __init__(self, session: Session, compression_level: int = 3):
+        """Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy session for database operations
+            compression_level: zstd compression level (1-22)
+        """
+        self._session = session
+        self._compression_level = compression_level
+
+    def put(self, text: str) -> str:
+        """Store text and return its content hash."""
+        key = blob_hash(text)
+        raw = text.encode("utf-8")
+        data = zstandard.ZstdCompressor(level=self._compression_level).compress(raw)
+        stmt = (
+            pg_insert(ContentBlob)
+            .values(hash=key, codec=ZSTD_CODEC, size=len(raw), data=data)
+            # Restart the orphan grace period so a concurrent sweep cannot
+            # delete a blob that a not-yet-committed source is about to use
+            .on_conflict_do_update(
+                index_elements=[ContentBlob.hash],
+                set_={"created_at": func.now()},
+            )
+        )
+        self._session.execute(stmt)
+        _cache_put(key, text)
+        return key
+
+    def get(self, key: str) -> str | None:
+        """Return the decompressed text for a hash, or None if missing."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Return decompressed texts for the given hashes in one query.
+
+        Missing hashes are omitted from the result.
+        """
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            text = _cache_get(key)
+            if text is None:
+                missing.append(key)
+            else:
+                found[key] = text
+
+        if missing:
+            rows = self._session.execute(
+                select(ContentBlob.hash, ContentBlob.codec, ContentBlob.data).where(
+                    ContentBlob.hash.in_(missing)
+                )
+            )
+            decompressor = zstandard.ZstdDecompressor()
+            for key, codec, data in rows:
+                if codec != ZSTD_CODEC:
+                    raise ValueError(f"Unsupported content blob codec: {codec}")
+                text = decompressor.decompress(data).decode("utf-8")
+                _cache_put(key, text)
+                found[key] = text
+
+        return found
+
+    def delete_orphans(self, older_than: timedelta = ORPHAN_GRACE_PERIOD) -> int:
+        """Delete blobs that no source references.
+
+        Args:
+            older_than: Only blobs created at least this long ago are
+                deleted, so bodies of uncommitted concurrent writes survive.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        cutoff = datetime.now(UTC) - older_than
+        stmt = (
+            delete(ContentBlob)
+            .where(
+                ContentBlob.created_at < cutoff,
+                ~exists().where(Source.content_blob_hash == ContentBlob.hash),
+                ~exists().where(Source.raw_content_blob_hash == ContentBlob.hash),
+            )
+            .returning(ContentBlob.hash)
+        )
+        deleted = list(self._session.execute(stmt).scalars())
+        with _cache_lock:
+            for key in deleted:
+                _cache.pop(key, None)
+        return len(deleted)
@@ -29,6 +29,7 @@ class DomainBoilerplateRepository:
         threshold_pct: float = 0.7,
         min_pages: int = 5,
         min_block_chars: int = 50,
+        content_digest: str | None = None,
     ) -> DomainBoilerplate:
         """Insert or update a domain boilerplate fingerprint.
 
@@ -43,6 +44,7 @@ class DomainBoilerplateRepository:
             threshold_pct: Threshold fraction used for detection.
             min_pages: Minimum pages parameter used.
             min_block_chars: Minimum block chars parameter used.
+            content_digest: Digest of analysed source content and parameters.
 
         Returns:
             DomainBoilerplate instance (created or updated).
@@ -58,6 +60,7 @@ class DomainBoilerplateRepository:
             "threshold_pct": threshold_pct,
             "min_pages": min_pages,
             "min_block_chars": min_block_chars,
+            "content_digest": content_digest,
         }
 
         stmt = pg_insert(DomainBoilerplate).values(**values)
@@ -72,6 +75,7 @@ class DomainBoilerplateRepository:
                 "threshold_pct": stmt.excluded.threshold_pct,
                 "min_pages": stmt.excluded.min_pages,
                 "min_block_chars": stmt.excluded.min_block_chars,
+                "content_digest": stmt.excluded.content_digest,
             },
         ).returning(DomainBoilerplate.id)
 
@@ -5,10 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.orm import Session
 
 from orm_models import Entity, Extraction, ExtractionEntity
+from services.storage.pagination import (
+    CountMode,
+    Keyset,
+    count_rows,
+    paginate,
+)
 
 
 @dataclass
@@ -20,6 +26,10 @@ class EntityFilters:
     entity_type: str | None = None
 
 
+# Order of listings (sorted by value); id breaks ties for keyset cursors
+LIST_ORDER = Keyset(Entity.value, Entity.id, descending=False)
+
+
 class EntityRepository:
     """Repository for managing Entity entities and extraction links."""
 
@@ -209,6 +219,58 @@ class EntityRepository:
         result = self._session.execute(query)
         return list(result.all())
 
+    def _select(self, filters: EntityFilters) -> Select:
+        """Select entity rows matching filters (unordered)."""
+        query = select(Entity)
+        conditions = self._build_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+        return query
+
+    def count_total(
+        self, filters: EntityFilters, mode: CountMode = "exact"
+    ) -> tuple[int, bool]:
+        """Count entities matching filters for a paginated listing.
+
+        Args:
+            filters: EntityFilters instance with filter criteria
+            mode: "exact" for COUNT(*), "estimate" for the planner estimate
+
+        Returns:
+            Tuple of (count, whether it is an estimate)
+        """
+        return count_rows(self._session, self._select(filters), mode)
+
+    def list_page(
+        self,
+        filters: EntityFilters,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[Entity], str | None]:
+        """List one page of entities in LIST_ORDER.
+
+        Args:
+            filters: EntityFilters instance with filter criteria
+            limit: Page size
+            offset: Number of results to skip (ignored with cursor)
+            cursor: Keyset cursor from the previous page
+
+        Returns:
+            Tuple of (page, cursor for the next page or None)
+
+        Raises:
+            InvalidCursorError: If cursor is malformed
+        """
+        return paginate(
+            self._session,
+            self._select(filters),
+            LIST_ORDER,
+            limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
     def list(
         self,
         filters: EntityFilters,
@@ -232,7 +294,7 @@ class EntityRepository:
             query = query.where(and_(*conditions))
 
         # Sort by value for consistent ordering
-        query = query.order_by(Entity.value)
+        query = query.order_by(*LIST_ORDER.order_by())
 
         # Apply pagination
         if offset > 0:
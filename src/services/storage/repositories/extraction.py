@@ -6,10 +6,16 @@ from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.orm import Session
 
 from orm_models import Extraction
+from services.storage.pagination import (
+    CountMode,
+    Keyset,
+    count_rows,
+    paginate,
+)
 
 
 @dataclass
@@ -24,6 +30,10 @@ class ExtractionFilters:
     max_confidence: float | None = None
 
 
+# Order of listings (most recent first); id breaks ties for keyset cursors
+LIST_ORDER = Keyset(Extraction.created_at, Extraction.id)
+
+
 class ExtractionRepository:
     """Repository for managing Extraction entities."""
 
@@ -188,6 +198,58 @@ class ExtractionRepository:
         result = self._session.execute(query)
         return result.scalar_one()
 
+    def _select(self, filters: ExtractionFilters) -> Select:
+        """Select extraction rows matching filters (unordered)."""
+        query = select(Extraction)
+        conditions = self._build_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+        return query
+
+    def count_total(
+        self, filters: ExtractionFilters, mode: CountMode = "exact"
+    ) -> tuple[int, bool]:
+        """Count extractions matching filters for a paginated listing.
+
+        Args:
+            filters: ExtractionFilters instance with filter criteria
+            mode: "exact" for COUNT(*), "estimate" for the planner estimate
+
+        Returns:
+            Tuple of (count, whether it is an estimate)
+        """
+        return count_rows(self._session, self._select(filters), mode)
+
+    def list_page(
+        self,
+        filters: ExtractionFilters,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[Extraction], str | None]:
+        """List one page of extractions in LIST_ORDER.
+
+        Args:
+            filters: ExtractionFilters instance with filter criteria
+            limit: Page size
+            offset: Number of results to skip (ignored with cursor)
+            cursor: Keyset cursor from the previous page
+
+        Returns:
+            Tuple of (page, cursor for the next page or None)
+
+        Raises:
+            InvalidCursorError: If cursor is malformed
+        """
+        return paginate(
+            self._session,
+            self._select(filters),
+            LIST_ORDER,
+            limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
     def list(
         self,
         filters: ExtractionFilters,
@@ -219,7 +281,7 @@ class ExtractionRepository:
             query = query.where(and_(*conditions))
 
         # Sort by created_at descending (most recent first)
-        query = query.order_by(Extraction.created_at.desc())
+        query = query.order_by(*LIST_ORDER.order_by())
 
         # Apply pagination
         if offset > 0:
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
+from config import SourceStorageConfig, settings
 from orm_models import Source
+from services.storage.content_hash import compute_content_hash
+from services.storage.repositories.content_blob import ContentBlobRepository
+
+
+def source_has_content():
+    """SQL condition matching sources with a body, inline or blob-stored."""
+    return or_(Source.content.isnot(None), Source.content_blob_hash.isnot(None))
 
 
 @dataclass
@@ -24,16 +33,36 @@ class SourceFilters:
     status: str | None = None
 
 
+@dataclass
+class SourceBody:
+    """A source's resolved page body, as streamed for domain analysis."""
+
+    id: UUID
+    uri: str
+    content: str
+    blob_stored: bool
+    is_cleaned: bool
+
+
 class SourceRepository:
     """Repository for managing Source entities."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, storage: SourceStorageConfig | None = None):
         """Initialize repository with database session.
 
         Args:
             session: SQLAlchemy session for database operations
+            storage: Body storage settings. Defaults to settings.source_storage.
         """
         self._session = session
+        self._storage = storage or settings.source_storage
+        self._blobs = ContentBlobRepository(session, self._storage.compression_level)
+
+    def _store_body(self, text: str | None) -> tuple[str | None, str | None]:
+        """Return (inline_value, blob_hash) for a body in the configured mode."""
+        if self._storage.mode != "blob" or text is None:
+            return text, None
+        return None, self._blobs.put(text)
 
     def create(
         self,
@@ -67,14 +96,19 @@ class SourceRepository:
         Returns:
             Created Source instance
         """
+        inline_content, content_blob_hash = self._store_body(content)
+        inline_raw, raw_blob_hash = self._store_body(raw_content)
         source = Source(
             project_id=project_id,
             uri=uri,
             source_group=source_group,
             source_type=source_type,
             title=title,
-            content=content,
-            raw_content=raw_content,
+            content=inline_content,
+            content_blob_hash=content_blob_hash,
+            content_hash=compute_content_hash(content),
+            raw_content=inline_raw,
+            raw_content_blob_hash=raw_blob_hash,
             meta_data=meta_data or {},
             outbound_links=outbound_links or [],
             status=status,
@@ -222,11 +256,14 @@ class SourceRepository:
         if source is None:
             return None
 
-        source.content = content
+        source.content, source.content_blob_hash = self._store_body(content)
+        source.content_hash = compute_content_hash(content)
         source.title = title
 
         if raw_content is not None:
-            source.raw_content = raw_content
+            source.raw_content, source.raw_content_blob_hash = self._store_body(
+                raw_content
+            )
         if outbound_links is not None:
             source.outbound_links = outbound_links
 
@@ -269,14 +306,19 @@ class SourceRepository:
             Tuple of (Source instance, created) where created is True if new,
             False if existing record was updated.
         """
+        inline_content, content_blob_hash = self._store_body(content)
+        inline_raw, raw_blob_hash = self._store_body(raw_content)
         values = {
             "project_id": project_id,
             "uri": uri,
             "source_group": source_group,
             "source_type": source_type,
             "title": title,
-            "content": content,
-            "raw_content": raw_content,
+            "content": inline_content,
+            "content_blob_hash": content_blob_hash,
+            "content_hash": compute_content_hash(content),
+            "raw_content": inline_raw,
+            "raw_content_blob_hash": raw_blob_hash,
             "meta_data": meta_data or {},
             "outbound_links": outbound_links or [],
             "status": status,
@@ -290,7 +332,10 @@ class SourceRepository:
             set_={
                 Source.title: stmt.excluded.title,
                 Source.content: stmt.excluded.content,
+                Source.content_blob_hash: stmt.excluded.content_blob_hash,
+                Source.content_hash: stmt.excluded.content_hash,
                 Source.raw_content: stmt.excluded.raw_content,
+                Source.raw_content_blob_hash: stmt.excluded.raw_content_blob_hash,
                 Source.meta_data: stmt.excluded.metadata,  # Fixed: use db column name
                 Source.outbound_links: stmt.excluded.outbound_links,
                 # Don't update status on conflict - keep existing status
@@ -365,7 +410,7 @@ class SourceRepository:
             select(domain_col, func.count().label("page_count"))
             .where(
                 Source.project_id == project_id,
-                Source.content.isnot(None),
+                source_has_content(),
                 Source.meta_data["domain"].as_string().isnot(None),
             )
             .group_by(domain_col)
@@ -390,15 +435,171 @@ class SourceRepository:
             domain: Domain string (from metadata->>'domain').
 
         Returns:
-            List of Source instances with content, ordered by created_at.
+            List of Source instances with bodies loaded, ordered by created_at.
         """
         result = self._session.execute(
             select(Source)
+            .options(undefer_group("body"))
             .where(
                 Source.project_id == project_id,
-                Source.content.isnot(None),
+                source_has_content(),
                 Source.meta_data["domain"].as_string() == domain,
             )
             .order_by(Source.created_at.asc())
         )
         return list(result.scalars().all())
+
+    def _domain_conditions(self, project_id: UUID, domain: str) -> tuple:
+        return (
+            Source.project_id == project_id,
+            source_has_content(),
+            Source.meta_data["domain"].as_string() == domain,
+        )
+
+    def backfill_content_hashes(
+        self, project_id: UUID, domain: str, batch_size: int = 500
+    ) -> int:
+        """Compute content_hash for a domain's sources ingested before hashing.
+
+        Args:
+            project_id: Project UUID.
+            domain: Domain string (from metadata->>'domain').
+            batch_size: Rows fetched and updated per round trip.
+
+        Returns:
+            Number of sources updated.
+        """
+        result = self._session.execute(
+            select(Source.id, Source.content)
+            .where(
+                *self._domain_conditions(project_id, domain),
+                Source.content_hash.is_(None),
+                Source.content.isnot(None),
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        updated = 0
+        for rows in result.partitions():
+            self._session.execute(
+                update(Source),
+                [
+                    {"id": row.id, "content_hash": compute_content_hash(row.content)}
+                    for row in rows
+                ],
+            )
+            updated += len(rows)
+        return updated
+
+    def get_domain_content_hashes(self, project_id: UUID, domain: str) -> builtins.list:
+        """Get (id, uri, content_hash) rows for a domain without loading bodies.
+
+        Args:
+            project_id: Project UUID.
+            domain: Domain string (from metadata->>'domain').
+
+        Returns:
+            List of rows with id, uri and content_hash attributes.
+        """
+        result = self._session.execute(
+            select(Source.id, Source.uri, Source.content_hash).where(
+                *self._domain_conditions(project_id, domain)
+            )
+        )
+        return list(result.all())
+
+    def count_cleaned_in_domain(self, project_id: UUID, domain: str) -> int:
+        """Count a domain's sources that have cleaned content recorded."""
+        result = self._session.execute(
+            select(func.count())
+            .select_from(Source)
+            .where(
+                *self._domain_conditions(project_id, domain),
+                or_(
+                    Source.cleaned_content.isnot(None),
+                    Source.cleaned_content_delta.isnot(None),
+                ),
+            )
+        )
+        return result.scalar() or 0
+
+    def iter_domain_bodies(
+        self, project_id: UUID, domain: str, batch_size: int = 500
+    ) -> Iterator[builtins.list[SourceBody]]:
+        """Stream a domain's page bodies in batches with constant memory.
+
+        Rows are fetched with a server-side cursor; blob-stored bodies are
+        loaded per batch. Sources with empty content are skipped.
+
+        Args:
+            project_id: Project UUID.
+            domain: Domain string (from metadata->>'domain').
+            batch_size: Rows per batch.
+
+        Yields:
+            Lists of SourceBody, ordered by created_at.
+        """
+        result = self._session.execute(
+            select(
+                Source.id,
+                Source.uri,
+                Source.content,
+                Source.content_blob_hash,
+                or_(
+                    Source.cleaned_content.isnot(None),
+                    Source.cleaned_content_delta.isnot(None),
+                ).label("is_cleaned"),
+            )
+            .where(*self._domain_conditions(project_id, domain))
+            .order_by(Source.created_at.asc(), Source.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        for rows in result.partitions():
+            blobs = self._blobs.get_many(
+                [r.content_blob_hash for r in rows if r.content is None]
+            )
+            batch = []
+            for r in rows:
+                content = r.content
+                if content is None and r.content_blob_hash:
+                    content = blobs.get(r.content_blob_hash)
+                if content:
+                    batch.append(
+                        SourceBody(
+                            id=r.id,
+                            uri=r.uri,
+                            content=content,
+                            blob_stored=r.content_blob_hash is not None,
+                            is_cleaned=bool(r.is_cleaned),
+                        )
+                    )
+            if batch:
+                yield batch
+
+    def bulk_update_cleaned(self, updates: builtins.list[dict]) -> None:
+        """Write cleaned_content / cleaned_content_delta for many sources.
+
+        Args:
+            updates: Dicts with id, cleaned_content and cleaned_content_delta.
+        """
+        if updates:
+            self._session.execute(update(Source), updates)
+
+    def clear_cleaned_in_domain(self, project_id: UUID, domain: str) -> int:
+        """Clear stale cleaned content for all of a domain's sources.
+
+        Returns:
+            Number of sources cleared.
+        """
+        result = self._session.execute(
+            update(Source)
+            .where(
+                *self._domain_conditions(project_id, domain),
+                or_(
+                    Source.cleaned_content.isnot(None),
+                    Source.cleaned_content_delta.isnot(None),
+                ),
+            )
+            .values(cleaned_content=None, cleaned_content_delta=None)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
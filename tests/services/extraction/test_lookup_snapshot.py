@@ -0,0 +1,306 @@
+"""Tests for shared factAPI lookup snapshots."""
+
+import asyncio
+import gc
+import json
+import weakref
+
+import httpx
+import pytest
+
+from services.extraction.field_groups import FieldDefinition, ValidatorSpec
+from services.extraction.field_validation import FieldValidationService
+from services.extraction.lookup_snapshot import (
+    FetchResult,
+    LookupMapping,
+    LookupSet,
+    LookupSnapshotStore,
+    lookup_records,
+    mapping_records,
+    normalize_value,
+    write_snapshot,
+)
+
+
+class TestSnapshotFormat:
+    def test_lookup_set_membership(self, tmp_path) -> None:
+        path = tmp_path / "countries.snap"
+        values = ["germany", "france", "czech republic", "", "ünited"]
+        assert write_snapshot(path, lookup_records(values + ["france"])) == 5
+
+        snap = LookupSet(path)
+        assert len(snap) == 5
+        for value in values:
+            assert value in snap
+        assert "germ" not in snap
+        assert "zzz" not in snap
+        assert None not in snap
+
+    def test_empty_snapshot(self, tmp_path) -> None:
+        path = tmp_path / "empty.snap"
+        write_snapshot(path, [])
+        assert len(LookupSet(path)) == 0
+        assert "x" not in LookupSet(path)
+
+    def test_mapping_get(self, tmp_path) -> None:
+        path = tmp_path / "cities.snap"
+        write_snapshot(
+            path,
+            mapping_records(
+                {
+                    "munich": {"Germany"},
+                    "paris": {"France", "United States"},
+                    "par": {"Nowhere"},
+                }
+            ),
+        )
+
+        mapping = LookupMapping(path)
+        assert mapping.get("munich") == frozenset({"Germany"})
+        assert mapping.get("paris") == frozenset({"France", "United States"})
+        assert mapping.get("par") == frozenset({"Nowhere"})
+        assert mapping.get("berlin") is None
+        assert "paris" in mapping
+
+    def test_context_manager_unmaps(self, tmp_path) -> None:
+        path = tmp_path / "countries.snap"
+        write_snapshot(path, lookup_records(["germany"]))
+
+        with LookupSet(path) as snap:
+            assert "germany" in snap
+
+        assert snap.closed
+
+    def test_rejects_foreign_file(self, tmp_path) -> None:
+        path = tmp_path / "bogus.snap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            LookupSet(path)
+
+    @pytest.mark.parametrize(
+        ("value", "case_sensitive", "expected"),
+        [
+            ("  Czech   Republic ", False, "czech republic"),
+            ("Czech  Republic", True, "Czech  Republic"),
+            (42, False, "42"),
+        ],
+    )
+    def test_normalize_value(self, value, case_sensitive, expected) -> None:
+        assert normalize_value(value, case_sensitive) == expected
+
+
+class CountingFetcher:
+    def __init__(self, values=("germany", "france"), etag='"v1"') -> None:
+        self.values = list(values)
+        self.etag = etag
+        self.calls: list[dict] = []
+
+    async def __call__(self, conditional: dict[str, str]) -> FetchResult:
+        self.calls.append(conditional)
+        await asyncio.sleep(0)
+        if self.etag and conditional.get("If-None-Match") == self.etag:
+            return FetchResult(not_modified=True)
+        return FetchResult(records=lookup_records(self.values), etag=self.etag)
+
+
+class TestLookupSnapshotStore:
+    async def test_stores_share_one_fetch(self, tmp_path) -> None:
+        fetch = CountingFetcher()
+        stores = [LookupSnapshotStore(tmp_path) for _ in range(4)]
+
+        results = await asyncio.gather(
+            *[store.get_set("worldcities/country/ci", fetch) for store in stores]
+        )
+
+        assert len(fetch.calls) == 1
+        assert all("germany" in snap for snap in results)
+        assert sum(s.stats.reused for s in stores) == 3
+
+    async def test_expired_snapshot_revalidated(self, tmp_path) -> None:
+        fetch = CountingFetcher()
+        await LookupSnapshotStore(tmp_path, ttl_seconds=60).get_set("k", fetch)
+        meta_path = next(tmp_path.glob("*.meta.json"))
+        meta = json.loads(meta_path.read_text())
+        meta["fetched_at"] -= 120
+        meta_path.write_text(json.dumps(meta))
+
+        store = LookupSnapshotStore(tmp_path, ttl_seconds=60)
+        snap = await store.get_set("k", fetch)
+
+        assert fetch.calls[-1] == {"If-None-Match": '"v1"'}
+        assert store.stats.not_modified == 1
+        assert "france" in snap
+        assert json.loads(meta_path.read_text())["fetched_at"] > meta["fetched_at"]
+
+    async def test_changed_table_rewritten(self, tmp_path) -> None:
+        fetch = CountingFetcher()
+        await LookupSnapshotStore(tmp_path).get_set("k", fetch)
+        fetch.values, fetch.etag = ["poland"], '"v2"'
+        meta_path = next(tmp_path.glob("*.meta.json"))
+        meta = json.loads(meta_path.read_text())
+        meta["fetched_at"] = 0
+        meta_path.write_text(json.dumps(meta))
+
+        snap = await LookupSnapshotStore(tmp_path).get_set("k", fetch)
+
+        assert "poland" in snap and "germany" not in snap
+
+    async def test_failed_refresh_serves_stale(self, tmp_path) -> None:
+        await LookupSnapshotStore(tmp_path).get_set("k", CountingFetcher())
+        meta_path = next(tmp_path.glob("*.meta.json"))
+        meta_path.write_text(json.dumps({"fetched_at": 0, "etag": '"v1"'}))
+
+        async def failing(conditional):
+            raise httpx.ConnectError("down")
+
+        store = LookupSnapshotStore(tmp_path)
+        snap = await store.get_set("k", failing)
+
+        assert "germany" in snap
+        assert store.stats.failures == 1
+
+    async def test_failure_without_snapshot_not_retried(self, tmp_path) -> None:
+        calls = 0
+
+        async def failing(conditional):
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("down")
+
+        store = LookupSnapshotStore(tmp_path)
+        with pytest.raises(httpx.ConnectError):
+            await store.get_set("k", failing)
+
+        assert await store.get_set("k", failing) is None
+        assert calls == 1
+
+    async def test_held_snapshot_survives_reload(self, tmp_path) -> None:
+        fetch = CountingFetcher()
+        store = LookupSnapshotStore(tmp_path, ttl_seconds=60)
+        first = await store.get_set("k", fetch)
+        # Change the table and age both the file and the in-process entry
+        fetch.values, fetch.etag = ["poland"], '"v2"'
+        meta_path = next(tmp_path.glob("*.meta.json"))
+        meta = json.loads(meta_path.read_text())
+        meta["fetched_at"] = 0
+        meta_path.write_text(json.dumps(meta))
+        store._opened["k"] = (first, store._opened["k"][1] - 120)
+
+        second = await store.get_set("k", fetch)
+
+        assert second is not first
+        assert not first.closed
+        assert "germany" in first and "poland" not in first
+        assert "poland" in second
+
+        released = weakref.ref(first)
+        del first
+        gc.collect()
+        assert released() is None
+        store.close()
+        assert second.closed
+
+
+class FakeFactAPI:
+    """Stand-in factAPI answering collection GETs with ETag support."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.requests: list[dict] = []
+
+    async def get(self, url, params=None, headers=None):
+        self.requests.append({"url": url, "params": params, "headers": headers})
+        request = httpx.Request("GET", url)
+        if (headers or {}).get("If-None-Match") == '"rev-1"':
+            return httpx.Response(304, request=request)
+        fields = params["_fields"].split(",")
+        data = [{f: row.get(f) for f in fields} for row in self.rows]
+        return httpx.Response(
+            200, json={"data": data}, headers={"ETag": '"rev-1"'}, request=request
+        )
+
+
+def _country_check() -> FieldDefinition:
+    return FieldDefinition(
+        name="country",
+        field_type="text",
+        description="Country",
+        validators=[
+            ValidatorSpec(
+                type="factapi_exists_in_column",
+                collection="worldcities",
+                column="country",
+                action="nullify",
+            )
+        ],
+    )
+
+
+class TestSnapshotBackedValidation:
+    @pytest.fixture
+    def factapi(self, monkeypatch) -> FakeFactAPI:
+        api = FakeFactAPI(
+            [
+                {"city": "Munich", "country": "Germany"},
+                {"city": "Paris", "country": "France"},
+                {"city": "Paris", "country": "United States"},
+            ]
+        )
+        monkeypatch.setattr(httpx.AsyncClient, "get", api.get)
+        return api
+
+    def _svc(self, tmp_path) -> FieldValidationService:
+        return FieldValidationService(
+            factapi_url="http://factapi.test",
+            api_key="test",
+            snapshot_dir=str(tmp_path),
+        )
+
+    async def test_many_workers_fetch_each_table_once(self, tmp_path, factapi) -> None:
+        workers = [self._svc(tmp_path) for _ in range(8)]
+        fields = [_country_check()]
+        nullified = 0
+
+        for i in range(10_000):
+            svc = workers[i % len(workers)]
+            lookups = {
+                svc._cache_key(
+                    "worldcities", "country", False
+                ): await svc.get_lookup_set("worldcities", "country")
+            }
+            value = "Germany" if i % 2 else "Atlantis"
+            fixed, _ = svc.apply_to_entity_fields({"country": value}, fields, lookups)
+            nullified += fixed["country"] is None
+
+        assert nullified == 5_000
+        assert len(factapi.requests) == 1
+
+    async def test_mapping_snapshot(self, tmp_path, factapi) -> None:
+        svc = self._svc(tmp_path)
+
+        mapping = await svc.get_mapping("worldcities", "city", "country")
+
+        assert mapping.get("munich") == frozenset({"Germany"})
+        assert mapping.get("paris") == frozenset({"France", "United States"})
+        assert factapi.requests[0]["params"]["_fields"] == "city,country"
+
+    async def test_restart_revalidates_with_etag(
+        self, tmp_path, factapi, monkeypatch
+    ) -> None:
+        await self._svc(tmp_path).get_lookup_set("worldcities", "country")
+        # A later process start makes the snapshot due for revalidation
+        monkeypatch.setattr("services.extraction.lookup_snapshot._PROCESS_STARTED", 4e9)
+
+        snap = await self._svc(tmp_path).get_lookup_set("worldcities", "country")
+
+        assert "germany" in snap
+        assert len(factapi.requests) == 2
+        assert factapi.requests[1]["headers"]["If-None-Match"] == '"rev-1"'
+
+    async def test_unreachable_factapi_returns_none(self, tmp_path, monkeypatch):
+        async def refuse(*args, **kwargs):
+            raise httpx.ConnectError("connection refused")
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", refuse)
+
+        assert await self._svc(tmp_path).get_lookup_set("worldcities", "x") is None
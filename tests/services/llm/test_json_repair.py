@@ -1,15 +1,14 @@
 """Tests for JSON repair utilities."""
 
 import json
+import random
 
 import pytest
 
 from services.llm.json_repair import (
-    _balance_brackets,
-    _fix_quotes,
-    _fix_unterminated_strings,
-    _remove_trailing_commas,
+    StreamingArrayParser,
     _strip_code_fences,
+    decode_tolerant,
     repair_json,
     try_repair_json,
 )
@@ -177,119 +176,138 @@ class TestStripCodeFences:
         assert result == '{"a": 1}'
 
 
-class TestFixUnterminatedStrings:
-    """Test _fix_unterminated_strings helper."""
-
-    def test_unterminated_at_end(self):
-        """Should close string at end."""
-        text = '{"key": "value'
-        result = _fix_unterminated_strings(text)
-        assert result.endswith('"')
-
-    def test_complete_string_unchanged(self):
-        """Complete strings should be unchanged."""
-        text = '{"key": "value"}'
-        result = _fix_unterminated_strings(text)
-        assert result == text
-
-    def test_escaped_quote_handled(self):
-        """Escaped quotes should not be counted as terminators."""
-        text = '{"key": "val\\"ue'
-        result = _fix_unterminated_strings(text)
-        assert result.endswith('"')
-
-
-class TestBalanceBrackets:
-    """Test _balance_brackets helper."""
-
-    def test_missing_brace(self):
-        """Should add missing closing brace."""
-        text = '{"a": 1'
-        result = _balance_brackets(text)
-        assert result == '{"a": 1}'
-
-    def test_missing_bracket(self):
-        """Should add missing closing bracket."""
-        text = '{"a": [1, 2'
-        result = _balance_brackets(text)
-        assert result == '{"a": [1, 2]}'
-
-    def test_missing_both(self):
-        """Should add both missing bracket and brace."""
-        text = '{"a": [1'
-        result = _balance_brackets(text)
-        assert result == '{"a": [1]}'
-
-    def test_nested_missing(self):
-        """Should handle nested missing brackets."""
-        text = '{"a": {"b": [1'
-        result = _balance_brackets(text)
-        assert result == '{"a": {"b": [1]}}'
-
-    def test_balanced_unchanged(self):
-        """Balanced brackets should be unchanged."""
-        text = '{"a": [1, 2]}'
-        result = _balance_brackets(text)
-        assert result == text
-
-    def test_brackets_in_strings_ignored(self):
-        """Brackets inside strings should be ignored."""
-        text = '{"a": "[not a real bracket'
-        result = _balance_brackets(text)
-        # The string is unterminated, but balance_brackets only adds closers
-        # It should add the missing } but not mess with the string content
-        assert result.endswith("}")
-
-
-class TestRemoveTrailingCommas:
-    """Test _remove_trailing_commas helper."""
-
-    def test_array_trailing_comma(self):
-        """Should remove trailing comma in array."""
-        text = "[1, 2, 3,]"
-        result = _remove_trailing_commas(text)
-        assert result == "[1, 2, 3]"
-
-    def test_object_trailing_comma(self):
-        """Should remove trailing comma in object."""
-        text = '{"a": 1, "b": 2,}'
-        result = _remove_trailing_commas(text)
-        assert result == '{"a": 1, "b": 2}'
-
-    def test_comma_with_whitespace(self):
-        """Should handle whitespace before closer."""
-        text = "[1, 2,  ]"
-        result = _remove_trailing_commas(text)
-        assert result == "[1, 2]"
-
-    def test_no_trailing_comma(self):
-        """Should leave valid JSON unchanged."""
-        text = '{"a": 1}'
-        result = _remove_trailing_commas(text)
-        assert result == text
-
-
-class TestFixQuotes:
-    """Test _fix_quotes helper."""
-
-    def test_all_single_quotes(self):
-        """Should convert all single quotes when no double quotes."""
-        text = "{'a': 1}"
-        result = _fix_quotes(text)
-        assert result == '{"a": 1}'
-
-    def test_mixed_quotes(self):
-        """Should handle mixed quote styles."""
-        text = "{'a': 1, \"b\": 2}"
-        result = _fix_quotes(text)
-        # Should attempt to fix single-quoted keys/values
-        assert '"a"' in result
-
-    def test_double_quotes_unchanged(self):
-        """Double quotes should remain unchanged."""
-        text = '{"a": 1}'
-        result = _fix_quotes(text)
-        assert result == text
+class TestDecodeTolerant:
+    """Test decode_tolerant single-pass decoder."""
+
+    def test_complete_document_not_flagged(self):
+        """A complete document decodes with nothing dropped."""
+        result = decode_tolerant('{"a": [1, {"b": "c"}]}')
+        assert result.value == {"a": [1, {"b": "c"}]}
+        assert result.dropped == []
+        assert result.complete is True
+
+    def test_truncated_document_closed(self):
+        """Open strings, arrays and objects are closed at the end of text."""
+        result = decode_tolerant('{"a": [1, {"b": "partial')
+        assert result.value == {"a": [1, {"b": "partial"}]}
+        assert result.dropped == []
+        assert result.complete is False
+
+    def test_partial_key_dropped(self):
+        """A key cut off mid-string is dropped and reported."""
+        result = decode_tolerant('{"items": [{"name": "A", "pri')
+        assert result.value == {"items": [{"name": "A"}]}
+        assert result.dropped == ["$.items[0].pri"]
+
+    def test_key_without_value_dropped(self):
+        """A key whose value never started is dropped and reported."""
+        result = decode_tolerant('{"a": 1, "b":')
+        assert result.value == {"a": 1}
+        assert result.dropped == ["$.b"]
+
+    @pytest.mark.parametrize("token", ["0.", "-", "tru", "1e"])
+    def test_cut_off_scalar_dropped(self, token):
+        """Numbers and literals cut off mid-token are dropped, not guessed."""
+        result = decode_tolerant('{"products": [1, 2, ' + token)
+        assert result.value == {"products": [1, 2]}
+        assert result.dropped == ["$.products[2]"]
+
+    def test_invalid_token_mid_document_dropped(self):
+        """An invalid token drops only its own member."""
+        result = decode_tolerant('{"a": undefined, "b": 1}')
+        assert result.value == {"b": 1}
+        assert result.dropped == ["$.a"]
+        assert result.complete is True
+
+    def test_partial_escape_trimmed(self):
+        """A string cut off inside an escape sequence keeps the text before it."""
+        assert decode_tolerant('{"a": "x\\u00').value == {"a": "x"}
+        assert decode_tolerant('{"a": "x\\').value == {"a": "x"}
+        # Escaped backslash followed by literal text is not an escape
+        assert decode_tolerant('{"a": "x\\\\u00').value == {"a": "x\\u00"}
+
+    def test_invalid_escape_kept_literally(self):
+        """Invalid escapes are kept as a literal backslash."""
+        assert decode_tolerant('{"t": "a \\x b"}').value == {"t": "a \\x b"}
+
+    def test_raw_control_characters_in_strings(self):
+        """Unescaped newlines inside strings are accepted."""
+        assert decode_tolerant('{"t": "line1\nline2"}').value == {"t": "line1\nline2"}
+
+    def test_missing_comma(self):
+        """Members without a separating comma are still read."""
+        assert decode_tolerant('{"a": 1 "b": [1 2]}').value == {"a": 1, "b": [1, 2]}
+
+    def test_mismatched_closer(self):
+        """A closer for an outer container closes the inner ones too."""
+        assert decode_tolerant('{"a": [1, 2}').value == {"a": [1, 2]}
+
+    def test_python_literals(self):
+        """Python True/False/None are read as JSON literals."""
+        assert decode_tolerant('{"a": True, "b": None}').value == {
+            "a": True,
+            "b": None,
+        }
+
+    def test_single_quoted_strings(self):
+        """Single-quoted keys and values are read as strings."""
+        assert decode_tolerant("{'a': 'it\\'s', \"b\": 2}").value == {
+            "a": "it's",
+            "b": 2,
+        }
+
+    def test_text_after_document_ignored(self):
+        """Prose after the closing brace does not prevent decoding."""
+        result = decode_tolerant('{"a": 1}\nHope this helps!')
+        assert result.value == {"a": 1}
+        assert result.complete is True
+
+    def test_array_root(self):
+        """Array documents are supported."""
+        assert decode_tolerant('[{"a": 1}, {"a": 2},').value == [{"a": 1}, {"a": 2}]
+
+    @pytest.mark.parametrize("text", ["", "not json", '"just a string"', "42"])
+    def test_non_container_raises(self, text):
+        """Text that does not start with an array or object is rejected."""
+        with pytest.raises(json.JSONDecodeError):
+            decode_tolerant(text)
+
+    def test_every_prefix_recovers_a_prefix(self):
+        """Each truncation point yields a dict whose values match the original."""
+        document = {
+            "products": [
+                {"name": 'D "Series"\n', "kw": 100.5, "tags": ["a", "b"]},
+                {"name": "Planetärgetriebe 製品", "kw": None, "ok": True},
+            ],
+            "confidence": 0.85,
+        }
+        text = json.dumps(document, ensure_ascii=False, indent=2)
+        for end in range(1, len(text)):
+            value = decode_tolerant(text[:end]).value
+            assert isinstance(value, dict)
+            for i, product in enumerate(value.get("products", [])):
+                for key, field_value in product.items():
+                    original = document["products"][i][key]
+                    if isinstance(original, str):
+                        assert original.startswith(field_value)
+                    elif isinstance(original, list):
+                        # Complete elements, then possibly one cut-off string
+                        for j, element in enumerate(field_value):
+                            assert original[j].startswith(element)
+                    elif isinstance(original, float):
+                        # A number at the very end may itself be cut short
+                        assert str(original).startswith(str(field_value))
+                    else:
+                        assert field_value == original
+
+    def test_large_input_is_linear(self):
+        """A multi-megabyte truncated response decodes in one pass."""
+        items = [{"name": f"item {i}", "value": i} for i in range(50000)]
+        text = json.dumps({"items": items})[:-20]
+        result = decode_tolerant(text)
+        assert len(result.value["items"]) == 50000
+        assert result.value["items"][-1] == {"name": "item 49999"}
+        assert result.complete is False
 
 
 class TestRealWorldExamples:
@@ -325,3 +343,67 @@ class TestRealWorldExamples:
 
         result = repair_json(malformed)
         assert result["facts"][0]["text"] == "Feature X is available"
+
+
+class TestStreamingArrayParser:
+    """Test StreamingArrayParser incremental item parsing."""
+
+    RESPONSE = json.dumps(
+        {
+            "note": "products: [{not an item}]",
+            "products": [
+                {"name": 'Gear \\"X\\"', "specs": {"kw": 5}, "tags": ["a}"]},
+                {"name": "Motor {M2}", "_quote": "see [1]"},
+                {"name": "Drive\\", "_confidence": 0.9},
+            ],
+            "other": [{"name": "ignored"}],
+            "has_more": False,
+        }
+    )
+
+    def _feed_all(self, parser, deltas):
+        items = []
+        for delta in deltas:
+            items.extend(parser.feed(delta))
+        return items
+
+    def test_whole_text_returns_target_items(self):
+        parser = StreamingArrayParser("products")
+        items = parser.feed(self.RESPONSE)
+        assert items == json.loads(self.RESPONSE)["products"]
+        assert parser.items_parsed == 3
+        assert parser.text == self.RESPONSE
+
+    def test_random_splits_yield_same_items(self):
+        expected = json.loads(self.RESPONSE)["products"]
+        rng = random.Random(7)
+        for _ in range(200):
+            cuts = sorted(rng.sample(range(1, len(self.RESPONSE)), 12))
+            deltas = [
+                self.RESPONSE[a:b]
+                for a, b in zip([0, *cuts], [*cuts, len(self.RESPONSE)], strict=True)
+            ]
+            parser = StreamingArrayParser("products")
+            assert self._feed_all(parser, deltas) == expected
+
+    def test_char_by_char_emits_item_when_closed(self):
+        parser = StreamingArrayParser("products")
+        first_end = self.RESPONSE.index("]}") + 2
+        emitted_at = None
+        for i, ch in enumerate(self.RESPONSE):
+            if parser.feed(ch):
+                emitted_at = i + 1
+                break
+        assert emitted_at == first_end
+
+    def test_cut_off_item_not_emitted(self):
+        parser = StreamingArrayParser("products")
+        items = parser.feed('{"products": [{"name": "A"}, {"name": "B", "kw": 1')
+        assert items == [{"name": "A"}]
+        assert parser.items_parsed == 1
+        assert parser.items == [{"name": "A"}]
+
+    def test_missing_key_emits_nothing(self):
+        parser = StreamingArrayParser("products")
+        assert parser.feed('{"items": [{"name": "A"}], "has_more": false}') == []
+        assert parser.items_parsed == 0
@@ -0,0 +1,109 @@
+"""Tests for the content-addressed artifact store."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from orm_models import Report
+from services.storage.artifact_store import (
+    ArtifactNotFoundError,
+    LocalArtifactStore,
+    delete_orphan_artifacts,
+)
+
+
+def _age(store: LocalArtifactStore, key: str, hours: float = 2) -> None:
+    old = time.time() - hours * 3600
+    os.utime(store.root / key[:2] / key[2:4] / key, (old, old))
+
+
+class TestLocalArtifactStore:
+    def test_put_returns_sha256_key(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        key = store.put(b"workbook")
+        assert key == hashlib.sha256(b"workbook").hexdigest()
+        assert store.exists(key)
+        assert store.read(key) == b"workbook"
+
+    def test_fan_out_layout(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        key = store.put(b"data")
+        assert (tmp_path / key[:2] / key[2:4] / key).is_file()
+
+    def test_identical_content_shares_one_file(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        assert store.put(b"same") == store.put(b"same")
+        files = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert len(files) == 1
+
+    def test_iter_chunks_streams_content(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        data = bytes(range(256)) * 10
+        key = store.put(data)
+        chunks = list(store.iter_chunks(key, chunk_size=1000))
+        assert len(chunks) == 3
+        assert b"".join(chunks) == data
+        assert store.size(key) == len(data)
+
+    def test_missing_artifact_raises(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        key = "0" * 64
+        assert not store.exists(key)
+        with pytest.raises(ArtifactNotFoundError):
+            store.iter_chunks(key)
+        with pytest.raises(ArtifactNotFoundError):
+            store.size(key)
+
+    def test_invalid_key_rejected(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        with pytest.raises(ValueError):
+            store.read("../../etc/passwd")
+
+    def test_delete(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        key = store.put(b"gone")
+        assert store.delete(key) is True
+        assert store.delete(key) is False
+        assert not store.exists(key)
+
+
+class TestOrphanArtifactSweep:
+    def test_only_old_unreferenced_artifacts_deleted(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        orphan, kept, fresh = (store.put(d) for d in (b"orphan", b"kept", b"fresh"))
+        _age(store, orphan)
+        _age(store, kept)
+
+        assert store.delete_unreferenced({kept}) == 1
+
+        assert not store.exists(orphan)
+        assert store.exists(kept)
+        assert store.exists(fresh)
+
+    def test_reput_restarts_grace_period(self, tmp_path):
+        store = LocalArtifactStore(tmp_path)
+        key = store.put(b"workbook")
+        _age(store, key)
+
+        assert store.put(b"workbook") == key
+
+        assert store.delete_unreferenced(set()) == 0
+        assert store.exists(key)
+
+    def test_deleted_report_artifact_removed(self, tmp_path, db):
+        store = LocalArtifactStore(tmp_path)
+        live_key = store.put(b"live workbook")
+        gone_key = store.put(b"deleted workbook")
+        for key in (live_key, gone_key):
+            db.add(Report(type="table", format="xlsx", artifact_key=key))
+        db.flush()
+        _age(store, live_key)
+        _age(store, gone_key)
+
+        db.query(Report).filter(Report.artifact_key == gone_key).delete()
+
+        assert delete_orphan_artifacts(db, store) == 1
+        assert store.exists(live_key)
+        assert not store.exists(gone_key)
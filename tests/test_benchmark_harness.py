@@ -0,0 +1,340 @@
+"""Tests for the offline pipeline benchmark harness."""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from benchmarks.corpus import load_pages, synthetic_pages
+from benchmarks.harness import (
+    BenchmarkOptions,
+    StageTimer,
+    compare_reports,
+    percentile,
+    run_benchmark,
+)
+from benchmarks.mock_openai import (
+    Latency,
+    MockOpenAIServer,
+    MockSettings,
+    chat_reply,
+    embed_text,
+    rerank_scores,
+)
+from config import settings
+from services.extraction.field_groups import FieldDefinition, FieldGroup
+from services.extraction.llm_skip_gate import (
+    BATCH_SYSTEM_PROMPT,
+    BATCH_USER_TEMPLATE,
+)
+from services.extraction.schema_extractor import SchemaExtractor
+
+CONTENT = (
+    "# Acme Drives\n\n"
+    "Acme Drives builds helical gearboxes in Munich, Germany.\n\n"
+    "The HX-200 gearbox delivers 450 kW and a rated torque of 12000 Nm.\n\n"
+    "Our service center in Lyon offers field service and repairs."
+)
+
+COMPANY = FieldGroup(
+    name="company_info",
+    description="Company information",
+    fields=[
+        FieldDefinition("company_name", "text", "Company name"),
+        FieldDefinition("employee_count", "integer", "Employees"),
+        FieldDefinition("makes_gearboxes", "boolean", "Makes gearboxes"),
+        FieldDefinition("size", "enum", "Company size", enum_values=["small", "large"]),
+    ],
+    prompt_hint="",
+)
+PRODUCTS = FieldGroup(
+    name="products",
+    description="Products",
+    fields=[
+        FieldDefinition("product_name", "text", "Product name"),
+        FieldDefinition("power_kw", "float", "Power"),
+    ],
+    prompt_hint="",
+    is_entity_list=True,
+)
+
+
+def _ask(group: FieldGroup, data_version: int) -> tuple[str, dict]:
+    extractor = SchemaExtractor(settings.llm, data_version=data_version)
+    kind, content = chat_reply(
+        {
+            "messages": [
+                {"role": "system", "content": extractor._build_system_prompt(group)},
+                {
+                    "role": "user",
+                    "content": extractor._build_user_prompt(CONTENT, group, "Acme"),
+                },
+            ]
+        }
+    )
+    return kind, json.loads(content)
+
+
+def _quotes(data: dict) -> list[str]:
+    if "fields" in data:
+        return [f["quote"] for f in data["fields"].values() if f["quote"]]
+    if "_quotes" in data:
+        return list(data["_quotes"].values())
+    return [
+        entity["_quote"]
+        for entities in data.values()
+        if isinstance(entities, list)
+        for entity in entities
+    ]
+
+
+class TestChatReply:
+    @pytest.mark.parametrize("data_version", [1, 2])
+    def test_field_group_answer(self, data_version) -> None:
+        kind, data = _ask(COMPANY, data_version)
+
+        assert kind == "extract"
+        parsed = SchemaExtractor.parse_v2_response(data, COMPANY)["fields"]
+        assert set(parsed) == {f.name for f in COMPANY.fields}
+        assert all(q in CONTENT for q in _quotes(data))
+
+    @pytest.mark.parametrize("data_version", [1, 2])
+    def test_entity_list_answer(self, data_version) -> None:
+        kind, data = _ask(PRODUCTS, data_version)
+
+        assert kind == "extract_entities"
+        entities = SchemaExtractor.parse_v2_entity_response(data, PRODUCTS)
+        assert entities["products"]
+        assert entities["has_more"] is False
+        assert all(15 <= len(q) <= 50 and q in CONTENT for q in _quotes(data))
+
+    def test_same_prompt_same_answer(self) -> None:
+        assert _ask(COMPANY, 2) == _ask(COMPANY, 2)
+
+    def test_batched_skip_gate(self) -> None:
+        kind, content = chat_reply(
+            {
+                "messages": [
+                    {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                    {
+                        "role": "user",
+                        "content": BATCH_USER_TEMPLATE.format(
+                            schema_summary="", pages="", count=3
+                        ),
+                    },
+                ]
+            }
+        )
+
+        assert kind == "skip_gate"
+        assert [d["page"] for d in json.loads(content)["decisions"]] == [1, 2, 3]
+
+    def test_unknown_prompt(self) -> None:
+        assert chat_reply({"messages": [{"role": "user", "content": "hi"}]}) == (
+            "other",
+            "{}",
+        )
+
+    def test_latency_reproducible_per_body(self) -> None:
+        latency = Latency(mean_ms=100, jitter_ms=50)
+
+        first = latency.delay(7, b"body")
+
+        assert first == latency.delay(7, b"body")
+        assert 0.05 <= first <= 0.15
+        assert Latency().delay(7, b"body") == 0.0
+
+
+class TestStreaming:
+    async def test_streamed_entities_match_buffered_answer(self) -> None:
+        _, expected = _ask(PRODUCTS, 2)
+        seen = []
+
+        with MockOpenAIServer() as server:
+            extractor = SchemaExtractor(
+                replace(settings.llm, base_url=server.base_url), data_version=2
+            )
+            result = await extractor.extract_field_group(
+                CONTENT, PRODUCTS, "Acme", on_entity=seen.append
+            )
+
+        assert seen == expected["products"]
+        assert len(result["products"]) == len(expected["products"])
+        assert "_truncated" not in result
+
+    async def test_stalled_stream_keeps_entities_received(self) -> None:
+        _, expected = _ask(PRODUCTS, 2)
+        seen = []
+
+        with MockOpenAIServer(MockSettings(stream_stall_at=0.9)) as server:
+            extractor = SchemaExtractor(
+                replace(
+                    settings.llm,
+                    base_url=server.base_url,
+                    http_timeout=1,
+                    max_retries=1,
+                ),
+                data_version=2,
+            )
+            result = await extractor.extract_field_group(
+                CONTENT, PRODUCTS, "Acme", on_entity=seen.append
+            )
+
+        assert seen
+        assert seen == expected["products"][: len(seen)]
+        assert result["_truncated"] is True
+        assert len(result["products"]) >= len(seen)
+
+
+class TestEmbeddings:
+    def test_unit_vectors_similar_for_similar_text(self) -> None:
+        a = embed_text("helical gearbox with high torque", 64)
+        b = embed_text("high torque helical gearbox", 64)
+        c = embed_text("privacy policy and cookie settings", 64)
+
+        assert sum(x * x for x in a) == pytest.approx(1.0)
+        assert sum(x * y for x, y in zip(a, b, strict=True)) > sum(
+            x * y for x, y in zip(a, c, strict=True)
+        )
+
+    def test_rerank_prefers_overlap(self) -> None:
+        scores = rerank_scores("gearbox torque", ["gearbox torque", "cookies"])
+        assert scores == [1.0, 0.0]
+
+
+class TestCorpus:
+    def test_synthetic_pages_deterministic(self) -> None:
+        pages = synthetic_pages(20, companies=3, page_chars=1500, seed=1)
+
+        assert pages == synthetic_pages(20, companies=3, page_chars=1500, seed=1)
+        assert len({p.source_group for p in pages}) == 3
+        assert len({p.url for p in pages}) == 20
+        assert any("/careers" in p.url or "/login" in p.url for p in pages)
+
+    def test_load_pages(self, tmp_path) -> None:
+        path = tmp_path / "pages.jsonl"
+        path.write_text(
+            json.dumps({"url": "https://acme.example/a", "content": "Text"})
+            + "\n\n"
+            + json.dumps(
+                {
+                    "url": "https://acme.example/b",
+                    "content": "More",
+                    "title": "B",
+                    "source_group": "Acme",
+                }
+            )
+            + "\n"
+        )
+
+        pages = load_pages(path)
+
+        assert [p.source_group for p in pages] == ["acme.example", "Acme"]
+        assert pages[1].title == "B"
+
+    def test_load_pages_requires_content(self, tmp_path) -> None:
+        path = tmp_path / "pages.jsonl"
+        path.write_text(json.dumps({"url": "https://acme.example/a"}) + "\n")
+
+        with pytest.raises(ValueError, match="pages.jsonl:1"):
+            load_pages(path)
+
+
+class TestStageTimer:
+    async def test_times_sync_and_async_callables(self) -> None:
+        timer = StageTimer()
+
+        async def work() -> int:
+            return 1
+
+        assert await timer.wrap(work, "a")() == 1
+        assert timer.wrap(lambda: 2, "b")() == 2
+        summary = timer.summary()
+
+        assert summary["a"]["count"] == 1
+        assert summary["b"]["count"] == 1
+
+    def test_percentile_nearest_rank(self) -> None:
+        values = [i / 1000 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.05
+        assert percentile(values, 99) == 0.099
+        assert percentile([], 50) == 0.0
+
+
+def _report(throughput=10.0, calls=3.0, rss=200.0, p50=100.0, p99=200.0) -> dict:
+    return {
+        "throughput_sources_per_s": throughput,
+        "llm_calls_per_source": calls,
+        "peak_rss_mb": rss,
+        "stages": {
+            "llm_extract": {"p50_ms": p50, "p99_ms": p99},
+            "grounding": {"p50_ms": 0.02, "p99_ms": 0.1},
+        },
+    }
+
+
+class TestCompareReports:
+    def test_within_threshold(self) -> None:
+        assert compare_reports(_report(throughput=9.5, p99=215), _report()) == []
+
+    def test_detects_regressions(self) -> None:
+        regressions = compare_reports(
+            _report(throughput=8.0, calls=4.0, p50=130.0), _report()
+        )
+
+        assert {r.metric for r in regressions} == {
+            "throughput_sources_per_s",
+            "llm_calls_per_source",
+            "stages.llm_extract.p50_ms",
+        }
+
+    def test_improvements_pass(self) -> None:
+        assert compare_reports(_report(throughput=20, rss=100, p99=50), _report()) == []
+
+    def test_sub_millisecond_noise_ignored(self) -> None:
+        current = _report()
+        current["stages"]["grounding"] = {"p50_ms": 0.2, "p99_ms": 0.9}
+
+        assert compare_reports(current, _report()) == []
+
+
+class TestRunBenchmark:
+    async def test_end_to_end(self) -> None:
+        pages = synthetic_pages(6, companies=2, page_chars=1500)
+
+        with MockOpenAIServer() as server:
+            report = await run_benchmark(
+                pages,
+                server,
+                BenchmarkOptions(template="drivetrain_company_simple"),
+            )
+
+        assert report["result"]["sources_processed"] == 6
+        assert report["result"]["sources_failed"] == 0
+        assert report["result"]["total_extractions"] > 0
+        assert report["result"]["consolidated_records"] > 0
+        assert report["llm_calls"] >= report["calls"]["extract"] > 0
+        assert report["llm_calls_per_source"] == round(report["llm_calls"] / 6, 3)
+        assert report["calls"]["embedding"] > 0
+        for stage in ("extract_project", "extract_source", "llm_extract", "grounding"):
+            assert report["stages"][stage]["count"] > 0
+        assert report["peak_rss_mb"] > 0
+        assert compare_reports(report, report) == []
+
+    async def test_streamed_entities(self) -> None:
+        pages = synthetic_pages(4, companies=1, page_chars=1500)
+
+        with MockOpenAIServer() as server:
+            report = await run_benchmark(
+                pages,
+                server,
+                BenchmarkOptions(
+                    template="drivetrain_company_simple",
+                    data_version=2,
+                    stream_entities=True,
+                ),
+            )
+
+        assert report["result"]["sources_failed"] == 0
+        assert report["stages"]["first_grounded_entity"]["count"] > 0
+        assert report["streaming"]["interrupted_salvaged"] == 0
@@ -0,0 +1,323 @@
+"""Tests for compressed, content-addressed source body storage."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.orm import Session
+
+from config import SourceStorageConfig
+from database import engine
+from orm_models import ContentBlob, Project, Source
+from services.extraction.content_selector import (
+    get_cleaned_content,
+    get_extraction_content,
+    get_source_content,
+)
+from services.extraction.domain_dedup import (
+    DomainDedupService,
+    compute_domain_fingerprint,
+)
+from services.storage.content_hash import compute_content_hash
+from services.storage.repositories.content_blob import (
+    ContentBlobRepository,
+    blob_hash,
+)
+from services.storage.repositories.source import SourceRepository
+
+BLOB = SourceStorageConfig(mode="blob", compression_level=3)
+INLINE = SourceStorageConfig(mode="inline", compression_level=3)
+
+NAV = "Home | Products | About us | Contact | Careers | Investor relations"
+FOOTER = "Copyright 2026 Example Industries GmbH. All rights reserved worldwide."
+
+
+def _page(i: int) -> str:
+    body = f"Product {i} is a helical gearbox rated for {i * 10} Nm of output torque."
+    return f"{NAV}\n\n{body}\n\n{FOOTER}"
+
+
+@pytest.fixture
+def db_session():
+    """Create a fresh database session for each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(name="blob_storage_project", extraction_schema={"name": "t"})
+    db_session.add(project)
+    db_session.flush()
+    return project
+
+
+class TestContentBlobRepository:
+    def test_roundtrip_compressed(self, db_session):
+        repo = ContentBlobRepository(db_session)
+        text = "Gearbox specifications. " * 500
+
+        key = repo.put(text)
+        db_session.flush()
+
+        assert key == blob_hash(text)
+        blob = db_session.get(ContentBlob, key)
+        assert blob.codec == "zstd"
+        assert blob.size == len(text.encode())
+        assert len(blob.data) < blob.size / 10
+        assert repo.get(key) == text
+
+    def test_identical_bodies_stored_once(self, db_session):
+        repo = ContentBlobRepository(db_session)
+        text = "Shared boilerplate-heavy page " + "x" * 100
+
+        assert repo.put(text) == repo.put(text)
+        count = db_session.execute(
+            select(func.count())
+            .select_from(ContentBlob)
+            .where(ContentBlob.hash == blob_hash(text))
+        ).scalar()
+        assert count == 1
+
+    def test_get_many_skips_missing(self, db_session):
+        repo = ContentBlobRepository(db_session)
+        a = repo.put("alpha body")
+        result = repo.get_many([a, "0" * 64])
+        assert result == {a: "alpha body"}
+
+
+class TestOrphanBlobSweep:
+    def test_recrawled_body_swept(self, db_session, project):
+        uri = "https://example.com/recrawl"
+        sources = SourceRepository(db_session, storage=BLOB)
+        sources.upsert(
+            project_id=project.id, uri=uri, source_group="acme", content="old body"
+        )
+        sources.upsert(
+            project_id=project.id, uri=uri, source_group="acme", content="new body"
+        )
+        db_session.flush()
+
+        deleted = ContentBlobRepository(db_session).delete_orphans(
+            older_than=timedelta(0)
+        )
+
+        db_session.expire_all()
+
+        assert deleted >= 1
+        assert db_session.get(ContentBlob, blob_hash("old body")) is None
+        assert db_session.get(ContentBlob, blob_hash("new body")) is not None
+
+    def test_deleted_source_bodies_swept(self, db_session, project):
+        source = SourceRepository(db_session, storage=BLOB).create(
+            project_id=project.id,
+            uri="https://example.com/gone",
+            source_group="acme",
+            content="Deleted body",
+            raw_content="<p>Deleted body</p>",
+        )
+        db_session.delete(source)
+        db_session.flush()
+
+        ContentBlobRepository(db_session).delete_orphans(older_than=timedelta(0))
+        db_session.expire_all()
+
+        assert db_session.get(ContentBlob, blob_hash("Deleted body")) is None
+        assert db_session.get(ContentBlob, blob_hash("<p>Deleted body</p>")) is None
+
+    def test_reput_of_aged_orphan_survives_sweep(self, db_session):
+        repo = ContentBlobRepository(db_session)
+        key = repo.put("Body recrawled after it was orphaned")
+        db_session.flush()
+        db_session.execute(
+            update(ContentBlob)
+            .where(ContentBlob.hash == key)
+            .values(created_at=func.now() - timedelta(days=1))
+        )
+
+        # A writer stores the same body again before committing its source
+        assert repo.put("Body recrawled after it was orphaned") == key
+        repo.delete_orphans()
+        db_session.expire_all()
+
+        assert db_session.get(ContentBlob, key) is not None
+
+    def test_recent_orphans_kept_within_grace_period(self, db_session):
+        repo = ContentBlobRepository(db_session)
+        key = repo.put("Body of a source not yet committed")
+        db_session.flush()
+
+        repo.delete_orphans()
+
+        assert db_session.get(ContentBlob, key) is not None
+
+
+class TestSourceRepositoryBlobMode:
+    def test_create_stores_body_in_blob(self, db_session, project):
+        repo = SourceRepository(db_session, storage=BLOB)
+        source = repo.create(
+            project_id=project.id,
+            uri="https://example.com/blob",
+            source_group="acme",
+            content="Body text",
+            raw_content="<p>Body text</p>",
+        )
+
+        assert source.content is None
+        assert source.raw_content is None
+        assert source.content_blob_hash == blob_hash("Body text")
+        assert source.raw_content_blob_hash == blob_hash("<p>Body text</p>")
+        assert source.content_hash == compute_content_hash("Body text")
+        assert get_source_content(source) == "Body text"
+
+    def test_upsert_moves_existing_row_to_blob(self, db_session, project):
+        uri = "https://example.com/migrate"
+        SourceRepository(db_session, storage=INLINE).upsert(
+            project_id=project.id, uri=uri, source_group="acme", content="v1"
+        )
+        source, _ = SourceRepository(db_session, storage=BLOB).upsert(
+            project_id=project.id, uri=uri, source_group="acme", content="v2"
+        )
+        db_session.refresh(source)
+
+        assert source.content is None
+        assert source.content_blob_hash == blob_hash("v2")
+        assert get_source_content(source) == "v2"
+
+    def test_blob_sources_count_as_having_content(self, db_session, project):
+        repo = SourceRepository(db_session, storage=BLOB)
+        for i in range(2):
+            repo.create(
+                project_id=project.id,
+                uri=f"https://example.com/p{i}",
+                source_group="acme",
+                content=_page(i),
+                meta_data={"domain": "example.com"},
+            )
+
+        assert repo.get_domains_for_project(project.id) == [("example.com", 2)]
+        assert len(repo.get_by_project_and_domain(project.id, "example.com")) == 2
+
+    def test_listing_does_not_load_bodies(self, db_session, project):
+        repo = SourceRepository(db_session, storage=INLINE)
+        repo.create(
+            project_id=project.id,
+            uri="https://example.com/deferred",
+            source_group="acme",
+            content="Large body",
+        )
+        db_session.expunge_all()
+
+        source = db_session.execute(
+            select(Source).where(Source.project_id == project.id)
+        ).scalar_one()
+
+        unloaded = inspect(source).unloaded
+        assert {"content", "raw_content", "cleaned_content"} <= unloaded
+
+
+class TestCleanedContentDelta:
+    def test_domain_dedup_stores_delta_and_replays_it(self, db_session, project):
+        repo = SourceRepository(db_session, storage=BLOB)
+        for i in range(6):
+            repo.create(
+                project_id=project.id,
+                uri=f"https://example.com/products/{i}",
+                source_group="acme",
+                content=_page(i),
+                meta_data={"domain": "example.com"},
+            )
+        db_session.flush()
+
+        result = DomainDedupService(db_session).analyze_domain(
+            project.id, "example.com", min_block_chars=20
+        )
+
+        assert result.pages_cleaned == 6
+        sources = repo.get_by_project_and_domain(project.id, "example.com")
+        for source in sources:
+            assert source.cleaned_content is None
+            assert len(source.cleaned_content_delta["hashes"]) == 2
+            cleaned = get_cleaned_content(source)
+            assert NAV not in cleaned
+            assert FOOTER not in cleaned
+            assert "helical gearbox" in cleaned
+            assert get_extraction_content(source) == cleaned
+            assert get_extraction_content(source, domain_dedup_enabled=False) == (
+                get_source_content(source)
+            )
+
+    def test_inline_sources_keep_cleaned_text(self, db_session, project):
+        repo = SourceRepository(db_session, storage=INLINE)
+        for i in range(6):
+            repo.create(
+                project_id=project.id,
+                uri=f"https://example.com/inline/{i}",
+                source_group="acme",
+                content=_page(i),
+                meta_data={"domain": "example.com"},
+            )
+        db_session.flush()
+
+        DomainDedupService(db_session).analyze_domain(
+            project.id, "example.com", min_block_chars=20
+        )
+
+        for source in repo.get_by_project_and_domain(project.id, "example.com"):
+            assert source.cleaned_content_delta is None
+            assert "helical gearbox" in source.cleaned_content
+            assert NAV not in source.cleaned_content
+
+
+class TestStreamingDomainAnalysis:
+    def _create(self, repo, project, n, prefix="products"):
+        for i in range(n):
+            repo.create(
+                project_id=project.id,
+                uri=f"https://example.com/{prefix}/{i}",
+                source_group="acme",
+                content=_page(i),
+                meta_data={"domain": "example.com"},
+            )
+        repo._session.flush()
+
+    def test_small_batches_match_in_memory_fingerprint(self, db_session, project):
+        repo = SourceRepository(db_session, storage=BLOB)
+        self._create(repo, project, 7)
+        expected = compute_domain_fingerprint(
+            [_page(i) for i in range(7)], min_block_chars=20
+        )
+
+        batches = list(repo.iter_domain_bodies(project.id, "example.com", batch_size=3))
+        result = DomainDedupService(db_session, batch_size=3).analyze_domain(
+            project.id, "example.com", min_block_chars=20
+        )
+
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert result.pages_analyzed == 7
+        assert result.pages_cleaned == 7
+        assert result.blocks_boilerplate == expected.blocks_boilerplate
+        db_session.expire_all()
+        for source in repo.get_by_project_and_domain(project.id, "example.com"):
+            assert NAV not in get_extraction_content(source)
+
+    def test_stale_cleaned_content_cleared(self, db_session, project):
+        repo = SourceRepository(db_session, storage=INLINE)
+        self._create(repo, project, 6)
+        service = DomainDedupService(db_session, batch_size=4)
+        service.analyze_domain(project.id, "example.com", min_block_chars=20)
+
+        # Raising the threshold above the page count leaves no boilerplate
+        result = service.analyze_domain(
+            project.id, "example.com", min_pages=10, min_block_chars=20
+        )
+
+        assert result.pages_cleaned == 0
+        assert repo.count_cleaned_in_domain(project.id, "example.com") == 0
@@ -0,0 +1,185 @@
+"""Tests for Camoufox request blocking."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from services.camoufox.blocking import (
+    AD_DOMAIN_MATCHER,
+    AD_DOMAIN_URL_PATTERN,
+    HostSuffixMatcher,
+    RequestBlocker,
+    url_host,
+)
+from services.camoufox.config import CamoufoxSettings
+from services.camoufox.models import ScrapeRequest
+from services.camoufox.scraper import CamoufoxScraper
+
+
+class TestHostSuffixMatcher:
+    @pytest.fixture
+    def matcher(self):
+        return HostSuffixMatcher(["doubleclick.net", "adservice.google.com"])
+
+    @pytest.mark.parametrize(
+        "host",
+        ["doubleclick.net", "ad.doubleclick.net", "x.y.doubleclick.net."],
+    )
+    def test_domain_and_subdomains_match(self, matcher, host):
+        assert matcher.matches_host(host)
+
+    @pytest.mark.parametrize(
+        "host",
+        ["notdoubleclick.net", "google.com", "www.google.com", "net", ""],
+    )
+    def test_other_hosts_do_not_match(self, matcher, host):
+        assert not matcher.matches_host(host)
+
+    def test_case_insensitive(self, matcher):
+        assert matcher.matches_url("https://AdService.Google.COM/x")
+
+    def test_url_matches_on_host_only(self, matcher):
+        assert matcher.matches_url("https://ad.doubleclick.net/pixel?x=1")
+        assert not matcher.matches_url("https://example.com/?ref=doubleclick.net")
+
+    def test_unparseable_url_not_matched(self, matcher):
+        assert not matcher.matches_url("http://[::1")
+        assert not matcher.matches_url("data:image/png;base64,AAAA")
+
+    def test_default_ad_list(self):
+        assert AD_DOMAIN_MATCHER.matches_url("https://www.googletagmanager.com/gtm.js")
+        assert AD_DOMAIN_MATCHER.matches_url("https://c.amazon-adsystem.com/aax2")
+        assert not AD_DOMAIN_MATCHER.matches_url("https://www.google.com/")
+
+
+class TestUrlHost:
+    @pytest.mark.parametrize(
+        ("url", "host"),
+        [
+            ("https://Ads.Example.com/a?b#c", "ads.example.com"),
+            ("http://user:pw@example.com:8080/x", "example.com"),
+            ("https://example.com?q=a/b", "example.com"),
+            ("https://example.com", "example.com"),
+            ("http://[::1]:8080/", "[::1]"),
+            ("data:image/png;base64,AAAA", ""),
+            ("about:blank", ""),
+        ],
+    )
+    def test_extracts_host(self, url, host):
+        assert url_host(url) == host
+
+
+class TestAdDomainUrlPattern:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://ad.doubleclick.net/pixel",
+            "https://doubleclick.net",
+            "http://www.GoogleTagManager.com:443/gtm.js?id=1",
+            "https://example.com/?ref=doubleclick.net",
+            "https://notdoubleclick.net/",
+            "https://doubleclick.net.example.com/",
+            "https://adsystem.com.evil/x",
+        ],
+    )
+    def test_agrees_with_trie(self, url):
+        assert bool(AD_DOMAIN_URL_PATTERN.search(url)) == (
+            AD_DOMAIN_MATCHER.matches_url(url)
+        )
+
+
+class TestRequestBlocker:
+    def test_counts_blocked_and_allowed(self):
+        blocker = RequestBlocker(["image", "font"])
+
+        assert blocker.should_block("https://example.com/a.png", "image")
+        assert blocker.should_block("https://ad.doubleclick.net/x.js", "script")
+        assert not blocker.should_block("https://example.com/app.js", "script")
+        assert not blocker.should_block("https://example.com/", "document")
+
+        assert blocker.stats.blocked_resources == 1
+        assert blocker.stats.blocked_ads == 1
+        assert blocker.stats.blocked == 2
+        assert blocker.stats.allowed == 2
+
+    def test_no_resource_types_blocks_only_ads(self):
+        blocker = RequestBlocker()
+        assert not blocker.routes_all_requests
+        assert not blocker.should_block("https://example.com/a.png", "image")
+
+
+class TestBlockedResourceTypesSetting:
+    def test_nothing_blocked_by_default(self):
+        assert CamoufoxSettings.model_fields["blocked_resource_types"].default == ""
+
+    def test_comma_separated(self):
+        config = CamoufoxSettings(blocked_resource_types="Image, stylesheet")
+        assert config.blocked_resource_types == ["image", "stylesheet"]
+
+    def test_empty_disables(self):
+        assert CamoufoxSettings(blocked_resource_types="").blocked_resource_types == []
+
+    def test_unknown_type_rejected(self):
+        with pytest.raises(ValidationError):
+            CamoufoxSettings(blocked_resource_types="image,script")
+
+
+class TestScrapeRouting:
+    @pytest.fixture
+    def browser(self):
+        browser = MagicMock()
+        context = AsyncMock()
+        context.on = MagicMock()
+        page = AsyncMock()
+        response = AsyncMock()
+        browser.new_context = AsyncMock(return_value=context)
+        context.new_page = AsyncMock(return_value=page)
+        page.goto = AsyncMock(return_value=response)
+        page.content = AsyncMock(return_value="<html><body>Test</body></html>")
+        response.status = 200
+        response.all_headers = AsyncMock(return_value={"content-type": "text/html"})
+        return browser, context
+
+    async def _scrape(self, browser, blocked_resource_types):
+        scraper = CamoufoxScraper(
+            CamoufoxSettings(
+                blocked_resource_types=blocked_resource_types, networkidle_timeout=0
+            )
+        )
+        await scraper._do_scrape(
+            ScrapeRequest(url="https://example.com", timeout=30000), browser
+        )
+
+    async def test_route_handler_uses_blocker(self, browser):
+        browser, context = browser
+        await self._scrape(browser, "image")
+
+        pattern, handler = context.route.call_args.args
+        assert pattern == "**/*"
+
+        image_route = AsyncMock()
+        image_route.request = MagicMock(
+            url="https://example.com/a.png", resource_type="image"
+        )
+        await handler(image_route)
+        image_route.abort.assert_awaited_once()
+
+        page_route = AsyncMock()
+        page_route.request = MagicMock(
+            url="https://example.com/app.js", resource_type="script"
+        )
+        await handler(page_route)
+        page_route.continue_.assert_awaited_once()
+
+    async def test_without_resource_types_only_ads_are_routed(self, browser):
+        browser, context = browser
+        await self._scrape(browser, "")
+
+        pattern, handler = context.route.call_args.args
+        assert pattern is AD_DOMAIN_URL_PATTERN
+        assert context.on.call_args.args[0] == "request"
+
+        route = AsyncMock()
+        await handler(route)
+        route.abort.assert_awaited_once()
@@ -0,0 +1,173 @@
+"""Tests for least-loaded browser selection and the Camoufox context pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.camoufox.config import CamoufoxSettings
+from services.camoufox.models import ScrapeRequest
+from services.camoufox.scraper import CamoufoxScraper
+
+
+def make_browser() -> MagicMock:
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+
+    async def new_context(**_options):
+        context = AsyncMock()
+        context.on = MagicMock()
+        page = AsyncMock()
+        response = AsyncMock()
+        response.status = 200
+        response.all_headers = AsyncMock(return_value={"content-type": "text/html"})
+        page.goto = AsyncMock(return_value=response)
+        page.content = AsyncMock(return_value="<html><body>ok</body></html>")
+        context.new_page = AsyncMock(return_value=page)
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+def make_scraper(browser_count: int = 2, pool_size: int = 2) -> CamoufoxScraper:
+    scraper = CamoufoxScraper(
+        CamoufoxSettings(
+            browser_count=browser_count,
+            max_concurrent_pages=8,
+            context_pool_size=pool_size,
+            networkidle_timeout=0,
+            recycle_after_requests=0,
+        )
+    )
+    scraper._browsers = [make_browser() for _ in range(browser_count)]
+    scraper._browser_request_counts = [0] * browser_count
+    scraper._browser_in_flight = [0] * browser_count
+    scraper._context_pools = [[] for _ in range(browser_count)]
+    return scraper
+
+
+async def warm(scraper: CamoufoxScraper) -> None:
+    for i in range(len(scraper._browsers)):
+        await scraper._refill_context_pool(i)
+
+
+REQUEST = ScrapeRequest(url="https://example.com", timeout=30000)
+
+
+class TestLeastLoadedSelection:
+    def test_picks_browser_with_fewest_in_flight(self):
+        scraper = make_scraper(browser_count=3)
+        scraper._browser_in_flight = [2, 0, 1]
+
+        _, index = scraper._get_next_browser()
+
+        assert index == 1
+
+    def test_ties_rotate_round_robin(self):
+        scraper = make_scraper(browser_count=3)
+
+        indices = [scraper._get_next_browser()[1] for _ in range(6)]
+
+        assert indices == [0, 1, 2, 0, 1, 2]
+
+    def test_disconnected_browser_skipped_even_if_idle(self):
+        scraper = make_scraper(browser_count=2)
+        scraper._browsers[0].is_connected.return_value = False
+        scraper._browser_in_flight = [0, 5]
+        scraper._schedule_browser_restart = MagicMock()
+
+        _, index = scraper._get_next_browser()
+
+        assert index == 1
+        scraper._schedule_browser_restart.assert_called_once_with(0)
+
+    async def test_concurrent_scrapes_spread_across_browsers(self):
+        scraper = make_scraper(browser_count=2, pool_size=0)
+        release = asyncio.Event()
+        seen: list[int] = []
+
+        async def slow_scrape(request, browser, browser_idx=None):
+            seen.append(browser_idx)
+            await release.wait()
+            return {"content": "", "pageStatusCode": 200}
+
+        scraper._do_scrape = slow_scrape
+        tasks = [asyncio.create_task(scraper.scrape(REQUEST)) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert scraper._browser_in_flight == [2, 2]
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert sorted(seen) == [0, 0, 1, 1]
+        assert scraper._browser_in_flight == [0, 0]
+
+
+class TestContextPool:
+    async def test_refill_fills_to_pool_size(self):
+        scraper = make_scraper(pool_size=2)
+        await warm(scraper)
+
+        assert [len(p) for p in scraper._context_pools] == [2, 2]
+
+    async def test_scrape_uses_pooled_context_and_closes_it(self):
+        scraper = make_scraper(browser_count=1, pool_size=1)
+        await warm(scraper)
+        _, pooled = scraper._context_pools[0][0]
+
+        result = await scraper.scrape(REQUEST)
+        await asyncio.sleep(0)
+
+        assert result["pageStatusCode"] == 200
+        pooled.close.assert_awaited_once()
+        assert scraper.pool_stats()["contextPoolHits"] == 1
+        # Refilled in the background with a new clean context
+        assert len(scraper._context_pools[0]) == 1
+        assert scraper._context_pools[0][0][1] is not pooled
+
+    async def test_context_options_bypass_pool(self):
+        scraper = make_scraper(browser_count=1, pool_size=1)
+        await warm(scraper)
+
+        await scraper._do_scrape(
+            ScrapeRequest(url="https://example.com", skip_tls_verification=True),
+            scraper._browsers[0],
+            0,
+        )
+
+        scraper._browsers[0].new_context.assert_awaited_with(ignore_https_errors=True)
+        assert len(scraper._context_pools[0]) == 1
+        assert scraper.pool_stats()["contextPoolMisses"] == 1
+
+    async def test_context_from_replaced_browser_not_used(self):
+        scraper = make_scraper(browser_count=1, pool_size=1)
+        await warm(scraper)
+        _, stale = scraper._context_pools[0][0]
+        scraper._browsers[0] = make_browser()
+
+        context = await scraper._new_context(scraper._browsers[0], 0, {})
+
+        assert context is not stale
+        assert scraper.pool_stats()["contextPoolMisses"] == 1
+
+    async def test_pool_disabled(self):
+        scraper = make_scraper(browser_count=1, pool_size=0)
+        await warm(scraper)
+
+        await scraper.scrape(REQUEST)
+
+        assert scraper._context_pools == [[]]
+        scraper._browsers[0].new_context.assert_awaited_once()
+
+    @pytest.mark.parametrize("pool_size", [0, 2])
+    async def test_stats_report_per_browser_load(self, pool_size):
+        scraper = make_scraper(browser_count=2, pool_size=pool_size)
+        await warm(scraper)
+        scraper._browser_in_flight = [1, 0]
+
+        stats = scraper.pool_stats()
+
+        assert [b["inFlight"] for b in stats["browsers"]] == [1, 0]
+        assert [b["pooledContexts"] for b in stats["browsers"]] == [pool_size] * 2
+        assert all(b["connected"] for b in stats["browsers"])
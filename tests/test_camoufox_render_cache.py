@@ -0,0 +1,218 @@
+"""Tests for the Camoufox rendered-page cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.camoufox.cache import (
+    BYPASS,
+    HIT,
+    MISS,
+    REVALIDATED,
+    RenderCache,
+    cache_key,
+    freshness_lifetime,
+    request_cache_mode,
+)
+from services.camoufox.models import ScrapeRequest
+
+REQUEST = ScrapeRequest(url="https://example.com/a", timeout=30000)
+
+
+def rendered(headers: dict[str, str] | None = None, status: int = 200) -> dict:
+    return {
+        "content": "<html>ok</html>",
+        "pageStatusCode": status,
+        "pageError": None,
+        "contentType": "text/html",
+        "cacheHeaders": headers or {},
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = RenderCache(
+        tmp_path, max_bytes=1_000_000, ttl_seconds=3600, revalidate=AsyncMock()
+    )
+    cache.load()
+    return cache
+
+
+class TestCacheKey:
+    def test_timeout_does_not_change_key(self):
+        assert cache_key(REQUEST) == cache_key(
+            ScrapeRequest(url=REQUEST.url, timeout=5000)
+        )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"url": "https://example.com/b"},
+            {"headers": {"Accept-Language": "de"}},
+            {"check_selector": "#main"},
+            {"discover_ajax": True},
+            {"wait_after_load": 1000},
+        ],
+    )
+    def test_rendering_options_change_key(self, changes):
+        assert cache_key(REQUEST) != cache_key(REQUEST.model_copy(update=changes))
+
+
+class TestFreshness:
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, 3600),
+            ({"cache-control": "public, max-age=60"}, 60),
+            ({"cache-control": "max-age=60, s-maxage=120"}, 120),
+            ({"cache-control": "max-age=999999"}, 3600),
+            ({"cache-control": "no-store"}, None),
+            ({"cache-control": "no-cache"}, None),
+            ({"cache-control": "no-cache", "etag": '"v1"'}, 0),
+            ({"cache-control": "max-age=0", "last-modified": "x"}, 0),
+        ],
+    )
+    def test_lifetime(self, headers, expected):
+        assert freshness_lifetime(headers, 3600) == expected
+
+    @pytest.mark.parametrize(
+        ("header", "mode"),
+        [
+            (None, (True, True)),
+            ("no-cache", (False, True)),
+            ("max-age=0", (False, True)),
+            ("no-store", (False, False)),
+        ],
+    )
+    def test_request_bypass(self, header, mode):
+        assert request_cache_mode(header) == mode
+
+
+class TestGetOrRender:
+    async def test_second_request_is_hit(self, cache):
+        render = AsyncMock(return_value=rendered())
+
+        first, first_status = await cache.get_or_render(REQUEST, render)
+        second, second_status = await cache.get_or_render(REQUEST, render)
+
+        assert (first_status, second_status) == (MISS, HIT)
+        assert render.await_count == 1
+        assert second["content"] == first["content"]
+        assert "cacheHeaders" not in second
+
+    async def test_errors_and_non_200_not_stored(self, cache):
+        for result in ({"error": "boom"}, rendered(status=404)):
+            render = AsyncMock(return_value=result)
+            await cache.get_or_render(REQUEST, render)
+            await cache.get_or_render(REQUEST, render)
+            assert render.await_count == 2
+        assert cache.entries == 0
+
+    async def test_no_store_response_not_stored(self, cache):
+        render = AsyncMock(return_value=rendered({"cache-control": "no-store"}))
+        await cache.get_or_render(REQUEST, render)
+        assert cache.entries == 0
+
+    async def test_bypass_renders_and_replaces(self, cache):
+        await cache.get_or_render(REQUEST, AsyncMock(return_value=rendered()))
+        fresh = rendered()
+        fresh["content"] = "<html>new</html>"
+
+        _, status = await cache.get_or_render(
+            REQUEST, AsyncMock(return_value=fresh), read=False
+        )
+        result, _ = await cache.get_or_render(REQUEST, AsyncMock())
+
+        assert status == BYPASS
+        assert result["content"] == "<html>new</html>"
+
+    async def test_expired_entry_revalidated_with_etag(self, cache):
+        headers = {"cache-control": "no-cache", "etag": '"v1"'}
+        await cache.get_or_render(REQUEST, AsyncMock(return_value=rendered(headers)))
+        cache._revalidate.return_value = 304
+        render = AsyncMock()
+
+        result, status = await cache.get_or_render(REQUEST, render)
+
+        assert status == REVALIDATED
+        assert result["content"] == "<html>ok</html>"
+        render.assert_not_awaited()
+        url, sent = cache._revalidate.await_args.args
+        assert url == REQUEST.url
+        assert sent["If-None-Match"] == '"v1"'
+
+    async def test_changed_origin_rerenders(self, cache):
+        headers = {"cache-control": "max-age=0", "etag": '"v1"'}
+        await cache.get_or_render(REQUEST, AsyncMock(return_value=rendered(headers)))
+        cache._revalidate.return_value = 200
+        render = AsyncMock(return_value=rendered())
+
+        _, status = await cache.get_or_render(REQUEST, render)
+
+        assert status == MISS
+        render.assert_awaited_once()
+
+    async def test_concurrent_requests_share_one_render(self, cache):
+        release = asyncio.Event()
+
+        async def slow_render(_request):
+            await release.wait()
+            return rendered()
+
+        render = AsyncMock(side_effect=slow_render)
+        tasks = [
+            asyncio.create_task(cache.get_or_render(REQUEST, render)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        statuses = sorted(status for _, status in await asyncio.gather(*tasks))
+
+        assert render.await_count == 1
+        assert statuses == [HIT, HIT, MISS]
+
+
+class TestStorage:
+    def test_entry_larger_than_cache_not_stored(self, tmp_path):
+        cache = RenderCache(tmp_path, max_bytes=1, ttl_seconds=60)
+        cache.load()
+
+        assert not cache.put("a", {"content": "x"}, {})
+        assert cache.entries == 0
+        assert not list(tmp_path.glob("*.json.gz"))
+
+    def test_least_recently_used_evicted_first(self, tmp_path):
+        cache = RenderCache(tmp_path, max_bytes=1_000_000, ttl_seconds=60)
+        cache.load()
+        # Fixed timestamps keep the three entries the same size
+        cache.put("a", {"content": "x"}, {}, now=1000.0)
+        cache.put("b", {"content": "y"}, {}, now=1000.0)
+        cache.get("a")
+        cache.max_bytes = cache.total_bytes
+
+        cache.put("c", {"content": "z"}, {}, now=1000.0)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+    def test_index_rebuilt_on_load(self, tmp_path):
+        cache = RenderCache(tmp_path, max_bytes=1_000_000, ttl_seconds=60)
+        cache.put("a", {"content": "x"}, {})
+
+        reloaded = RenderCache(tmp_path, max_bytes=1_000_000, ttl_seconds=60)
+        reloaded.load()
+
+        assert reloaded.entries == 1
+        assert reloaded.total_bytes == cache.total_bytes
+        assert reloaded.get("a").result == {"content": "x"}
+
+    def test_corrupt_entry_dropped(self, tmp_path):
+        cache = RenderCache(tmp_path, max_bytes=1_000_000, ttl_seconds=60)
+        (tmp_path / "a.json.gz").write_bytes(b"not gzip")
+        cache.load()
+
+        assert cache.get("a") is None
+        assert cache.entries == 0
+        assert not (tmp_path / "a.json.gz").exists()
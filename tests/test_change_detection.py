@@ -0,0 +1,261 @@
+"""Tests for content-hash change detection (skip unchanged sources)."""
+
+from dataclasses import replace
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from constants import SourceStatus
+from services.extraction.domain_dedup import (
+    DomainDedupService,
+    compute_domain_content_digest,
+)
+from services.extraction.pipeline import SchemaExtractionPipeline
+from services.extraction.schema_adapter import schema_fingerprint
+from services.storage.content_hash import compute_content_hash, normalize_content
+from services.storage.repositories.source import SourceBody
+
+SCHEMA = {"name": "test_schema", "field_groups": [{"name": "test", "fields": []}]}
+
+
+class TestContentHash:
+    def test_cosmetic_whitespace_ignored(self):
+        a = "# Title\r\n\r\n\r\nSome   text  \nMore\ttext"
+        b = "# Title\n\nSome text\nMore text\n"
+        assert compute_content_hash(a) == compute_content_hash(b)
+
+    def test_unicode_composition_ignored(self):
+        assert compute_content_hash("Cafe\u0301") == compute_content_hash("Caf\u00e9")
+
+    def test_text_change_detected(self):
+        assert compute_content_hash("Price: 10") != compute_content_hash("Price: 12")
+
+    def test_line_structure_preserved(self):
+        assert normalize_content("a\nb") == "a\nb"
+
+    def test_empty_content_has_no_hash(self):
+        assert compute_content_hash(None) is None
+        assert compute_content_hash("") is None
+
+
+class TestSchemaFingerprint:
+    def test_key_order_irrelevant(self):
+        a = {"name": "s", "field_groups": []}
+        b = {"field_groups": [], "name": "s"}
+        assert schema_fingerprint(a) == schema_fingerprint(b)
+
+    def test_schema_edit_changes_fingerprint(self):
+        edited = {**SCHEMA, "extraction_context": {"source_type": "company"}}
+        assert schema_fingerprint(SCHEMA) != schema_fingerprint(edited)
+
+    def test_data_version_changes_fingerprint(self):
+        assert schema_fingerprint(SCHEMA, 1) != schema_fingerprint(SCHEMA, 2)
+
+
+class TestPipelineSkipsUnchanged:
+    @pytest.fixture
+    def orchestrator(self):
+        orchestrator = AsyncMock()
+        orchestrator.extract_all_groups.return_value = ([], None)
+        return orchestrator
+
+    @pytest.fixture
+    def db(self):
+        return Mock()
+
+    def _source(self, content="Content", status=SourceStatus.EXTRACTED, hashes=None):
+        source = Mock()
+        source.id = uuid4()
+        source.project_id = uuid4()
+        source.content = content
+        source.content_hash = compute_content_hash(content)
+        source.source_group = "TestCompany"
+        source.uri = f"https://example.com/{source.id}"
+        source.title = "Page"
+        source.status = status
+        source.page_type = None
+        source.extraction_content_hash, source.extraction_schema_hash = hashes or (
+            None,
+            None,
+        )
+        return source
+
+    async def _run(self, db, orchestrator, sources, extraction_config=None, **kwargs):
+        project = Mock()
+        project.extraction_schema = SCHEMA
+
+        execute_result = Mock()
+        execute_result.scalar_one_or_none.return_value = project
+        execute_result.scalars.return_value.all.return_value = sources
+        db.execute.return_value = execute_result
+
+        group = Mock()
+        group.name = "test"
+        pipeline = SchemaExtractionPipeline(
+            orchestrator, db, extraction_config=extraction_config
+        )
+        with patch("services.extraction.pipeline.SchemaAdapter") as adapter_cls:
+            adapter = adapter_cls.return_value
+            adapter.validate_extraction_schema.return_value = Mock(is_valid=True)
+            adapter.convert_to_field_groups.return_value = [group]
+            return await pipeline.extract_project(project_id=uuid4(), **kwargs)
+
+    def _current_schema_hash(self):
+        from config import settings
+
+        return schema_fingerprint(SCHEMA, settings.extraction.data_version)
+
+    async def test_unchanged_source_skipped(self, db, orchestrator):
+        unchanged = self._source(
+            hashes=(compute_content_hash("Content"), self._current_schema_hash())
+        )
+        changed = self._source(
+            content="New content",
+            hashes=(compute_content_hash("Content"), self._current_schema_hash()),
+        )
+
+        result = await self._run(
+            db, orchestrator, [unchanged, changed], skip_extracted=False
+        )
+
+        assert result.sources_unchanged == 1
+        assert result.sources_processed == 1
+        assert orchestrator.extract_all_groups.await_count == 1
+        assert orchestrator.extract_all_groups.await_args.kwargs["source_id"] == (
+            changed.id
+        )
+
+    async def test_schema_change_forces_reextraction(self, db, orchestrator):
+        source = self._source(hashes=(compute_content_hash("Content"), "old-schema"))
+
+        result = await self._run(db, orchestrator, [source], skip_extracted=False)
+
+        assert result.sources_unchanged == 0
+        assert result.sources_processed == 1
+
+    async def test_hashes_recorded_after_extraction(self, db, orchestrator):
+        source = self._source(status=SourceStatus.PENDING)
+
+        await self._run(db, orchestrator, [source])
+
+        assert source.extraction_content_hash == source.content_hash
+        assert source.extraction_schema_hash == self._current_schema_hash()
+
+    async def test_partial_extraction_does_not_record_hashes(self, db, orchestrator):
+        source = self._source(status=SourceStatus.PENDING)
+
+        await self._run(db, orchestrator, [source], field_groups_filter=["test"])
+
+        assert source.extraction_content_hash is None
+        assert source.extraction_schema_hash is None
+
+    async def test_failed_extraction_does_not_record_hashes(self, db, orchestrator):
+        orchestrator.extract_all_groups.side_effect = RuntimeError("boom")
+        source = self._source(status=SourceStatus.PENDING)
+
+        result = await self._run(db, orchestrator, [source])
+
+        assert result.sources_failed == 1
+        assert source.extraction_content_hash is None
+
+    async def test_disabled_setting_reextracts_everything(self, db, orchestrator):
+        from config import settings
+
+        source = self._source(
+            hashes=(compute_content_hash("Content"), self._current_schema_hash())
+        )
+        config = replace(settings.extraction, skip_unchanged_sources=False)
+
+        result = await self._run(
+            db, orchestrator, [source], extraction_config=config, skip_extracted=False
+        )
+
+        assert result.sources_unchanged == 0
+        assert result.sources_processed == 1
+
+
+class TestDomainDedupSkipsUnchanged:
+    def _source(self, uri, content):
+        source = Mock()
+        source.id = uuid4()
+        source.uri = uri
+        source.content = content
+        source.content_hash = compute_content_hash(content)
+        source.content_blob_hash = None
+        source.cleaned_content = None
+        source.cleaned_content_delta = None
+        return source
+
+    def test_digest_independent_of_order(self):
+        a = self._source("https://x.com/a", "A")
+        b = self._source("https://x.com/b", "B")
+        assert compute_domain_content_digest(
+            [a, b], 0.7, 5, 50
+        ) == compute_domain_content_digest([b, a], 0.7, 5, 50)
+
+    def test_digest_changes_with_content_and_params(self):
+        a = self._source("https://x.com/a", "A")
+        base = compute_domain_content_digest([a], 0.7, 5, 50)
+        assert compute_domain_content_digest([a], 0.8, 5, 50) != base
+        a.content_hash = compute_content_hash("A2")
+        assert compute_domain_content_digest([a], 0.7, 5, 50) != base
+
+    def test_digest_ignores_sources_without_hash(self):
+        a = self._source("https://x.com/a", "A")
+        b = self._source("https://x.com/b", None)
+        assert compute_domain_content_digest(
+            [a, b], 0.7, 5, 50
+        ) == compute_domain_content_digest([a], 0.7, 5, 50)
+
+    def _service(self, sources, existing):
+        service = DomainDedupService(Mock())
+        service._source_repo = Mock()
+        service._source_repo.get_domain_content_hashes.return_value = sources
+        service._source_repo.count_cleaned_in_domain.return_value = sum(
+            1 for s in sources if s.cleaned_content is not None
+        )
+        service._source_repo.iter_domain_bodies.return_value = []
+        service._bp_repo = Mock()
+        service._bp_repo.get.return_value = existing
+        return service
+
+    def test_unchanged_domain_not_reanalyzed(self):
+        sources = [self._source(f"https://x.com/{i}", f"Page {i}") for i in range(3)]
+        sources[0].cleaned_content = "cleaned"
+        service = self._service(
+            sources,
+            Mock(
+                content_digest=compute_domain_content_digest(sources, 0.7, 5, 50),
+                pages_analyzed=3,
+                blocks_boilerplate=2,
+                bytes_removed_avg=10,
+            ),
+        )
+
+        result = service.analyze_domain(uuid4(), "x.com")
+
+        assert result.unchanged is True
+        assert result.pages_cleaned == 1
+        assert result.bytes_removed_total == 10
+        service._bp_repo.upsert.assert_not_called()
+        service._source_repo.iter_domain_bodies.assert_not_called()
+
+    def test_changed_domain_reanalyzed_and_digest_stored(self):
+        sources = [self._source(f"https://x.com/{i}", f"Page {i}") for i in range(3)]
+        service = self._service(sources, Mock(content_digest="stale"))
+        service._source_repo.iter_domain_bodies.return_value = [
+            [
+                SourceBody(s.id, s.uri, s.content, blob_stored=False, is_cleaned=False)
+                for s in sources
+            ]
+        ]
+
+        result = service.analyze_domain(uuid4(), "x.com")
+
+        assert result.unchanged is False
+        service._source_repo.backfill_content_hashes.assert_called_once()
+        kwargs = service._bp_repo.upsert.call_args.kwargs
+        assert kwargs["content_digest"] == compute_domain_content_digest(
+            sources, 0.7, 5, 50
+        )
@@ -1,5 +1,7 @@
 """Tests for document chunking."""
 
+import time
+
 from services.llm.chunking import (
     chunk_document,
     count_tokens,
@@ -27,6 +29,15 @@ class TestCountTokens:
         text = "a" * 400
         assert count_tokens(text) == 100
 
+    def test_cjk_scripts(self) -> None:
+        # Han, Hiragana, Katakana, Hangul: 1.5 chars per token
+        assert count_tokens("漢字ひらカナ한국") == 5
+        # Greek and accented Latin count as non-CJK
+        assert count_tokens("Δéλτα漢字漢") == 1 + 2
+
+    def test_mixed_text(self) -> None:
+        assert count_tokens("gearbox 製品") == 2 + 1
+
 
 class TestSplitByHeaders:
     """Test markdown header splitting."""
@@ -151,6 +162,37 @@ Content 2."""
         for chunk in chunks:
             assert count_tokens(chunk.content) <= 100
 
+    def test_oversized_paragraph_word_windows(self) -> None:
+        section = "## Specs\n" + " ".join(f"w{i:03d}" for i in range(60))
+        chunks = chunk_document(section, max_tokens=20)
+
+        # Header (9 chars) + 14 five-char words = 79 chars = 19 tokens
+        assert [c.content for c in chunks[:2]] == [
+            "## Specs\n" + " ".join(f"w{i:03d}" for i in range(14)),
+            "## Specs\n" + " ".join(f"w{i:03d}" for i in range(14, 28)),
+        ]
+        assert chunks[-1].content.endswith("w059")
+
+    def test_word_larger_than_budget_is_own_chunk(self) -> None:
+        section = "## Data\n" + "short " + "x" * 200 + " tail"
+        chunks = chunk_document(section, max_tokens=20)
+
+        assert [c.content for c in chunks] == [
+            "## Data\nshort",
+            "## Data\n" + "x" * 200,
+            "## Data\ntail",
+        ]
+
+    def test_linear_on_large_documents(self) -> None:
+        # 5 MB single paragraph used to be quadratic in split_large_section
+        text = "## Catalogue\n" + "helical gearbox 450 kW motor " * 180_000
+        start = time.perf_counter()
+        chunks = chunk_document(text, max_tokens=5000, overlap_tokens=200)
+        elapsed = time.perf_counter() - start
+        assert len(chunks) > 200
+        assert all(count_tokens(c.content) <= 5000 + 200 for c in chunks)
+        assert elapsed < 5.0
+
     def test_header_path_extraction(self) -> None:
         markdown = """# Main Title
 
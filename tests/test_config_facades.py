@@ -6,6 +6,7 @@ import pytest
 
 from config import (
     ClassificationConfig,
+    ConsolidationConfig,
     CrawlConfig,
     DatabaseConfig,
     ExtractionConfig,
@@ -16,6 +17,7 @@ from config import (
     SchedulerConfig,
     ScrapingConfig,
     Settings,
+    SourceStorageConfig,
     ValidationConfig,
 )
 
@@ -37,6 +39,7 @@ ALL_FACADES = [
     ("llm", LLMConfig),
     ("llm_queue", LLMQueueConfig),
     ("extraction", ExtractionConfig),
+    ("consolidation", ConsolidationConfig),
     ("classification", ClassificationConfig),
     ("scraping", ScrapingConfig),
     ("crawl", CrawlConfig),
@@ -44,6 +47,7 @@ ALL_FACADES = [
     ("scheduler", SchedulerConfig),
     ("observability", ObservabilityConfig),
     ("validation", ValidationConfig),
+    ("source_storage", SourceStorageConfig),
 ]
 
 
@@ -118,6 +122,14 @@ class TestLLMQueueConfig:
         assert q.worker_min_concurrency == s.llm_worker_min_concurrency
 
 
+class TestConsolidationConfig:
+    def test_roundtrip(self, s: Settings) -> None:
+        co = s.consolidation
+        assert co.max_concurrent_groups == s.consolidation_max_concurrent_groups
+        assert co.process_workers == s.consolidation_process_workers
+        assert co.llm_max_concurrent == s.consolidation_llm_max_concurrent
+
+
 class TestExtractionConfig:
     def test_roundtrip(self, s: Settings) -> None:
         ex = s.extraction
@@ -137,6 +149,13 @@ class TestExtractionConfig:
         assert ex.domain_dedup_threshold_pct == s.domain_dedup_threshold_pct
         assert ex.domain_dedup_min_pages == s.domain_dedup_min_pages
         assert ex.domain_dedup_min_block_chars == s.domain_dedup_min_block_chars
+        assert ex.domain_dedup_process_workers == s.domain_dedup_process_workers
+        assert ex.skip_unchanged_sources == s.extraction_skip_unchanged_sources
+        assert ex.stream_entities == s.extraction_stream_entities
+        assert (
+            ex.grounding_backfill_process_workers
+            == s.grounding_backfill_process_workers
+        )
 
 
 class TestClassificationConfig:
@@ -154,6 +173,8 @@ class TestClassificationConfig:
             cl.use_default_skip_patterns == s.classification_use_default_skip_patterns
         )
         assert cl.classifier_content_limit == s.classification_content_limit
+        assert cl.skip_gate_batch_size == s.classification_skip_gate_batch_size
+        assert cl.embed_batch_size == s.classification_embed_batch_size
 
 
 class TestScrapingConfig:
@@ -185,6 +206,7 @@ class TestCrawlConfig:
         assert cr.max_concurrency == s.crawl_max_concurrency
         assert cr.max_concurrent_crawls == s.max_concurrent_crawls
         assert cr.poll_interval == s.crawl_poll_interval
+        assert cr.extract_batch_size == s.crawl_extract_batch_size
         assert cr.smart_relevance_threshold == s.smart_crawl_default_relevance_threshold
         assert cr.smart_map_limit == s.smart_crawl_map_limit
         assert cr.smart_batch_max_concurrency == s.smart_crawl_batch_max_concurrency
@@ -226,6 +248,31 @@ class TestObservabilityConfig:
         assert obs.alerting_enabled == s.alerting_enabled
         assert obs.alert_webhook_url == s.alert_webhook_url
         assert obs.alert_webhook_format == s.alert_webhook_format
+        assert obs.metrics_max_staleness == s.metrics_max_staleness
+
+
+class TestSourceStorageConfig:
+    def test_roundtrip(self, s: Settings) -> None:
+        st = s.source_storage
+        assert st.mode == s.source_storage_mode
+        assert st.compression_level == s.source_blob_compression_level
+
+
+class TestValidationConfig:
+    def test_roundtrip(self, s: Settings) -> None:
+        v = s.validation
+        assert v.enabled == s.field_validation_enabled
+        assert v.factapi_url == s.factapi_url
+        assert v.cache_ttl_seconds == s.factapi_cache_ttl_seconds
+        assert v.snapshot_dir == s.factapi_snapshot_dir
+
+    def test_mode_validated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("API_KEY", "test-key-at-least-16-chars")
+        monkeypatch.setenv("SOURCE_STORAGE_MODE", "BLOB")
+        assert Settings().source_storage.mode == "blob"
+        monkeypatch.setenv("SOURCE_STORAGE_MODE", "s3")
+        with pytest.raises(ValueError):
+            Settings()
 
 
 # ---------------------------------------------------------------------------
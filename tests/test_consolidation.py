@@ -1202,6 +1202,55 @@ class TestEntityProvenance:
         assert result.entity_provenance is None
 
 
+# ── fuzzy entity resolution ──
+
+
+class TestFuzzyEntityDedup:
+    def test_exact_matching_by_default(self):
+        items = [{"name": "MOTOX 80"}, {"name": "Motox-80 gearmotor"}]
+        assert len(_dedup_dicts(items)) == 2
+
+    def test_threshold_merges_near_duplicates(self):
+        items = [
+            {"name": "MOTOX 80", "power": None},
+            {"name": "Motox-80 gearmotor", "power": "1.5 kW"},
+        ]
+        result = _dedup_dicts(items, match_threshold=0.5)
+        assert result == [{"name": "MOTOX 80", "power": "1.5 kW"}]
+
+    def test_nameless_entities_not_fuzzy_matched(self):
+        items = [{"type": "A"}, {"type": "B"}, {"type": "A"}]
+        assert len(_dedup_dicts(items, match_threshold=0.1)) == 2
+
+    def test_provenance_follows_clusters(self):
+        extractions = [
+            {
+                "data": {"products": [{"name": "MOTOX 80"}, {"name": "Pump Z"}]},
+                "confidence": 0.9,
+                "grounding_scores": {"products": 1.0},
+                "source_id": "s1",
+            },
+            {
+                "data": {"products": [{"name": "Motox-80 gearmotor"}]},
+                "confidence": 0.7,
+                "grounding_scores": {"products": 1.0},
+                "source_id": "s2",
+            },
+        ]
+        record = consolidate_extractions(
+            extractions,
+            [{"name": "name", "field_type": "string"}],
+            "flender",
+            "products",
+            entity_list_key="products",
+            entity_match_threshold=0.5,
+        )
+        field = record.fields["products"]
+        assert [e["name"] for e in field.value] == ["MOTOX 80", "Pump Z"]
+        assert field.entity_provenance[0]["top_sources"] == ["s1", "s2"]
+        assert field.entity_provenance[1]["top_sources"] == ["s1"]
+
+
 # ── strategy defaults ──
 
 
@@ -370,7 +370,7 @@ class TestReconsolidate:
         def failing_upsert(*args, **kwargs):
             raise RuntimeError("simulated DB error")
 
-        service._upsert_record = failing_upsert
+        service._upsert_records = failing_upsert
 
         result = await service.reconsolidate(test_project.id, source_groups=["abb"])
         assert result["errors"] == 1
@@ -398,11 +398,11 @@ class TestConsolidateProjectSessionRollback:
             source_group="abb",
         )
 
-        # Force _upsert_record to always fail
+        # Force _upsert_records to always fail
         def failing_upsert(*args, **kwargs):
             raise RuntimeError("simulated DB error")
 
-        service._upsert_record = failing_upsert
+        service._upsert_records = failing_upsert
 
         result = await service.consolidate_project(test_project.id)
         assert result["errors"] == 1
@@ -447,8 +447,8 @@ class TestSavepointIsolation:
         )
         db_session.flush()
 
-        # Make group_b fail during upsert by patching
-        original_upsert = service._upsert_record
+        # Make group_b fail during upsert by patching (one call per group)
+        original_upsert = service._upsert_records
         call_count = 0
 
         def fail_on_second_call(*args, **kwargs):
@@ -458,7 +458,7 @@ class TestSavepointIsolation:
                 raise RuntimeError("simulated failure on group B")
             return original_upsert(*args, **kwargs)
 
-        service._upsert_record = fail_on_second_call
+        service._upsert_records = fail_on_second_call
 
         result = await service._process_source_groups(
             test_project.id, ["group_a", "group_b"]
@@ -779,3 +779,155 @@ class TestLLMPostProcess:
         assert desc is not None
         # longest_top_k picks the longest string from top-K
         assert desc.value == "A longer description"
+
+
+class TestConcurrentConsolidation:
+    """Concurrent source groups, executor offload and batched LLM summaries."""
+
+    async def test_concurrent_groups_match_sequential(
+        self, extraction_repo, test_project, db_session, project_repo
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        for sg in ("abb", "siemens", "sew"):
+            source = Source(
+                project_id=test_project.id,
+                uri=f"https://example.com/{sg}",
+                source_group=sg,
+            )
+            db_session.add(source)
+            db_session.flush()
+            _create_extraction(
+                extraction_repo,
+                test_project,
+                source,
+                data={"company_name": sg.upper(), "employee_count": 100},
+                source_group=sg,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = ConsolidationService(
+                db_session,
+                project_repo,
+                executor=executor,
+                max_concurrent_groups=3,
+            )
+            result = await service.consolidate_project(test_project.id)
+
+        assert result == {"source_groups": 3, "records_created": 3, "errors": 0}
+
+        from sqlalchemy import select
+
+        rows = (
+            db_session.execute(
+                select(ConsolidatedExtraction).where(
+                    ConsolidatedExtraction.project_id == test_project.id,
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert {r.source_group: r.data["company_name"] for r in rows} == {
+            "abb": "ABB",
+            "siemens": "SIEMENS",
+            "sew": "SEW",
+        }
+
+    async def test_summaries_dispatched_concurrently(
+        self, extraction_repo, db_session, project_repo
+    ):
+        import asyncio
+
+        project = Project(
+            name="test_concurrent_summaries",
+            extraction_schema={
+                "field_groups": [
+                    {
+                        "name": "company_info",
+                        "description": "Company information",
+                        "fields": [
+                            {
+                                "name": "description",
+                                "field_type": "text",
+                                "consolidation_strategy": "llm_summarize",
+                            },
+                            {
+                                "name": "history",
+                                "field_type": "text",
+                                "consolidation_strategy": "llm_summarize",
+                            },
+                        ],
+                        "prompt_hint": "",
+                    },
+                ]
+            },
+        )
+        db_session.add(project)
+        db_session.flush()
+        for i in range(2):
+            source = Source(
+                project_id=project.id,
+                uri=f"https://example.com/p{i}",
+                source_group="abb",
+            )
+            db_session.add(source)
+            db_session.flush()
+            _create_extraction(
+                extraction_repo,
+                project,
+                source,
+                data={"description": f"Desc {i}", "history": f"History {i}"},
+                grounding_scores={"description": 1.0, "history": 1.0},
+            )
+
+        in_flight = 0
+        peak = 0
+
+        class SlowLLMClient:
+            async def complete(self, system_prompt, user_prompt, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"text": "Synthesized."}
+
+        service = ConsolidationService(db_session, project_repo, llm_max_concurrent=4)
+        records = await service.consolidate_source_group(
+            project.id, "abb", llm_client=SlowLLMClient()
+        )
+
+        assert peak == 2
+        assert records[0].fields["description"].value == "Synthesized."
+        assert records[0].fields["history"].value == "Synthesized."
+
+    def test_from_config_shares_one_process_pool(self, db_session, project_repo):
+        from config import ConsolidationConfig
+        from services.extraction import process_pools
+
+        config = ConsolidationConfig(
+            max_concurrent_groups=5, process_workers=2, llm_max_concurrent=3
+        )
+        try:
+            first = ConsolidationService.from_config(db_session, project_repo, config)
+            second = ConsolidationService.from_config(db_session, project_repo, config)
+
+            assert first._executor is not None
+            assert first._executor is second._executor
+            assert first._max_concurrent_groups == 5
+        finally:
+            process_pools.shutdown_process_pools()
+
+        assert process_pools._pools == {}
+
+    def test_from_config_without_workers_runs_inline(self, db_session, project_repo):
+        from config import ConsolidationConfig
+
+        config = ConsolidationConfig(
+            max_concurrent_groups=2, process_workers=0, llm_max_concurrent=3
+        )
+
+        service = ConsolidationService.from_config(db_session, project_repo, config)
+
+        assert service._executor is None
+        assert service._max_concurrent_groups == 2
@@ -0,0 +1,232 @@
+"""Tests for incremental page ingestion while a crawl is running."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from constants import JobStatus, SourceStatus
+from orm_models import Job
+from services.scraper.client import CrawlStatus
+from services.scraper.crawl_worker import CrawlWorker
+
+
+def _pages(start: int, count: int) -> list[dict]:
+    return [
+        {
+            "markdown": f"Page {i}",
+            "metadata": {"url": f"https://example.com/{i}", "statusCode": 200},
+        }
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def mock_db():
+    return MagicMock()
+
+
+@pytest.fixture
+def firecrawl_client():
+    return AsyncMock()
+
+
+@pytest.fixture
+def worker(mock_db, firecrawl_client):
+    w = CrawlWorker(db=mock_db, firecrawl_client=firecrawl_client)
+    w.job_repo = MagicMock()
+    w.job_repo.is_cancellation_requested.return_value = False
+    w.source_repo = MagicMock()
+    w.source_repo.upsert.side_effect = lambda **kw: (MagicMock(id=uuid4()), True)
+    return w
+
+
+@pytest.fixture
+def crawl_job():
+    return Job(
+        id=uuid4(),
+        type="crawl",
+        status=JobStatus.RUNNING,
+        payload={
+            "url": "https://example.com",
+            "project_id": str(uuid4()),
+            "company": "TestCo",
+            "firecrawl_job_id": "fc-1",
+            "language_detection_enabled": False,
+        },
+        started_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def batch_size():
+    """Patch the extraction micro-batch size used by the worker."""
+
+    def _set(size: int):
+        mock_settings = MagicMock()
+        mock_settings.crawl.extract_batch_size = size
+        mock_settings.language_filtering_enabled = False
+        return patch("services.scraper.crawl_worker.settings", mock_settings)
+
+    return _set
+
+
+def _extract_jobs(mock_db) -> list[Job]:
+    return [
+        c.args[0]
+        for c in mock_db.add.call_args_list
+        if isinstance(c.args[0], Job) and c.args[0].type == "extract"
+    ]
+
+
+class TestIncrementalIngestion:
+    async def test_pages_stored_while_scraping(
+        self, worker, crawl_job, firecrawl_client, batch_size
+    ):
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=10, completed=3, pages=_pages(0, 3)
+        )
+
+        with batch_size(0):
+            await worker.process_job(crawl_job)
+
+        firecrawl_client.get_crawl_status.assert_awaited_once_with("fc-1", skip=0)
+        assert worker.source_repo.upsert.call_count == 3
+        assert crawl_job.payload["pages_ingested"] == 3
+        assert crawl_job.result["sources_created"] == 3
+        assert crawl_job.status == JobStatus.RUNNING
+
+    async def test_next_poll_resumes_from_offset(
+        self, worker, crawl_job, firecrawl_client, batch_size
+    ):
+        crawl_job.payload["pages_ingested"] = 3
+        crawl_job.payload["sources_created"] = 3
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=10, completed=5, pages=_pages(3, 2)
+        )
+
+        with batch_size(0):
+            await worker.process_job(crawl_job)
+
+        firecrawl_client.get_crawl_status.assert_awaited_once_with("fc-1", skip=3)
+        assert crawl_job.payload["pages_ingested"] == 5
+        assert crawl_job.payload["sources_created"] == 5
+
+    async def test_skipped_pages_still_advance_offset(
+        self, worker, crawl_job, firecrawl_client, batch_size
+    ):
+        pages = _pages(0, 2)
+        pages[1]["metadata"]["statusCode"] = 404
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=10, completed=2, pages=pages
+        )
+
+        with batch_size(0):
+            await worker.process_job(crawl_job)
+
+        assert crawl_job.payload["pages_ingested"] == 2
+        assert crawl_job.payload["sources_created"] == 1
+
+    async def test_completed_with_new_pages_keeps_polling(
+        self, worker, crawl_job, firecrawl_client, batch_size
+    ):
+        """Pagination is capped per poll, so completion waits for an empty poll."""
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="completed", total=10, completed=10, pages=_pages(0, 4)
+        )
+
+        with batch_size(0):
+            await worker.process_job(crawl_job)
+
+        assert crawl_job.status == JobStatus.RUNNING
+        assert crawl_job.payload["pages_ingested"] == 4
+
+    async def test_completes_when_all_pages_ingested(
+        self, worker, crawl_job, firecrawl_client, mock_db, batch_size
+    ):
+        crawl_job.payload["pages_ingested"] = 8
+        crawl_job.payload["sources_created"] = 8
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="completed", total=10, completed=10, pages=_pages(8, 2)
+        )
+
+        with batch_size(0):
+            await worker.process_job(crawl_job)
+
+        assert crawl_job.status == JobStatus.COMPLETED
+        assert crawl_job.result["sources_created"] == 10
+        # Legacy mode: one extraction job for all pending sources at the end
+        jobs = _extract_jobs(mock_db)
+        assert len(jobs) == 1
+        assert jobs[0].payload["source_ids"] is None
+
+
+class TestMicroBatchExtraction:
+    async def test_extraction_queued_per_batch_while_scraping(
+        self, worker, crawl_job, firecrawl_client, mock_db, batch_size
+    ):
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=10, completed=3, pages=_pages(0, 3)
+        )
+
+        with batch_size(2):
+            await worker.process_job(crawl_job)
+
+        jobs = _extract_jobs(mock_db)
+        assert len(jobs) == 1
+        assert len(jobs[0].payload["source_ids"]) == 3
+        assert crawl_job.payload["pending_extract_source_ids"] == []
+
+    async def test_below_batch_size_waits(
+        self, worker, crawl_job, firecrawl_client, mock_db, batch_size
+    ):
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=10, completed=1, pages=_pages(0, 1)
+        )
+
+        with batch_size(5):
+            await worker.process_job(crawl_job)
+
+        assert _extract_jobs(mock_db) == []
+        assert len(crawl_job.payload["pending_extract_source_ids"]) == 1
+
+    async def test_remainder_flushed_on_completion(
+        self, worker, crawl_job, firecrawl_client, mock_db, batch_size
+    ):
+        pending = [str(uuid4())]
+        crawl_job.payload["pages_ingested"] = 1
+        crawl_job.payload["sources_created"] = 1
+        crawl_job.payload["pending_extract_source_ids"] = pending
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="completed", total=1, completed=1, pages=[]
+        )
+
+        with batch_size(5):
+            await worker.process_job(crawl_job)
+
+        assert crawl_job.status == JobStatus.COMPLETED
+        jobs = _extract_jobs(mock_db)
+        assert len(jobs) == 1
+        assert jobs[0].payload["source_ids"] == pending
+
+    async def test_recrawled_pending_sources_queued(
+        self, worker, crawl_job, firecrawl_client, mock_db, batch_size
+    ):
+        """Existing pages still awaiting extraction are queued like new ones."""
+        pending_id, extracted_id = uuid4(), uuid4()
+        worker.source_repo.upsert.side_effect = [
+            (MagicMock(id=pending_id, status=SourceStatus.PENDING), False),
+            (MagicMock(id=extracted_id, status=SourceStatus.EXTRACTED), False),
+        ]
+        firecrawl_client.get_crawl_status.return_value = CrawlStatus(
+            status="scraping", total=2, completed=2, pages=_pages(0, 2)
+        )
+
+        with batch_size(1):
+            await worker.process_job(crawl_job)
+
+        assert crawl_job.payload["sources_created"] == 0
+        jobs = _extract_jobs(mock_db)
+        assert len(jobs) == 1
+        assert jobs[0].payload["source_ids"] == [str(pending_id)]
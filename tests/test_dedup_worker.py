@@ -0,0 +1,232 @@
+"""Tests for parallel project boilerplate analysis and DedupWorker."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from constants import JobStatus, JobType
+from orm_models import Job, Project
+from services.extraction.dedup_worker import DedupWorker
+from services.extraction.domain_dedup import (
+    DomainAnalysisResult,
+    DomainDedupService,
+    ProjectAnalysisResult,
+    clean_domain_in_worker,
+    init_worker_process,
+)
+
+
+def _result(domain: str, cleaned: int = 1) -> DomainAnalysisResult:
+    return DomainAnalysisResult(
+        domain=domain,
+        pages_analyzed=5,
+        pages_cleaned=cleaned,
+        blocks_boilerplate=2 if cleaned else 0,
+        bytes_removed_total=100 * cleaned,
+    )
+
+
+def _service(domains: list[str], executor=None) -> DomainDedupService:
+    service = DomainDedupService(Mock(), executor=executor)
+    service._source_repo = Mock()
+    service._source_repo.get_domains_for_project.return_value = [
+        (d, 5) for d in domains
+    ]
+    service._bp_repo = Mock()
+    return service
+
+
+class TestAnalyzeProjectParallel:
+    async def test_pool_results_collected_in_order(self):
+        domains = ["a.com", "b.com", "c.com"]
+        project_id = uuid4()
+
+        def clean(pid, domain, t_pct, m_pages, m_chars, batch_size):
+            assert (t_pct, m_pages, m_chars) == (0.8, 5, 50)
+            return _result(domain, cleaned=0 if domain == "b.com" else 1)
+
+        progress = []
+        with (
+            ThreadPoolExecutor(max_workers=2) as executor,
+            patch(
+                "services.extraction.domain_dedup.clean_domain_in_worker",
+                side_effect=clean,
+            ),
+        ):
+            service = _service(domains, executor)
+            result = await service.analyze_project_parallel(
+                project_id,
+                threshold_pct=0.8,
+                progress_callback=lambda *args: progress.append(args),
+            )
+
+        assert [r.domain for r in result.domain_results] == domains
+        assert result.domains_with_boilerplate == 2
+        assert result.total_pages_cleaned == 2
+        # Workers persist their own records alongside the cleaned content
+        service._bp_repo.upsert.assert_not_called()
+        assert progress == [("domains", 1, 3), ("domains", 2, 3), ("domains", 3, 3)]
+
+    async def test_without_executor_runs_inline(self):
+        service = _service(["a.com", "b.com"])
+        service.analyze_domain = Mock(side_effect=lambda pid, d, *a: _result(d))
+
+        result = await service.analyze_project_parallel(uuid4())
+
+        assert service.analyze_domain.call_count == 2
+        assert result.domains_analyzed == 2
+
+    async def test_worker_failure_propagates(self):
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            patch(
+                "services.extraction.domain_dedup.clean_domain_in_worker",
+                side_effect=RuntimeError("boom"),
+            ),
+        ):
+            service = _service(["a.com"], executor)
+            with pytest.raises(RuntimeError, match="boom"):
+                await service.analyze_project_parallel(uuid4())
+
+    def test_worker_commits_record_with_cleaned_content(self):
+        session = Mock()
+        project_id = uuid4()
+
+        def analyze(pid, domain, *params):
+            session.commit.assert_not_called()
+            return _result(domain)
+
+        with (
+            patch("database.SessionLocal", return_value=session),
+            patch.object(
+                DomainDedupService, "analyze_domain", side_effect=analyze
+            ) as analyze_domain,
+        ):
+            result = clean_domain_in_worker(project_id, "a.com", 0.7, 5, 50)
+
+        assert result.domain == "a.com"
+        analyze_domain.assert_called_once_with(project_id, "a.com", 0.7, 5, 50)
+        session.commit.assert_called_once()
+        session.close.assert_called_once()
+
+
+@pytest.fixture
+def dedup_job():
+    return Job(
+        id=uuid4(),
+        type=JobType.DEDUP,
+        status=JobStatus.QUEUED,
+        payload={"project_id": str(uuid4()), "min_pages": 3},
+    )
+
+
+def _patch_service(analyze):
+    service_cls = Mock()
+    service_cls.from_config.return_value.analyze_project_parallel = analyze
+    return patch("services.extraction.dedup_worker.DomainDedupService", service_cls)
+
+
+class TestDedupWorker:
+    async def test_completes_with_domain_stats(self, dedup_job):
+        worker = DedupWorker(Mock())
+
+        async def analyze(project_id, *, progress_callback, min_pages, **_):
+            assert min_pages == 3
+            progress_callback("domains", 1, 2)
+            assert dedup_job.result == {"stage": "domains", "completed": 1, "total": 2}
+            return ProjectAnalysisResult(
+                domains_analyzed=1,
+                domains_with_boilerplate=1,
+                total_pages_cleaned=1,
+                total_bytes_removed=100,
+                domain_results=[_result("a.com")],
+            )
+
+        with _patch_service(analyze):
+            await worker.process_job(dedup_job)
+
+        assert dedup_job.status == JobStatus.COMPLETED
+        assert dedup_job.result["domains_analyzed"] == 1
+        assert dedup_job.result["domains"][0]["domain"] == "a.com"
+        assert dedup_job.completed_at is not None
+
+    async def test_failure_marks_job_failed(self, dedup_job):
+        db = Mock()
+        worker = DedupWorker(db)
+
+        with _patch_service(AsyncMock(side_effect=RuntimeError("db gone"))):
+            await worker.process_job(dedup_job)
+
+        assert dedup_job.status == JobStatus.FAILED
+        assert dedup_job.error == "db gone"
+        db.rollback.assert_called_once()
+
+    async def test_uses_shared_process_pool(self, dedup_job):
+        extraction = Mock(domain_dedup_process_workers=2)
+        worker = DedupWorker(Mock(), extraction=extraction)
+
+        with (
+            patch("services.extraction.process_pools.get_process_pool") as get_pool,
+            patch.object(
+                DomainDedupService,
+                "analyze_project_parallel",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ),
+        ):
+            await worker.process_job(dedup_job)
+
+        get_pool.assert_called_once_with(
+            "domain_dedup", 2, initializer=init_worker_process
+        )
+        get_pool.return_value.shutdown.assert_not_called()
+        assert dedup_job.status == JobStatus.FAILED
+
+
+class TestAnalyzeBoilerplateEndpoint:
+    @pytest.fixture
+    def project(self, db):
+        project = Project(name="test_dedup_endpoint", extraction_schema={})
+        db.add(project)
+        db.flush()
+        return project
+
+    def test_runs_synchronously_by_default(self, client, db, project, valid_api_key):
+        with patch(
+            "services.extraction.process_pools.get_process_pool", return_value=None
+        ):
+            response = client.post(
+                f"/api/v1/projects/{project.id}/analyze-boilerplate",
+                headers={"X-API-Key": valid_api_key},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "domains_analyzed": 0,
+            "domains_with_boilerplate": 0,
+            "total_pages_cleaned": 0,
+            "total_bytes_removed": 0,
+            "domains": [],
+        }
+        assert db.query(Job).filter(Job.project_id == project.id).count() == 0
+
+    def test_async_queues_job(self, client, db, project, valid_api_key):
+        response = client.post(
+            f"/api/v1/projects/{project.id}/analyze-boilerplate?async=true&min_pages=3",
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "queued"
+        job = db.get(Job, body["job_id"])
+        assert job.type == JobType.DEDUP
+        assert job.payload["min_pages"] == 3
+
+    def test_missing_project_returns_404(self, client, valid_api_key):
+        response = client.post(
+            f"/api/v1/projects/{uuid4()}/analyze-boilerplate",
+            headers={"X-API-Key": valid_api_key},
+        )
+        assert response.status_code == 404
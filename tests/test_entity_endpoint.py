@@ -276,6 +276,27 @@ class TestListEntities:
         assert data["limit"] == 2
         assert data["offset"] == 1
 
+    def test_list_entities_cursor_pagination(
+        self, client, test_project, test_entities, auth_headers
+    ):
+        """Cursor pages follow value order, one entity per page."""
+        url = f"/api/v1/projects/{test_project.id}/entities"
+        response = client.get(url, headers=auth_headers)
+        expected = [e["id"] for e in response.json()["entities"]]
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+            data = client.get(url, params=params, headers=auth_headers).json()
+            seen.extend(e["id"] for e in data["entities"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert len(seen) == 4
+
     def test_list_entities_empty(self, client, test_project, auth_headers):
         """Should return empty list when no entities match."""
         response = client.get(
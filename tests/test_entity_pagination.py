@@ -1,7 +1,9 @@
 """Tests for entity pagination (v2)."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+from services.extraction import schema_orchestrator
 from services.extraction.field_groups import FieldDefinition, FieldGroup
 from services.extraction.schema_orchestrator import SchemaExtractionOrchestrator
 
@@ -20,7 +22,7 @@ def _make_entity_group(max_items=10):
     )
 
 
-def _make_orchestrator(extractor_mock):
+def _make_orchestrator(extractor_mock, stream_entities=False):
     from config import ClassificationConfig, ExtractionConfig
 
     extraction_config = ExtractionConfig(
@@ -40,8 +42,11 @@ def _make_orchestrator(extractor_mock):
         domain_dedup_threshold_pct=0.7,
         domain_dedup_min_pages=5,
         domain_dedup_min_block_chars=50,
+        domain_dedup_process_workers=0,
         source_grounding_min_ratio=0.5,
         data_version=2,
+        skip_unchanged_sources=True,
+        stream_entities=stream_entities,
     )
     classification_config = ClassificationConfig(
         enabled=False,
@@ -177,3 +182,64 @@ class TestEntityPagination:
 
         entities, _, _ = await orch._extract_entities_paginated("content", group, "ctx")
         assert entities == []
+
+
+class TestStreamedEntityGrounding:
+    CONTENT = "We build the A gear and the B motor."
+
+    def _chunk(self):
+        return SimpleNamespace(content=self.CONTENT, chunk_index=0, header_path=[])
+
+    def _entities(self):
+        return [
+            {"name": "A", "type": "gear", "_confidence": 0.9, "_quote": "A gear"},
+            {"name": "B", "type": "motor", "_confidence": 0.8, "_quote": "B motor"},
+        ]
+
+    async def test_entities_grounded_while_streaming(self, monkeypatch):
+        """Entities are grounded during the call and not grounded again."""
+        grounded_quotes = []
+        real_ground = schema_orchestrator.ground_entity_item
+
+        def counting_ground(quote, content):
+            grounded_quotes.append(quote)
+            return real_ground(quote, content)
+
+        monkeypatch.setattr(schema_orchestrator, "ground_entity_item", counting_ground)
+        grounded_during_call = []
+
+        async def extract(*args, on_entity=None, **kwargs):
+            assert on_entity is not None
+            for entity in self._entities():
+                on_entity(entity)
+                grounded_during_call.append(len(grounded_quotes))
+            return {"products": self._entities(), "has_more": False}
+
+        extractor = AsyncMock()
+        extractor.extract_field_group = AsyncMock(side_effect=extract)
+        orch = _make_orchestrator(extractor, stream_entities=True)
+
+        result = await orch._extract_entity_chunk_v2(
+            self._chunk(), 0, _make_entity_group(), "ctx", self.CONTENT
+        )
+
+        assert grounded_during_call == [1, 2]
+        assert grounded_quotes == ["A gear", "B motor"]
+        items = result.entity_items["products"]
+        assert [item.fields["name"] for item in items] == ["A", "B"]
+        assert all(item.grounding == 1.0 for item in items)
+
+    async def test_buffered_by_default(self):
+        """Without stream_entities no callback is passed to the extractor."""
+        extractor = AsyncMock()
+        extractor.extract_field_group = AsyncMock(
+            return_value={"products": self._entities(), "has_more": False}
+        )
+        orch = _make_orchestrator(extractor)
+
+        result = await orch._extract_entity_chunk_v2(
+            self._chunk(), 0, _make_entity_group(), "ctx", self.CONTENT
+        )
+
+        assert extractor.extract_field_group.call_args.kwargs["on_entity"] is None
+        assert len(result.entity_items["products"]) == 2
@@ -0,0 +1,66 @@
+"""Tests for blocking-based fuzzy entity resolution."""
+
+import time
+
+from services.extraction.entity_resolution import cluster_entity_keys, entity_tokens
+
+
+class TestEntityTokens:
+    def test_splits_letter_digit_boundaries(self):
+        assert entity_tokens("MOTOX80") == ["motox", "80"]
+
+    def test_punctuation_separates_tokens(self):
+        assert entity_tokens("Motox-80 gearmotor") == ["motox", "80", "gearmotor"]
+
+    def test_decimal_numbers_kept_whole(self):
+        assert entity_tokens("Drive 1.5kW") == ["drive", "1.5", "kw"]
+
+    def test_accents_folded(self):
+        assert entity_tokens("Müller") == entity_tokens("Muller")
+
+    def test_empty(self):
+        assert entity_tokens("--") == []
+
+
+class TestClusterEntityKeys:
+    def test_descriptive_suffix_merges(self):
+        keys = ["motox 80", "motox-80 gearmotor"]
+        assert cluster_entity_keys(keys, threshold=0.5) == [0, 0]
+
+    def test_compact_form_matches_exactly(self):
+        keys = ["Gear Motor", "gearmotor", "GEAR-MOTOR"]
+        assert cluster_entity_keys(keys, threshold=0.99) == [0, 0, 0]
+
+    def test_different_model_numbers_never_merge(self):
+        keys = ["motox 80", "motox 90", "motox 80 gearmotor"]
+        clusters = cluster_entity_keys(keys, threshold=0.1)
+        assert clusters[0] == clusters[2]
+        assert clusters[0] != clusters[1]
+
+    def test_unrelated_names_stay_separate(self):
+        keys = ["helical gearbox", "planetary gearbox", "worm gearbox"]
+        assert cluster_entity_keys(keys, threshold=0.5) == [0, 1, 2]
+
+    def test_cluster_ids_in_first_seen_order(self):
+        keys = ["b", "a", "b"]
+        assert cluster_entity_keys(keys, threshold=0.5) == [0, 1, 0]
+
+    def test_tokenless_keys_match_exactly(self):
+        keys = ["--", "--", "++"]
+        assert cluster_entity_keys(keys, threshold=0.5) == [0, 0, 1]
+
+    def test_common_token_does_not_block(self):
+        """A token shared by every entity is not a blocking key."""
+        keys = [f"gearmotor series{i}" for i in range(100)]
+        clusters = cluster_entity_keys(keys, threshold=0.5, max_block_size=8)
+        assert len(set(clusters)) == 100
+
+    def test_near_linear_on_large_groups(self):
+        keys = [f"Product {i} gearmotor" for i in range(10_000)]
+        keys += [f"PRODUCT-{i}" for i in range(10_000)]
+        start = time.perf_counter()
+        clusters = cluster_entity_keys(keys, threshold=0.5)
+        elapsed = time.perf_counter() - start
+        assert len(set(clusters)) == 10_000
+        assert clusters[:10_000] == clusters[10_000:]
+        assert elapsed < 5.0
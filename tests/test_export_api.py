@@ -1,11 +1,19 @@
 import csv
+import gzip
 import io
+import json
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+from api.v1.export import (
+    EXPORT_CHUNK_SIZE,
+    _chunked,
+    _entity_record,
+    _json_document,
+)
 from database import get_db
 from main import app
 
@@ -45,7 +53,8 @@ def mock_db_session(mock_entities, mock_extractions):
     mock_session = MagicMock()
     mock_query = MagicMock()
     mock_query.filter.return_value = mock_query
-    mock_query.all.return_value = mock_entities
+    mock_query.yield_per.return_value = mock_entities
+    mock_query.count.return_value = len(mock_entities)
     mock_session.query.return_value = mock_query
     return mock_session
 
@@ -132,7 +141,8 @@ class TestExportExtractions:
         extraction.created_at = None
 
         mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [extraction]
+        mock_query.yield_per.return_value = [extraction]
+        mock_query.count.return_value = 1
         mock_session.query.return_value = mock_query
 
         def override_get_db():
@@ -169,7 +179,8 @@ class TestExportExtractions:
         extraction.created_at = None
 
         mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [extraction]
+        mock_query.yield_per.return_value = [extraction]
+        mock_query.count.return_value = 1
         mock_session.query.return_value = mock_query
 
         def override_get_db():
@@ -208,7 +219,8 @@ class TestExportExtractions:
         extraction.created_at = None
 
         mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [extraction]
+        mock_query.yield_per.return_value = [extraction]
+        mock_query.count.return_value = 1
         mock_session.query.return_value = mock_query
 
         def override_get_db():
@@ -236,7 +248,8 @@ class TestExportEmpty:
         mock_session = MagicMock()
         mock_query = MagicMock()
         mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = []
+        mock_query.yield_per.return_value = []
+        mock_query.count.return_value = 0
         mock_session.query.return_value = mock_query
 
         def override_get_db():
@@ -256,3 +269,100 @@ class TestExportEmpty:
         data = response.json()
         assert data["count"] == 0
         assert data["entities"] == []
+
+
+class TestExportStreaming:
+    @pytest.fixture
+    def many_entities(self):
+        entities = []
+        for i in range(3000):
+            entity = MagicMock()
+            entity.id = uuid4()
+            entity.entity_type = "feature"
+            entity.value = f"Feature {i}"
+            entity.normalized_value = f"feature_{i}"
+            entity.source_group = "company_a"
+            entity.attributes = {"i": i}
+            entity.created_at = None
+            entities.append(entity)
+        return entities
+
+    @pytest.fixture
+    def streaming_client(self, many_entities):
+        mock_session = MagicMock()
+        mock_query = MagicMock()
+        mock_query.filter.return_value = mock_query
+        mock_query.yield_per.return_value = many_entities
+        mock_query.count.return_value = len(many_entities)
+        mock_session.query.return_value = mock_query
+
+        def override_get_db():
+            yield mock_session
+
+        app.dependency_overrides[get_db] = override_get_db
+        yield TestClient(app), mock_session, mock_query
+        app.dependency_overrides.clear()
+
+    def test_rows_read_through_server_side_cursor(
+        self, streaming_client, valid_api_key
+    ):
+        client, mock_session, mock_query = streaming_client
+
+        response = client.get(
+            f"/api/v1/projects/{uuid4()}/export/entities?format=json",
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 200
+        mock_query.yield_per.assert_called_once()
+        mock_query.all.assert_not_called()
+        # The JSON count is taken while streaming, not by a COUNT query
+        mock_query.count.assert_not_called()
+        assert response.json()["count"] == 3000
+        # Generator closes the session once the stream is exhausted
+        mock_session.close.assert_called()
+
+    def test_json_document_streams_in_chunks(self, many_entities):
+        records = (_entity_record(e) for e in many_entities)
+        chunks = list(_chunked(_json_document("entities", uuid4(), records)))
+
+        assert len(chunks) > 1
+        assert all(len(c) < 2 * EXPORT_CHUNK_SIZE for c in chunks)
+        data = json.loads(b"".join(chunks))
+        assert data["count"] == 3000
+        assert len(data["entities"]) == 3000
+        assert data["entities"][-1]["value"] == "Feature 2999"
+
+    def test_empty_json_document_is_valid(self):
+        data = json.loads(b"".join(_chunked(_json_document("sources", uuid4(), []))))
+        assert data["count"] == 0
+        assert data["sources"] == []
+
+    def test_ndjson(self, streaming_client, valid_api_key):
+        client, _, _ = streaming_client
+
+        response = client.get(
+            f"/api/v1/projects/{uuid4()}/export/entities?format=ndjson",
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 200
+        assert "application/x-ndjson" in response.headers["content-type"]
+        lines = response.text.splitlines()
+        assert len(lines) == 3000
+        assert json.loads(lines[0])["value"] == "Feature 0"
+
+    def test_gzip_compressed_csv(self, streaming_client, valid_api_key):
+        client, _, _ = streaming_client
+
+        response = client.get(
+            f"/api/v1/projects/{uuid4()}/export/entities?format=csv&compress=true",
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".csv.gz" in response.headers["content-disposition"]
+        rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode())))
+        assert rows[0][0] == "id"
+        assert len(rows) == 3001
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -77,15 +77,15 @@ class TestCheckpointCallback:
         callback = worker._create_checkpoint_callback(job)
 
         # Simulate checkpoint after processing 3 sources
-        processed_ids = [str(uuid4()) for _ in range(3)]
-        callback(processed_ids, 15, 5)
+        last_id = str(uuid4())
+        callback(last_id, 3, 15, [])
 
         # Verify checkpoint was added to payload
         assert "checkpoint" in job.payload
         checkpoint = job.payload["checkpoint"]
-        assert checkpoint["processed_source_ids"] == processed_ids
+        assert checkpoint["resume_after"] == last_id
+        assert checkpoint["sources_processed"] == 3
         assert checkpoint["total_extractions"] == 15
-        assert checkpoint["total_entities"] == 5
         assert "last_checkpoint_at" in checkpoint
 
         # Note: Callback does NOT commit - pipeline commits after calling callback
@@ -110,7 +110,7 @@ class TestCheckpointCallback:
         )
 
         callback = worker._create_checkpoint_callback(job)
-        callback(["source1"], 10, 2)
+        callback(str(uuid4()), 2, 10, [])
 
         # Verify existing fields preserved
         assert job.payload["project_id"] == existing_payload["project_id"]
@@ -119,6 +119,58 @@ class TestCheckpointCallback:
         # And checkpoint added
         assert "checkpoint" in job.payload
 
+    def test_checkpoint_size_constant(self, mock_db):
+        """Checkpoint size does not grow with the number of processed sources."""
+        import json
+
+        worker = ExtractionWorker(db=mock_db)
+        job = Job(id=uuid4(), type="extract", status="running", payload={})
+        callback = worker._create_checkpoint_callback(job)
+
+        callback(str(uuid4()), 20, 40, [])
+        small = len(json.dumps(job.payload))
+        callback(str(uuid4()), 50_000, 100_000, [])
+        large = len(json.dumps(job.payload))
+
+        assert large - small <= 8
+
+    def test_totals_carry_over_from_previous_run(self, mock_db):
+        """A resumed job's checkpoint totals include the previous run."""
+        worker = ExtractionWorker(db=mock_db)
+        job = Job(
+            id=uuid4(),
+            type="extract",
+            status="running",
+            payload={
+                "checkpoint": {
+                    "resume_after": str(uuid4()),
+                    "sources_processed": 100,
+                    "total_extractions": 300,
+                }
+            },
+        )
+
+        callback = worker._create_checkpoint_callback(job)
+        callback(str(uuid4()), 20, 50, [])
+        callback(str(uuid4()), 40, 90, [])
+
+        assert job.payload["checkpoint"]["sources_processed"] == 140
+        assert job.payload["checkpoint"]["total_extractions"] == 390
+
+    def test_failed_source_ids_capped(self, mock_db):
+        """The failed-source list kept for retry is bounded."""
+        from services.extraction.worker import MAX_CHECKPOINT_FAILED_IDS
+
+        worker = ExtractionWorker(db=mock_db)
+        job = Job(id=uuid4(), type="extract", status="running", payload={})
+        callback = worker._create_checkpoint_callback(job)
+
+        failed = [str(uuid4()) for _ in range(MAX_CHECKPOINT_FAILED_IDS + 5)]
+        callback(str(uuid4()), 10, 20, failed)
+
+        kept = job.payload["checkpoint"]["failed_source_ids"]
+        assert kept == failed[:MAX_CHECKPOINT_FAILED_IDS]
+
 
 class TestResumeState:
     """Tests for resume state detection in ExtractionWorker."""
@@ -155,13 +207,13 @@ class TestResumeState:
         result = worker._get_resume_state(job)
         assert result is None
 
-    def test_get_resume_state_returns_set_of_processed_ids(self, mock_db):
-        """_get_resume_state returns set of processed source IDs."""
+    def test_get_resume_state_returns_cursor(self, mock_db):
+        """_get_resume_state returns the last committed source ID."""
         worker = ExtractionWorker(
             db=mock_db,
         )
 
-        processed_ids = [str(uuid4()), str(uuid4()), str(uuid4())]
+        last_id = uuid4()
         job = Job(
             id=uuid4(),
             type="extract",
@@ -169,23 +221,18 @@ class TestResumeState:
             payload={
                 "project_id": str(uuid4()),
                 "checkpoint": {
-                    "processed_source_ids": processed_ids,
-                    "last_checkpoint_at": "2024-01-15T10:30:00Z",
+                    "resume_after": str(last_id),
+                    "sources_processed": 3,
                     "total_extractions": 45,
-                    "total_entities": 12,
+                    "last_checkpoint_at": "2024-01-15T10:30:00Z",
                 },
             },
         )
 
-        result = worker._get_resume_state(job)
-
-        assert result is not None
-        assert isinstance(result, set)
-        assert len(result) == 3
-        assert all(pid in result for pid in processed_ids)
+        assert worker._get_resume_state(job) == last_id
 
-    def test_get_resume_state_returns_none_for_empty_processed_ids(self, mock_db):
-        """_get_resume_state returns None when processed_source_ids is empty."""
+    def test_get_resume_state_ignores_legacy_checkpoint(self, mock_db):
+        """Checkpoints storing processed_source_ids restart from the beginning."""
         worker = ExtractionWorker(
             db=mock_db,
         )
@@ -197,9 +244,9 @@ class TestResumeState:
             payload={
                 "project_id": str(uuid4()),
                 "checkpoint": {
-                    "processed_source_ids": [],
+                    "processed_source_ids": [str(uuid4())],
                     "last_checkpoint_at": "2024-01-15T10:30:00Z",
-                    "total_extractions": 0,
+                    "total_extractions": 3,
                     "total_entities": 0,
                 },
             },
@@ -272,14 +319,8 @@ class TestSchemaExtractionPipelineCheckpointing:
         # Track checkpoint calls
         checkpoint_calls = []
 
-        def checkpoint_callback(processed_ids, extractions, entities):
-            checkpoint_calls.append(
-                {
-                    "processed_ids": processed_ids.copy(),
-                    "extractions": extractions,
-                    "entities": entities,
-                }
-            )
+        def checkpoint_callback(resume_after, processed, extractions, failed):
+            checkpoint_calls.append((resume_after, processed, extractions))
 
         # Run extraction with checkpoint callback
         with patch("services.extraction.pipeline.SchemaAdapter") as mock_adapter_class:
@@ -293,23 +334,19 @@ class TestSchemaExtractionPipelineCheckpointing:
                 checkpoint_callback=checkpoint_callback,
             )
 
-        # Verify checkpoint was called at least once (after chunk processing)
-        assert len(checkpoint_calls) >= 1
+        # One checkpoint per chunk (chunk_size=20), cursor at each chunk's end
+        assert checkpoint_calls == [
+            (str(sources[19].id), 20, 0),
+            (str(sources[24].id), 25, 0),
+        ]
 
-    async def test_resume_from_skips_already_processed_sources(
+    async def test_resume_after_filters_sources_in_query(
         self, mock_db, mock_orchestrator, mock_source
     ):
-        """Resume skips sources that were already processed."""
+        """Resume narrows the source query instead of filtering in Python."""
         pipeline = SchemaExtractionPipeline(mock_orchestrator, mock_db)
+        sources = [mock_source() for _ in range(3)]
 
-        # Create 5 sources
-        sources = [mock_source() for _ in range(5)]
-        source_ids = [str(s.id) for s in sources]
-
-        # Mark first 2 as already processed
-        resume_from = set(source_ids[:2])
-
-        # Mock project
         mock_project = Mock()
         mock_project.extraction_schema = {
             "name": "test_schema",
@@ -317,6 +354,7 @@ class TestSchemaExtractionPipelineCheckpointing:
         }
 
         self._setup_db_mock(mock_db, mock_project, sources)
+        resume_after = uuid4()
 
         with patch("services.extraction.pipeline.SchemaAdapter") as mock_adapter_class:
             mock_adapter = Mock()
@@ -326,11 +364,13 @@ class TestSchemaExtractionPipelineCheckpointing:
 
             result = await pipeline.extract_project(
                 project_id=uuid4(),
-                resume_from=resume_from,
+                resume_after=resume_after,
             )
 
-        # Only 3 sources should be processed (5 total - 2 already done)
         assert result.sources_processed == 3
+        source_query = str(mock_db.execute.call_args_list[-1].args[0])
+        assert "sources.id >" in source_query
+        assert "ORDER BY sources.id" in source_query
 
     async def test_batch_commit_happens_after_each_chunk(
         self, mock_db, mock_orchestrator, mock_source
@@ -363,10 +403,10 @@ class TestSchemaExtractionPipelineCheckpointing:
         # Should have committed at least twice (once per chunk)
         assert mock_db.commit.call_count >= 2
 
-    async def test_failed_sources_not_added_to_checkpoint(
+    async def test_failed_sources_not_counted_in_checkpoint(
         self, mock_db, mock_orchestrator, mock_source
     ):
-        """Failed sources should NOT be added to checkpoint (can be retried on resume)."""
+        """Failed sources are not counted and keep their status for resume."""
         pipeline = SchemaExtractionPipeline(mock_orchestrator, mock_db)
 
         # Create 5 sources
@@ -398,8 +438,8 @@ class TestSchemaExtractionPipelineCheckpointing:
         # Track checkpoint calls
         checkpoint_calls = []
 
-        def checkpoint_callback(processed_ids, extractions, entities):
-            checkpoint_calls.append(processed_ids.copy())
+        def checkpoint_callback(resume_after, processed, extractions, failed):
+            checkpoint_calls.append((resume_after, processed, failed))
 
         # Create a mock FieldGroup that the adapter will return
         mock_field_group = Mock()
@@ -420,23 +460,105 @@ class TestSchemaExtractionPipelineCheckpointing:
         # Should have 2 failed sources
         assert result.sources_failed == 2
 
-        # Checkpoint should only contain successful source IDs (indices 0, 2, 4)
-        if checkpoint_calls:
-            final_checkpoint = checkpoint_calls[-1]
-            successful_source_ids = {str(sources[i].id) for i in [0, 2, 4]}
-            failed_source_ids = {str(sources[i].id) for i in [1, 3]}
+        # Only successful sources are counted; failed ones are listed for retry
+        assert checkpoint_calls == [
+            (str(sources[4].id), 3, [str(sources[1].id), str(sources[3].id)])
+        ]
+
+        # Failed sources stay pending, so the resume query still selects them
+        for i in fail_indices:
+            assert sources[i].status == "pending"
+
+
+class TestForcedResumeRetriesFailures:
+    """A forced run's failures before the cursor are retried on resume."""
+
+    async def test_extracted_source_failed_before_cursor_is_retried(self, db):
+        from dataclasses import replace
+
+        from config import settings
+        from constants import SourceStatus
+        from orm_models import Source
+
+        project = Project(
+            name="test_forced_resume",
+            extraction_schema={
+                "name": "test_schema",
+                "field_groups": [{"name": "test", "fields": []}],
+            },
+        )
+        db.add(project)
+        db.flush()
+        sources = [
+            Source(
+                project_id=project.id,
+                uri=f"https://example.com/{i}",
+                source_group="acme",
+                content=f"Page {i}",
+                status=SourceStatus.EXTRACTED,
+            )
+            for i in range(3)
+        ]
+        db.add_all(sources)
+        db.flush()
+        first, second, third = sorted(s.id for s in sources)
+
+        attempted = []
+        failing = {first}
+
+        async def extract_all_groups(**kwargs):
+            attempted.append(kwargs["source_id"])
+            if kwargs["source_id"] in failing:
+                failing.discard(kwargs["source_id"])
+                raise RuntimeError("LLM timeout")
+            return ([], None)
+
+        orchestrator = AsyncMock()
+        orchestrator.extract_all_groups.side_effect = extract_all_groups
+        orchestrator.batch_classification_enabled = False
+        pipeline = SchemaExtractionPipeline(
+            orchestrator,
+            db,
+            extraction_config=replace(settings.extraction, extraction_batch_size=1),
+        )
+        worker = ExtractionWorker(db=db)
+        job = Job(id=uuid4(), type="extract", status="running", payload={})
+
+        group = Mock()
+        group.name = "test"
+        checks = iter([False, False, False, True])
+
+        async def interrupted() -> bool:
+            return next(checks, False)
+
+        with patch("services.extraction.pipeline.SchemaAdapter") as adapter_cls:
+            adapter = adapter_cls.return_value
+            adapter.validate_extraction_schema.return_value = Mock(is_valid=True)
+            adapter.convert_to_field_groups.return_value = [group]
+
+            # Forced run: the first source fails, the job stops after two chunks
+            first_run = await pipeline.extract_project(
+                project.id,
+                skip_extracted=False,
+                cancellation_check=interrupted,
+                checkpoint_callback=worker._create_checkpoint_callback(job),
+            )
+            assert first_run.cancelled
+            assert job.payload["checkpoint"]["resume_after"] == str(second)
+            assert job.payload["checkpoint"]["failed_source_ids"] == [str(first)]
+            assert db.get(Source, first).status == SourceStatus.EXTRACTED
 
-            # All successful sources should be in checkpoint
-            for sid in successful_source_ids:
-                assert sid in final_checkpoint, (
-                    f"Successful source {sid} missing from checkpoint"
-                )
+            attempted.clear()
+            await pipeline.extract_project(
+                project.id,
+                skip_extracted=False,
+                checkpoint_callback=worker._create_checkpoint_callback(job),
+                resume_after=worker._get_resume_state(job),
+                retry_source_ids=worker._get_retry_source_ids(job),
+            )
 
-            # No failed sources should be in checkpoint
-            for sid in failed_source_ids:
-                assert sid not in final_checkpoint, (
-                    f"Failed source {sid} should not be in checkpoint"
-                )
+        assert attempted == [first, third]
+        assert job.payload["checkpoint"]["failed_source_ids"] == []
 
 
 class TestWorkerProcessJobWithCheckpointing:
@@ -494,7 +616,8 @@ class TestWorkerProcessJobWithCheckpointing:
     async def test_process_job_resumes_from_checkpoint(self, mock_db, mock_llm):
         """Worker resumes from checkpoint when restarting a failed job."""
         project_id = uuid4()
-        already_processed = [str(uuid4()), str(uuid4())]
+        already_processed = str(uuid4())
+        failed_before_cursor = str(uuid4())
 
         # Mock project with schema
         mock_project = Mock(spec=Project)
@@ -512,10 +635,11 @@ class TestWorkerProcessJobWithCheckpointing:
             payload={
                 "project_id": str(project_id),
                 "checkpoint": {
-                    "processed_source_ids": already_processed,
-                    "last_checkpoint_at": "2024-01-15T10:30:00Z",
+                    "resume_after": already_processed,
+                    "sources_processed": 2,
                     "total_extractions": 10,
-                    "total_entities": 3,
+                    "failed_source_ids": [failed_before_cursor],
+                    "last_checkpoint_at": "2024-01-15T10:30:00Z",
                 },
             },
         )
@@ -541,10 +665,10 @@ class TestWorkerProcessJobWithCheckpointing:
 
             await worker.process_job(job)
 
-            # Verify extract_project was called with resume_from
+            # Verify extract_project was called with the resume cursor
             call_kwargs = mock_pipeline.extract_project.call_args.kwargs
-            assert "resume_from" in call_kwargs
-            assert call_kwargs["resume_from"] == set(already_processed)
+            assert call_kwargs["resume_after"] == UUID(already_processed)
+            assert call_kwargs["retry_source_ids"] == [UUID(failed_before_cursor)]
 
 
 class TestCheckpointDataStructure:
@@ -564,15 +688,18 @@ class TestCheckpointDataStructure:
         )
 
         callback = worker._create_checkpoint_callback(job)
-        callback(["id1", "id2"], 10, 5)
+        callback(str(uuid4()), 2, 10, [])
 
         checkpoint = job.payload["checkpoint"]
 
         # Verify all required fields present
-        assert "processed_source_ids" in checkpoint
-        assert "last_checkpoint_at" in checkpoint
-        assert "total_extractions" in checkpoint
-        assert "total_entities" in checkpoint
+        assert set(checkpoint) == {
+            "resume_after",
+            "sources_processed",
+            "total_extractions",
+            "failed_source_ids",
+            "last_checkpoint_at",
+        }
 
     def test_checkpoint_timestamp_is_iso_format(self, mock_db):
         """Checkpoint timestamp is in ISO 8601 format."""
@@ -588,7 +715,7 @@ class TestCheckpointDataStructure:
         )
 
         callback = worker._create_checkpoint_callback(job)
-        callback(["id1"], 5, 2)
+        callback(str(uuid4()), 1, 5, [])
 
         timestamp = job.payload["checkpoint"]["last_checkpoint_at"]
 
@@ -569,6 +569,124 @@ class TestListExtractions:
         assert data["offset"] == 5
         assert len(data["extractions"]) == 5
 
+    def test_list_extractions_cursor_pagination(
+        self,
+        client: TestClient,
+        valid_api_key: str,
+        test_project: Project,
+        test_sources: list[Source],
+        db: Session,
+    ):
+        """Cursor pages cover every extraction once, in offset order."""
+        from datetime import UTC, datetime, timedelta
+
+        from orm_models import Extraction
+
+        # Pairs share a created_at so the id tie-breaker is exercised
+        base = datetime(2026, 1, 1, tzinfo=UTC)
+        for i in range(11):
+            db.add(
+                Extraction(
+                    project_id=test_project.id,
+                    source_id=test_sources[0].id,
+                    data={"text": f"fact {i}"},
+                    extraction_type="test",
+                    source_group="TestCo",
+                    created_at=base + timedelta(minutes=i // 2),
+                )
+            )
+        db.flush()
+        url = f"/api/v1/projects/{test_project.id}/extractions"
+        headers = {"X-API-Key": valid_api_key}
+
+        response = client.get(f"{url}?limit=100", headers=headers)
+        expected = [e["id"] for e in response.json()["extractions"]]
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+            data = client.get(url, params=params, headers=headers).json()
+            assert data["total"] == 11
+            seen.extend(e["id"] for e in data["extractions"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert len(seen) == 11
+
+    def test_list_extractions_last_page_has_no_cursor(
+        self,
+        client: TestClient,
+        valid_api_key: str,
+        test_project: Project,
+        test_sources: list[Source],
+        db: Session,
+    ):
+        """next_cursor is set only while more rows follow."""
+        from orm_models import Extraction
+
+        for i in range(4):
+            db.add(
+                Extraction(
+                    project_id=test_project.id,
+                    source_id=test_sources[0].id,
+                    data={"text": f"fact {i}"},
+                    extraction_type="test",
+                    source_group="TestCo",
+                )
+            )
+        db.flush()
+        url = f"/api/v1/projects/{test_project.id}/extractions"
+        headers = {"X-API-Key": valid_api_key}
+
+        assert client.get(f"{url}?limit=3", headers=headers).json()["next_cursor"]
+        data = client.get(f"{url}?limit=4", headers=headers).json()
+        assert data["next_cursor"] is None
+        assert data["total_estimated"] is False
+
+    def test_list_extractions_rejects_invalid_cursor(
+        self, client: TestClient, valid_api_key: str, test_project: Project
+    ):
+        """Should return 400 for a cursor that does not decode."""
+        response = client.get(
+            f"/api/v1/projects/{test_project.id}/extractions?cursor=not-a-cursor",
+            headers={"X-API-Key": valid_api_key},
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_CURSOR"
+
+    def test_list_extractions_estimated_count(
+        self,
+        client: TestClient,
+        valid_api_key: str,
+        test_project: Project,
+        test_sources: list[Source],
+        db: Session,
+    ):
+        """Small estimated results fall back to an exact count."""
+        from orm_models import Extraction
+
+        db.add(
+            Extraction(
+                project_id=test_project.id,
+                source_id=test_sources[0].id,
+                data={"text": "fact"},
+                extraction_type="test",
+                source_group="TestCo",
+            )
+        )
+        db.flush()
+
+        response = client.get(
+            f"/api/v1/projects/{test_project.id}/extractions?count=estimate",
+            headers={"X-API-Key": valid_api_key},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["total_estimated"] is False
+
     def test_list_extractions_validates_source_id_format(
         self, client: TestClient, valid_api_key: str, test_project: Project
     ):
@@ -240,6 +240,54 @@ class TestFirecrawlClient:
         # We can't easily test this without making another request,
         # but we verify the pattern works
 
+    @pytest.mark.asyncio
+    async def test_get_crawl_status_skip_follows_next_while_scraping(self, client):
+        """Incremental polls pass skip and collect every page past the offset."""
+        first = Mock()
+        first.json.return_value = {
+            "status": "scraping",
+            "total": 10,
+            "completed": 6,
+            "data": [{"markdown": "a"}],
+            "next": "http://localhost:3002/v1/crawl/fc-1?skip=5",
+        }
+        second = Mock()
+        second.json.return_value = {"data": [{"markdown": "b"}], "next": None}
+
+        with patch.object(
+            client._http_client,
+            "get",
+            new_callable=AsyncMock,
+            side_effect=[first, second],
+        ) as mock_get:
+            status = await client.get_crawl_status("fc-1", skip=4)
+
+        assert mock_get.call_args_list[0].args[0].endswith("/v1/crawl/fc-1?skip=4")
+        assert status.status == "scraping"
+        assert [p["markdown"] for p in status.pages] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_get_crawl_status_without_skip_ignores_next_while_scraping(
+        self, client
+    ):
+        """Legacy polls only paginate once the crawl is completed."""
+        response = Mock()
+        response.json.return_value = {
+            "status": "scraping",
+            "total": 10,
+            "completed": 6,
+            "data": [{"markdown": "a"}],
+            "next": "http://localhost:3002/v1/crawl/fc-1?skip=1",
+        }
+
+        with patch.object(
+            client._http_client, "get", new_callable=AsyncMock, return_value=response
+        ) as mock_get:
+            status = await client.get_crawl_status("fc-1")
+
+        mock_get.assert_awaited_once_with("http://localhost:3002/v1/crawl/fc-1")
+        assert len(status.pages) == 1
+
 
 class TestScrapeResult:
     """Test suite for ScrapeResult data class."""
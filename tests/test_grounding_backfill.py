@@ -289,3 +289,335 @@ class TestBackfillLogic:
         refreshed = extraction_repo.get(ext.id)
         assert refreshed.grounding_scores["company_name"] == 1.0
         assert refreshed.grounding_scores["employee_count"] == 1.0
+
+
+def _v1(repo, project, source, name, quote):
+    return repo.create(
+        project_id=project.id,
+        source_id=source.id,
+        data={"company_name": name, "_quotes": {"company_name": quote}},
+        extraction_type="company_info",
+        source_group="test_company",
+    )
+
+
+def _v2(repo, project, source, name, quote, grounding):
+    ext = repo.create(
+        project_id=project.id,
+        source_id=source.id,
+        data={"company_name": {"value": name, "quote": quote, "grounding": grounding}},
+        extraction_type="company_info",
+        source_group="test_company",
+    )
+    ext.data_version = 2
+    return ext
+
+
+class TestGroundingBackfillService:
+    """Keyset-ordered, checkpointed backfill runs against the DB."""
+
+    async def test_v1_scores_in_batches(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from services.extraction.grounding_backfill import GroundingBackfillService
+
+        grounded = _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+        ungrounded = _v1(extraction_repo, test_project, test_source, "ABB", "Other")
+        _v2(extraction_repo, test_project, test_source, "ABB", "ABB", 1.0)
+        db_session.flush()
+
+        checkpoints = []
+        service = GroundingBackfillService(db_session, batch_size=2)
+        totals = await service.run(
+            test_project.id,
+            "v1",
+            checkpoint_callback=lambda t: checkpoints.append(t.to_dict()),
+        )
+
+        assert totals.total_extractions == 3
+        assert (totals.processed, totals.skipped, totals.updated) == (2, 1, 2)
+        assert totals.field_stats == {"company_name": {"grounded": 1, "ungrounded": 1}}
+        assert [c["processed"] + c["skipped"] for c in checkpoints] == [2, 3]
+        assert checkpoints[-1]["extractions_per_second"] > 0
+        assert extraction_repo.get(grounded.id).grounding_scores == {
+            "company_name": 1.0
+        }
+        assert extraction_repo.get(ungrounded.id).grounding_scores == {
+            "company_name": 0.0
+        }
+
+    async def test_v2_regrounds_against_source_content(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from services.extraction.grounding_backfill import GroundingBackfillService
+
+        test_source.content = "ABB Ltd is a global technology company."
+        stale = _v2(extraction_repo, test_project, test_source, "ABB", "ABB Ltd", 0.0)
+        _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+        db_session.flush()
+
+        service = GroundingBackfillService(db_session)
+        dry = await service.run(test_project.id, "v2", dry_run=True)
+        assert (dry.processed, dry.skipped, dry.updated) == (1, 1, 1)
+        assert extraction_repo.get(stale.id).data["company_name"]["grounding"] == 0.0
+
+        totals = await service.run(test_project.id, "v2")
+        assert totals.updated == 1
+        assert totals.field_stats["company_name"] == {"grounded": 1}
+        assert extraction_repo.get(stale.id).data["company_name"]["grounding"] == 1.0
+
+    async def test_executor_slices_match_inline(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from services.extraction.grounding_backfill import GroundingBackfillService
+
+        for i in range(7):
+            quote = "ABB Ltd" if i % 2 else "unrelated"
+            _v1(extraction_repo, test_project, test_source, "ABB", quote)
+        db_session.flush()
+
+        inline = await GroundingBackfillService(db_session, batch_size=5).run(
+            test_project.id, "v1", dry_run=True
+        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pooled = await GroundingBackfillService(
+                db_session, executor=executor, parallelism=3, batch_size=5
+            ).run(test_project.id, "v1", dry_run=True)
+
+        timing = {"elapsed_seconds": 0, "extractions_per_second": 0}
+        assert pooled.to_dict() | timing == inline.to_dict() | timing
+
+    async def test_inline_scoring_runs_off_event_loop(self, db_session):
+        import threading
+
+        from services.extraction.grounding_backfill import GroundingBackfillService
+
+        service = GroundingBackfillService(db_session)
+
+        parts = await service._score_slices(
+            lambda n: (n, threading.get_ident()), [(1,), (2,)]
+        )
+
+        assert [n for n, _ in parts] == [1, 2]
+        assert all(ident != threading.get_ident() for _, ident in parts)
+
+    async def test_cancel_then_resume_from_checkpoint(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from services.extraction.grounding_backfill import (
+            BackfillCancelledError,
+            BackfillTotals,
+            GroundingBackfillService,
+        )
+
+        exts = [
+            _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+            for _ in range(5)
+        ]
+        db_session.flush()
+
+        checkpoints = []
+        checks = iter([False, True])
+
+        async def cancel_after_first_batch() -> bool:
+            return next(checks)
+
+        service = GroundingBackfillService(db_session, batch_size=2)
+        with pytest.raises(BackfillCancelledError):
+            await service.run(
+                test_project.id,
+                "v1",
+                checkpoint_callback=lambda t: checkpoints.append(t.to_dict()),
+                cancellation_check=cancel_after_first_batch,
+            )
+        assert len(checkpoints) == 1
+        assert extraction_repo.get(exts[2].id).grounding_scores is None
+
+        totals = await service.run(
+            test_project.id,
+            "v1",
+            resume=BackfillTotals.from_dict(checkpoints[0]),
+        )
+        assert (totals.total_extractions, totals.processed, totals.updated) == (
+            5,
+            5,
+            5,
+        )
+        assert all(
+            extraction_repo.get(e.id).grounding_scores == {"company_name": 1.0}
+            for e in exts
+        )
+
+    async def test_project_without_schema_fails(self, db_session):
+        from services.extraction.grounding_backfill import GroundingBackfillService
+
+        project = Project(name="test_backfill_no_schema", extraction_schema={})
+        db_session.add(project)
+        db_session.flush()
+
+        with pytest.raises(ValueError, match="field_groups"):
+            await GroundingBackfillService(db_session).run(project.id, "v1")
+
+
+class TestBackfillWorker:
+    """BackfillWorker job lifecycle."""
+
+    def _job(self, db_session, project, **payload):
+        from constants import JobStatus, JobType
+        from orm_models import Job
+
+        job = Job(
+            type=JobType.BACKFILL,
+            status=JobStatus.QUEUED,
+            project_id=project.id,
+            payload={"project_id": str(project.id), "mode": "v1", **payload},
+        )
+        db_session.add(job)
+        db_session.flush()
+        return job
+
+    async def test_completes_with_throughput(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from services.extraction.backfill_worker import BackfillWorker
+
+        ext = _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+        job = self._job(db_session, test_project, batch_size=10)
+
+        await BackfillWorker(db_session).process_job(job)
+
+        assert job.status == "completed"
+        assert job.result["mode"] == "v1"
+        assert job.result["processed"] == 1
+        assert job.result["updated"] == 1
+        assert job.result["extractions_per_second"] > 0
+        assert "resume_after" not in job.result
+        assert job.payload["checkpoint"]["resume_after"]
+        assert extraction_repo.get(ext.id).grounding_scores == {"company_name": 1.0}
+
+    async def test_resumes_after_checkpoint(
+        self, extraction_repo, test_project, test_source, db_session
+    ):
+        from services.extraction.backfill_worker import BackfillWorker
+        from services.extraction.grounding_backfill import BACKFILL_ORDER
+
+        done = _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+        todo = _v1(extraction_repo, test_project, test_source, "ABB", "ABB Ltd")
+        db_session.flush()
+        checkpoint = {
+            "total_extractions": 2,
+            "processed": 1,
+            "updated": 1,
+            "skipped": 0,
+            "field_stats": {"company_name": {"grounded": 1}},
+            "resume_after": BACKFILL_ORDER.cursor_for(done),
+            "elapsed_seconds": 1.0,
+        }
+        job = self._job(db_session, test_project, checkpoint=checkpoint)
+        job.status = "running"
+
+        await BackfillWorker(db_session).process_job(job)
+
+        assert job.status == "completed"
+        assert (job.result["processed"], job.result["updated"]) == (2, 2)
+        assert job.result["field_stats"] == {"company_name": {"grounded": 2}}
+        assert extraction_repo.get(done.id).grounding_scores is None
+        assert extraction_repo.get(todo.id).grounding_scores == {"company_name": 1.0}
+
+    async def test_cancelled_before_start(self, test_project, db_session):
+        from services.extraction.backfill_worker import BackfillWorker
+
+        job = self._job(db_session, test_project)
+        job.status = "cancelling"
+
+        await BackfillWorker(db_session).process_job(job)
+
+        assert job.status == "cancelled"
+        assert job.started_at is None
+
+    async def test_failure_shuts_down_pool_and_marks_failed(self):
+        from unittest.mock import AsyncMock, Mock, patch
+        from uuid import uuid4
+
+        from orm_models import Job
+        from services.extraction.backfill_worker import BackfillWorker
+
+        job = Job(
+            id=uuid4(),
+            type="backfill",
+            status="queued",
+            payload={"project_id": str(uuid4()), "mode": "v2"},
+        )
+        db = Mock()
+        worker = BackfillWorker(
+            db, extraction=Mock(grounding_backfill_process_workers=3)
+        )
+        service = Mock(run=AsyncMock(side_effect=RuntimeError("db gone")))
+
+        with (
+            patch("services.extraction.backfill_worker.ProcessPoolExecutor") as pool,
+            patch(
+                "services.extraction.backfill_worker.GroundingBackfillService",
+                return_value=service,
+            ) as service_cls,
+        ):
+            await worker.process_job(job)
+
+        assert pool.call_args.kwargs["max_workers"] == 3
+        assert service_cls.call_args.kwargs["parallelism"] == 3
+        pool.return_value.shutdown.assert_called_once()
+        assert job.status == "failed"
+        assert job.error == "db gone"
+        db.rollback.assert_called_once()
+
+
+class TestBackfillEndpoints:
+    """Backfill endpoints queue a job instead of scoring in the request."""
+
+    @pytest.fixture
+    def client(self, db_session):
+        from fastapi.testclient import TestClient
+
+        from database import get_db
+        from main import app
+
+        app.dependency_overrides[get_db] = lambda: db_session
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    @pytest.mark.parametrize(
+        ("path", "mode", "dry_run"),
+        [("backfill-grounding", "v1", False), ("backfill-grounding-v2", "v2", True)],
+    )
+    def test_queues_backfill_job(
+        self, client, db_session, test_project, valid_api_key, path, mode, dry_run
+    ):
+        from orm_models import Job
+
+        response = client.post(
+            f"/api/v1/projects/{test_project.id}/{path}?batch_size=250",
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "queued"
+        job = db_session.get(Job, body["job_id"])
+        assert job.type == "backfill"
+        assert job.payload == {
+            "project_id": str(test_project.id),
+            "mode": mode,
+            "dry_run": dry_run,
+            "batch_size": 250,
+        }
+
+    def test_missing_project_returns_404(self, client, valid_api_key):
+        from uuid import uuid4
+
+        response = client.post(
+            f"/api/v1/projects/{uuid4()}/backfill-grounding",
+            headers={"X-API-Key": valid_api_key},
+        )
+        assert response.status_code == 404
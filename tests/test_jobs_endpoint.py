@@ -181,6 +181,39 @@ class TestListJobs:
         assert len(data["jobs"]) == 2
         assert data["offset"] == 2
 
+    def test_list_jobs_cursor_pagination(
+        self, client: TestClient, auth_headers, sample_jobs: list[Job]
+    ) -> None:
+        """Cursor pages return the same jobs in the same order as one page."""
+        response = client.get("/api/v1/jobs?limit=100", headers=auth_headers)
+        expected = [job["id"] for job in response.json()["jobs"]]
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/api/v1/jobs", params=params, headers=auth_headers)
+            data = response.json()
+            seen.extend(job["id"] for job in data["jobs"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert {str(job.id) for job in sample_jobs} <= set(seen)
+
+    def test_list_jobs_estimated_count(
+        self, client: TestClient, auth_headers, sample_jobs: list[Job]
+    ) -> None:
+        """Exact and estimated totals agree on a small table."""
+        exact = client.get("/api/v1/jobs?type=scrape", headers=auth_headers).json()
+        estimate = client.get(
+            "/api/v1/jobs?type=scrape&count=estimate", headers=auth_headers
+        ).json()
+
+        assert exact["total"] == estimate["total"] >= 3
+        assert estimate["total_estimated"] is False
+
     def test_list_jobs_sorted_newest_first(
         self, client: TestClient, auth_headers, sample_jobs: list[Job]
     ) -> None:
@@ -3,13 +3,16 @@
 import pytest
 
 from services.extraction.llm_skip_gate import (
+    BATCH_SYSTEM_PROMPT,
     LLMSkipGate,
     SkipGateResult,
+    _parse_batch_decisions,
     _parse_decision,
     _parse_decision_from_dict,
     _sample_content,
     build_schema_summary,
 )
+from services.extraction.page_classifier import PageToClassify
 
 # ── Fixtures ──
 
@@ -165,6 +168,157 @@ class TestLLMSkipGate:
         assert result.decision == "skip"
 
 
+# ── Batched skip-gate tests ──
+
+
+class BatchLLMClient:
+    """Answers batch prompts with per-page decisions, single prompts by URL."""
+
+    def __init__(self, skip_urls=(), batch_response=None):
+        self._skip_urls = set(skip_urls)
+        self._batch_response = batch_response
+        self.calls = []
+
+    async def complete(self, **kwargs):
+        self.calls.append(kwargs)
+        prompt = kwargs["user_prompt"]
+        urls = [line[5:] for line in prompt.splitlines() if line.startswith("URL: ")]
+        if kwargs["system_prompt"] != BATCH_SYSTEM_PROMPT:
+            return {"decision": "skip" if urls[0] in self._skip_urls else "extract"}
+        if self._batch_response is not None:
+            return self._batch_response
+        return {
+            "decisions": [
+                {"page": n, "decision": "skip" if url in self._skip_urls else "extract"}
+                for n, url in enumerate(urls, start=1)
+            ]
+        }
+
+
+def _pages(count: int, content: str = "Gearbox specifications and ratings. " * 5):
+    return [
+        PageToClassify(f"https://example.com/p{i}", f"Page {i}", content)
+        for i in range(count)
+    ]
+
+
+class TestShouldExtractMany:
+    async def test_pages_batched_per_request(self):
+        client = BatchLLMClient(skip_urls={"https://example.com/p1"})
+        gate = LLMSkipGate(llm_client=client, batch_size=3)
+
+        results = await gate.should_extract_many(_pages(7), SAMPLE_SCHEMA)
+
+        assert [r.decision for r in results] == [
+            "extract",
+            "skip",
+            "extract",
+            "extract",
+            "extract",
+            "extract",
+            "extract",
+        ]
+        assert len(client.calls) == 3
+        assert gate.stats.batch_requests == 3
+        assert gate.stats.batched_pages == 7
+        assert gate.stats.fallback_pages == 0
+
+    async def test_trivial_pages_not_sent(self):
+        client = BatchLLMClient()
+        gate = LLMSkipGate(llm_client=client, batch_size=4)
+        pages = _pages(2) + _pages(1, content="Short")
+
+        results = await gate.should_extract_many(pages, SAMPLE_SCHEMA)
+
+        assert [r.decision for r in results] == ["extract"] * 3
+        prompt = client.calls[0]["user_prompt"]
+        assert "PAGE 2:" in prompt and "PAGE 3:" not in prompt
+
+    async def test_unparseable_batch_falls_back_per_page(self):
+        client = BatchLLMClient(
+            skip_urls={"https://example.com/p0"}, batch_response={"oops": True}
+        )
+        gate = LLMSkipGate(llm_client=client, batch_size=4)
+
+        results = await gate.should_extract_many(_pages(2), SAMPLE_SCHEMA)
+
+        assert [r.decision for r in results] == ["skip", "extract"]
+        assert len(client.calls) == 3  # one batch + two single-page retries
+        assert gate.stats.fallback_pages == 2
+        assert gate.stats.single_pages == 2
+
+    async def test_missing_entries_re_asked(self):
+        client = BatchLLMClient(
+            skip_urls={"https://example.com/p1"},
+            batch_response={"decisions": [{"page": 1, "decision": "extract"}]},
+        )
+        gate = LLMSkipGate(llm_client=client, batch_size=4)
+
+        results = await gate.should_extract_many(_pages(2), SAMPLE_SCHEMA)
+
+        assert [r.decision for r in results] == ["extract", "skip"]
+        assert gate.stats.fallback_pages == 1
+
+    async def test_batch_size_one_uses_single_page_prompt(self):
+        client = BatchLLMClient()
+        gate = LLMSkipGate(llm_client=client)
+
+        await gate.should_extract_many(_pages(2), SAMPLE_SCHEMA)
+
+        assert len(client.calls) == 2
+        assert all(c["system_prompt"] != BATCH_SYSTEM_PROMPT for c in client.calls)
+
+    async def test_schema_summary_memoised(self, monkeypatch):
+        from services.extraction import llm_skip_gate
+
+        calls = []
+        original = llm_skip_gate.build_schema_summary
+        monkeypatch.setattr(
+            llm_skip_gate,
+            "build_schema_summary",
+            lambda schema: calls.append(schema) or original(schema),
+        )
+        gate = LLMSkipGate(llm_client=BatchLLMClient(), batch_size=2)
+
+        await gate.should_extract_many(_pages(6), SAMPLE_SCHEMA)
+        await gate.should_extract_many(_pages(2), dict(SAMPLE_SCHEMA))
+
+        assert len(calls) == 1
+
+
+class TestParseBatchDecisions:
+    def test_indexed_entries(self):
+        response = {
+            "decisions": [
+                {"page": 2, "decision": "Skip"},
+                {"page": 1, "decision": "extract"},
+            ]
+        }
+        assert _parse_batch_decisions(response, 2) == {0: "extract", 1: "skip"}
+
+    def test_bare_list_of_strings(self):
+        assert _parse_batch_decisions(["skip", "extract"], 2) == {
+            0: "skip",
+            1: "extract",
+        }
+
+    def test_fenced_string(self):
+        text = '```json\n{"decisions": [{"page": 1, "decision": "skip"}]}\n```'
+        assert _parse_batch_decisions(text, 1) == {0: "skip"}
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"decisions": [{"page": 5, "decision": "skip"}]},
+            {"decisions": [{"page": 1, "decision": "maybe"}]},
+            {"decision": "skip"},
+            "not json",
+        ],
+    )
+    def test_unattributable_entries_dropped(self, response):
+        assert _parse_batch_decisions(response, 2) == {}
+
+
 # ── _parse_decision tests ──
 
 
@@ -0,0 +1,223 @@
+"""Tests for in-process hot-path histograms and counters."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config import settings
+from services.extraction.extraction_items import locate_in_source
+from services.extraction.field_groups import FieldDefinition, FieldGroup
+from services.extraction.schema_extractor import SchemaExtractor
+from services.llm.models import LLMRequest
+from services.llm.worker import LLMWorker
+from services.metrics.instruments import (
+    EXTRACTION_LLM_SECONDS,
+    GROUNDING_MATCHES,
+    LLM_COMPLETION_TOKENS,
+    LLM_INFERENCE_SECONDS,
+    LLM_PROMPT_TOKENS,
+    LLM_QUEUE_WAIT_SECONDS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    record_token_usage,
+)
+
+
+class TestCounter:
+    def test_inc_per_label_set(self) -> None:
+        counter = Counter("c_total", "help", ("kind",))
+
+        counter.inc(kind="a")
+        counter.inc(3, kind="a")
+        counter.inc(kind="b")
+
+        assert counter.value(kind="a") == 4
+        assert counter.value(kind="b") == 1
+        assert counter.value(kind="c") == 0
+
+    def test_wrong_labels_rejected(self) -> None:
+        counter = Counter("c_total", "help", ("kind",))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc(other="a")
+        with pytest.raises(ValueError):
+            counter.inc(kind="a", other="b")
+
+    def test_series_beyond_limit_collapse(self) -> None:
+        counter = Counter("c_total", "help", ("domain",), max_series=2)
+
+        for domain in ("a.example", "b.example", "c.example", "d.example"):
+            counter.inc(domain=domain)
+
+        assert counter.value(domain="a.example") == 1
+        assert counter.value(domain="other") == 2
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative_and_inclusive(self) -> None:
+        hist = Histogram("h_seconds", "help", ("op",), buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value, op="x")
+        lines = hist.render()
+
+        assert "# TYPE h_seconds histogram" in lines
+        assert 'h_seconds_bucket{op="x",le="0.1"} 2' in lines
+        assert 'h_seconds_bucket{op="x",le="1.0"} 3' in lines
+        assert 'h_seconds_bucket{op="x",le="+Inf"} 4' in lines
+        assert 'h_seconds_sum{op="x"} 2.65' in lines
+        assert 'h_seconds_count{op="x"} 4' in lines
+        assert hist.sum(op="x") == pytest.approx(2.65)
+
+    def test_time_context_manager(self) -> None:
+        hist = Histogram("h_seconds", "help", ("op",))
+
+        with hist.time(op="x"):
+            pass
+
+        assert hist.count(op="x") == 1
+
+    def test_time_records_on_exception(self) -> None:
+        hist = Histogram("h_seconds", "help")
+
+        with pytest.raises(RuntimeError), hist.time():
+            raise RuntimeError("boom")
+
+        assert hist.count() == 1
+
+
+class TestRegistry:
+    def test_render_escapes_label_values(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("c_total", "help", ("group",))
+        counter.inc(group='say "hi"\\')
+
+        assert 'c_total{group="say \\"hi\\"\\\\"} 1' in registry.render()
+
+    def test_reset_keeps_instruments(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("c_total", "help")
+        counter.inc()
+
+        registry.reset()
+
+        assert counter.value() == 0
+        assert "# TYPE c_total counter" in registry.render()
+
+    def test_empty_registry_renders_nothing(self) -> None:
+        assert MetricsRegistry().render() == ""
+
+
+def test_record_token_usage_ignores_missing_usage() -> None:
+    prompt = LLM_PROMPT_TOKENS.value(field_group="tokens_test")
+    completion = LLM_COMPLETION_TOKENS.value(field_group="tokens_test")
+
+    record_token_usage(None, "tokens_test")
+    record_token_usage(MagicMock(), "tokens_test")
+    record_token_usage(
+        SimpleNamespace(prompt_tokens=120, completion_tokens=30), "tokens_test"
+    )
+
+    assert LLM_PROMPT_TOKENS.value(field_group="tokens_test") == prompt + 120
+    assert LLM_COMPLETION_TOKENS.value(field_group="tokens_test") == completion + 30
+
+
+async def test_schema_extractor_records_latency_and_tokens() -> None:
+    group = FieldGroup(
+        name="instrumented_group",
+        description="Company",
+        fields=[FieldDefinition("company_name", "text", "Name")],
+        prompt_hint="",
+    )
+    extractor = SchemaExtractor(settings.llm)
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = '{"company_name": "Acme"}'
+    response.choices[0].finish_reason = "stop"
+    response.usage = SimpleNamespace(prompt_tokens=200, completion_tokens=12)
+    extractor.client = MagicMock()
+    extractor.client.chat.completions.create = AsyncMock(return_value=response)
+
+    await extractor.extract_field_group("Acme builds gearboxes.", group)
+
+    assert (
+        EXTRACTION_LLM_SECONDS.count(field_group="instrumented_group", status="success")
+        == 1
+    )
+    assert LLM_PROMPT_TOKENS.value(field_group="instrumented_group") == 200
+    assert LLM_COMPLETION_TOKENS.value(field_group="instrumented_group") == 12
+
+
+async def test_llm_worker_records_queue_wait_inference_and_tokens() -> None:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = '{"name": "Acme"}'
+    response.choices[0].finish_reason = "stop"
+    response.usage = SimpleNamespace(prompt_tokens=50, completion_tokens=5)
+    llm_client = MagicMock()
+    llm_client.chat.completions.create = AsyncMock(return_value=response)
+    worker = LLMWorker(redis=AsyncMock(), llm_client=llm_client, worker_id="w")
+    waits = LLM_QUEUE_WAIT_SECONDS.count(request_type="extract_entities")
+    inferences = LLM_INFERENCE_SECONDS.count(
+        request_type="extract_entities", status="success"
+    )
+    now = datetime.now(UTC)
+    request = LLMRequest(
+        request_id="r1",
+        request_type="extract_entities",
+        payload={},
+        priority=5,
+        created_at=now - timedelta(seconds=2),
+        timeout_at=now + timedelta(seconds=60),
+    )
+    worker._execute_llm_call = AsyncMock(return_value={})
+
+    await worker._process_request("1-0", {"data": request.to_json()})
+
+    assert LLM_QUEUE_WAIT_SECONDS.count(request_type="extract_entities") == waits + 1
+    assert (
+        LLM_INFERENCE_SECONDS.count(request_type="extract_entities", status="success")
+        == inferences + 1
+    )
+
+    del worker._execute_llm_call
+    await worker._extract_field_group(
+        {
+            "system_prompt": "s",
+            "user_prompt": "u",
+            "field_group": {"name": "worker_group"},
+        },
+        temperature=0.1,
+        retry_count=0,
+    )
+
+    assert LLM_PROMPT_TOKENS.value(field_group="worker_group") == 50
+    assert LLM_COMPLETION_TOKENS.value(field_group="worker_group") == 5
+
+
+def test_locate_in_source_counts_match_tier() -> None:
+    chunk = SimpleNamespace(chunk_index=0, header_path=[])
+    exact = GROUNDING_MATCHES.value(tier="1")
+    unmatched = GROUNDING_MATCHES.value(tier="0")
+
+    locate_in_source("builds gearboxes", "Acme builds gearboxes in Munich.", chunk)
+    locate_in_source("sells bananas wholesale", "Acme builds gearboxes.", chunk)
+
+    assert GROUNDING_MATCHES.value(tier="1") == exact + 1
+    assert GROUNDING_MATCHES.value(tier="0") == unmatched + 1
+
+
+def test_metrics_endpoint_exports_instruments(client: TestClient) -> None:
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "# TYPE scristill_llm_inference_seconds histogram" in response.text
+    assert "# TYPE scristill_scrape_seconds histogram" in response.text
+    # Database metrics still come first
+    assert response.text.index("scristill_jobs_total") < response.text.index(
+        "scristill_llm_queue_wait_seconds"
+    )
@@ -0,0 +1,140 @@
+"""Tests for the cached database metrics snapshot."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.metrics import snapshot as snapshot_module
+from services.metrics.collector import SystemMetrics
+from services.metrics.snapshot import MetricsSnapshot
+
+
+def _metrics(jobs_total: int) -> SystemMetrics:
+    return SystemMetrics(
+        jobs_total=jobs_total,
+        jobs_by_type={},
+        jobs_by_status={},
+        sources_total=0,
+        sources_by_status={},
+        extractions_total=0,
+        entities_total=0,
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def collects(monkeypatch) -> list:
+    """Record each MetricsCollector.collect call; jobs_total = call number."""
+    calls = []
+
+    class FakeCollector:
+        def __init__(self, db) -> None:
+            self._db = db
+
+        def collect(self) -> SystemMetrics:
+            calls.append(self._db)
+            return _metrics(len(calls))
+
+    monkeypatch.setattr(snapshot_module, "MetricsCollector", FakeCollector)
+    return calls
+
+
+class TestMetricsSnapshot:
+    def test_serves_cached_snapshot_within_max_age(self, collects) -> None:
+        clock = FakeClock()
+        snapshot = MetricsSnapshot(60, clock=clock)
+
+        first = snapshot.get("db")
+        clock.now += 60
+        second = snapshot.get("db")
+
+        assert first is second
+        assert len(collects) == 1
+
+    def test_recollects_when_older_than_max_age(self, collects) -> None:
+        clock = FakeClock()
+        snapshot = MetricsSnapshot(60, clock=clock)
+
+        snapshot.get("db")
+        clock.now += 61
+
+        assert snapshot.get("db").jobs_total == 2
+
+    def test_zero_max_age_collects_every_time(self, collects) -> None:
+        snapshot = MetricsSnapshot(0, clock=FakeClock())
+
+        snapshot.get("db")
+        snapshot.get("db")
+
+        assert len(collects) == 2
+
+    def test_refresh_replaces_snapshot(self, collects) -> None:
+        snapshot = MetricsSnapshot(60, clock=FakeClock())
+        snapshot.get("db")
+
+        snapshot.refresh("other-db")
+
+        assert snapshot.get("db").jobs_total == 2
+        assert collects == ["db", "other-db"]
+
+
+class TestRefresher:
+    async def test_refresher_keeps_scrapes_off_the_database(self, collects) -> None:
+        snapshot = MetricsSnapshot(60)
+        session = MagicMock()
+
+        task = asyncio.create_task(snapshot.run_refresher(lambda: session))
+        for _ in range(100):
+            if collects:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        assert collects == [session]
+        session.close.assert_called_once()
+        scrape_db = MagicMock()
+        assert snapshot.get(scrape_db).jobs_total == 1
+        assert scrape_db not in collects
+
+    async def test_refresher_survives_failures(self) -> None:
+        # max age 2s -> refresh every second
+        snapshot = MetricsSnapshot(2)
+        attempts = []
+
+        def failing_factory():
+            attempts.append(1)
+            raise RuntimeError("database unavailable")
+
+        task = asyncio.create_task(snapshot.run_refresher(failing_factory))
+        for _ in range(300):
+            if len(attempts) >= 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        assert len(attempts) >= 2
+
+    async def test_start_and_stop(self, monkeypatch, collects) -> None:
+        monkeypatch.setattr(snapshot_module, "_snapshot", MetricsSnapshot(60))
+        monkeypatch.setattr(snapshot_module, "SessionLocal", MagicMock)
+
+        await snapshot_module.start_metrics_refresher()
+        assert snapshot_module._refresh_task is not None
+
+        await snapshot_module.stop_metrics_refresher()
+        assert snapshot_module._refresh_task is None
+
+    async def test_start_disabled_when_max_age_zero(self, monkeypatch) -> None:
+        monkeypatch.setattr(snapshot_module, "_snapshot", MetricsSnapshot(0))
+
+        await snapshot_module.start_metrics_refresher()
+
+        assert snapshot_module._refresh_task is None
@@ -0,0 +1,79 @@
+"""Tests for keyset pagination helpers."""
+
+import base64
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from orm_models import Entity, Extraction, Job
+from services.storage.pagination import (
+    InvalidCursorError,
+    Keyset,
+    count_rows,
+    estimate_rows,
+)
+
+
+def _encode(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class TestKeyset:
+    def test_cursor_round_trip(self) -> None:
+        keyset = Keyset(Extraction.created_at, Extraction.id)
+        row = SimpleNamespace(
+            created_at=datetime(2026, 3, 1, 12, 0, 0, 123456, tzinfo=UTC),
+            id=uuid4(),
+        )
+
+        clause = keyset.after(keyset.cursor_for(row))
+        params = clause.compile().params
+
+        assert row.created_at in params.values()
+        assert row.id in params.values()
+        assert "<" in str(clause)
+
+    def test_ascending_uses_greater_than(self) -> None:
+        keyset = Keyset(Entity.value, Entity.id, descending=False)
+        row = SimpleNamespace(value="Gearbox", id=uuid4())
+
+        clause = keyset.after(keyset.cursor_for(row))
+
+        assert ">" in str(clause)
+        assert "Gearbox" in clause.compile().params.values()
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            _encode(["2026-03-01T00:00:00+00:00"]),
+            _encode(["yesterday", str(uuid4())]),
+            _encode(["2026-03-01T00:00:00+00:00", "not-a-uuid"]),
+            _encode(["2026-03-01T00:00:00+00:00", 42]),
+            _encode({"created_at": "2026-03-01"}),
+        ],
+    )
+    def test_invalid_cursor_rejected(self, cursor) -> None:
+        keyset = Keyset(Extraction.created_at, Extraction.id)
+
+        with pytest.raises(InvalidCursorError):
+            keyset.after(cursor)
+
+
+class TestRowEstimate:
+    def test_estimate_with_in_filters(self, db) -> None:
+        query = select(Job).where(
+            Job.type.in_(["scrape", "extract"]),
+            Job.project_id.in_([uuid4(), uuid4()]),
+        )
+
+        assert estimate_rows(db, query) >= 0
+
+    def test_estimate_mode_counts_small_results_exactly(self, db) -> None:
+        query = select(Job).where(Job.id.in_([uuid4()]))
+
+        assert count_rows(db, query, "estimate") == (0, False)
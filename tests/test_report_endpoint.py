@@ -2,12 +2,15 @@
 
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
-from orm_models import Project, Report
+from constants import JobType
+from models import ReportRequest
+from orm_models import Job, Project, Report
+from services.storage.artifact_store import LocalArtifactStore
 
 
 @pytest.fixture
@@ -142,6 +145,92 @@ class TestCreateReport:
         assert response.status_code == 404
 
 
+class TestCreateReportBackground:
+    """Test POST /reports?background=true queues a report job."""
+
+    @patch("api.v1.reports.ReportService")
+    def test_background_creates_report_job(
+        self,
+        MockReportService,
+        client: TestClient,
+        valid_api_key: str,
+        test_project,
+        db,
+    ):
+        response = client.post(
+            f"/api/v1/projects/{test_project.id}/reports?background=true",
+            json={"type": "table", "group_by": "domain", "output_format": "xlsx"},
+            headers={"X-API-Key": valid_api_key},
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "queued"
+        MockReportService.assert_not_called()
+
+        job = db.query(Job).filter(Job.id == UUID(data["job_id"])).one()
+        assert job.type == JobType.REPORT
+        assert job.project_id == test_project.id
+        request = ReportRequest.model_validate(job.payload["request"])
+        assert request.group_by == "domain"
+        assert request.output_format == "xlsx"
+
+
+class TestDownloadReport:
+    """Test GET /reports/{report_id}/download."""
+
+    def test_download_streams_artifact(
+        self, client: TestClient, valid_api_key: str, test_project, db, tmp_path
+    ):
+        store = LocalArtifactStore(tmp_path)
+        key = store.put(b"xlsx-bytes")
+        report = Report(
+            project_id=test_project.id,
+            type="table",
+            title="Sheet",
+            content="",
+            format="xlsx",
+            artifact_key=key,
+        )
+        db.add(report)
+        db.flush()
+
+        with patch("api.v1.reports.get_artifact_store", return_value=store):
+            response = client.get(
+                f"/api/v1/projects/{test_project.id}/reports/{report.id}/download",
+                headers={"X-API-Key": valid_api_key},
+            )
+
+        assert response.status_code == 200
+        assert response.content == b"xlsx-bytes"
+        assert response.headers["content-length"] == str(len(b"xlsx-bytes"))
+        assert "Sheet.xlsx" in response.headers["content-disposition"]
+
+    def test_download_missing_artifact_returns_404(
+        self, client: TestClient, valid_api_key: str, test_project, db, tmp_path
+    ):
+        report = Report(
+            project_id=test_project.id,
+            type="table",
+            title="Sheet",
+            format="xlsx",
+            artifact_key="0" * 64,
+        )
+        db.add(report)
+        db.flush()
+
+        with patch(
+            "api.v1.reports.get_artifact_store",
+            return_value=LocalArtifactStore(tmp_path),
+        ):
+            response = client.get(
+                f"/api/v1/projects/{test_project.id}/reports/{report.id}/download",
+                headers={"X-API-Key": valid_api_key},
+            )
+
+        assert response.status_code == 404
+
+
 class TestListReports:
     """Test GET /api/v1/projects/{project_id}/reports endpoint."""
 
@@ -8,8 +8,13 @@ import pytest
 from models import ReportRequest, ReportType
 from orm_models import Report
 from services.llm.client import LLMClient
-from services.reports.service import ReportData, ReportService
+from services.reports.service import (
+    ReportCancelledError,
+    ReportData,
+    ReportService,
+)
 from services.reports.synthesis import ReportSynthesizer, SynthesisResult
+from services.storage.artifact_store import LocalArtifactStore
 from services.storage.repositories.entity import EntityRepository
 from services.storage.repositories.extraction import ExtractionRepository
 
@@ -160,6 +165,54 @@ class TestReportServiceGenerate:
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_generate_reports_progress(
+        self, report_service, mock_extraction_repo, mock_entity_repo
+    ):
+        """Progress callback sees each stage of generation."""
+        request = ReportRequest(type=ReportType.SINGLE, source_groups=["company-a"])
+        mock_extraction_repo.list = MagicMock(return_value=[])
+        mock_entity_repo.list = MagicMock(return_value=[])
+
+        stages = []
+        await report_service.generate(
+            uuid4(),
+            request,
+            progress_callback=lambda stage, done, total: stages.append(stage),
+        )
+
+        assert stages == ["gathering", "storing"]
+
+    @pytest.mark.asyncio
+    async def test_generate_stops_when_cancelled(
+        self, report_service, mock_extraction_repo, mock_entity_repo, mock_db_session
+    ):
+        """Cancellation raises before the report is persisted."""
+        request = ReportRequest(type=ReportType.SINGLE, source_groups=["company-a"])
+        mock_extraction_repo.list = MagicMock(return_value=[])
+        mock_entity_repo.list = MagicMock(return_value=[])
+
+        with pytest.raises(ReportCancelledError):
+            await report_service.generate(
+                uuid4(), request, cancellation_check=AsyncMock(return_value=True)
+            )
+
+        mock_db_session.add.assert_not_called()
+
+    def test_store_binary_uses_artifact_store(self, report_service, tmp_path):
+        """Binary content goes to the artifact store instead of the DB row."""
+        report_service._artifact_store = LocalArtifactStore(tmp_path)
+
+        binary, key = report_service._store_binary(b"xlsx-bytes")
+
+        assert binary is None
+        assert report_service._artifact_store.read(key) == b"xlsx-bytes"
+
+    def test_store_binary_without_store_keeps_bytes(self, report_service):
+        """Without a store, bytes stay on the DB row (legacy behaviour)."""
+        assert report_service._store_binary(b"x") == (b"x", None)
+        assert report_service._store_binary(None) == (None, None)
+
 
 class TestReportServiceGatherData:
     """Test ReportService._gather_data() method."""
@@ -1,12 +1,21 @@
 """Tests for TABLE report generation with new source/domain grouping."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 import pytest
 
 from services.reports.schema_table_generator import ColumnMetadata, SchemaTableGenerator
-from services.reports.service import ReportService
-from services.reports.smart_merge import MergeCandidate, SmartMergeService
+from services.reports.service import ReportCancelledError, ReportData, ReportService
+from services.reports.smart_merge import (
+    MergeCache,
+    MergeCancelledError,
+    MergeCandidate,
+    MergeResult,
+    SmartMergeService,
+    get_merge_cache,
+)
 
 
 class TestSchemaTableGenerator:
@@ -287,6 +296,311 @@ class TestSmartMergeService:
         assert "failed" in result.reasoning.lower()
 
 
+class TestSmartMergeMemoAndConcurrency:
+    """Tests for merge memoisation and the global LLM concurrency bound."""
+
+    @pytest.fixture
+    def mock_llm_client(self):
+        client = MagicMock()
+        client.complete = AsyncMock(
+            return_value={"value": "merged", "confidence": 0.9, "sources_used": []}
+        )
+        return client
+
+    @pytest.fixture
+    def column_meta(self):
+        return ColumnMetadata(
+            name="test_field",
+            label="Test Field",
+            field_type="text",
+            description="A test field",
+            field_group="test",
+        )
+
+    @staticmethod
+    def _candidates(*values):
+        return [
+            MergeCandidate(
+                value=v, source_url=f"url{i}", source_title=None, confidence=0.9
+            )
+            for i, v in enumerate(values)
+        ]
+
+    async def test_repeated_candidate_set_reuses_merge(
+        self, mock_llm_client, column_meta
+    ):
+        cache = MergeCache()
+        service = SmartMergeService(mock_llm_client, cache=cache)
+        candidates = self._candidates("A", "B")
+
+        first = await service.merge_column("f", column_meta, candidates)
+        # Fresh service (e.g. a regenerated report) sharing the same cache,
+        # candidates in a different order
+        again = SmartMergeService(mock_llm_client, cache=cache)
+        second = await again.merge_column("f", column_meta, candidates[::-1])
+
+        assert mock_llm_client.complete.call_count == 1
+        assert first.value == second.value == "merged"
+
+    async def test_memo_key_includes_column(self, mock_llm_client, column_meta):
+        service = SmartMergeService(mock_llm_client, cache=MergeCache())
+        candidates = self._candidates("A", "B")
+
+        await service.merge_column("f1", column_meta, candidates)
+        await service.merge_column("f2", column_meta, candidates)
+
+        assert mock_llm_client.complete.call_count == 2
+
+    async def test_failed_merge_not_memoised(self, mock_llm_client, column_meta):
+        cache = MergeCache()
+        service = SmartMergeService(mock_llm_client, cache=cache)
+        mock_llm_client.complete.side_effect = Exception("LLM failed")
+
+        await service.merge_column("f", column_meta, self._candidates("A", "B"))
+
+        assert len(cache) == 0
+
+    async def test_memo_key_includes_enum_values(self, mock_llm_client, column_meta):
+        from dataclasses import replace
+
+        service = SmartMergeService(mock_llm_client, cache=MergeCache())
+        candidates = self._candidates("A", "B")
+
+        await service.merge_column(
+            "f", replace(column_meta, enum_values=["A", "B"]), candidates
+        )
+        await service.merge_column(
+            "f", replace(column_meta, enum_values=["B", "A"]), candidates
+        )
+        await service.merge_column(
+            "f", replace(column_meta, enum_values=["A", "B", "C"]), candidates
+        )
+
+        assert mock_llm_client.complete.call_count == 2
+
+    async def test_unparseable_response_falls_back_uncached(
+        self, mock_llm_client, column_meta
+    ):
+        cache = MergeCache()
+        service = SmartMergeService(mock_llm_client, cache=cache)
+        mock_llm_client.complete.return_value = {"value": "x", "confidence": "high"}
+        candidates = self._candidates("A", "B")
+
+        result = await service.merge_column("f", column_meta, candidates)
+
+        assert result.value == "A"
+        assert len(cache) == 0
+
+        mock_llm_client.complete.return_value = {"value": "merged", "confidence": 0.9}
+        retried = await service.merge_column("f", column_meta, candidates)
+        assert retried.value == "merged"
+        assert mock_llm_client.complete.call_count == 2
+
+    async def test_agreeing_candidates_skip_llm_and_cache(
+        self, mock_llm_client, column_meta
+    ):
+        cache = MergeCache()
+        service = SmartMergeService(mock_llm_client, cache=cache)
+
+        await service.merge_column("f", column_meta, self._candidates("A", "A"))
+
+        mock_llm_client.complete.assert_not_called()
+        assert len(cache) == 0
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = MergeCache(max_size=2)
+        result = MergeResult(value=1, confidence=1.0)
+        cache.put("a", result)
+        cache.put("b", result)
+        cache.get("a")
+        cache.put("c", result)
+
+        assert cache.get("a") is result
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    async def test_cancellation_checked_before_llm_call(
+        self, mock_llm_client, column_meta
+    ):
+        service = SmartMergeService(
+            mock_llm_client, cancellation_check=AsyncMock(return_value=True)
+        )
+
+        with pytest.raises(MergeCancelledError):
+            await service.merge_column("f", column_meta, self._candidates("A", "B"))
+
+        mock_llm_client.complete.assert_not_called()
+
+    def test_shared_cache_sized_from_settings(self, monkeypatch):
+        import services.reports.smart_merge as smart_merge
+
+        monkeypatch.setattr(smart_merge, "_shared_cache", None)
+        monkeypatch.setattr(smart_merge.settings, "smart_merge_cache_size", 0)
+        assert get_merge_cache() is None
+
+        monkeypatch.setattr(smart_merge.settings, "smart_merge_cache_size", 3)
+        cache = get_merge_cache()
+        assert cache is get_merge_cache()
+        for key in "abcd":
+            cache.put(key, MergeResult(value=1, confidence=1.0))
+        assert len(cache) == 3
+
+    async def test_max_concurrent_bounds_llm_calls(self, column_meta):
+        in_flight = 0
+        peak = 0
+
+        async def slow_complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"value": "merged", "confidence": 0.9}
+
+        client = MagicMock()
+        client.complete = slow_complete
+        service = SmartMergeService(client, max_concurrent=3)
+
+        await asyncio.gather(
+            *[
+                service.merge_column(
+                    f"f{i}", column_meta, self._candidates(f"A{i}", f"B{i}")
+                )
+                for i in range(12)
+            ]
+        )
+
+        assert peak == 3
+
+
+class TestAggregateByDomainConcurrency:
+    """Domains are merged concurrently under one global LLM bound."""
+
+    async def test_domains_merge_concurrently_in_order(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow_complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"value": "merged", "confidence": 0.9}
+
+        llm_client = MagicMock()
+        llm_client.complete = slow_complete
+        service = ReportService(
+            extraction_repo=MagicMock(),
+            entity_repo=MagicMock(),
+            llm_client=llm_client,
+            db_session=MagicMock(),
+        )
+
+        # Unique values so the process-wide merge memo cannot serve them
+        token = uuid4().hex
+        domains = [f"d{i}.com" for i in range(4)]
+        source_rows = [
+            {
+                "domain": d,
+                "source_url": f"https://{d}/{j}",
+                "source_title": None,
+                "name": f"{token}-{d}-{j}",
+                "avg_confidence": 0.9,
+            }
+            for d in domains
+            for j in range(2)
+        ]
+        service._aggregate_by_source = MagicMock(
+            return_value=(
+                source_rows,
+                ["source_url", "source_title", "domain", "name", "avg_confidence"],
+                {"name": "Name"},
+                {},
+            )
+        )
+        data = ReportData(
+            extractions_by_group={},
+            entities_by_group={},
+            source_groups=[],
+            extraction_ids=[],
+            entity_count=0,
+        )
+        progress = []
+
+        rows, columns, _ = await service._aggregate_by_domain(
+            data,
+            {},
+            progress_callback=lambda stage, done, total: progress.append(done),
+        )
+
+        assert [r["domain"] for r in rows] == domains
+        assert all(r["name"] == "merged" for r in rows)
+        assert peak > 1
+        assert progress == [0, 1, 2, 3, 4]
+        assert columns[0] == "domain"
+
+    async def test_cancellation_stops_queued_merges(self, monkeypatch):
+        """Merges waiting for an LLM slot stop once cancellation is requested."""
+        import services.reports.service as report_service
+
+        monkeypatch.setattr(report_service.settings, "smart_merge_max_concurrent", 1)
+        cancelled = False
+
+        async def complete(**kwargs):
+            nonlocal cancelled
+            # Cancellation arrives while the first LLM merge runs
+            cancelled = True
+            await asyncio.sleep(0.01)
+            return {"value": "merged", "confidence": 0.9}
+
+        async def cancellation_check() -> bool:
+            return cancelled
+
+        llm_client = MagicMock()
+        llm_client.complete = AsyncMock(side_effect=complete)
+        service = ReportService(
+            extraction_repo=MagicMock(),
+            entity_repo=MagicMock(),
+            llm_client=llm_client,
+            db_session=MagicMock(),
+        )
+        token = uuid4().hex
+        source_rows = [
+            {
+                "domain": f"d{i}.com",
+                "source_url": f"https://d{i}.com/{j}",
+                "source_title": None,
+                "name": f"{token}-{i}-{j}",
+                "avg_confidence": 0.9,
+            }
+            for i in range(4)
+            for j in range(2)
+        ]
+        service._aggregate_by_source = MagicMock(
+            return_value=(
+                source_rows,
+                ["source_url", "source_title", "domain", "name", "avg_confidence"],
+                {"name": "Name"},
+                {},
+            )
+        )
+        data = ReportData(
+            extractions_by_group={},
+            entities_by_group={},
+            source_groups=[],
+            extraction_ids=[],
+            entity_count=0,
+        )
+
+        with pytest.raises(ReportCancelledError):
+            await service._aggregate_by_domain(
+                data, {}, cancellation_check=cancellation_check
+            )
+
+        assert llm_client.complete.call_count == 1
+
+
 class TestMarkdownTable:
     """Tests for markdown table generation."""
 
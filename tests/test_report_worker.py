@@ -0,0 +1,105 @@
+"""Tests for ReportWorker."""
+
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from constants import JobStatus, JobType
+from orm_models import Job, Report
+from services.reports.service import ReportCancelledError
+from services.reports.worker import ReportWorker
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return Mock()
+
+
+@pytest.fixture
+def report_job():
+    return Job(
+        id=uuid4(),
+        type=JobType.REPORT,
+        status=JobStatus.QUEUED,
+        payload={
+            "project_id": str(uuid4()),
+            "request": {"type": "table", "group_by": "domain"},
+        },
+    )
+
+
+@pytest.fixture
+def worker(mock_db):
+    w = ReportWorker(mock_db, llm_config=Mock())
+    w.job_repo = Mock()
+    w.job_repo.is_cancellation_requested.return_value = False
+    return w
+
+
+def _patch_service(generate):
+    service = Mock()
+    service.generate = generate
+    return (
+        patch("services.reports.worker.ReportService", return_value=service),
+        patch("services.reports.worker.LLMClient"),
+    )
+
+
+class TestReportWorker:
+    async def test_completes_with_report_id(self, worker, report_job):
+        report = Report(id=uuid4(), format="xlsx", title="Table")
+
+        async def generate(project_id, request, *, progress_callback, **_):
+            assert request.group_by == "domain"
+            progress_callback("merging", 1, 2)
+            assert report_job.result == {
+                "stage": "merging",
+                "completed": 1,
+                "total": 2,
+            }
+            return report
+
+        svc_patch, llm_patch = _patch_service(generate)
+        with svc_patch, llm_patch as MockLLM:
+            MockLLM.return_value.__aenter__ = AsyncMock(return_value=Mock())
+            MockLLM.return_value.__aexit__ = AsyncMock(return_value=False)
+            await worker.process_job(report_job)
+
+        assert report_job.status == JobStatus.COMPLETED
+        assert report_job.result["report_id"] == str(report.id)
+        assert report_job.completed_at is not None
+
+    async def test_cancelled_during_generation(self, worker, report_job, mock_db):
+        svc_patch, llm_patch = _patch_service(
+            AsyncMock(side_effect=ReportCancelledError("cancelled"))
+        )
+        with svc_patch, llm_patch as MockLLM:
+            MockLLM.return_value.__aenter__ = AsyncMock(return_value=Mock())
+            MockLLM.return_value.__aexit__ = AsyncMock(return_value=False)
+            await worker.process_job(report_job)
+
+        mock_db.rollback.assert_called_once()
+        worker.job_repo.mark_cancelled.assert_called_once_with(report_job.id)
+
+    async def test_cancelled_before_start(self, worker, report_job):
+        worker.job_repo.is_cancellation_requested.return_value = True
+
+        with patch("services.reports.worker.ReportService") as MockService:
+            await worker.process_job(report_job)
+
+        MockService.assert_not_called()
+        worker.job_repo.mark_cancelled.assert_called_once_with(report_job.id)
+
+    async def test_failure_marks_job_failed(self, worker, report_job):
+        svc_patch, llm_patch = _patch_service(
+            AsyncMock(side_effect=ValueError("No extraction schema"))
+        )
+        with svc_patch, llm_patch as MockLLM:
+            MockLLM.return_value.__aenter__ = AsyncMock(return_value=Mock())
+            MockLLM.return_value.__aexit__ = AsyncMock(return_value=False)
+            await worker.process_job(report_job)
+
+        assert report_job.status == JobStatus.FAILED
+        assert report_job.error == "No extraction schema"
@@ -131,8 +131,9 @@ class TestWorkerStagger:
             await scheduler.start()
 
             # Expected sleeps: after scrape (0.5), after crawl-0 (0.5),
-            # after crawl-1 (0.5), before extract (0.5), before consolidate (0.5)
-            assert len(sleep_calls) == 5
+            # after crawl-1 (0.5), before extract (0.5), before consolidate (0.5),
+            # before report (0.5), before dedup (0.5), before backfill (0.5)
+            assert len(sleep_calls) == 8
             assert all(d == 0.5 for d in sleep_calls)
 
     @pytest.mark.asyncio
@@ -266,6 +267,44 @@ class TestCleanupStaleJobsIntegration:
         assert "Server restart" in cancelling_job.error
         assert counts.get("cancelling", 0) >= 1
 
+    @pytest.mark.asyncio
+    async def test_running_backfill_jobs_requeued_on_startup(self, db, test_project):
+        """Checkpointed backfill jobs are requeued to resume, not failed."""
+        from services.scraper.scheduler import JobScheduler
+
+        backfill_job = Job(
+            project_id=test_project.id,
+            type="backfill",
+            status="running",
+            payload={"project_id": str(test_project.id), "checkpoint": {}},
+            started_at=datetime.now(UTC) - timedelta(minutes=10),
+            updated_at=datetime.now(UTC) - timedelta(minutes=5),
+        )
+        db.add(backfill_job)
+        db.flush()
+
+        mock_container = MagicMock()
+
+        with (
+            patch("services.scraper.scheduler.SessionLocal", return_value=db),
+        ):
+            original_commit = db.commit
+            original_close = db.close
+            db.commit = MagicMock()
+            db.close = MagicMock()
+
+            try:
+                scheduler = JobScheduler(services=mock_container, poll_interval=5)
+                counts = await scheduler._cleanup_stale_jobs()
+            finally:
+                db.commit = original_commit
+                db.close = original_close
+
+        assert backfill_job.status == "queued"
+        assert backfill_job.error is None
+        assert backfill_job.completed_at is None
+        assert counts.get("requeued", 0) >= 1
+
     @pytest.mark.asyncio
     async def test_queued_jobs_left_untouched(self, db, test_project):
         """Queued jobs should NOT be modified during cleanup."""
@@ -438,6 +438,32 @@ class TestValidateExtractionSchema:
             "30" in error or "too many" in error.lower() for error in result.errors
         )
 
+    def test_entity_match_threshold_must_be_in_range(self):
+        """Error if extraction_context.entity_match_threshold is outside (0, 1]."""
+        adapter = SchemaAdapter()
+        schema = {
+            "name": "test",
+            "field_groups": [
+                {
+                    "name": "group",
+                    "description": "desc",
+                    "fields": [{"name": "f", "field_type": "text", "description": "d"}],
+                },
+            ],
+        }
+
+        ok = adapter.validate_extraction_schema(
+            schema, extraction_context={"entity_match_threshold": 0.6}
+        )
+        assert ok.is_valid
+
+        for bad in (0, 1.5, "0.5", True):
+            result = adapter.validate_extraction_schema(
+                schema, extraction_context={"entity_match_threshold": bad}
+            )
+            assert not result.is_valid
+            assert any("entity_match_threshold" in e for e in result.errors)
+
 
 class TestConvertToFieldGroups:
     """Test conversion from JSONB to FieldGroup objects."""
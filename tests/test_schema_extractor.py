@@ -1,5 +1,8 @@
 """Tests for schema-based extraction."""
 
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -154,6 +157,35 @@ class TestSchemaExtractor:
         assert isinstance(result["products_gearbox"], list)
         assert len(result["products_gearbox"]) >= 1
 
+    async def test_entity_list_truncation_unrecoverable_flags_truncated(
+        self, llm_config
+    ):
+        """Test that a truncated entity response with no JSON is flagged."""
+        extractor = SchemaExtractor(llm_config)
+
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(
+                choices=[
+                    MagicMock(
+                        message=MagicMock(content="Here are the products I fou"),
+                        finish_reason="length",
+                    )
+                ]
+            )
+        )
+
+        result = await extractor.extract_field_group(
+            content="We have many products...",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+        )
+
+        assert result == {
+            "products_gearbox": [],
+            "confidence": 0.0,
+            "_truncated": True,
+        }
+
     async def test_non_entity_truncation_attempts_repair(self, llm_config):
         """Test that truncated non-entity extraction attempts JSON repair."""
         extractor = SchemaExtractor(llm_config)
@@ -208,6 +240,170 @@ class TestSchemaExtractor:
         assert result["manufactures_motors"] is True
 
 
+def _stream(deltas, finish_reason="stop", error=None, stall=False):
+    """Fake streamed completion yielding ``deltas`` as content chunks."""
+
+    async def chunks():
+        for delta in deltas:
+            yield SimpleNamespace(
+                usage=None,
+                choices=[
+                    SimpleNamespace(
+                        delta=SimpleNamespace(content=delta), finish_reason=None
+                    )
+                ],
+            )
+        if error is not None:
+            raise error
+        if stall:
+            await asyncio.sleep(3600)
+        if finish_reason is not None:
+            yield SimpleNamespace(
+                usage=None,
+                choices=[
+                    SimpleNamespace(
+                        delta=SimpleNamespace(content=None),
+                        finish_reason=finish_reason,
+                    )
+                ],
+            )
+
+    return chunks()
+
+
+class TestStreamedEntityExtraction:
+    """Entity lists streamed with an on_entity callback (direct mode)."""
+
+    @pytest.fixture
+    def llm_config(self):
+        from config import LLMConfig
+
+        return LLMConfig(
+            base_url="http://localhost:9003/v1",
+            embedding_base_url="http://localhost:9003/v1",
+            api_key="test",
+            model="test-model",
+            embedding_model="bge-m3",
+            embedding_dimension=1024,
+            http_timeout=60,
+            max_tokens=4096,
+            max_retries=2,
+            retry_backoff_min=0,
+            retry_backoff_max=0,
+            base_temperature=0.1,
+            retry_temperature_increment=0.05,
+        )
+
+    def _extractor(self, llm_config, *streams):
+        extractor = SchemaExtractor(llm_config)
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock(side_effect=streams)
+        return extractor
+
+    async def test_entities_reported_as_they_arrive(self, llm_config):
+        extractor = self._extractor(
+            llm_config,
+            _stream(
+                [
+                    '{"products_gearbox": [{"product_name": "D',
+                    ' Series"}, {"product_',
+                    'name": "K Series"}]}',
+                ]
+            ),
+        )
+        seen = []
+
+        result = await extractor.extract_field_group(
+            content="Our D and K Series gearboxes.",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+            on_entity=seen.append,
+        )
+
+        assert seen == [{"product_name": "D Series"}, {"product_name": "K Series"}]
+        assert [p["product_name"] for p in result["products_gearbox"]] == [
+            "D Series",
+            "K Series",
+        ]
+        assert "_truncated" not in result
+        kwargs = extractor.client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+
+    async def test_interrupted_stream_keeps_received_entities(self, llm_config):
+        extractor = self._extractor(
+            llm_config,
+            _stream(
+                ['{"products_gearbox": [{"product_name": "D Series"}, {"prod'],
+                error=ConnectionError("connection reset"),
+            ),
+        )
+        seen = []
+
+        result = await extractor.extract_field_group(
+            content="Our D and K Series gearboxes.",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+            on_entity=seen.append,
+        )
+
+        assert seen == [{"product_name": "D Series"}]
+        assert result["products_gearbox"][0]["product_name"] == "D Series"
+        assert result["_truncated"] is True
+        assert extractor.client.chat.completions.create.await_count == 1
+
+    async def test_interrupted_stream_drops_partial_trailing_entity(self, llm_config):
+        extractor = self._extractor(
+            llm_config,
+            _stream(
+                [
+                    '{"products_gearbox": [{"product_name": "Alpha"}, ',
+                    '{"product_name": "Planetary Gearb',
+                ],
+                error=ConnectionError("connection reset"),
+            ),
+        )
+
+        result = await extractor.extract_field_group(
+            content="Alpha and Planetary Gearbox series.",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+            on_entity=lambda entity: None,
+        )
+
+        assert [p["product_name"] for p in result["products_gearbox"]] == ["Alpha"]
+        assert result["_truncated"] is True
+
+    async def test_stalled_stream_salvaged_at_timeout(self, llm_config):
+        extractor = self._extractor(
+            replace(llm_config, http_timeout=0.05),
+            _stream(['{"products_gearbox": [{"product_name": "D"}, '], stall=True),
+        )
+
+        result = await extractor.extract_field_group(
+            content="Our D Series gearbox.",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+            on_entity=lambda entity: None,
+        )
+
+        assert result["products_gearbox"] == [{"product_name": "D"}]
+        assert result["_truncated"] is True
+
+    async def test_stream_failing_before_first_entity_retries(self, llm_config):
+        extractor = self._extractor(
+            llm_config,
+            _stream(['{"products_gearbox": [{"prod'], error=ConnectionError("x")),
+            _stream(['{"products_gearbox": [{"product_name": "K"}]}']),
+        )
+        seen = []
+
+        result = await extractor.extract_field_group(
+            content="Our K Series gearbox.",
+            field_group=PRODUCTS_GEARBOX_GROUP,
+            on_entity=seen.append,
+        )
+
+        assert seen == [{"product_name": "K"}]
+        assert result["products_gearbox"] == [{"product_name": "K"}]
+        assert extractor.client.chat.completions.create.await_count == 2
+
+
 class TestPromptGrounding:
     """Test Phase 2A: grounding rules in prompts."""
 
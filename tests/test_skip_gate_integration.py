@@ -280,6 +280,140 @@ class TestSkipGateIntegration:
         mock_smart.classify.assert_called_once()
 
 
+class TestBatchedSmartClassification:
+    """classify_sources precomputes smart classifications per batch."""
+
+    def _pages(self):
+        from services.extraction.page_classifier import PageToClassify
+
+        return [
+            PageToClassify("https://example.com/products", "Products", "Specs"),
+            PageToClassify("https://example.com/careers", "Jobs", "Join us"),
+            PageToClassify("https://example.com/about", "About", "History"),
+        ]
+
+    def _result(self, groups):
+        from services.extraction.page_classifier import ClassificationResult
+
+        return ClassificationResult(
+            page_type="product",
+            relevant_groups=groups,
+            skip_extraction=False,
+            confidence=0.9,
+            method=ClassificationMethod.HYBRID,
+        )
+
+    async def test_rule_skipped_pages_not_sent(
+        self, mock_extractor, sample_field_groups
+    ):
+        mock_smart = Mock()
+        mock_smart.classify_many = AsyncMock(
+            return_value=[self._result(["products"]), self._result(["company_info"])]
+        )
+        orchestrator = SchemaExtractionOrchestrator(
+            mock_extractor,
+            classification_config=FakeClassificationConfig(
+                skip_gate_enabled=False, smart_enabled=True
+            ),
+            smart_classifier=mock_smart,
+        )
+
+        results = await orchestrator.classify_sources(
+            self._pages(), sample_field_groups
+        )
+
+        sent = mock_smart.classify_many.await_args.args[0]
+        assert [p.url for p in sent] == [
+            "https://example.com/products",
+            "https://example.com/about",
+        ]
+        assert results[0].relevant_groups == ["products"]
+        assert results[1] is None
+        assert results[2].relevant_groups == ["company_info"]
+
+    async def test_skip_gate_takes_precedence(
+        self, mock_extractor, sample_field_groups, sample_schema
+    ):
+        from services.extraction.llm_skip_gate import SkipGateResult
+
+        mock_smart = Mock()
+        mock_smart.classify_many = AsyncMock()
+        gate = Mock()
+        gate.should_extract_many = AsyncMock(
+            return_value=[
+                SkipGateResult(decision="extract", confidence=0.0, latency=0.1),
+                SkipGateResult(decision="skip", confidence=0.0, latency=0.1),
+            ]
+        )
+        orchestrator = SchemaExtractionOrchestrator(
+            mock_extractor,
+            classification_config=FakeClassificationConfig(smart_enabled=True),
+            smart_classifier=mock_smart,
+            skip_gate=gate,
+            extraction_schema=sample_schema,
+        )
+
+        results = await orchestrator.classify_sources(
+            self._pages(), sample_field_groups
+        )
+
+        mock_smart.classify_many.assert_not_called()
+        sent, schema = gate.should_extract_many.await_args.args
+        assert len(sent) == 2 and schema is sample_schema
+        assert results[0].relevant_groups == ["company_info", "products"]
+        assert results[0].method == ClassificationMethod.LLM
+        assert results[1] is None
+        assert results[2].skip_extraction is True
+        assert results[2].page_type == "skip"
+
+    async def test_precomputed_classification_used(
+        self, mock_extractor, sample_field_groups
+    ):
+        mock_smart = Mock()
+        mock_smart.classify = AsyncMock()
+        orchestrator = SchemaExtractionOrchestrator(
+            mock_extractor,
+            classification_config=FakeClassificationConfig(
+                skip_gate_enabled=False, smart_enabled=True
+            ),
+            smart_classifier=mock_smart,
+        )
+
+        _, classification = await orchestrator.extract_all_groups(
+            source_id=uuid4(),
+            markdown="Product specs and details." * 10,
+            source_context="Test Company",
+            field_groups=sample_field_groups,
+            source_url="https://example.com/products",
+            source_title="Products",
+            precomputed_classification=self._result(["products"]),
+        )
+
+        assert classification.relevant_groups == ["products"]
+        mock_smart.classify.assert_not_called()
+
+    async def test_pipeline_classifies_chunk_once(self, sample_field_groups):
+        from services.extraction.pipeline import SchemaExtractionPipeline
+
+        orchestrator = Mock(batch_classification_enabled=True)
+        orchestrator.classify_sources = AsyncMock(
+            return_value=[self._result(["products"]), None]
+        )
+        sources = [
+            Mock(id=uuid4(), uri="https://example.com/products", title="P"),
+            Mock(id=uuid4(), uri="https://example.com/careers", title="C"),
+        ]
+        for source in sources:
+            source.content = "Some content"
+            source.cleaned_content = None
+        pipeline = SchemaExtractionPipeline(orchestrator, Mock())
+
+        classifications = await pipeline._classify_chunk(sources, sample_field_groups)
+
+        orchestrator.classify_sources.assert_awaited_once()
+        assert list(classifications) == [sources[0].id]
+
+
 class MockLLMClient:
     """Mock LLM client for integration tests."""
 
@@ -1408,3 +1408,117 @@ class TestContentCleaningIntegration:
         assert "Skip to content" not in summary
         assert "tracking.png" not in summary
         assert "manufacture" in summary
+
+
+class TestClassifyMany:
+    """Test batched classification (classify_many)."""
+
+    DIM = 8
+
+    def _unit(self, *components: float) -> list[float]:
+        vec = list(components) + [0.0] * (self.DIM - len(components))
+        norm = math.sqrt(sum(c * c for c in vec))
+        return [c / norm for c in vec]
+
+    @pytest.fixture
+    def pages(self):
+        from services.extraction.page_classifier import PageToClassify
+
+        return [
+            PageToClassify("https://example.com/gearboxes", "Gearboxes", "Gears"),
+            PageToClassify("https://example.com/careers", "Jobs", "Join us"),
+            PageToClassify("https://example.com/mixed", "Mixed", "Everything"),
+            PageToClassify("https://example.com/blog/x", "Blog", "Unrelated"),
+        ]
+
+    @pytest.fixture
+    def page_vectors(self):
+        return {
+            "https://example.com/gearboxes": self._unit(1.0),
+            "https://example.com/mixed": self._unit(0.6, 0.55, 0.58),
+            "https://example.com/blog/x": self._unit(0.3, 0.2, 0.1, 1.0),
+        }
+
+    @pytest.fixture
+    def embedding_service(self, embedding_service, field_groups, page_vectors):
+        group_vectors = [self._unit(*([0.0] * i + [1.0])) for i in range(3)]
+
+        def vector_for(text: str) -> list[float]:
+            for group, vector in zip(field_groups, group_vectors, strict=True):
+                if text.startswith(f"{group.name}:"):
+                    return vector
+            url = next(line[5:] for line in text.splitlines() if line[:5] == "URL: ")
+            return page_vectors[url]
+
+        embedding_service.embed_batch.side_effect = lambda texts: [
+            vector_for(t) for t in texts
+        ]
+        embedding_service.embed.side_effect = vector_for
+        embedding_service.rerank.return_value = [(0, 0.9), (1, 0.2), (2, 0.6)]
+        return embedding_service
+
+    async def test_matches_per_page_classify(
+        self, smart_classifier, field_groups, pages
+    ):
+        batched = await smart_classifier.classify_many(pages, field_groups)
+        single = [
+            await smart_classifier.classify(p.url, p.title, p.content, field_groups)
+            for p in pages
+        ]
+
+        for many, one in zip(batched, single, strict=True):
+            assert many.relevant_groups == one.relevant_groups
+            assert many.skip_extraction == one.skip_extraction
+            assert many.reasoning == one.reasoning
+            assert many.confidence == pytest.approx(one.confidence)
+
+        assert batched[0].relevant_groups == ["products_gearbox"]
+        assert batched[1].skip_extraction is True
+        assert batched[2].relevant_groups == ["products_gearbox", "services"]
+
+    async def test_pages_embedded_in_batches(
+        self, embedding_service, redis_client, app_config, field_groups, pages
+    ):
+        from dataclasses import replace
+
+        classifier = SmartClassifier(
+            embedding_service=embedding_service,
+            redis_client=redis_client,
+            app_config=replace(app_config, embed_batch_size=2),
+        )
+        # Five classifiable pages (the careers page is skipped by rule)
+        many = pages + [pages[0], pages[2]]
+
+        results = await classifier.classify_many(many, field_groups)
+
+        assert len(results) == len(many)
+        embedding_service.embed.assert_not_called()
+        page_batches = [
+            c.args[0]
+            for c in embedding_service.embed_batch.call_args_list
+            if not c.args[0][0].startswith("products_gearbox:")
+        ]
+        assert [len(b) for b in page_batches] == [2, 2, 1]
+
+    async def test_group_matrix_reused_across_batches(
+        self, smart_classifier, embedding_service, field_groups, pages
+    ):
+        await smart_classifier.classify_many(pages, field_groups)
+        calls = embedding_service.embed_batch.call_count
+
+        await smart_classifier.classify_many(pages, field_groups)
+
+        # Only the page batch is embedded the second time
+        assert embedding_service.embed_batch.call_count == calls + 1
+
+    async def test_embedding_failure_falls_back_for_batch(
+        self, smart_classifier, embedding_service, field_groups, pages
+    ):
+        embedding_service.embed_batch.side_effect = Exception("server down")
+
+        results = await smart_classifier.classify_many(pages, field_groups)
+
+        assert results[1].skip_extraction is True
+        for i in (0, 2, 3):
+            assert results[i].relevant_groups == []
+            assert "Smart classification failed" in results[i].reasoning
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from database import engine
 from orm_models import Project, Source
+from services.storage.content_hash import compute_content_hash
 from services.storage.repositories.source import SourceFilters, SourceRepository
 
 
@@ -445,3 +446,58 @@ class TestSourceRepositoryUpdateContent:
         assert updated.source_group == "original_group"
         assert updated.status == "pending"
         assert updated.uri == "https://example.com/preserve_test"
+
+
+class TestSourceRepositoryContentHash:
+    """Test content hashing at ingest."""
+
+    def test_create_sets_content_hash(self, source_repo, test_project):
+        source = source_repo.create(
+            project_id=test_project.id,
+            uri="https://example.com/hash_create",
+            source_group="test_group",
+            content="Hello  world\r\n",
+        )
+        assert source.content_hash == compute_content_hash("Hello world")
+
+    def test_create_without_content_has_no_hash(self, source_repo, test_project):
+        source = source_repo.create(
+            project_id=test_project.id,
+            uri="https://example.com/hash_none",
+            source_group="test_group",
+        )
+        assert source.content_hash is None
+
+    def test_update_content_refreshes_hash(self, source_repo, test_project):
+        source = source_repo.create(
+            project_id=test_project.id,
+            uri="https://example.com/hash_update",
+            source_group="test_group",
+            content="Old",
+        )
+        updated = source_repo.update_content(source.id, content="New", title="T")
+        assert updated.content_hash == compute_content_hash("New")
+
+    def test_upsert_refreshes_hash_on_conflict(
+        self, source_repo, test_project, db_session
+    ):
+        uri = "https://example.com/hash_upsert"
+        first, created = source_repo.upsert(
+            project_id=test_project.id,
+            uri=uri,
+            source_group="test_group",
+            content="Version one",
+        )
+        assert created
+        first_hash = first.content_hash
+
+        second, _ = source_repo.upsert(
+            project_id=test_project.id,
+            uri=uri,
+            source_group="test_group",
+            content="Version two",
+        )
+        db_session.refresh(second)
+        assert second.id == first.id
+        assert second.content_hash == compute_content_hash("Version two")
+        assert second.content_hash != first_hash